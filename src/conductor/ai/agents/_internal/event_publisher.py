@@ -0,0 +1,328 @@
+"""Buffered delivery of framework-worker events and progress updates.
+
+The LangGraph, LangChain and Claude Agent SDK bridges report what an agent
+is doing as it runs: an event per node, tool call or tool result (``POST
+/agent/events/{executionId}``) and, for long-running workers, IN_PROGRESS
+task updates.  Posting each one from a thread pool as it happens costs a
+request per event, lets events of one execution overtake each other, and
+sends progress updates that a newer one has already superseded.
+
+:class:`EventPublisher` buffers instead.  ``publish`` appends the event to
+its execution's queue and returns; a background thread flushes queues every
+``flush_interval`` seconds, or as soon as one holds ``max_batch`` events,
+and posts each execution's batch in order with at most one batch per
+execution in flight.  Consecutive identical ``thinking`` events in a batch
+are sent once, and only the latest pending progress update of a task is
+sent.  Queues are bounded: past ``max_pending`` events per execution new
+events are dropped, and events delivered more than ``late_after`` seconds
+after they were published are counted as late (see :attr:`stats`).
+Other requests about an execution, such as completing a task injected into
+it, go through :meth:`EventPublisher.post` so they follow its events.
+
+Everything is created lazily in the process that uses it, so importing this
+module is safe in spawned worker processes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from conductor.ai.agents._internal.agent_http import _agent_api_client, agent_post
+
+logger = logging.getLogger("conductor.ai.agents.event_publisher")
+
+# (server_url, auth_key, auth_secret)
+_Credentials = Tuple[str, str, str]
+
+_Pending = Tuple[float, Dict[str, Any], Optional[str]]
+
+# Event types whose consecutive duplicates carry no extra information.
+_COALESCIBLE_TYPES = frozenset({"thinking"})
+
+
+@dataclass
+class PublisherStats:
+    """Counters of an :class:`EventPublisher` since it was created."""
+
+    published: int = 0
+    sent: int = 0
+    failed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    late: int = 0
+    progress_sent: int = 0
+    progress_coalesced: int = 0
+
+
+class EventPublisher:
+    """Batches events per execution and coalesces progress updates.
+
+    Args:
+        flush_interval: Seconds between flushes of the pending queues.
+        max_batch: Pending events of one execution that trigger an early flush.
+        max_pending: Pending events kept per execution; newer ones are dropped.
+        late_after: Delivery delay, in seconds, past which an event counts as late.
+        max_workers: Threads posting batches; one execution uses one at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = 0.1,
+        max_batch: int = 50,
+        max_pending: int = 1000,
+        late_after: float = 5.0,
+        max_workers: int = 4,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.late_after = late_after
+        self._max_workers = max_workers
+        self._lock = threading.Condition()
+        # (published at, body, path); a None path is the execution's events endpoint.
+        self._events: Dict[Tuple[_Credentials, str], Deque[_Pending]] = {}
+        self._progress: Dict[str, Tuple[_Credentials, str, Dict[str, Any]]] = {}
+        self._in_flight: Set[Tuple[_Credentials, str]] = set()
+        self._progress_in_flight: Dict[str, str] = {}
+        self._stats = PublisherStats()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pid = os.getpid()
+
+    @property
+    def stats(self) -> PublisherStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return PublisherStats(**{f.name: getattr(self._stats, f.name) for f in fields(PublisherStats)})
+
+    def publish(
+        self,
+        execution_id: str,
+        event: Dict[str, Any],
+        server_url: str,
+        auth_key: str,
+        auth_secret: str,
+    ) -> None:
+        """Queues *event* for ``POST /agent/events/{execution_id}``."""
+        self._ensure_started()
+        key = ((server_url, auth_key, auth_secret), execution_id)
+        with self._lock:
+            self._stats.published += 1
+            pending = self._events.setdefault(key, deque())
+            if len(pending) >= self.max_pending:
+                self._stats.dropped += 1
+                return
+            pending.append((time.monotonic(), event, None))
+            full = len(pending) >= self.max_batch
+        if full:
+            self._wake.set()
+
+    def post(
+        self,
+        execution_id: str,
+        path: str,
+        body: Dict[str, Any],
+        server_url: str,
+        auth_key: str,
+        auth_secret: str,
+    ) -> None:
+        """Queues ``POST {path}`` after the events of *execution_id* published so far.
+
+        Unlike events, these requests are never dropped.
+        """
+        self._ensure_started()
+        key = ((server_url, auth_key, auth_secret), execution_id)
+        with self._lock:
+            self._events.setdefault(key, deque()).append((time.monotonic(), body, path))
+        self._wake.set()
+
+    def update_progress(
+        self,
+        task_id: str,
+        execution_id: str,
+        output_data: Dict[str, Any],
+        server_url: str,
+        auth_key: str,
+        auth_secret: str,
+    ) -> None:
+        """Queues an IN_PROGRESS update of *task_id*, replacing one not sent yet."""
+        self._ensure_started()
+        with self._lock:
+            if task_id in self._progress:
+                self._stats.progress_coalesced += 1
+            self._progress[task_id] = ((server_url, auth_key, auth_secret), execution_id, output_data)
+
+    def flush(self, execution_id: Optional[str] = None, timeout: float = 5.0) -> bool:
+        """Waits until the pending events (of *execution_id*, or all) are posted.
+
+        Returns false if they were not all posted within *timeout* seconds.
+        """
+        deadline = time.monotonic() + timeout
+        self._wake.set()
+        with self._lock:
+            while self._has_pending(execution_id):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._wake.set()
+                self._lock.wait(min(remaining, self.flush_interval))
+        return True
+
+    def _has_pending(self, execution_id: Optional[str]) -> bool:
+        def matches(candidate: str) -> bool:
+            return execution_id is None or candidate == execution_id
+
+        return (
+            any(matches(key[1]) for key, pending in self._events.items() if pending)
+            or any(matches(key[1]) for key in self._in_flight)
+            or any(matches(update[1]) for update in self._progress.values())
+            or any(matches(candidate) for candidate in self._progress_in_flight.values())
+        )
+
+    def _ensure_started(self) -> None:
+        if self._pid != os.getpid():
+            # Inherited through fork: the parent's threads do not exist here.
+            self.__init__(
+                flush_interval=self.flush_interval,
+                max_batch=self.max_batch,
+                max_pending=self.max_pending,
+                late_after=self.late_after,
+                max_workers=self._max_workers,
+            )
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="agent-event-push"
+                )
+                self._thread = threading.Thread(
+                    target=self._run, name="agent-event-publisher", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self._dispatch()
+            except Exception as exc:  # never let the flusher die
+                logger.debug("Event flush failed: %s", exc)
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            batches = []
+            for key, pending in self._events.items():
+                if pending and key not in self._in_flight:
+                    batches.append((key, list(pending)))
+                    pending.clear()
+                    self._in_flight.add(key)
+            for key in [k for k, pending in self._events.items() if not pending and k not in self._in_flight]:
+                del self._events[key]
+            # An update still being posted keeps its successor waiting, so
+            # the server never sees them out of order.
+            progress = [(t, u) for t, u in self._progress.items() if t not in self._progress_in_flight]
+            for task_id, update in progress:
+                del self._progress[task_id]
+                self._progress_in_flight[task_id] = update[1]
+        for key, batch in batches:
+            self._submit(self._send_events, key, batch)
+        for task_id, update in progress:
+            self._submit(self._send_progress, task_id, update)
+
+    def _submit(self, fn: Any, *args: Any) -> None:
+        try:
+            self._pool.submit(fn, *args)
+        except RuntimeError:
+            # The pool stops accepting work at interpreter exit; the final
+            # flush posts from the flusher thread itself.
+            fn(*args)
+
+    def _send_events(self, key: Tuple[_Credentials, str], batch: List[_Pending]) -> None:
+        (server_url, auth_key, auth_secret), execution_id = key
+        sent = failed = late = coalesced = 0
+        previous = None
+        try:
+            for published_at, event, path in batch:
+                if path is not None:
+                    previous = None
+                    try:
+                        agent_post(server_url, auth_key, auth_secret, path, event)
+                    except Exception as exc:
+                        logger.debug("POST %s failed (execution_id=%s): %s", path, execution_id, exc)
+                    continue
+                if event.get("type") in _COALESCIBLE_TYPES and event == previous:
+                    coalesced += 1
+                    continue
+                previous = event
+                try:
+                    agent_post(server_url, auth_key, auth_secret, f"/agent/events/{execution_id}", event)
+                    sent += 1
+                except Exception as exc:
+                    failed += 1
+                    logger.debug("Event push failed (execution_id=%s): %s", execution_id, exc)
+                if time.monotonic() - published_at > self.late_after:
+                    late += 1
+        finally:
+            with self._lock:
+                self._stats.sent += sent
+                self._stats.failed += failed
+                self._stats.late += late
+                self._stats.coalesced += coalesced
+                self._in_flight.discard(key)
+                self._lock.notify_all()
+            if late:
+                logger.debug("%d events of execution_id=%s delivered late", late, execution_id)
+
+    def _send_progress(self, task_id: str, update: Tuple[_Credentials, str, Dict[str, Any]]) -> None:
+        (server_url, auth_key, auth_secret), execution_id, output_data = update
+        try:
+            from conductor.client.http.api.task_resource_api import TaskResourceApi
+            from conductor.client.http.models.task_result import TaskResult
+
+            result = TaskResult(
+                task_id=task_id,
+                workflow_instance_id=execution_id,
+                status="IN_PROGRESS",
+                output_data=output_data,
+            )
+            TaskResourceApi(_agent_api_client(server_url, auth_key, auth_secret)).update_task(result)
+            with self._lock:
+                self._stats.progress_sent += 1
+        except Exception as exc:
+            logger.debug(
+                "Task progress update failed (task_id=%s, execution_id=%s): %s",
+                task_id,
+                execution_id,
+                exc,
+            )
+        finally:
+            with self._lock:
+                self._progress_in_flight.pop(task_id, None)
+                self._lock.notify_all()
+
+
+_PUBLISHER: Optional[EventPublisher] = None
+_PUBLISHER_LOCK = threading.Lock()
+
+
+def event_publisher() -> EventPublisher:
+    """The process-wide :class:`EventPublisher`, flushed at interpreter exit."""
+    global _PUBLISHER
+    if _PUBLISHER is None:
+        with _PUBLISHER_LOCK:
+            if _PUBLISHER is None:
+                _PUBLISHER = EventPublisher()
+                atexit.register(_PUBLISHER.flush)
+    return _PUBLISHER
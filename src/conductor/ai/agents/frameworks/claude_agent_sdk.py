@@ -17,7 +17,8 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import is_dataclass, replace
 from typing import Any, Dict, List, Optional, Tuple
 
-from conductor.ai.agents._internal.agent_http import _agent_api_client, agent_post
+from conductor.ai.agents._internal.agent_http import agent_post
+from conductor.ai.agents._internal.event_publisher import event_publisher
 from conductor.ai.agents.frameworks.serializer import WorkerInfo
 
 logger = logging.getLogger("conductor.ai.agents.frameworks.claude_agent_sdk")
@@ -31,6 +32,9 @@ _EVENT_PUSH_POOL = ThreadPoolExecutor(
 # Minimum seconds between IN_PROGRESS task updates to avoid spamming the server
 _PROGRESS_UPDATE_INTERVAL_S = 30
 
+# Max seconds a task result waits for its pending events to be delivered
+_FINAL_FLUSH_TIMEOUT_S = 1.0
+
 # Max characters of tool output / assistant text to include in progress updates
 _PROGRESS_SNIPPET_MAX_CHARS = 500
 
@@ -319,10 +323,27 @@ def make_claude_agent_sdk_worker(
                 status=TaskResultStatus.FAILED,
                 reason_for_incompletion=str(exc),
             )
+        finally:
+            # Deliver pending events, completions and progress before the task
+            # result is reported, so no IN_PROGRESS update trails the final
+            # status; bounded so a slow server cannot hold up the result.
+            deadline = time.monotonic() + _FINAL_FLUSH_TIMEOUT_S
+            for tracked in _tracked_executions(execution_id, metadata):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not event_publisher().flush(tracked, timeout=remaining):
+                    break
 
     return tool_worker
 
 
+def _tracked_executions(execution_id: str, metadata: Dict[str, Any]) -> List[str]:
+    """*execution_id* and the tracking sub-workflows this worker created or used."""
+    executions = [execution_id]
+    executions.extend(metadata["_tool_target_exec"].values())
+    executions.extend(entry["sub_exec_id"] for entry in metadata["_agent_tool_map"].values())
+    return list(dict.fromkeys(e for e in executions if e))
+
+
 # ---------------------------------------------------------------------------
 # Async query runner
 # ---------------------------------------------------------------------------
@@ -881,26 +902,8 @@ def _push_event_nonblocking(
     auth_key: str,
     auth_secret: str,
 ) -> None:
-    """Fire-and-forget HTTP POST to {server_url}/agent/events/{executionId}."""
-
-    def _do_push():
-        try:
-            agent_post(server_url, auth_key, auth_secret, f"/agent/events/{execution_id}", event)
-        except Exception as exc:
-            logger.debug("Event push failed (execution_id=%s): %s", execution_id, exc)
-
-    _EVENT_PUSH_POOL.submit(_do_push)
-
-
-def _task_client(server_url: str, auth_key: str, auth_secret: str):
-    """Return a ``TaskResourceApi`` backed by the shared cached ``ApiClient``.
-
-    Reuses the single per-(server_url, auth_key) ApiClient from ``agent_http`` so
-    the ``/tasks`` progress update and the ``/agent/*`` posts share one token.
-    """
-    from conductor.client.http.api.task_resource_api import TaskResourceApi
-
-    return TaskResourceApi(_agent_api_client(server_url, auth_key, auth_secret))
+    """Queue an event for {server_url}/agent/events/{executionId} on the shared publisher."""
+    event_publisher().publish(execution_id, event, server_url, auth_key, auth_secret)
 
 
 def _update_task_progress_nonblocking(
@@ -911,11 +914,12 @@ def _update_task_progress_nonblocking(
     auth_key: str,
     auth_secret: str,
 ) -> None:
-    """Fire-and-forget Conductor task update with IN_PROGRESS status.
+    """Queue a Conductor task update with IN_PROGRESS status.
 
     Sends current tool counts, tools used, and a snippet of the last output
     so the server (and any polling clients) can see real-time progress from
-    this long-running Claude Code worker.
+    this long-running Claude Code worker.  An update not yet sent when the
+    next one arrives is replaced by it.
     """
     all_calls = metadata.get("tools_used", [])
     progress_data: Dict[str, Any] = {
@@ -926,26 +930,9 @@ def _update_task_progress_nonblocking(
         "last_tool_output": str(metadata.get("last_tool_output", ""))[:_PROGRESS_SNIPPET_MAX_CHARS],
     }
 
-    def _do_update():
-        try:
-            from conductor.client.http.models.task_result import TaskResult
-
-            result = TaskResult(
-                task_id=task_id,
-                workflow_instance_id=execution_id,
-                status="IN_PROGRESS",
-                output_data=progress_data,
-            )
-            _task_client(server_url, auth_key, auth_secret).update_task(result)
-        except Exception as exc:
-            logger.debug(
-                "Task progress update failed (task_id=%s, execution_id=%s): %s",
-                task_id,
-                execution_id,
-                exc,
-            )
-
-    _EVENT_PUSH_POOL.submit(_do_update)
+    event_publisher().update_progress(
+        task_id, execution_id, progress_data, server_url, auth_key, auth_secret
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1027,27 +1014,17 @@ def _complete_tool_task_nonblocking(
 ) -> None:
     """Fire-and-forget update of an injected task's status.
 
-    Uses POST /api/agent/tasks/{executionId}/{refTaskName}/{status}.
+    Uses POST /api/agent/tasks/{executionId}/{refTaskName}/{status}, queued on
+    the shared publisher behind the events already published for the execution.
     """
-
-    def _do_complete():
-        try:
-            agent_post(
-                server_url,
-                auth_key,
-                auth_secret,
-                f"/agent/tasks/{execution_id}/{ref_name}/{status}",
-                output_data,
-            )
-        except Exception as exc:
-            logger.debug(
-                "Complete tool task failed (execution_id=%s, ref=%s): %s",
-                execution_id,
-                ref_name,
-                exc,
-            )
-
-    _EVENT_PUSH_POOL.submit(_do_complete)
+    event_publisher().post(
+        execution_id,
+        f"/agent/tasks/{execution_id}/{ref_name}/{status}",
+        output_data,
+        server_url,
+        auth_key,
+        auth_secret,
+    )
 
 
 def _complete_workflow_nonblocking(
@@ -1059,26 +1036,17 @@ def _complete_workflow_nonblocking(
 ) -> None:
     """Fire-and-forget: mark a tracking sub-workflow as COMPLETED.
 
-    Uses POST /api/agent/execution/{executionId}/complete.
+    Uses POST /api/agent/execution/{executionId}/complete, queued on the shared
+    publisher behind the events already published for the sub-workflow.
     """
-
-    def _do_complete():
-        try:
-            agent_post(
-                server_url,
-                auth_key,
-                auth_secret,
-                f"/agent/execution/{workflow_execution_id}/complete",
-                output_data or {},
-            )
-        except Exception as exc:
-            logger.debug(
-                "Complete workflow failed (execution_id=%s): %s",
-                workflow_execution_id,
-                exc,
-            )
-
-    _EVENT_PUSH_POOL.submit(_do_complete)
+    event_publisher().post(
+        workflow_execution_id,
+        f"/agent/execution/{workflow_execution_id}/complete",
+        output_data or {},
+        server_url,
+        auth_key,
+        auth_secret,
+    )
 
 
 # ---------------------------------------------------------------------------
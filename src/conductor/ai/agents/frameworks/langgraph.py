@@ -19,17 +19,13 @@ from __future__ import annotations
 import inspect
 import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
-from conductor.ai.agents._internal.agent_http import agent_post
+from conductor.ai.agents._internal.event_publisher import event_publisher
 from conductor.ai.agents.frameworks.serializer import WorkerInfo
 
 logger = logging.getLogger("conductor.ai.agents.frameworks.langgraph")
 
-# Shared thread pool for non-blocking event push (process lifetime)
-_EVENT_PUSH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="langgraph-event-push")
-
 _DEFAULT_NAME = "langgraph_agent"
 
 
@@ -1577,6 +1573,9 @@ def make_langgraph_worker(
                 status=TaskResultStatus.FAILED,
                 reason_for_incompletion=str(exc),
             )
+        finally:
+            # Deliver the run's events before its task result is reported.
+            event_publisher().flush(execution_id)
 
     return tool_worker
 
@@ -1762,12 +1761,5 @@ def _push_event_nonblocking(
     auth_key: str,
     auth_secret: str,
 ) -> None:
-    """Fire-and-forget HTTP POST to {server_url}/agent/events/{executionId}."""
-
-    def _do_push():
-        try:
-            agent_post(server_url, auth_key, auth_secret, f"/agent/events/{execution_id}", event)
-        except Exception as exc:
-            logger.debug("Event push failed (execution_id=%s): %s", execution_id, exc)
-
-    _EVENT_PUSH_POOL.submit(_do_push)
+    """Queue an event for {server_url}/agent/events/{executionId} on the shared publisher."""
+    event_publisher().publish(execution_id, event, server_url, auth_key, auth_secret)
@@ -8,8 +8,41 @@ process crashes.  This module handles message accumulation, trimming, and
 from __future__ import annotations
 
 import copy
+import json
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional
+
+
+class _Record(NamedTuple):
+    """A stored message with its position and token estimate, computed once."""
+
+    seq: int
+    message: Dict[str, Any]
+    tokens: int
+    nested: bool
+
+
+def estimate_tokens(message: Dict[str, Any]) -> int:
+    """Rough token count of *message*: about four characters per token."""
+    try:
+        size = len(json.dumps(message, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        size = len(str(message))
+    return size // 4 + 1
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copies the dicts and lists of JSON-like *value*; other values are shared."""
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+
+def _copy_message(record: _Record) -> Dict[str, Any]:
+    return _copy_containers(record.message) if record.nested else dict(record.message)
 
 
 @dataclass
@@ -20,49 +53,68 @@ class ConversationMemory:
     ``workflow.variables`` so that conversation state is persisted
     across workflow executions and process restarts.
 
+    System messages and the rest of the conversation are kept apart, the
+    latter in a deque, so trimming drops the oldest messages in constant
+    time instead of rebuilding the history.  Messages are copied on the way
+    in and out, so the stored ones, and their token estimates, only change
+    through this class.
+
     Attributes:
-        messages: The accumulated conversation messages.
+        messages: The accumulated conversation messages, in order.  Reading
+            it builds a list of copies whose in-place changes (``append``,
+            item assignment, ``del`` ...) are written back to the memory, as
+            they were when this was a plain list; like then, they bypass
+            trimming.  Editing a message dict in place does not change the
+            memory: assign the changed message back instead.  Assign the
+            attribute to replace the history.
         max_messages: Maximum messages to retain (oldest are trimmed).
+        token_budget: Maximum estimated tokens to retain (see
+            :func:`estimate_tokens`).  The oldest non-system messages are
+            trimmed past it; system messages and the newest message are kept.
     """
 
     messages: List[Dict[str, Any]] = field(default_factory=list)
     max_messages: Optional[int] = None
+    token_budget: Optional[int] = None
+
+    @property
+    def token_count(self) -> int:
+        """Estimated tokens of the retained messages."""
+        return self._tokens
 
     def add_user_message(self, content: str) -> None:
         """Append a user message to the conversation."""
-        self.messages.append({"role": "user", "message": content})
-        self._trim()
+        self._append({"role": "user", "message": content})
 
     def add_assistant_message(self, content: str) -> None:
         """Append an assistant message to the conversation."""
-        self.messages.append({"role": "assistant", "message": content})
-        self._trim()
+        self._append({"role": "assistant", "message": content})
 
     def add_system_message(self, content: str) -> None:
         """Append a system message to the conversation."""
-        self.messages.append({"role": "system", "message": content})
-        self._trim()
+        self._append({"role": "system", "message": content})
 
     def add_tool_call(
         self, tool_name: str, arguments: Dict[str, Any], task_reference_name: Optional[str] = None
     ) -> None:
         """Record a tool call in the conversation."""
         ref = task_reference_name or f"{tool_name}_ref"
-        self.messages.append(
+        self._append(
             {
                 "role": "tool_call",
                 "message": "",
-                "tool_calls": [{"name": tool_name, "taskReferenceName": ref, "input": arguments}],
+                "tool_calls": [
+                    {"name": tool_name, "taskReferenceName": ref, "input": copy.deepcopy(arguments)}
+                ],
             }
         )
-        self._trim()
 
     def add_tool_result(
         self, tool_name: str, result: Any, task_reference_name: Optional[str] = None
     ) -> None:
         """Record a tool result in the conversation."""
         ref = task_reference_name or f"{tool_name}_ref"
-        self.messages.append(
+        self._append(
             {
                 "role": "tool",
                 "message": str(result),
@@ -70,15 +122,57 @@ class ConversationMemory:
                 "taskReferenceName": ref,
             }
         )
-        self._trim()
 
     def to_chat_messages(self) -> List[Dict[str, Any]]:
-        """Return messages in a format compatible with ``ChatMessage``."""
-        return copy.deepcopy(self.messages)
+        """Return messages in a format compatible with ``ChatMessage``.
+
+        The dicts are copies; changing them does not change the memory.
+        """
+        return [_copy_message(r) for r in self._records()]
 
     def clear(self) -> None:
         """Clear all conversation history."""
-        self.messages.clear()
+        self._system: Deque[_Record] = deque()
+        self._turns: Deque[_Record] = deque()
+        self._tokens = 0
+        self._seq = 0
+
+    def _records(self) -> Iterable[_Record]:
+        if not self._system:
+            return self._turns
+        if not self._turns:
+            return self._system
+        # Two runs already ordered by seq: sorting them is a linear merge.
+        return sorted([*self._system, *self._turns])
+
+    def _get_messages(self) -> List[Dict[str, Any]]:
+        return _MessageList((_copy_message(r) for r in self._records()), self)
+
+    def _set_messages(self, messages: Iterable[Dict[str, Any]]) -> None:
+        self.clear()
+        for message in messages:
+            self._store(message)
+
+    def _append(self, message: Dict[str, Any]) -> None:
+        # The add_* methods build a fresh dict, so it is stored as is.
+        self._store(message, copy=False)
+        self._trim()
+
+    def _store(self, message: Dict[str, Any], copy: bool = True) -> None:
+        if copy:
+            message = _copy_containers(message)
+        record = _Record(
+            self._seq,
+            message,
+            estimate_tokens(message),
+            any(isinstance(v, (dict, list)) for v in message.values()),
+        )
+        self._seq += 1
+        self._tokens += record.tokens
+        if message.get("role") == "system":
+            self._system.append(record)
+        else:
+            self._turns.append(record)
 
     def _trim(self) -> None:
         """Trim messages to stay within configured limits.
@@ -86,27 +180,82 @@ class ConversationMemory:
         Preserves original ordering: removes the oldest non-system messages
         first while keeping all system messages in their original positions.
         """
-        if self.max_messages and len(self.messages) > self.max_messages:
-            system_count = sum(1 for m in self.messages if m.get("role") == "system")
-            if system_count >= self.max_messages:
+        if self.max_messages:
+            if len(self._system) >= self.max_messages:
                 # More system messages than budget — keep only the latest
-                system_msgs = [m for m in self.messages if m.get("role") == "system"]
-                self.messages = system_msgs[-self.max_messages :]
-                return
-
-            # Number of non-system messages we can keep
-            keep_non_system = self.max_messages - system_count
-            # Count non-system messages from the end to find the cutoff
-            non_system_seen = 0
-            cutoff_idx = len(self.messages)
-            for i in range(len(self.messages) - 1, -1, -1):
-                if self.messages[i].get("role") != "system":
-                    non_system_seen += 1
-                    if non_system_seen == keep_non_system:
-                        cutoff_idx = i
-                        break
-
-            # Keep all messages from cutoff_idx onward, plus system messages before it
-            result = [m for m in self.messages[:cutoff_idx] if m.get("role") == "system"]
-            result.extend(self.messages[cutoff_idx:])
-            self.messages = result
+                while self._turns:
+                    self._drop(self._turns)
+                while len(self._system) > self.max_messages:
+                    self._drop(self._system)
+            else:
+                while len(self._system) + len(self._turns) > self.max_messages:
+                    self._drop(self._turns)
+        if self.token_budget is not None:
+            while self._tokens > self.token_budget and len(self._turns) > 1:
+                self._drop(self._turns)
+
+    def _drop(self, records: Deque[_Record]) -> None:
+        self._tokens -= records.popleft().tokens
+
+
+def _write_through(name: str) -> Any:
+    method = getattr(list, name)
+
+    def mutate(self: "_MessageList", *args: Any) -> Any:
+        memory = self._memory
+        if memory is None:
+            return method(self, *args)
+        # Apply the change to the current history, which may have grown
+        # since this list was read, and store the result.
+        list.__setitem__(self, slice(None), [_copy_message(r) for r in memory._records()])
+        result = method(self, *args)
+        memory._set_messages(self)
+        return self if result is self else result
+
+    mutate.__name__ = name
+    return mutate
+
+
+class _MessageList(list):
+    """The list returned by ``ConversationMemory.messages``.
+
+    Appending stores the message directly; other in-place changes rebuild
+    the memory's history from the changed list.  Copies are plain lists.
+    """
+
+    def __init__(self, iterable: Iterable[Dict[str, Any]] = (), memory: Optional[ConversationMemory] = None) -> None:
+        super().__init__(iterable)
+        self._memory = memory
+
+    def append(self, message: Dict[str, Any]) -> None:
+        super().append(message)
+        if self._memory is not None:
+            self._memory._store(message)
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        for message in list(messages):
+            self.append(message)
+
+    def __iadd__(self, messages: Iterable[Dict[str, Any]]) -> "_MessageList":
+        self.extend(messages)
+        return self
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return list, (list(self),)
+
+    insert = _write_through("insert")
+    pop = _write_through("pop")
+    remove = _write_through("remove")
+    clear = _write_through("clear")
+    sort = _write_through("sort")
+    reverse = _write_through("reverse")
+    __setitem__ = _write_through("__setitem__")
+    __delitem__ = _write_through("__delitem__")
+    __imul__ = _write_through("__imul__")
+
+
+# ``messages`` is a dataclass field, so that it stays an ``__init__`` argument
+# and part of ``repr``/``==``, but is stored as the records above.
+ConversationMemory.messages = property(  # type: ignore[assignment]
+    ConversationMemory._get_messages, ConversationMemory._set_messages
+)
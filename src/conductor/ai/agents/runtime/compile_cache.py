@@ -0,0 +1,178 @@
+"""Content-addressed cache of server-compiled agent workflows.
+
+``/agent/compile`` output depends on the request payload (the serialized
+``AgentConfig``), the server it was sent to and the compiler versions on
+both sides, so compilations are keyed by a SHA-256 of the payload, the
+server URL and the SDK version rather than by agent name: an agent whose
+config changes under the same name gets a new key, and an unchanged agent
+is not recompiled when a new process starts.  The server's build is not
+visible to the SDK, so entries also expire ``ttl_seconds`` after they were
+compiled, which bounds how long a server upgrade goes unnoticed.
+
+``CompileCache`` keeps results in memory and, when given a directory, as
+one JSON file per key so that every process on the host shares them.
+Files are written to a temporary name and renamed into place, so readers
+never see a partial entry; a hit refreshes the file's mtime and the oldest
+files are evicted once the directory exceeds ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from conductor import __version__
+
+logger = logging.getLogger("conductor.ai.agents.runtime.compile_cache")
+
+_SUFFIX = ".json"
+
+
+def compile_cache_key(payload: Dict[str, Any], server_url: str = "") -> str:
+    """Stable hash of a compile request and the SDK version; key order in *payload* does not matter."""
+    canonical = json.dumps(
+        {"server": server_url, "sdk": __version__, "request": payload},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CompileCache:
+    """Compile responses by :func:`compile_cache_key`, in memory and optionally on disk.
+
+    Args:
+        directory: Where to persist entries; ``None`` keeps them in memory only.
+        max_bytes: Size budget of *directory*; least recently used entries are
+            removed past it.
+        ttl_seconds: Age after which an entry is a miss; ``None`` keeps
+            entries until they are evicted.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self.directory = os.path.expanduser(directory) if directory else None
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # key -> (time.time() when stored, response)
+        self._memory: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The cached compile response for *key*, or ``None``."""
+        with self._lock:
+            cached = self._memory.get(key)
+        if cached is not None:
+            if not self._expired(cached[0]):
+                return cached[1]
+            with self._lock:
+                self._memory.pop(key, None)
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            stored_at, data = float(entry["storedAt"]), entry["data"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Discarding unreadable compile cache entry %s: %s", path, e)
+            self._remove(path)
+            return None
+        if self._expired(stored_at):
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._memory[key] = (stored_at, data)
+        return data
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Stores a compile response; disk errors are logged and otherwise ignored."""
+        stored_at = time.time()
+        with self._lock:
+            self._memory[key] = (stored_at, data)
+        if not self.directory:
+            return
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=_SUFFIX)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"storedAt": stored_at, "data": data}, f, separators=(",", ":"), default=str)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                self._remove(tmp)
+                raise
+        except OSError as e:
+            logger.warning("Could not write compile cache entry to %s: %s", self.directory, e)
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """Drops every entry, including the files in *directory*."""
+        with self._lock:
+            self._memory.clear()
+        if self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith(_SUFFIX):
+                    self._remove(os.path.join(self.directory, name))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(_SUFFIX) or entry.name.startswith(".tmp-"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        # Never evict the newest entry, even if it alone exceeds the budget.
+        for _, size, path in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
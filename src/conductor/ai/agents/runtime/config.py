@@ -14,6 +14,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass
+from typing import Optional
 def _env(var: str, default=None):
     """Read an environment variable, treating blank values as unset."""
     value = os.environ.get(var)
@@ -80,6 +81,34 @@ class AgentConfig:
         liveness_stall_seconds: Idle window (no polls) before a run is
             considered stalled.
         liveness_check_interval_seconds: How often the monitor polls.
+        shared_status_watcher: Wait for executions through one batched
+            :class:`WorkflowWatcher` shared by all waiters instead of polling
+            each execution's status every second.
+        compile_cache_dir: Directory shared by all processes on the host in
+            which server compilations are cached, keyed by a hash of the
+            serialized agent config. ``None`` caches in memory only.
+        compile_cache_max_bytes: Size budget of ``compile_cache_dir``; the
+            least recently used entries are evicted past it.
+        compile_cache_ttl_seconds: Seconds a compiled workflow is reused
+            before the agent is compiled again, so server upgrades are picked
+            up; 0 never expires entries.
+        prepare_concurrency: Maximum concurrent server calls while preparing
+            an agent tree (integration upserts, prompt template
+            associations, compilation).
+        bulk_register_task_defs: Register the task definitions of all tool
+            workers from the runtime's process with a few bulk requests,
+            skipping definitions the server already has, instead of from
+            every worker process at startup.
+        stream_max_sse_connections: Executions :attr:`AgentRuntime.stream_hub`
+            reads over SSE at once; further executions are polled.
+        stream_queue_size: Events the stream hub buffers per subscriber
+            before it pauses reading that execution.
+        mcp_discovery_ttl_seconds: Seconds a tool list discovered by
+            :meth:`AgentRuntime.discover_mcp_tools` is reused before the MCP
+            server is asked again; 0 never expires it.
+        mcp_discovery_cache_dir: Directory in which discovered MCP tool lists
+            are shared by all processes on the host and across restarts.
+            ``None`` caches in memory only.
     """
 
     worker_poll_interval_ms: int = 100
@@ -91,6 +120,16 @@ class AgentConfig:
     liveness_enabled: bool = True
     liveness_stall_seconds: float = 30.0
     liveness_check_interval_seconds: float = 10.0
+    shared_status_watcher: bool = False
+    compile_cache_dir: Optional[str] = None
+    compile_cache_max_bytes: int = 64 * 1024 * 1024
+    compile_cache_ttl_seconds: float = 86400.0
+    prepare_concurrency: int = 8
+    bulk_register_task_defs: bool = True
+    stream_max_sse_connections: int = 64
+    stream_queue_size: int = 256
+    mcp_discovery_ttl_seconds: float = 300.0
+    mcp_discovery_cache_dir: Optional[str] = None
 
     @classmethod
     def from_env(cls) -> AgentConfig:
@@ -108,4 +147,14 @@ class AgentConfig:
             liveness_enabled=_env_bool("CONDUCTOR_AGENT_LIVENESS_ENABLED", True),
             liveness_stall_seconds=_env_float("CONDUCTOR_AGENT_LIVENESS_STALL_SECONDS", 30.0),
             liveness_check_interval_seconds=_env_float("CONDUCTOR_AGENT_LIVENESS_CHECK_INTERVAL_SECONDS", 10.0),
+            shared_status_watcher=_env_bool("CONDUCTOR_AGENT_SHARED_STATUS_WATCHER", False),
+            compile_cache_dir=_env("CONDUCTOR_AGENT_COMPILE_CACHE_DIR"),
+            compile_cache_max_bytes=_env_int("CONDUCTOR_AGENT_COMPILE_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+            compile_cache_ttl_seconds=_env_float("CONDUCTOR_AGENT_COMPILE_CACHE_TTL_SECONDS", 86400.0),
+            prepare_concurrency=_env_int("CONDUCTOR_AGENT_PREPARE_CONCURRENCY", 8),
+            bulk_register_task_defs=_env_bool("CONDUCTOR_AGENT_BULK_REGISTER_TASK_DEFS", True),
+            stream_max_sse_connections=_env_int("CONDUCTOR_AGENT_STREAM_MAX_SSE_CONNECTIONS", 64),
+            stream_queue_size=_env_int("CONDUCTOR_AGENT_STREAM_QUEUE_SIZE", 256),
+            mcp_discovery_ttl_seconds=_env_float("CONDUCTOR_AGENT_MCP_DISCOVERY_TTL_SECONDS", 300.0),
+            mcp_discovery_cache_dir=_env("CONDUCTOR_AGENT_MCP_DISCOVERY_CACHE_DIR"),
         )
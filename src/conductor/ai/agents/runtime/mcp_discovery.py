@@ -7,8 +7,15 @@ each with proper name, description, and input schema.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from conductor.ai.agents.tool import ToolDef
@@ -16,36 +23,246 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("conductor.ai.agents.runtime.mcp_discovery")
 
+# (server_url, headers) of one MCP server.
+McpServer = Tuple[str, Optional[Dict[str, str]]]
+
 # Module-level cache: server_url -> list of discovered tool dicts
 _discovery_cache: Dict[str, List[Dict[str, Any]]] = {}
 
 
-def discover_mcp_tools(
-    executor: "WorkflowExecutor",
-    server_url: str,
-    headers: Optional[Dict[str, str]] = None,
-) -> List[Dict[str, Any]]:
-    """Discover tools from an MCP server via ``LIST_MCP_TOOLS``.
+class McpToolDiscovery:
+    """Discovers MCP server tools, caching them with a TTL in memory and on disk.
 
-    Builds a minimal one-task workflow, executes it inline (no pre-registration),
-    and returns the list of tool descriptors from the server output.
+    A server's tool list is reused for ``ttl_seconds`` after it was
+    discovered.  Past that it is refreshed: an unchanged list keeps the
+    cached one, and a failed refresh keeps serving it and retries after
+    ``failure_ttl_seconds``.  Servers that could not be discovered at all
+    are cached as ``[]`` for ``failure_ttl_seconds``.
 
-    Results are cached per *server_url* so repeated calls for the same server
-    are free.
+    With *cache_dir*, successful discoveries are also written there, one
+    JSON file per server renamed into place, and a process whose entry is
+    missing or expired adopts a fresh one written by another process (or
+    before a restart) instead of discovering again.  Files are named by a
+    hash of the server URL and headers; headers are not stored.
 
     Args:
-        executor: A ``WorkflowExecutor`` used to run the discovery workflow.
-        server_url: URL of the MCP server.
-        headers: Optional HTTP headers for MCP server authentication.
-
-    Returns:
-        A list of dicts, each with ``name``, ``description``, and
-        ``inputSchema`` keys.  Returns ``[]`` on failure (graceful fallback).
+        ttl_seconds: Seconds a discovered tool list stays fresh; ``None``
+            never expires it.
+        failure_ttl_seconds: Seconds before a failed discovery is retried.
+        cache_dir: Directory shared by all processes; ``None`` caches in
+            memory only.
+        max_workers: Servers discovered at once by :meth:`discover_many`.
+        memory: The dict used as the in-memory layer, keyed by server URL.
     """
-    if server_url in _discovery_cache:
-        logger.debug("MCP discovery cache hit for %s", server_url)
-        return _discovery_cache[server_url]
 
+    def __init__(
+        self,
+        *,
+        ttl_seconds: Optional[float] = 300.0,
+        failure_ttl_seconds: float = 30.0,
+        cache_dir: Optional[str] = None,
+        max_workers: int = 8,
+        memory: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self.max_workers = max_workers
+        self._memory = memory if memory is not None else {}
+        # Entries without an expiry (seeded by hand) never expire.
+        self._expires_at: Dict[str, float] = {}
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._server_locks: Dict[str, threading.Lock] = {}
+
+    def discover(
+        self,
+        executor: "WorkflowExecutor",
+        server_url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """The tools of one server, from the cache while fresh."""
+        key = _server_key(server_url, headers)
+        cached = self._fresh(key)
+        if cached is not None:
+            logger.debug("MCP discovery cache hit for %s", server_url)
+            return cached
+        with self._server_lock(key):
+            # Another thread may have discovered it while this one waited.
+            cached = self._fresh(key)
+            if cached is not None:
+                return cached
+            return self._refresh(executor, key, server_url, headers)
+
+    def discover_many(
+        self, executor: "WorkflowExecutor", servers: Iterable[McpServer]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """The tools of each of *servers*, discovering the uncached ones concurrently.
+
+        Returns:
+            A dict of server URL to its tool descriptors.
+        """
+        unique = {_server_key(url, headers): (url, headers) for url, headers in servers}
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        pending = []
+        for url, headers in unique.values():
+            cached = self._fresh(_server_key(url, headers))
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append((url, headers))
+        if len(pending) <= 1 or self.max_workers <= 1:
+            for url, headers in pending:
+                results[url] = self.discover(executor, url, headers)
+            return results
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)), thread_name_prefix="mcp-discovery"
+        ) as pool:
+            futures = {
+                url: pool.submit(self.discover, executor, url, headers) for url, headers in pending
+            }
+            for url, future in futures.items():
+                results[url] = future.result()
+        return results
+
+    def discover_agent(
+        self, executor: "WorkflowExecutor", agent: Any
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """The tools of every MCP server used in *agent*'s tree (see :meth:`discover_many`)."""
+        return self.discover_many(executor, mcp_servers(agent))
+
+    def clear(self) -> None:
+        """Drops every cached tool list, including those in *cache_dir*."""
+        with self._lock:
+            self._memory.clear()
+            self._expires_at.clear()
+        if self.cache_dir:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json"):
+                    _remove(os.path.join(self.cache_dir, name))
+
+    def _fresh(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            tools = self._memory.get(key)
+            expires_at = self._expires_at.get(key)
+        if tools is not None and (expires_at is None or time.time() < expires_at):
+            return tools
+        entry = self._read(key)
+        if entry is None:
+            return None
+        expires_at = self._expiry(entry["discovered_at"])
+        if expires_at is not None and time.time() >= expires_at:
+            return None
+        with self._lock:
+            self._memory[key] = entry["tools"]
+            self._set_expiry(key, expires_at)
+        return entry["tools"]
+
+    def _refresh(
+        self,
+        executor: "WorkflowExecutor",
+        key: str,
+        server_url: str,
+        headers: Optional[Dict[str, str]],
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            stale = self._memory.get(key)
+        tools = _run_discovery(executor, server_url, headers)
+        now = time.time()
+        if tools is None:
+            if stale:
+                logger.warning("Keeping the cached tools of MCP server %s", server_url)
+            tools = stale or []
+            with self._lock:
+                self._memory[key] = tools
+                self._expires_at[key] = now + self.failure_ttl_seconds
+            return tools
+        if stale is not None and tools == stale:
+            logger.debug("MCP server %s tools unchanged", server_url)
+            tools = stale
+        else:
+            logger.info("Discovered %d tools from MCP server %s", len(tools), server_url)
+        with self._lock:
+            self._memory[key] = tools
+            self._set_expiry(key, self._expiry(now))
+        self._write(key, {"server_url": server_url, "tools": tools, "discovered_at": now})
+        return tools
+
+    def _expiry(self, discovered_at: float) -> Optional[float]:
+        return None if self.ttl_seconds is None else discovered_at + self.ttl_seconds
+
+    def _set_expiry(self, key: str, expires_at: Optional[float]) -> None:
+        if expires_at is None:
+            self._expires_at.pop(key, None)
+        else:
+            self._expires_at[key] = expires_at
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".json")
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable MCP discovery cache entry %s: %s", path, e)
+            return None
+        if not (
+            isinstance(entry, dict)
+            and isinstance(entry.get("tools"), list)
+            and isinstance(entry.get("discovered_at"), (int, float))
+        ):
+            return None
+        return entry
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        if not self.cache_dir:
+            return
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-", suffix=".part")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, separators=(",", ":"), default=str)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                _remove(tmp)
+                raise
+        except OSError as e:
+            logger.warning("Could not write MCP discovery cache entry to %s: %s", self.cache_dir, e)
+
+    def _server_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._server_locks.setdefault(key, threading.Lock())
+
+
+def _server_key(server_url: str, headers: Optional[Dict[str, str]]) -> str:
+    """Cache key of a server: its URL, plus a hash of its headers if it has any."""
+    if not headers:
+        return server_url
+    digest = hashlib.sha256(json.dumps(headers, sort_keys=True).encode("utf-8")).hexdigest()
+    return f"{server_url}#{digest[:16]}"
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _run_discovery(
+    executor: "WorkflowExecutor",
+    server_url: str,
+    headers: Optional[Dict[str, str]],
+) -> Optional[List[Dict[str, Any]]]:
+    """Runs the ``LIST_MCP_TOOLS`` workflow; ``None`` if it failed."""
     try:
         from conductor.client.workflow.conductor_workflow import ConductorWorkflow
         from conductor.client.workflow.task.llm_tasks.list_mcp_tools import ListMcpTools
@@ -75,18 +292,94 @@ def discover_mcp_tools(
                 server_url,
                 reason,
             )
-            _discovery_cache[server_url] = []
-            return []
+            return None
 
-        tools = (run.output or {}).get("tools") or []
-        logger.info("Discovered %d tools from MCP server %s", len(tools), server_url)
-        _discovery_cache[server_url] = tools
-        return tools
+        return (run.output or {}).get("tools") or []
 
     except Exception as exc:
         logger.warning("MCP discovery failed for %s: %s", server_url, exc)
-        _discovery_cache[server_url] = []
-        return []
+        return None
+
+
+def mcp_servers(agent: Any) -> List[McpServer]:
+    """Distinct ``(server_url, headers)`` of the ``mcp_tool()`` tools in the agent tree."""
+    from conductor.ai.agents.runtime.preparation import walk_agents
+    from conductor.ai.agents.tool import ToolDef
+
+    servers: Dict[str, McpServer] = {}
+    for a in walk_agents(agent):
+        for td in a.tools:
+            if not isinstance(td, ToolDef) or td.tool_type != "mcp":
+                continue
+            server_url = td.config.get("server_url")
+            if server_url:
+                headers = td.config.get("headers")
+                servers.setdefault(_server_key(server_url, headers), (server_url, headers))
+    return list(servers.values())
+
+
+def _default_discovery() -> McpToolDiscovery:
+    from conductor.ai.agents.runtime.config import _env, _env_float
+
+    ttl = _env_float("CONDUCTOR_AGENT_MCP_DISCOVERY_TTL_SECONDS", 300.0)
+    return McpToolDiscovery(
+        ttl_seconds=ttl if ttl > 0 else None,
+        cache_dir=_env("CONDUCTOR_AGENT_MCP_DISCOVERY_CACHE_DIR"),
+        memory=_discovery_cache,
+    )
+
+
+_DEFAULT: Optional[McpToolDiscovery] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def _discovery() -> McpToolDiscovery:
+    global _DEFAULT
+    if _DEFAULT is None:
+        with _DEFAULT_LOCK:
+            if _DEFAULT is None:
+                _DEFAULT = _default_discovery()
+    return _DEFAULT
+
+
+def discover_mcp_tools(
+    executor: "WorkflowExecutor",
+    server_url: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Discover tools from an MCP server via ``LIST_MCP_TOOLS``.
+
+    Builds a minimal one-task workflow, executes it inline (no pre-registration),
+    and returns the list of tool descriptors from the server output.
+
+    Results are cached per *server_url* (and *headers*) for
+    ``CONDUCTOR_AGENT_MCP_DISCOVERY_TTL_SECONDS`` (default 300; 0 never
+    expires) and, if ``CONDUCTOR_AGENT_MCP_DISCOVERY_CACHE_DIR`` is set,
+    shared on disk with other processes.  See :class:`McpToolDiscovery`.
+
+    Args:
+        executor: A ``WorkflowExecutor`` used to run the discovery workflow.
+        server_url: URL of the MCP server.
+        headers: Optional HTTP headers for MCP server authentication.
+
+    Returns:
+        A list of dicts, each with ``name``, ``description``, and
+        ``inputSchema`` keys.  Returns ``[]`` on failure (graceful fallback).
+    """
+    return _discovery().discover(executor, server_url, headers)
+
+
+def discover_agent_mcp_tools(
+    executor: "WorkflowExecutor", agent: Any
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Discover the tools of every MCP server in *agent*'s tree concurrently.
+
+    Uses the same cache as :func:`discover_mcp_tools`.
+
+    Returns:
+        A dict of server URL to its tool descriptors.
+    """
+    return _discovery().discover_agent(executor, agent)
 
 
 def expand_mcp_tool_def(
@@ -157,4 +450,6 @@ def clear_discovery_cache() -> None:
 
     Useful in tests or when MCP server tool definitions change.
     """
+    if _DEFAULT is not None:
+        _DEFAULT.clear()
     _discovery_cache.clear()
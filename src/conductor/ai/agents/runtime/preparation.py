@@ -0,0 +1,144 @@
+"""Concurrent preparation of an agent tree before it runs.
+
+Preparing an agent touches the server several times: LLM integrations
+and models are upserted, prompt templates are associated with the models
+that use them, and the agent is compiled.  Templates are associated with
+``integration:model`` names, so that phase runs after the integrations are
+upserted; compilation is independent of both and overlaps with them.
+Within each phase the items (providers, models, templates) are independent,
+so ``AgentRuntime`` collects them for the whole tree, removes duplicates
+and runs them with bounded parallelism.
+
+``PreparationReport`` records how long each phase took so slow start-ups
+can be attributed to a phase.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("conductor.ai.agents.runtime.preparation")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class PreparationReport:
+    """Wall-clock seconds per preparation phase, and in total.
+
+    Phases run concurrently, so ``total_seconds`` is usually less than the
+    sum of ``phases``.
+    """
+
+    agent_name: str
+    phases: Dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        breakdown = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in self.phases.items())
+        return f"prepared '{self.agent_name}' in {self.total_seconds:.2f}s ({breakdown})"
+
+
+def walk_agents(agent: Any) -> Iterator[Any]:
+    """Yields *agent* and its sub-agents depth-first, each once."""
+    from conductor.ai.agents.agent import Agent
+
+    seen: set = set()
+    stack = [agent]
+    while stack:
+        current = stack.pop()
+        if not isinstance(current, Agent) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        stack.extend(reversed(current.agents))
+
+
+def collect_models(agent: Any) -> List[str]:
+    """Distinct model strings used in the agent tree, in tree order."""
+    return list(dict.fromkeys(a.model for a in walk_agents(agent) if a.model))
+
+
+def collect_template_models(agent: Any) -> Dict[str, List[str]]:
+    """Prompt template name -> distinct models of the agents whose instructions use it."""
+    from conductor.ai.agents.agent import PromptTemplate
+
+    templates: Dict[str, List[str]] = {}
+    for a in walk_agents(agent):
+        if isinstance(a.instructions, PromptTemplate) and a.model:
+            models = templates.setdefault(a.instructions.name, [])
+            if a.model not in models:
+                models.append(a.model)
+    return templates
+
+
+def map_concurrently(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> List[R]:
+    """``[fn(item) for item in items]`` with up to *max_workers* calls in flight.
+
+    A single item runs on the calling thread.  The first exception is
+    re-raised after the remaining calls finish.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)), thread_name_prefix="agent-prepare"
+    ) as pool:
+        return list(pool.map(fn, items))
+
+
+def run_phases(
+    agent_name: str,
+    phases: List[Tuple[str, Callable[[], Any]]],
+    max_workers: int,
+    *,
+    after: Optional[Dict[str, str]] = None,
+) -> Tuple[PreparationReport, Dict[str, Any]]:
+    """Runs *phases* concurrently and times each of them.
+
+    *after* maps a phase name to the earlier phase it must follow; such a
+    phase runs on the same thread once its prerequisite has returned, and
+    is skipped if the prerequisite fails.
+
+    Returns the report and each phase's return value by name.  The first
+    phase to fail re-raises once all phases have finished.
+    """
+    report = PreparationReport(agent_name)
+    started = time.monotonic()
+    after = after or {}
+    chains: List[List[Tuple[str, Callable[[], Any]]]] = []
+    chain_of: Dict[str, List[Tuple[str, Callable[[], Any]]]] = {}
+    for name, fn in phases:
+        chain = chain_of.get(after.get(name, ""))
+        if chain is None:
+            chain = []
+            chains.append(chain)
+        chain.append((name, fn))
+        chain_of[name] = chain
+
+    def _timed(chain: List[Tuple[str, Callable[[], Any]]]) -> List[Any]:
+        results = []
+        for name, fn in chain:
+            phase_started = time.monotonic()
+            try:
+                results.append(fn())
+            finally:
+                report.phases[name] = time.monotonic() - phase_started
+        return results
+
+    chain_results = map_concurrently(_timed, chains, max_workers)
+    report.total_seconds = time.monotonic() - started
+    # Report phases in declaration order regardless of completion order.
+    report.phases = {name: report.phases[name] for name, _ in phases}
+    logger.debug("%s", report)
+    results = {
+        name: result
+        for chain, values in zip(chains, chain_results)
+        for (name, _), result in zip(chain, values)
+    }
+    return report, results
@@ -17,10 +17,11 @@ import re
 import threading
 import time
 import uuid
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from conductor.ai.agents.runtime.config import AgentConfig
+    from conductor.ai.agents.runtime.stream_hub import StreamHub
     from conductor.client.configuration.configuration import Configuration
 
 from conductor.ai.agents.agent import Agent
@@ -390,6 +391,10 @@ class AgentRuntime:
         self._workflow_client = self._clients.get_workflow_client()
         self._task_client = self._clients.get_task_client()
         self._schedule_client_instance: Optional[Any] = None
+        self._status_watcher: Optional[Any] = None
+        self._status_watcher_lock = threading.Lock()
+        self._stream_hub: Optional[Any] = None
+        self._mcp_discovery: Optional[Any] = None
 
         from conductor.ai.agents.runtime.worker_manager import WorkerManager
 
@@ -398,9 +403,17 @@ class AgentRuntime:
             poll_interval_ms=self._config.worker_poll_interval_ms,
             thread_count=self._config.worker_thread_count,
             daemon=self._config.daemon_workers,
+            bulk_register_task_defs=self._config.bulk_register_task_defs,
         )
 
-        self._compiled_workflows: Dict[str, Any] = {}
+        from conductor.ai.agents.runtime.compile_cache import CompileCache
+
+        compile_ttl = self._config.compile_cache_ttl_seconds
+        self._compile_cache = CompileCache(
+            self._config.compile_cache_dir,
+            max_bytes=self._config.compile_cache_max_bytes,
+            ttl_seconds=compile_ttl if compile_ttl > 0 else None,
+        )
         self._workers_started = False
         self._registered_tool_names: set = set()
         self._worker_start_lock = threading.Lock()
@@ -408,7 +421,11 @@ class AgentRuntime:
         self._is_shutdown = False
         self._integration_client_instance: Optional[Any] = None
         self._prompt_client_instance: Optional[Any] = None
+        self._client_lock = threading.Lock()
         self._ensured_models: set = set()
+        self._ensured_providers: set = set()
+        self._integration_lock = threading.Lock()
+        self.last_preparation: Optional[Any] = None
         self._integration_api_available: Optional[bool] = None
         self._sse_fallback_warned = False
 
@@ -706,13 +723,11 @@ class AgentRuntime:
 
         Compilation is always server-side. The Python SDK serializes
         the agent config and sends it to the Java runtime which compiles
-        the Conductor workflow.
+        the Conductor workflow.  Results are cached by a hash of the
+        serialized config (see :mod:`~conductor.ai.agents.runtime.compile_cache`),
+        so a changed agent is recompiled even if its name is unchanged.
         """
-        if agent.name not in self._compiled_workflows:
-            wf = self._compile_via_server(agent)
-            self._compiled_workflows[agent.name] = wf
-            logger.info("Compiled agent '%s' via server", agent.name)
-        return self._compiled_workflows[agent.name]
+        return self._compile_via_server(agent)
 
     def _compile_via_server(self, agent: Agent) -> Any:
         """Compile an agent via the server's /agent/compile endpoint.
@@ -725,47 +740,76 @@ class AgentRuntime:
         raw ``WorkflowDef`` that implements the interface the runtime
         needs (``to_workflow_def()``, ``start_workflow_with_input()``).
         """
-        from conductor.ai.agents.config_serializer import AgentConfigSerializer
+        return self._wrap_compiled(self._compile_payload(self._compile_request(agent)))
 
-        serializer = AgentConfigSerializer()
-        config_json = serializer.serialize(agent)
-
-        data = self._agent_client.compile_agent({"agentConfig": config_json})
+    async def _compile_via_server_async(self, agent: Agent) -> Any:
+        """Async version of :meth:`_compile_via_server`."""
+        payload = self._compile_request(agent)
+        key = self._compile_cache_key(payload)
+        data = self._compile_cache.get(key)
+        if data is None:
+            data = await self._agent_client.compile_agent_async(payload)
+            self._compile_cache.put(key, data)
+            logger.info("Compiled agent '%s' via server", agent.name)
+        return self._wrap_compiled(data)
 
-        workflow_def_dict = data.get("workflowDef", data)
+    def precompile(self, *agents: Agent, max_workers: int = 8) -> List[Any]:
+        """Compile several agents, sending the server calls for cache misses concurrently.
 
-        return ServerCompiledWorkflow(
-            executor=self._executor,
-            workflow_def_dict=workflow_def_dict,
-        )
+        Warms the compile cache at service start-up so that the first
+        ``run()`` / ``start()`` of each agent does not wait on the server.
+        Agents with identical configs are compiled once.
 
-    async def _compile_via_server_async(self, agent: Agent) -> Any:
-        """Async version of :meth:`_compile_via_server`."""
+        Returns:
+            One compiled workflow per agent, in argument order.
+        """
+        from conductor.ai.agents.runtime.preparation import map_concurrently
+
+        payloads = [self._compile_request(agent) for agent in agents]
+        misses: Dict[str, Dict[str, Any]] = {}
+        for payload in payloads:
+            key = self._compile_cache_key(payload)
+            if key not in misses and self._compile_cache.get(key) is None:
+                misses[key] = payload
+        map_concurrently(self._compile_payload, misses.values(), max_workers)
+        return [self._wrap_compiled(self._compile_payload(payload)) for payload in payloads]
+
+    def _compile_request(self, agent: Agent) -> Dict[str, Any]:
         from conductor.ai.agents.config_serializer import AgentConfigSerializer
 
         serializer = AgentConfigSerializer()
-        config_json = serializer.serialize(agent)
+        return {"agentConfig": serializer.serialize(agent)}
+
+    def _compile_cache_key(self, payload: Dict[str, Any]) -> str:
+        from conductor.ai.agents.runtime.compile_cache import compile_cache_key
 
-        data = await self._agent_client.compile_agent_async({"agentConfig": config_json})
-        workflow_def_dict = data.get("workflowDef", data)
+        return compile_cache_key(payload, self._conductor_config.host or "")
 
+    def _compile_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST *payload* to /agent/compile unless an identical request is cached."""
+        key = self._compile_cache_key(payload)
+        data = self._compile_cache.get(key)
+        if data is None:
+            data = self._agent_client.compile_agent(payload)
+            self._compile_cache.put(key, data)
+            name = (payload.get("agentConfig") or payload.get("rawConfig") or {}).get("name")
+            logger.info("Compiled agent '%s' via server", name)
+        return data
+
+    def _wrap_compiled(self, data: Dict[str, Any]) -> Any:
         return ServerCompiledWorkflow(
             executor=self._executor,
-            workflow_def_dict=workflow_def_dict,
+            workflow_def_dict=data.get("workflowDef", data),
         )
 
     def _prepare(self, agent: Agent) -> Any:
         """Compile and set up workers."""
-        # Auto-register integrations if enabled
-        if self._config.auto_register_integrations:
-            self._ensure_models_for_agent(agent)
-
-        # Associate prompt templates with the agent's model (if any)
-        self._associate_templates_with_models(agent)
-
-        wf = self._compile_agent(agent)
+        started = time.monotonic()
+        report, results = self._prepare_server_resources(agent, compile_agent=True)
+        wf = results["compile"]
 
         # Workers are registered separately from server-side compilation.
+        workers_started = time.monotonic()
         self._register_workers(agent)
 
         # Workers are registered during compilation (via @worker_task decorator).
@@ -793,8 +837,64 @@ class AgentRuntime:
                     # the fork() deadlock window of a full stop/restart cycle.
                     self._worker_manager.start()
 
+        self._finish_preparation(report, started, workers_started)
         return wf
 
+    def _prepare_server_resources(self, agent: Agent, *, compile_agent: bool = False) -> Any:
+        """Upsert integrations, then associate prompt templates, while (optionally) compiling.
+
+        Templates are associated with ``integration:model`` names, so they
+        must wait for the integrations; compilation overlaps with both.
+
+        Returns the :class:`PreparationReport` and each phase's result by name.
+        """
+        from conductor.ai.agents.runtime.preparation import run_phases
+
+        phases = []
+        if self._config.auto_register_integrations:
+            phases.append(("integrations", lambda: self._ensure_models_for_agent(agent)))
+        phases.append(("prompts", lambda: self._associate_templates_with_models(agent)))
+        if compile_agent:
+            phases.append(("compile", lambda: self._compile_agent(agent)))
+        return run_phases(
+            agent.name,
+            phases,
+            self._config.prepare_concurrency,
+            after={"prompts": "integrations"},
+        )
+
+    def _finish_preparation(self, report: Any, started: float, workers_started: float) -> None:
+        now = time.monotonic()
+        report.phases["workers"] = now - workers_started
+        report.total_seconds = now - started
+        self.last_preparation = report
+        logger.debug("%s", report)
+
+    def discover_mcp_tools(self, agent: Any) -> Dict[str, List[Dict[str, Any]]]:
+        """Discover the tools of every MCP server used in *agent*'s tree.
+
+        Servers are queried concurrently (up to ``prepare_concurrency`` at
+        once) through ``LIST_MCP_TOOLS`` workflows, and their tool lists are
+        cached for ``mcp_discovery_ttl_seconds``, on disk in
+        ``mcp_discovery_cache_dir`` if set.  A server that cannot be reached
+        maps to ``[]``, or to its last known tools.
+
+        Returns:
+            A dict of server URL to its tool descriptors (``name``,
+            ``description``, ``inputSchema``); see
+            :func:`~conductor.ai.agents.runtime.mcp_discovery.expand_mcp_tool_def`.
+        """
+        if self._mcp_discovery is None:
+            from conductor.ai.agents.runtime.mcp_discovery import McpToolDiscovery
+
+            ttl = self._config.mcp_discovery_ttl_seconds
+            self._mcp_discovery = McpToolDiscovery(
+                ttl_seconds=ttl if ttl > 0 else None,
+                cache_dir=self._config.mcp_discovery_cache_dir,
+                max_workers=self._config.prepare_concurrency,
+            )
+        return self._mcp_discovery.discover_agent(self._executor, agent)
+
     def prepare(self, agent: Any) -> None:
         """Pre-register workers for an agent without starting executions.
 
@@ -845,20 +945,20 @@ class AgentRuntime:
                 self._registered_tool_names.update(w.name for w in workers)
             return
 
-        # Auto-register integrations if enabled
-        if self._config.auto_register_integrations:
-            self._ensure_models_for_agent(agent)
-
-        # Associate prompt templates with the agent's model (if any)
-        self._associate_templates_with_models(agent)
+        # Auto-register integrations and associate prompt templates with the
+        # agents' models, concurrently across the whole tree
+        started = time.monotonic()
+        report, _ = self._prepare_server_resources(agent)
 
         # Register worker functions locally (tools, guardrails, etc.)
+        workers_started = time.monotonic()
         self._register_workers(agent)
 
         # Track worker names so _prepare_workers doesn't re-log them
         if self._has_worker_tools(agent):
             worker_names = self._collect_worker_names(agent)
             self._registered_tool_names.update(worker_names)
+        self._finish_preparation(report, started, workers_started)
 
     def _prepare_workers(
         self, agent: Agent, *, required_workers: Optional[set] = None, domain: Optional[str] = None
@@ -874,17 +974,16 @@ class AgentRuntime:
         names appear in the set are registered.  User-defined tool
         workers are always registered.
         """
-        # Auto-register integrations if enabled
-        if self._config.auto_register_integrations:
-            self._ensure_models_for_agent(agent)
-
-        # Associate prompt templates with the agent's model (if any)
-        self._associate_templates_with_models(agent)
+        # Auto-register integrations and associate prompt templates with the
+        # agents' models, concurrently across the whole tree
+        started = time.monotonic()
+        report, _ = self._prepare_server_resources(agent)
 
         if required_workers is not None:
             logger.info("Server expects workers: %s", sorted(required_workers))
 
         # Register worker functions locally
+        workers_started = time.monotonic()
         self._register_workers(agent, required_workers=required_workers, domain=domain)
 
         # Start worker polling if needed
@@ -910,6 +1009,8 @@ class AgentRuntime:
                     # the fork() deadlock window of a full stop/restart cycle.
                     self._worker_manager.start()
 
+        self._finish_preparation(report, started, workers_started)
+
     def _collect_worker_names(self, agent: Agent, *, required_workers: Optional[set] = None) -> set:
         """Collect all worker task names from an agent tree.
 
@@ -1698,7 +1799,10 @@ class AgentRuntime:
     def _prompt_client(self) -> Any:
         """Lazily create the prompt client (only when templates are used)."""
         if self._prompt_client_instance is None:
-            self._prompt_client_instance = self._clients.get_prompt_client()
+            # Templates are associated on worker threads, which share one client.
+            with self._client_lock:
+                if self._prompt_client_instance is None:
+                    self._prompt_client_instance = self._clients.get_prompt_client()
         return self._prompt_client_instance
 
     def _resolve_prompt(self, prompt: Any) -> str:
@@ -1762,72 +1866,70 @@ class AgentRuntime:
         Conductor requires that a prompt template is associated with the
         ``integration:model`` it will be used with.  This walks the agent tree,
         finds all :class:`PromptTemplate` instructions, and updates each template's
-        model associations on the server if needed.
+        model associations on the server if needed — one read and at most one
+        write per template, with templates handled concurrently.
         """
-        from conductor.ai.agents._internal.model_parser import parse_model
-        from conductor.ai.agents.agent import PromptTemplate
-
-        seen: set = set()
+        from conductor.ai.agents.runtime.preparation import collect_template_models, map_concurrently
 
-        from conductor.ai.agents.agent import Agent as _Agent
-
-        def _collect(a: Agent) -> None:
-            if not isinstance(a, _Agent):
-                return
-            if isinstance(a.instructions, PromptTemplate) and a.model:
-                key = (a.instructions.name, a.model)
-                if key not in seen:
-                    seen.add(key)
-            for sub in a.agents:
-                _collect(sub)
-
-        _collect(agent)
-        if not seen:
+        templates = collect_template_models(agent)
+        if not templates:
             return
 
-        for template_name, model_string in seen:
-            try:
-                parsed = parse_model(model_string)
-                model_key = f"{parsed.provider}:{parsed.model}"
+        map_concurrently(
+            lambda item: self._associate_template(*item),
+            templates.items(),
+            self._config.prepare_concurrency,
+        )
 
-                template_obj = self._prompt_client.get_prompt(template_name)
-                if template_obj is None:
-                    logger.warning(
-                        "Prompt template '%s' not found — skipping model association",
-                        template_name,
-                    )
-                    continue
+    def _associate_template(self, template_name: str, model_strings: List[str]) -> None:
+        """Add the ``integration:model`` keys of *model_strings* that *template_name* lacks."""
+        from conductor.ai.agents._internal.model_parser import parse_model
 
-                # Check if model is already associated
-                existing_models = getattr(template_obj, "integrations", None) or []
-                if model_key in existing_models:
-                    logger.debug(
-                        "Template '%s' already associated with '%s'",
-                        template_name,
-                        model_key,
-                    )
-                    continue
+        try:
+            model_keys = []
+            for model_string in model_strings:
+                parsed = parse_model(model_string)
+                model_keys.append(f"{parsed.provider}:{parsed.model}")
 
-                # Add model association by re-saving with updated models list
-                updated_models = list(existing_models) + [model_key]
-                self._prompt_client.save_prompt(
-                    prompt_name=template_name,
-                    description=getattr(template_obj, "description", "") or template_name,
-                    prompt_template=template_obj.template,
-                    models=updated_models,
-                )
-                logger.info(
-                    "Associated template '%s' with model '%s'",
+            template_obj = self._prompt_client.get_prompt(template_name)
+            if template_obj is None:
+                logger.warning(
+                    "Prompt template '%s' not found — skipping model association",
                     template_name,
-                    model_key,
                 )
-            except Exception as e:
-                logger.warning(
-                    "Failed to associate template '%s' with model '%s': %s",
+                return
+
+            # Check which models are already associated
+            existing_models = getattr(template_obj, "integrations", None) or []
+            missing = [key for key in dict.fromkeys(model_keys) if key not in existing_models]
+            if not missing:
+                logger.debug(
+                    "Template '%s' already associated with '%s'",
                     template_name,
-                    model_string,
-                    e,
+                    ", ".join(model_keys),
                 )
+                return
+
+            # Add model associations by re-saving with updated models list
+            updated_models = list(existing_models) + missing
+            self._prompt_client.save_prompt(
+                prompt_name=template_name,
+                description=getattr(template_obj, "description", "") or template_name,
+                prompt_template=template_obj.template,
+                models=updated_models,
+            )
+            logger.info(
+                "Associated template '%s' with model '%s'",
+                template_name,
+                ", ".join(missing),
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to associate template '%s' with model '%s': %s",
+                template_name,
+                ", ".join(model_strings),
+                e,
+            )
 
     # ── Integration auto-registration ──────────────────────────────
 
@@ -1835,7 +1937,10 @@ class AgentRuntime:
     def _integration_client(self) -> Any:
         """Lazily create the integration client (only when auto-register is used)."""
         if self._integration_client_instance is None:
-            self._integration_client_instance = self._clients.get_integration_client()
+            # Models are ensured on worker threads, which share one client.
+            with self._client_lock:
+                if self._integration_client_instance is None:
+                    self._integration_client_instance = self._clients.get_integration_client()
         return self._integration_client_instance
 
     def _ensure_model(self, model_string: str) -> None:
@@ -1885,23 +1990,26 @@ class AgentRuntime:
             from conductor.client.http.models.integration_api_update import IntegrationApiUpdate
             from conductor.client.http.models.integration_update import IntegrationUpdate
 
-            # Upsert integration — always save to ensure it's enabled with
-            # the correct API key, even if a previous run left it inactive.
-            logger.info(
-                "Ensuring %s integration '%s' is configured and enabled",
-                spec.display_name,
-                parsed.provider,
-            )
-            self._integration_client.save_integration(
-                parsed.provider,
-                IntegrationUpdate(
-                    category="AI_MODEL",
-                    type=spec.integration_type,
-                    configuration={"api_key": api_key},
-                    enabled=True,
-                    description=spec.display_name,
-                ),
-            )
+            # Upsert integration — always save (once per provider in this
+            # session) to ensure it's enabled with the correct API key, even
+            # if a previous run left it inactive.
+            if parsed.provider not in self._ensured_providers:
+                logger.info(
+                    "Ensuring %s integration '%s' is configured and enabled",
+                    spec.display_name,
+                    parsed.provider,
+                )
+                self._integration_client.save_integration(
+                    parsed.provider,
+                    IntegrationUpdate(
+                        category="AI_MODEL",
+                        type=spec.integration_type,
+                        configuration={"api_key": api_key},
+                        enabled=True,
+                        description=spec.display_name,
+                    ),
+                )
+                self._ensured_providers.add(parsed.provider)
 
             # Upsert model — always save to ensure it's enabled.
             logger.info(
@@ -1920,14 +2028,17 @@ class AgentRuntime:
 
             self._integration_api_available = True
         except Exception as e:
-            if self._integration_api_available is None:
+            with self._integration_lock:
+                first_failure = self._integration_api_available is None
+                if first_failure:
+                    self._integration_api_available = False
+            if first_failure:
                 # First failure — likely OSS Conductor without integration API
                 logger.warning(
                     "Integration API not available (OSS Conductor?). "
                     "Auto-registration disabled: %s",
                     e,
                 )
-                self._integration_api_available = False
             else:
                 logger.warning(
                     "Failed to auto-register '%s': %s",
@@ -1938,21 +2049,28 @@ class AgentRuntime:
         self._ensured_models.add(model_string)
 
     def _ensure_models_for_agent(self, agent: Agent) -> None:
-        """Walk the agent tree and ensure all referenced models are registered."""
-        seen: set = set()
+        """Walk the agent tree and ensure all referenced models are registered.
 
-        def _collect(a: Agent) -> None:
-            if not isinstance(a, Agent):
-                return
-            if a.model and a.model not in seen:
-                seen.add(a.model)
-            for sub in a.agents:
-                _collect(sub)
+        The first model of each provider is registered together with the
+        provider's integration; the remaining models only need the model
+        upsert and follow once every integration exists.  Both waves run
+        concurrently.
+        """
+        from conductor.ai.agents._internal.model_parser import parse_model
+        from conductor.ai.agents.runtime.preparation import collect_models, map_concurrently
 
-        _collect(agent)
+        models = [m for m in collect_models(agent) if m not in self._ensured_models]
+        if not models:
+            return
 
-        for model_str in seen:
-            self._ensure_model(model_str)
+        first_per_provider: Dict[str, str] = {}
+        for model_str in models:
+            first_per_provider.setdefault(parse_model(model_str).provider, model_str)
+        first = list(first_per_provider.values())
+        rest = [m for m in models if m not in first]
+
+        map_concurrently(self._ensure_model, first, self._config.prepare_concurrency)
+        map_concurrently(self._ensure_model, rest, self._config.prepare_concurrency)
 
     def _has_worker_tools(self, agent: Agent) -> bool:
         """Check if this agent or any sub-agent has tools or guardrails that need local workers.
@@ -2041,7 +2159,7 @@ class AgentRuntime:
             config_json = serializer.serialize(agent)
             payload = {"agentConfig": config_json}
 
-        return self._agent_client.compile_agent(payload)
+        return self._compile_payload(payload)
 
     # ── Deploy (CI/CD) ─────────────────────────────────────────────
 
@@ -3232,11 +3350,55 @@ class AgentRuntime:
 
     # ── Execution helpers ─────────────────────────────────────────
 
+    def _get_status_watcher(self) -> Optional[Any]:
+        """Return the shared :class:`WorkflowWatcher` when ``shared_status_watcher`` is enabled."""
+        if not self._config.shared_status_watcher:
+            return None
+        if self._status_watcher is None:
+            from conductor.client.workflow.executor.workflow_watcher import WorkflowWatcher
+
+            with self._status_watcher_lock:
+                if self._status_watcher is None:
+                    self._status_watcher = WorkflowWatcher(self._workflow_client)
+        return self._status_watcher
+
+    @property
+    def stream_hub(self) -> "StreamHub":
+        """Shared :class:`~conductor.ai.agents.runtime.stream_hub.StreamHub` for streaming many executions.
+
+        ``async for event in runtime.stream_hub.subscribe(execution_id)``
+        streams like :meth:`stream_async`, but executions share SSE
+        connections, polling threads and incremental task fetches.  Closed
+        by :meth:`shutdown_async`.
+        """
+        if self._stream_hub is None:
+            from conductor.ai.agents.runtime.stream_hub import StreamHub
+
+            self._stream_hub = StreamHub(
+                self,
+                max_sse_streams=self._config.stream_max_sse_connections,
+                queue_size=self._config.stream_queue_size,
+            )
+        return self._stream_hub
+
     def _poll_status_until_complete(
         self, execution_id: str, *, timeout: Optional[int] = None
     ) -> AgentStatus:
         """Poll ``/api/agent/{id}/status`` until the execution completes."""
         effective_timeout = timeout if timeout and timeout > 0 else 30000
+        watcher = self._get_status_watcher()
+        if watcher is not None:
+            status = self.get_status(execution_id)
+            if status.is_complete:
+                return status
+            if watcher.wait(execution_id, timeout=effective_timeout) is None:
+                logger.warning(
+                    "Execution %s did not complete within %ds.",
+                    execution_id,
+                    effective_timeout,
+                )
+            return self.get_status(execution_id)
+
         poll_interval = 1
         elapsed = 0
 
@@ -3259,6 +3421,21 @@ class AgentRuntime:
     ) -> AgentStatus:
         """Async version of :meth:`_poll_status_until_complete`."""
         effective_timeout = timeout if timeout and timeout > 0 else 30000
+        watcher = self._get_status_watcher()
+        if watcher is not None:
+            status = await self.get_status_async(execution_id)
+            if status.is_complete:
+                return status
+            try:
+                await asyncio.wait_for(watcher.watch_async(execution_id), effective_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Execution %s did not complete within %ds.",
+                    execution_id,
+                    effective_timeout,
+                )
+            return await self.get_status_async(execution_id)
+
         poll_interval = 1
         elapsed = 0
 
@@ -3628,23 +3805,221 @@ class AgentRuntime:
 
         yield from self._stream_polling(execution_id)
 
+    def _workflow_events(
+        self,
+        wf: Any,
+        execution_id: str,
+        seen_task_ids: set,
+        seen_human_task_ids: set,
+    ) -> Tuple[List[AgentEvent], bool, bool]:
+        """Typed events for a polled workflow snapshot.
+
+        Tasks already in *seen_task_ids* / *seen_human_task_ids* are skipped
+        and new ones are added, so calling this with successive snapshots of
+        one execution reports each task once.
+
+        Returns:
+            ``(events, waiting, finished)`` — *waiting* is true while a HUMAN
+            or PULL_WORKFLOW_MESSAGES task waits for input, *finished* once
+            the execution reached a terminal status (the last event is then
+            DONE or ERROR).
+        """
+        events: List[AgentEvent] = []
+        raw_status = getattr(wf, "status", "UNKNOWN")
+
+        # Process new/updated tasks
+        if hasattr(wf, "tasks") and wf.tasks:
+            for task in wf.tasks:
+                task_id = getattr(task, "task_id", None)
+                if task_id and task_id not in seen_task_ids:
+                    seen_task_ids.add(task_id)
+                    task_type = str(getattr(task, "task_type", "")).upper()
+                    task_ref = getattr(task, "reference_task_name", "")
+                    task_status = str(getattr(task, "status", "")).upper()
+                    output_data = getattr(task, "output_data", {}) or {}
+
+                    # Built-in Conductor task types (not tool workers)
+                    # LLM task -> THINKING
+                    if "LLM_CHAT_COMPLETE" in task_type:
+                        events.append(AgentEvent(
+                            type=EventType.THINKING,
+                            content=f"LLM processing ({task_ref})",
+                            execution_id=execution_id,
+                        ))
+
+                    # Dispatch task with function -> TOOL_CALL (local compile)
+                    elif "dispatch" in task_ref.lower() and task_status == "COMPLETED":
+                        fn_name = output_data.get("function")
+                        if fn_name:
+                            events.append(AgentEvent(
+                                type=EventType.TOOL_CALL,
+                                tool_name=fn_name,
+                                args=output_data.get("parameters"),
+                                execution_id=execution_id,
+                            ))
+                            events.append(AgentEvent(
+                                type=EventType.TOOL_RESULT,
+                                tool_name=fn_name,
+                                result=output_data.get("result"),
+                                execution_id=execution_id,
+                            ))
+
+                    # Worker/tool task -> TOOL_CALL + TOOL_RESULT (server compile)
+                    # Server-compiled workflows use the tool function name as
+                    # the task type (e.g. "get_weather") with a "call_" ref.
+                    elif (
+                        task_ref.startswith("call_")
+                        and task_type not in self._SYSTEM_TASK_TYPES
+                        and task_status == "COMPLETED"
+                    ):
+                        fn_name = task_type.lower()
+                        raw_args = getattr(task, "input_data", None) or {}
+                        clean_args = {
+                            k: v for k, v in raw_args.items() if k != "__conductor_agent_ctx__"
+                        }
+                        events.append(AgentEvent(
+                            type=EventType.TOOL_CALL,
+                            tool_name=fn_name,
+                            args=clean_args,
+                            execution_id=execution_id,
+                        ))
+                        events.append(AgentEvent(
+                            type=EventType.TOOL_RESULT,
+                            tool_name=fn_name,
+                            result=output_data,
+                            execution_id=execution_id,
+                        ))
+
+                    # Guardrail task -> GUARDRAIL_PASS or GUARDRAIL_FAIL
+                    elif "guardrail" in task_ref.lower() and task_status == "COMPLETED":
+                        passed = output_data.get("passed")
+                        if passed is not None:
+                            g_name = output_data.get("guardrail_name", task_ref)
+                            g_message = output_data.get("message", "")
+                            if passed:
+                                events.append(AgentEvent(
+                                    type=EventType.GUARDRAIL_PASS,
+                                    guardrail_name=g_name,
+                                    execution_id=execution_id,
+                                ))
+                            else:
+                                events.append(AgentEvent(
+                                    type=EventType.GUARDRAIL_FAIL,
+                                    guardrail_name=g_name,
+                                    content=g_message,
+                                    execution_id=execution_id,
+                                ))
+
+                    # SubWorkflow -> HANDOFF
+                    elif "SUB_WORKFLOW" in task_type:
+                        target = _normalize_handoff_target(task_ref)
+                        events.append(AgentEvent(
+                            type=EventType.HANDOFF,
+                            target=target,
+                            execution_id=execution_id,
+                        ))
+
+                    # Failed task -> ERROR
+                    elif task_status == "FAILED":
+                        reason = output_data.get("reason", "Task failed")
+                        events.append(AgentEvent(
+                            type=EventType.ERROR,
+                            content=f"Task '{task_ref}' failed: {reason}",
+                            execution_id=execution_id,
+                        ))
+
+        # Detect HUMAN and PULL_WORKFLOW_MESSAGES tasks waiting for input
+        has_waiting_human = False
+        if hasattr(wf, "tasks") and wf.tasks:
+            for task in wf.tasks:
+                task_id = getattr(task, "task_id", None)
+                task_type = str(getattr(task, "task_type", "")).upper()
+                task_status = str(getattr(task, "status", "")).upper()
+                if task_type == "HUMAN" and task_status == "IN_PROGRESS":
+                    has_waiting_human = True
+                    if task_id and task_id not in seen_human_task_ids:
+                        seen_human_task_ids.add(task_id)
+                        task_ref = getattr(task, "reference_task_name", "")
+                        events.append(AgentEvent(
+                            type=EventType.WAITING,
+                            content=f"Waiting for human input ({task_ref})",
+                            execution_id=execution_id,
+                        ))
+                elif task_type == "PULL_WORKFLOW_MESSAGES" and task_status == "IN_PROGRESS":
+                    has_waiting_human = True
+                    if task_id and task_id not in seen_human_task_ids:
+                        seen_human_task_ids.add(task_id)
+                        task_ref = getattr(task, "reference_task_name", "")
+                        events.append(AgentEvent(
+                            type=EventType.WAITING,
+                            content=f"Waiting for message ({task_ref})",
+                            execution_id=execution_id,
+                        ))
+
+        # Check explicit PAUSED state
+        if raw_status == "PAUSED" and not has_waiting_human:
+            events.append(AgentEvent(
+                type=EventType.WAITING,
+                content="Waiting for input...",
+                execution_id=execution_id,
+            ))
+
+        if raw_status in ("COMPLETED", "FAILED", "TERMINATED", "TIMED_OUT"):
+            output = None
+            if hasattr(wf, "output") and wf.output:
+                output_data = wf.output
+                if isinstance(output_data, dict):
+                    output = output_data.get("result", output_data)
+                else:
+                    output = output_data
+
+            if raw_status == "COMPLETED":
+                events.append(AgentEvent(
+                    type=EventType.DONE,
+                    output=output,
+                    execution_id=execution_id,
+                ))
+            else:
+                reason = getattr(wf, "reason", None)
+                error_msg = (
+                    reason if isinstance(reason, str) and reason else f"Execution {raw_status}"
+                )
+                events.append(AgentEvent(
+                    type=EventType.ERROR,
+                    content=error_msg,
+                    output=output,
+                    execution_id=execution_id,
+                ))
+            return events, has_waiting_human, True
+
+        return events, has_waiting_human, False
+
     def _stream_polling(self, execution_id: str) -> Iterator[AgentEvent]:
         """Poll-based event streaming fallback.
 
         Polls the execution status and tasks, yielding typed events for
         new/changed tasks.  Detects HUMAN tasks (IN_PROGRESS) as WAITING
         events for human-in-the-loop scenarios.
+
+        Each poll fetches the workflow without its tasks first; the task
+        list (with every LLM transcript in it) is downloaded only when the
+        workflow's ``updateTime`` or status changed, and the interval grows
+        while nothing does (see :class:`PollCursor`).
         """
-        seen_task_ids: set = set()
-        seen_human_task_ids: set = set()
+        from conductor.ai.agents.runtime.stream_hub import PollCursor
+
+        cursor = PollCursor()
+        waiting = False
         logger.info("Polling stream for execution_id=%s", execution_id)
 
         while True:
             try:
-                wf = self._workflow_client.get_workflow(
-                    execution_id,
-                    include_tasks=True,
-                )
+                wf = self._workflow_client.get_workflow(execution_id, include_tasks=False)
+                if cursor.needs_tasks(wf):
+                    wf = self._workflow_client.get_workflow(execution_id, include_tasks=True)
+                    cursor.record_tasks(wf)
+                else:
+                    wf = None
             except Exception as e:
                 logger.error("Error fetching execution status: %s", e)
                 yield AgentEvent(
@@ -3654,178 +4029,16 @@ class AgentRuntime:
                 )
                 break
 
-            raw_status = getattr(wf, "status", "UNKNOWN")
-
-            # Process new/updated tasks
-            if hasattr(wf, "tasks") and wf.tasks:
-                for task in wf.tasks:
-                    task_id = getattr(task, "task_id", None)
-                    if task_id and task_id not in seen_task_ids:
-                        seen_task_ids.add(task_id)
-                        task_type = str(getattr(task, "task_type", "")).upper()
-                        task_ref = getattr(task, "reference_task_name", "")
-                        task_status = str(getattr(task, "status", "")).upper()
-                        output_data = getattr(task, "output_data", {}) or {}
-
-                        # Built-in Conductor task types (not tool workers)
-                        # LLM task -> THINKING
-                        if "LLM_CHAT_COMPLETE" in task_type:
-                            yield AgentEvent(
-                                type=EventType.THINKING,
-                                content=f"LLM processing ({task_ref})",
-                                execution_id=execution_id,
-                            )
-
-                        # Dispatch task with function -> TOOL_CALL (local compile)
-                        elif "dispatch" in task_ref.lower() and task_status == "COMPLETED":
-                            fn_name = output_data.get("function")
-                            if fn_name:
-                                yield AgentEvent(
-                                    type=EventType.TOOL_CALL,
-                                    tool_name=fn_name,
-                                    args=output_data.get("parameters"),
-                                    execution_id=execution_id,
-                                )
-                                yield AgentEvent(
-                                    type=EventType.TOOL_RESULT,
-                                    tool_name=fn_name,
-                                    result=output_data.get("result"),
-                                    execution_id=execution_id,
-                                )
-
-                        # Worker/tool task -> TOOL_CALL + TOOL_RESULT (server compile)
-                        # Server-compiled workflows use the tool function name as
-                        # the task type (e.g. "get_weather") with a "call_" ref.
-                        elif (
-                            task_ref.startswith("call_")
-                            and task_type not in self._SYSTEM_TASK_TYPES
-                            and task_status == "COMPLETED"
-                        ):
-                            fn_name = task_type.lower()
-                            raw_args = getattr(task, "input_data", None) or {}
-                            clean_args = {
-                                k: v for k, v in raw_args.items() if k != "__conductor_agent_ctx__"
-                            }
-                            yield AgentEvent(
-                                type=EventType.TOOL_CALL,
-                                tool_name=fn_name,
-                                args=clean_args,
-                                execution_id=execution_id,
-                            )
-                            yield AgentEvent(
-                                type=EventType.TOOL_RESULT,
-                                tool_name=fn_name,
-                                result=output_data,
-                                execution_id=execution_id,
-                            )
-
-                        # Guardrail task -> GUARDRAIL_PASS or GUARDRAIL_FAIL
-                        elif "guardrail" in task_ref.lower() and task_status == "COMPLETED":
-                            passed = output_data.get("passed")
-                            if passed is not None:
-                                g_name = output_data.get("guardrail_name", task_ref)
-                                g_message = output_data.get("message", "")
-                                if passed:
-                                    yield AgentEvent(
-                                        type=EventType.GUARDRAIL_PASS,
-                                        guardrail_name=g_name,
-                                        execution_id=execution_id,
-                                    )
-                                else:
-                                    yield AgentEvent(
-                                        type=EventType.GUARDRAIL_FAIL,
-                                        guardrail_name=g_name,
-                                        content=g_message,
-                                        execution_id=execution_id,
-                                    )
-
-                        # SubWorkflow -> HANDOFF
-                        elif "SUB_WORKFLOW" in task_type:
-                            target = _normalize_handoff_target(task_ref)
-                            yield AgentEvent(
-                                type=EventType.HANDOFF,
-                                target=target,
-                                execution_id=execution_id,
-                            )
-
-                        # Failed task -> ERROR
-                        elif task_status == "FAILED":
-                            reason = output_data.get("reason", "Task failed")
-                            yield AgentEvent(
-                                type=EventType.ERROR,
-                                content=f"Task '{task_ref}' failed: {reason}",
-                                execution_id=execution_id,
-                            )
-
-            # Detect HUMAN and PULL_WORKFLOW_MESSAGES tasks waiting for input
-            has_waiting_human = False
-            if hasattr(wf, "tasks") and wf.tasks:
-                for task in wf.tasks:
-                    task_id = getattr(task, "task_id", None)
-                    task_type = str(getattr(task, "task_type", "")).upper()
-                    task_status = str(getattr(task, "status", "")).upper()
-                    if task_type == "HUMAN" and task_status == "IN_PROGRESS":
-                        has_waiting_human = True
-                        if task_id and task_id not in seen_human_task_ids:
-                            seen_human_task_ids.add(task_id)
-                            task_ref = getattr(task, "reference_task_name", "")
-                            yield AgentEvent(
-                                type=EventType.WAITING,
-                                content=f"Waiting for human input ({task_ref})",
-                                execution_id=execution_id,
-                            )
-                    elif task_type == "PULL_WORKFLOW_MESSAGES" and task_status == "IN_PROGRESS":
-                        has_waiting_human = True
-                        if task_id and task_id not in seen_human_task_ids:
-                            seen_human_task_ids.add(task_id)
-                            task_ref = getattr(task, "reference_task_name", "")
-                            yield AgentEvent(
-                                type=EventType.WAITING,
-                                content=f"Waiting for message ({task_ref})",
-                                execution_id=execution_id,
-                            )
-
-            # Check explicit PAUSED state
-            if raw_status == "PAUSED" and not has_waiting_human:
-                yield AgentEvent(
-                    type=EventType.WAITING,
-                    content="Waiting for input...",
-                    execution_id=execution_id,
+            if wf is not None:
+                events, waiting, finished = self._workflow_events(
+                    wf, execution_id, cursor.seen_task_ids, cursor.seen_human_task_ids
                 )
-
-            if raw_status in ("COMPLETED", "FAILED", "TERMINATED", "TIMED_OUT"):
-                output = None
-                if hasattr(wf, "output") and wf.output:
-                    output_data = wf.output
-                    if isinstance(output_data, dict):
-                        output = output_data.get("result", output_data)
-                    else:
-                        output = output_data
-
-                if raw_status == "COMPLETED":
-                    yield AgentEvent(
-                        type=EventType.DONE,
-                        output=output,
-                        execution_id=execution_id,
-                    )
-                else:
-                    reason = getattr(wf, "reason", None)
-                    error_msg = (
-                        reason if isinstance(reason, str) and reason else f"Execution {raw_status}"
-                    )
-                    yield AgentEvent(
-                        type=EventType.ERROR,
-                        content=error_msg,
-                        output=output,
-                        execution_id=execution_id,
-                    )
-                break
+                yield from events
+                if finished:
+                    break
 
             # Don't busy-poll while waiting for human input
-            if has_waiting_human:
-                time.sleep(2)
-            else:
-                time.sleep(0.5)
+            time.sleep(cursor.delay(2.0, 5.0) if waiting else cursor.delay(0.5, 2.0))
 
     # ── Async execution ─────────────────────────────────────────────
 
@@ -4167,8 +4380,10 @@ class AgentRuntime:
         Uses ``run_in_executor`` for the sync Conductor SDK
         ``get_workflow`` call, and ``asyncio.sleep`` for non-blocking waits.
         """
-        seen_task_ids: set = set()
-        seen_human_task_ids: set = set()
+        from conductor.ai.agents.runtime.stream_hub import PollCursor
+
+        cursor = PollCursor()
+        waiting = False
         logger.info("Async polling stream for execution_id=%s", execution_id)
 
         loop = asyncio.get_event_loop()
@@ -4177,11 +4392,16 @@ class AgentRuntime:
             try:
                 wf = await loop.run_in_executor(
                     None,
-                    lambda: self._workflow_client.get_workflow(
-                        execution_id,
-                        include_tasks=True,
-                    ),
+                    lambda: self._workflow_client.get_workflow(execution_id, include_tasks=False),
                 )
+                if cursor.needs_tasks(wf):
+                    wf = await loop.run_in_executor(
+                        None,
+                        lambda: self._workflow_client.get_workflow(execution_id, include_tasks=True),
+                    )
+                    cursor.record_tasks(wf)
+                else:
+                    wf = None
             except Exception as e:
                 logger.error("Error fetching execution status: %s", e)
                 yield AgentEvent(
@@ -4191,162 +4411,16 @@ class AgentRuntime:
                 )
                 break
 
-            raw_status = getattr(wf, "status", "UNKNOWN")
-
-            # Process new/updated tasks
-            if hasattr(wf, "tasks") and wf.tasks:
-                for task in wf.tasks:
-                    task_id = getattr(task, "task_id", None)
-                    if task_id and task_id not in seen_task_ids:
-                        seen_task_ids.add(task_id)
-                        task_type = str(getattr(task, "task_type", "")).upper()
-                        task_ref = getattr(task, "reference_task_name", "")
-                        task_status = str(getattr(task, "status", "")).upper()
-                        output_data = getattr(task, "output_data", {}) or {}
-
-                        if "LLM_CHAT_COMPLETE" in task_type:
-                            yield AgentEvent(
-                                type=EventType.THINKING,
-                                content=f"LLM processing ({task_ref})",
-                                execution_id=execution_id,
-                            )
-                        elif "dispatch" in task_ref.lower() and task_status == "COMPLETED":
-                            fn_name = output_data.get("function")
-                            if fn_name:
-                                yield AgentEvent(
-                                    type=EventType.TOOL_CALL,
-                                    tool_name=fn_name,
-                                    args=output_data.get("parameters"),
-                                    execution_id=execution_id,
-                                )
-                                yield AgentEvent(
-                                    type=EventType.TOOL_RESULT,
-                                    tool_name=fn_name,
-                                    result=output_data.get("result"),
-                                    execution_id=execution_id,
-                                )
-                        elif (
-                            task_ref.startswith("call_")
-                            and task_type not in self._SYSTEM_TASK_TYPES
-                            and task_status == "COMPLETED"
-                        ):
-                            fn_name = task_type.lower()
-                            raw_args = getattr(task, "input_data", None) or {}
-                            clean_args = {
-                                k: v for k, v in raw_args.items() if k != "__conductor_agent_ctx__"
-                            }
-                            yield AgentEvent(
-                                type=EventType.TOOL_CALL,
-                                tool_name=fn_name,
-                                args=clean_args,
-                                execution_id=execution_id,
-                            )
-                            yield AgentEvent(
-                                type=EventType.TOOL_RESULT,
-                                tool_name=fn_name,
-                                result=output_data,
-                                execution_id=execution_id,
-                            )
-                        elif "guardrail" in task_ref.lower() and task_status == "COMPLETED":
-                            passed = output_data.get("passed")
-                            if passed is not None:
-                                g_name = output_data.get("guardrail_name", task_ref)
-                                g_message = output_data.get("message", "")
-                                if passed:
-                                    yield AgentEvent(
-                                        type=EventType.GUARDRAIL_PASS,
-                                        guardrail_name=g_name,
-                                        execution_id=execution_id,
-                                    )
-                                else:
-                                    yield AgentEvent(
-                                        type=EventType.GUARDRAIL_FAIL,
-                                        guardrail_name=g_name,
-                                        content=g_message,
-                                        execution_id=execution_id,
-                                    )
-                        elif "SUB_WORKFLOW" in task_type:
-                            target = _normalize_handoff_target(task_ref)
-                            yield AgentEvent(
-                                type=EventType.HANDOFF,
-                                target=target,
-                                execution_id=execution_id,
-                            )
-                        elif task_status == "FAILED":
-                            reason = output_data.get("reason", "Task failed")
-                            yield AgentEvent(
-                                type=EventType.ERROR,
-                                content=f"Task '{task_ref}' failed: {reason}",
-                                execution_id=execution_id,
-                            )
-
-            # Detect HUMAN and PULL_WORKFLOW_MESSAGES tasks waiting for input
-            has_waiting_human = False
-            if hasattr(wf, "tasks") and wf.tasks:
-                for task in wf.tasks:
-                    task_id = getattr(task, "task_id", None)
-                    task_type = str(getattr(task, "task_type", "")).upper()
-                    task_status = str(getattr(task, "status", "")).upper()
-                    if task_type == "HUMAN" and task_status == "IN_PROGRESS":
-                        has_waiting_human = True
-                        if task_id and task_id not in seen_human_task_ids:
-                            seen_human_task_ids.add(task_id)
-                            task_ref = getattr(task, "reference_task_name", "")
-                            yield AgentEvent(
-                                type=EventType.WAITING,
-                                content=f"Waiting for human input ({task_ref})",
-                                execution_id=execution_id,
-                            )
-                    elif task_type == "PULL_WORKFLOW_MESSAGES" and task_status == "IN_PROGRESS":
-                        has_waiting_human = True
-                        if task_id and task_id not in seen_human_task_ids:
-                            seen_human_task_ids.add(task_id)
-                            task_ref = getattr(task, "reference_task_name", "")
-                            yield AgentEvent(
-                                type=EventType.WAITING,
-                                content=f"Waiting for message ({task_ref})",
-                                execution_id=execution_id,
-                            )
-
-            if raw_status == "PAUSED" and not has_waiting_human:
-                yield AgentEvent(
-                    type=EventType.WAITING,
-                    content="Waiting for input...",
-                    execution_id=execution_id,
+            if wf is not None:
+                events, waiting, finished = self._workflow_events(
+                    wf, execution_id, cursor.seen_task_ids, cursor.seen_human_task_ids
                 )
+                for event in events:
+                    yield event
+                if finished:
+                    break
 
-            if raw_status in ("COMPLETED", "FAILED", "TERMINATED", "TIMED_OUT"):
-                output = None
-                if hasattr(wf, "output") and wf.output:
-                    output_data = wf.output
-                    if isinstance(output_data, dict):
-                        output = output_data.get("result", output_data)
-                    else:
-                        output = output_data
-
-                if raw_status == "COMPLETED":
-                    yield AgentEvent(
-                        type=EventType.DONE,
-                        output=output,
-                        execution_id=execution_id,
-                    )
-                else:
-                    reason = getattr(wf, "reason", None)
-                    error_msg = (
-                        reason if isinstance(reason, str) and reason else f"Execution {raw_status}"
-                    )
-                    yield AgentEvent(
-                        type=EventType.ERROR,
-                        content=error_msg,
-                        output=output,
-                        execution_id=execution_id,
-                    )
-                break
-
-            if has_waiting_human:
-                await asyncio.sleep(2)
-            else:
-                await asyncio.sleep(0.5)
+            await asyncio.sleep(cursor.delay(2.0, 5.0) if waiting else cursor.delay(0.5, 2.0))
 
     async def _run_framework_async(
         self,
@@ -4517,6 +4591,8 @@ class AgentRuntime:
             if self._is_shutdown:
                 return
             logger.info("Shutting down AgentRuntime")
+            if self._status_watcher is not None:
+                self._status_watcher.stop()
             if self._workers_started and self._worker_manager is not None:
                 self._worker_manager.stop()
                 self._workers_started = False
@@ -4528,6 +4604,10 @@ class AgentRuntime:
             if self._is_shutdown:
                 return
             logger.info("Shutting down AgentRuntime (async)")
+            if self._status_watcher is not None:
+                self._status_watcher.stop()
+            if self._stream_hub is not None:
+                await self._stream_hub.aclose()
             if self._workers_started and self._worker_manager is not None:
                 self._worker_manager.stop()
                 self._workers_started = False
@@ -4901,6 +4981,7 @@ class AgentRuntime:
         agent_copy.memory = ConversationMemory(
             messages=prior_messages + existing,
             max_messages=agent_copy.memory.max_messages if agent_copy.memory else None,
+            token_budget=agent_copy.memory.token_budget if agent_copy.memory else None,
         )
         return agent_copy
 
@@ -5216,7 +5297,7 @@ class AgentRuntime:
         """
         if not execution_id:
             return None
-        prompt, completion, total, found = self._collect_tokens_by_id(execution_id, set())
+        prompt, completion, total, found = self._collect_tokens_by_id(execution_id)
         if not found:
             return None
         if total == 0 and (prompt > 0 or completion > 0):
@@ -5227,30 +5308,33 @@ class AgentRuntime:
             total_tokens=total,
         )
 
-    def _collect_tokens_by_id(self, execution_id: str, visited: set) -> tuple:
-        """Recursively collect token counts via GET /api/agent/{id}.
+    def _collect_tokens_by_id(self, execution_id: str) -> tuple:
+        """Collect token counts over the execution tree via GET /api/agent/{id}.
 
         Returns ``(prompt, completion, total, found_any)`` tuple.
         The server pre-computes ``tokenUsage`` for each execution level; this
-        method reads that field and recurses into SUB_WORKFLOW tasks so the
-        full agent tree is covered.
+        method sums that field over the execution and every sub-agent reached
+        through SUB_WORKFLOW tasks, fetching sibling sub-agents concurrently.
         """
-        if execution_id in visited:
-            return 0, 0, 0, False
-        visited.add(execution_id)
+        from conductor.client.orkes.workflow_tree import fetch_workflow_tree
+
+        def sub_workflow_ids(data: dict) -> list:
+            return [
+                task.get("subWorkflowId")
+                for task in data.get("tasks", [])
+                if "SUB_WORKFLOW" in str(task.get("taskType", "")).upper()
+            ]
 
-        data = self._fetch_agent_workflow(execution_id)
-        if not data:
-            return 0, 0, 0, False
+        tree = fetch_workflow_tree(execution_id, self._fetch_agent_workflow, sub_workflow_ids)
 
         total_prompt = 0
         total_completion = 0
         total_total = 0
         found_any = False
-
-        # Use server-computed token usage for this execution level
-        token_usage = data.get("tokenUsage")
-        if token_usage:
+        for node in tree:
+            token_usage = node.workflow.get("tokenUsage")
+            if not token_usage:
+                continue
             p = int(token_usage.get("promptTokens", 0))
             c = int(token_usage.get("completionTokens", 0))
             t = int(token_usage.get("totalTokens", 0))
@@ -5260,16 +5344,4 @@ class AgentRuntime:
                 total_completion += c
                 total_total += t
 
-        # Recurse into sub-agent workflows
-        for task in data.get("tasks", []):
-            if "SUB_WORKFLOW" in str(task.get("taskType", "")).upper():
-                sub_id = task.get("subWorkflowId")
-                if sub_id and sub_id not in visited:
-                    p, c, t, f = self._collect_tokens_by_id(sub_id, visited)
-                    if f:
-                        found_any = True
-                        total_prompt += p
-                        total_completion += c
-                        total_total += t
-
         return total_prompt, total_completion, total_total, found_any
@@ -0,0 +1,286 @@
+"""Event streams of many concurrent agent executions from one event loop.
+
+``AgentRuntime.stream_async`` opens one SSE connection, or one polling
+loop fetching the full workflow, per stream.  A service streaming
+thousands of executions at once (a chat backend, say) would hold as many
+sockets and re-download every task list twice a second.  ``StreamHub``
+shares that work instead:
+
+* each execution is read once, however many subscribers it has, and its
+  events are fanned out to a bounded queue per subscriber;
+* at most ``max_sse_streams`` executions hold an SSE connection (all on
+  the agent client's shared HTTP client); the rest, and every execution
+  once the server turns out not to support SSE, are polled;
+* polling first fetches the workflow *without* tasks and downloads the
+  task list only when the workflow's ``updateTime`` or status moved past
+  the :class:`PollCursor`, on a thread pool of ``max_concurrent_polls``
+  shared by all executions;
+* a subscriber that stops reading fills its queue, which pauses reading
+  that execution (and no other) until it catches up.
+
+Example::
+
+    hub = runtime.stream_hub
+    async for event in hub.subscribe(execution_id):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from conductor.ai.agents.result import AgentEvent
+    from conductor.ai.agents.runtime.runtime import AgentRuntime
+
+logger = logging.getLogger("conductor.ai.agents.runtime.stream_hub")
+
+_END = object()
+
+
+@dataclass
+class PollCursor:
+    """How far a polling consumer has read one execution.
+
+    Polling probes the workflow without its tasks, which for agents with
+    long LLM transcripts is most of the payload, and fetches the task list
+    only when the probe's ``updateTime`` or status moved (or the last fetch
+    is older than ``max_staleness`` seconds).  ``idle_polls`` counts probes
+    since the last change and backs off :meth:`delay`.  The task id sets
+    are the ones :meth:`AgentRuntime._workflow_events` has reported.
+    """
+
+    seen_task_ids: Set[str] = field(default_factory=set)
+    seen_human_task_ids: Set[str] = field(default_factory=set)
+    update_time: Optional[int] = None
+    status: Optional[str] = None
+    fetched_at: Optional[float] = None
+    idle_polls: int = 0
+
+    def needs_tasks(self, wf: Any, max_staleness: float = 10.0) -> bool:
+        """Records a task-less snapshot; true if the task list should be fetched."""
+        update_time = getattr(wf, "update_time", None)
+        status = getattr(wf, "status", None)
+        changed = update_time != self.update_time or status != self.status
+        self.update_time, self.status = update_time, status
+        self.idle_polls = 0 if changed else self.idle_polls + 1
+        return (
+            changed
+            or self.fetched_at is None
+            or time.monotonic() - self.fetched_at > max_staleness
+        )
+
+    def record_tasks(self, wf: Any) -> None:
+        """Records a snapshot fetched with its tasks."""
+        self.update_time = getattr(wf, "update_time", self.update_time)
+        self.fetched_at = time.monotonic()
+
+    def delay(self, interval: float, max_interval: float) -> float:
+        """*interval* grown by half for every idle probe, up to *max_interval*."""
+        return min(interval * 1.5**self.idle_polls, max(interval, max_interval))
+
+
+class _Channel:
+    """The upstream reader of one execution and the queues of its subscribers."""
+
+    def __init__(self, execution_id: str) -> None:
+        self.execution_id = execution_id
+        self.queues: List[asyncio.Queue] = []
+        self.task: Optional[asyncio.Task] = None
+        self.transport = "pending"
+
+    async def publish(self, item: Any) -> None:
+        # Awaiting each queue in turn makes the slowest subscriber set the pace.
+        for queue in list(self.queues):
+            await queue.put(item)
+
+
+class StreamHub:
+    """Multiplexes the event streams of many executions.
+
+    Args:
+        runtime: The :class:`AgentRuntime` whose clients and event mapping are used.
+        max_sse_streams: Executions read over SSE at once; others are polled.
+        max_concurrent_polls: Workflow fetches in flight across all polled executions.
+        queue_size: Events buffered per subscriber before its execution is paused.
+        poll_interval: Seconds between polls of a running execution; grows
+            while the execution does not change, up to ``max_poll_interval``.
+        waiting_poll_interval: Seconds between polls while it waits for input,
+            up to ``max_waiting_poll_interval``.
+        max_staleness: Seconds after which the task list is fetched even if
+            the workflow looks unchanged.
+    """
+
+    def __init__(
+        self,
+        runtime: "AgentRuntime",
+        *,
+        max_sse_streams: int = 64,
+        max_concurrent_polls: int = 16,
+        queue_size: int = 256,
+        poll_interval: float = 0.5,
+        waiting_poll_interval: float = 2.0,
+        max_poll_interval: float = 2.0,
+        max_waiting_poll_interval: float = 5.0,
+        max_staleness: float = 10.0,
+    ) -> None:
+        self._runtime = runtime
+        self.max_sse_streams = max_sse_streams
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.waiting_poll_interval = waiting_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_waiting_poll_interval = max_waiting_poll_interval
+        self.max_staleness = max_staleness
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_polls, thread_name_prefix="agent-stream-poll"
+        )
+        self._channels: Dict[str, _Channel] = {}
+        self._sse_streams = 0
+        self._sse_unavailable = not runtime._config.streaming_enabled
+        self._closed = False
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Executions being read, by transport, and subscribers in total."""
+        channels = list(self._channels.values())
+        return {
+            "executions": len(channels),
+            "sse": sum(1 for c in channels if c.transport == "sse"),
+            "polling": sum(1 for c in channels if c.transport == "polling"),
+            "subscribers": sum(len(c.queues) for c in channels),
+        }
+
+    async def subscribe(self, execution_id: str) -> AsyncIterator["AgentEvent"]:
+        """Yields the events of *execution_id* until it finishes.
+
+        Subscribers that join an execution that is already being read
+        receive the events from that point on.
+        """
+        if self._closed:
+            raise RuntimeError("StreamHub is closed")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        channel = self._channels.get(execution_id)
+        if channel is None:
+            channel = self._channels[execution_id] = _Channel(execution_id)
+            channel.queues.append(queue)
+            channel.task = asyncio.ensure_future(self._read(channel))
+        else:
+            channel.queues.append(queue)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    return
+                yield item
+        finally:
+            self._unsubscribe(channel, queue)
+
+    async def aclose(self) -> None:
+        """Stops reading every execution; open subscriptions end."""
+        self._closed = True
+        channels = list(self._channels.values())
+        for channel in channels:
+            if channel.task is not None:
+                channel.task.cancel()
+        for channel in channels:
+            for queue in channel.queues:
+                _put_end(queue)
+        self._channels.clear()
+        self._executor.shutdown(wait=False)
+
+    def _unsubscribe(self, channel: _Channel, queue: asyncio.Queue) -> None:
+        if queue in channel.queues:
+            channel.queues.remove(queue)
+        # Taking items out releases a publish() blocked on this full queue,
+        # which would otherwise stall the other subscribers.
+        while not queue.empty():
+            queue.get_nowait()
+        if not channel.queues:
+            if self._channels.get(channel.execution_id) is channel:
+                del self._channels[channel.execution_id]
+            if channel.task is not None and not channel.task.done():
+                channel.task.cancel()
+
+    async def _read(self, channel: _Channel) -> None:
+        from conductor.ai.agents.result import AgentEvent, EventType
+
+        try:
+            use_sse = not self._sse_unavailable and self._sse_streams < self.max_sse_streams
+            if not (use_sse and await self._read_sse(channel)):
+                await self._read_polling(channel)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Error streaming execution_id=%s: %s", channel.execution_id, e)
+            await channel.publish(
+                AgentEvent(type=EventType.ERROR, content=str(e), execution_id=channel.execution_id)
+            )
+        finally:
+            if self._channels.get(channel.execution_id) is channel:
+                del self._channels[channel.execution_id]
+        await channel.publish(_END)
+
+    async def _read_sse(self, channel: _Channel) -> bool:
+        """Reads *channel* over SSE; false if SSE turned out to be unavailable."""
+        from conductor.ai.agents.runtime.runtime import _SSEUnavailableError
+
+        channel.transport = "sse"
+        self._sse_streams += 1
+        published = False
+        try:
+            async for event in self._runtime._stream_sse_async(channel.execution_id):
+                published = True
+                await channel.publish(event)
+            return True
+        except _SSEUnavailableError as e:
+            if published:
+                raise
+            if not self._sse_unavailable:
+                logger.info("SSE unavailable (%s), polling executions instead", e)
+                self._sse_unavailable = True
+            return False
+        finally:
+            self._sse_streams -= 1
+
+    async def _read_polling(self, channel: _Channel) -> None:
+        channel.transport = "polling"
+        cursor = PollCursor()
+        waiting = False
+        while True:
+            wf = await self._fetch(channel.execution_id, include_tasks=False)
+            if cursor.needs_tasks(wf, self.max_staleness):
+                wf = await self._fetch(channel.execution_id, include_tasks=True)
+                cursor.record_tasks(wf)
+                events, waiting, finished = self._runtime._workflow_events(
+                    wf, channel.execution_id, cursor.seen_task_ids, cursor.seen_human_task_ids
+                )
+                for event in events:
+                    await channel.publish(event)
+                if finished:
+                    return
+            if waiting:
+                await asyncio.sleep(cursor.delay(self.waiting_poll_interval, self.max_waiting_poll_interval))
+            else:
+                await asyncio.sleep(cursor.delay(self.poll_interval, self.max_poll_interval))
+
+    async def _fetch(self, execution_id: str, include_tasks: bool) -> Any:
+        client = self._runtime._workflow_client
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, lambda: client.get_workflow(execution_id, include_tasks=include_tasks)
+        )
+
+
+def _put_end(queue: asyncio.Queue) -> None:
+    """Ends a subscription, discarding buffered events if its queue is full."""
+    while True:
+        try:
+            queue.put_nowait(_END)
+            return
+        except asyncio.QueueFull:
+            queue.get_nowait()
@@ -47,11 +47,14 @@ class WorkerManager:
         poll_interval_ms: int = 100,
         thread_count: int = 10,
         daemon: bool = True,
+        bulk_register_task_defs: bool = True,
     ) -> None:
         self._configuration = configuration
         self._poll_interval_ms = poll_interval_ms
         self._thread_count = thread_count
         self._daemon = daemon
+        self._bulk_register_task_defs = bulk_register_task_defs
+        self._registered_task_defs: set = set()
         self._task_handler: Optional["TaskHandler"] = None
         self._lock = threading.Lock()
 
@@ -111,6 +114,7 @@ class WorkerManager:
                 # before multiprocessing's _exit_function tries to join it.
                 self._register_logger_cleanup()
 
+                self._register_task_definitions(self._task_handler.workers)
                 self._task_handler.start_processes()
             else:
                 # TaskHandler already running — start processes for any newly
@@ -141,6 +145,7 @@ class WorkerManager:
         # specific domain are DIFFERENT polling targets and both need processes.
         existing = {(w.get_task_definition_name(), getattr(w, "domain", None)) for w in th.workers}
 
+        new_workers = []
         for (task_def_name, domain), record in list(_decorated_functions.items()):
             if (task_def_name, domain) in existing:
                 continue  # already running with same domain
@@ -164,7 +169,12 @@ class WorkerManager:
             except Exception as exc:
                 logger.debug("Skipping new worker '%s': %s", task_def_name, exc)
                 continue
+            new_workers.append(worker)
+            existing.add((task_def_name, domain))
 
+        self._register_task_definitions(new_workers)
+        for worker in new_workers:
+            task_def_name = worker.get_task_definition_name()
             # Inject the new worker into the running TaskHandler
             th._TaskHandler__create_task_runner_process(  # type: ignore[attr-defined]
                 worker, self._configuration, None
@@ -174,7 +184,6 @@ class WorkerManager:
                 new_proc.daemon = True
             new_proc.start()
             th.workers.append(worker)
-            existing.add((task_def_name, domain))
             # Extend the monitor's per-worker restart tracking arrays so that
             # the monitor can restart this process if it deadlocks after fork().
             if hasattr(th, "_restart_counts"):
@@ -183,6 +192,43 @@ class WorkerManager:
                 th._next_restart_at.append(0.0)
             logger.info("Started late-registered worker '%s'", task_def_name)
 
+    def _register_task_definitions(self, workers: Any) -> None:
+        """Register the task definitions of *workers* from this process, in bulk.
+
+        Without this every worker process registers its own task definition
+        (and schemas) at startup, several requests per worker.  Workers whose
+        definition could not be registered here still register their own.
+        """
+        if not self._bulk_register_task_defs:
+            return
+        pending = []
+        for w in workers:
+            if not getattr(w, "register_task_def", False) or getattr(w, "task_def_registered", False):
+                continue
+            if w.get_task_definition_name() in self._registered_task_defs:
+                # Same task under another domain, already registered by an earlier batch.
+                w.task_def_registered = True
+                continue
+            pending.append(w)
+        if not pending:
+            return
+        try:
+            from conductor.client.automator.task_def_registration import register_task_definitions
+            from conductor.client.orkes.orkes_metadata_client import OrkesMetadataClient
+            from conductor.client.orkes.orkes_schema_client import OrkesSchemaClient
+
+            register_task_definitions(
+                pending,
+                OrkesMetadataClient(self._configuration),
+                OrkesSchemaClient(self._configuration),
+                self._configuration,
+            )
+        except Exception as exc:
+            logger.warning("Bulk task definition registration failed: %s", exc)
+        self._registered_task_defs.update(
+            w.get_task_definition_name() for w in pending if getattr(w, "task_def_registered", False)
+        )
+
     def _register_logger_cleanup(self) -> None:
         """Register an atexit handler to cleanly stop the logger process."""
         handler = self._task_handler
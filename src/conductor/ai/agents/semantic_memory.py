@@ -24,11 +24,16 @@ Example::
 from __future__ import annotations
 
 import hashlib
+import heapq
+import json
 import logging
+import os
+import tempfile
 import time
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger("conductor.ai.agents.semantic_memory")
 
@@ -86,54 +91,395 @@ class MemoryStore(ABC):
 
 
 class InMemoryStore(MemoryStore):
-    """Simple in-memory store using keyword overlap for similarity.
+    """Local store with a keyword index and an optional vector index.
 
     This is a lightweight fallback when no vector database is available.
     For production use, plug in a real vector store via :class:`MemoryStore`.
 
-    Similarity is computed as keyword overlap (Jaccard similarity)
-    between the query and stored memory texts.
+    Without embeddings, similarity is keyword overlap (Jaccard similarity)
+    between the query and stored memory texts.  Each memory's word set is
+    computed once when it is added, and an inverted index from words to
+    memories lets a search score only memories sharing a word with the
+    query, starting from its rarest words.
+
+    Memories with an :attr:`MemoryEntry.embedding` (or one computed by
+    *embed*) are also kept as unit vectors in a NumPy matrix.  When *embed*
+    is given, :meth:`search` ranks memories by the cosine similarity of
+    their embeddings to the query's; :meth:`search_by_vector` does the same
+    for a precomputed query vector.  The vector index requires ``numpy``;
+    without it embeddings are ignored and :meth:`search` uses keywords.
+
+    Args:
+        embed: Optional function returning the embedding of a text.  It is
+            called for memories added without an embedding and for queries.
+        path: Optional file prefix for :meth:`save`.  If ``<path>.json``
+            exists it is loaded, and the embeddings saved with it are
+            memory-mapped rather than read into memory; loaded entries
+            keep ``embedding=None`` and their vectors live only in the index.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        path: Optional[str] = None,
+    ) -> None:
         self._memories: Dict[str, MemoryEntry] = {}
+        self._embed = embed
+        self.path = path
+        # Insertion order, so that equal scores rank older memories first.
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._words: Dict[str, FrozenSet[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        # Memories by number of distinct words, for bounding unseen scores.
+        self._lengths: Dict[int, int] = {}
+        self._vectors: Optional[_VectorIndex] = None
+        if path and os.path.exists(path + ".json"):
+            self._load(path)
 
     def add(self, entry: MemoryEntry) -> str:
         if not entry.id:
             entry.id = hashlib.sha256(f"{entry.content}{time.time()}".encode()).hexdigest()[:16]
         if not entry.created_at:
             entry.created_at = time.time()
+        if entry.embedding is None and self._embed is not None:
+            entry.embedding = list(self._embed(entry.content))
+        # Validate the embedding before touching any state, so that a bad
+        # vector leaves the store as it was.
+        vectors = self._vectors
+        unit = None
+        if entry.embedding is not None:
+            if vectors is None and _optional_numpy() is not None:
+                vectors = _VectorIndex(len(entry.embedding))
+            if vectors is not None:
+                unit = vectors.unit(entry.embedding)
+        if entry.id in self._memories:
+            self._unindex(entry.id)
+        else:
+            self._order[entry.id] = self._next_order
+            self._next_order += 1
         self._memories[entry.id] = entry
+        self._index(entry.id, entry.content)
+        if unit is not None:
+            self._vectors = vectors
+            vectors.put(entry.id, unit)
         return entry.id
 
     def search(self, query: str, top_k: int = 5) -> List[MemoryEntry]:
         if not self._memories:
             return []
+        if self._embed is not None and self._vectors is not None and len(self._vectors):
+            return self.search_by_vector(self._embed(query), top_k)
 
-        query_words = set(query.lower().split())
-        scored = []
-        for entry in self._memories.values():
-            entry_words = set(entry.content.lower().split())
-            if not query_words or not entry_words:
-                score = 0.0
-            else:
-                intersection = query_words & entry_words
-                union = query_words | entry_words
-                score = len(intersection) / len(union) if union else 0.0
-            scored.append((score, entry))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [entry for score, entry in scored[:top_k] if score > 0]
+        query_words = frozenset(query.lower().split())
+        if top_k <= 0 or not query_words:
+            return []
+        size = len(query_words)
+        # Score the memories sharing the rarest query words first, and stop
+        # once the k-th best score beats any memory that holds only the
+        # remaining, more common, words could reach.
+        words = sorted(query_words, key=lambda w: len(self._postings.get(w, ())))
+        seen: Set[str] = set()
+        best: List[Tuple[float, int, str]] = []
+        for searched, word in enumerate(words, 1):
+            for memory_id in self._postings.get(word, ()):
+                if memory_id in seen:
+                    continue
+                seen.add(memory_id)
+                entry_words = self._words[memory_id]
+                shared = len(query_words & entry_words)
+                score = shared / (size + len(entry_words) - shared)
+                item = (score, -self._order[memory_id], memory_id)
+                if len(best) < top_k:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+            if len(best) == top_k and best[0][0] > self._max_jaccard(size - searched, size):
+                break
+        return [self._memories[memory_id] for _, _, memory_id in sorted(best, reverse=True)]
+
+    def search_by_vector(self, vector: Sequence[float], top_k: int = 5) -> List[MemoryEntry]:
+        """Memories most similar to *vector* by cosine similarity, most similar first.
+
+        Only memories with a positive similarity are returned.
+        """
+        if self._vectors is None:
+            return []
+        return [
+            self._memories[memory_id]
+            for score, memory_id in self._vectors.top_k(vector, top_k)
+            if score > 0
+        ]
 
     def delete(self, memory_id: str) -> bool:
-        return self._memories.pop(memory_id, None) is not None
+        if self._memories.pop(memory_id, None) is None:
+            return False
+        self._unindex(memory_id)
+        del self._order[memory_id]
+        return True
 
     def clear(self) -> None:
         self._memories.clear()
+        self._order.clear()
+        self._words.clear()
+        self._postings.clear()
+        self._lengths.clear()
+        self._vectors = None
 
     def list_all(self) -> List[MemoryEntry]:
         return list(self._memories.values())
 
+    def save(self, path: Optional[str] = None) -> None:
+        """Writes the memories to ``<path>.json`` and their vectors to ``<path>.<generation>.npy``.
+
+        Both files are written to temporary names and renamed into place,
+        the vectors first under a new name that ``<path>.json`` then points
+        to, so a crash in between leaves the previous pair intact.  Vector
+        files of earlier saves are removed afterwards.
+
+        Args:
+            path: File prefix; defaults to the one given to the constructor.
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError("InMemoryStore.save() needs a path")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        data = {
+            "entries": [
+                {
+                    "id": e.id,
+                    "content": e.content,
+                    "metadata": e.metadata,
+                    "created_at": e.created_at,
+                }
+                for e in self._memories.values()
+            ],
+            "vector_ids": list(self._vectors.ids) if self._vectors is not None else [],
+        }
+        vectors_file = None
+        if self._vectors is not None:
+            vectors_file = f"{os.path.basename(path)}.{uuid.uuid4().hex[:12]}.npy"
+            data["vectors_file"] = vectors_file
+            _replace_atomically(os.path.join(directory, vectors_file), self._vectors.save)
+        _replace_atomically(
+            path + ".json",
+            lambda f: f.write(json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")),
+        )
+        _remove_vector_files(path, keep=vectors_file)
+
+    def _max_jaccard(self, shared: int, size: int) -> float:
+        """Highest score of a memory sharing at most *shared* of *size* query words."""
+        best = 0.0
+        for length in self._lengths:
+            overlap = min(shared, length)
+            best = max(best, overlap / (size + length - overlap))
+        return best
+
+    def _load(self, path: str) -> None:
+        with open(path + ".json", encoding="utf-8") as f:
+            data = json.load(f)
+        for item in data.get("entries", []):
+            entry = MemoryEntry(
+                id=item["id"],
+                content=item.get("content", ""),
+                metadata=item.get("metadata") or {},
+                created_at=item.get("created_at", 0.0),
+            )
+            self._memories[entry.id] = entry
+            self._order[entry.id] = self._next_order
+            self._next_order += 1
+            self._index(entry.id, entry.content)
+        vector_ids = data.get("vector_ids") or []
+        if vector_ids and _optional_numpy() is not None:
+            # Saves before generations wrote the vectors to <path>.npy.
+            vectors_file = data.get("vectors_file") or os.path.basename(path) + ".npy"
+            vectors_path = os.path.join(os.path.dirname(os.path.abspath(path)), vectors_file)
+            try:
+                self._vectors = _VectorIndex.load(vectors_path, vector_ids)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    "Ignoring the embeddings of %s, which cannot be loaded (%s); "
+                    "search falls back to keywords until they are added again",
+                    path,
+                    e,
+                )
+
+    def _index(self, memory_id: str, content: str) -> None:
+        words = frozenset(content.lower().split())
+        self._words[memory_id] = words
+        if words:
+            self._lengths[len(words)] = self._lengths.get(len(words), 0) + 1
+        for word in words:
+            self._postings.setdefault(word, set()).add(memory_id)
+
+    def _unindex(self, memory_id: str) -> None:
+        words = self._words.pop(memory_id, frozenset())
+        if words:
+            remaining = self._lengths[len(words)] - 1
+            if remaining:
+                self._lengths[len(words)] = remaining
+            else:
+                del self._lengths[len(words)]
+        for word in words:
+            ids = self._postings[word]
+            ids.discard(memory_id)
+            if not ids:
+                del self._postings[word]
+        if self._vectors is not None:
+            self._vectors.remove(memory_id)
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "InMemoryStore needs numpy to index embeddings. Install with: pip install numpy"
+        ) from None
+    return numpy
+
+
+_numpy_missing_logged = False
+
+
+def _optional_numpy() -> Any:
+    """``numpy``, or ``None`` (logged once) if it is not installed."""
+    global _numpy_missing_logged
+    try:
+        import numpy
+    except ImportError:
+        if not _numpy_missing_logged:
+            _numpy_missing_logged = True
+            logger.warning(
+                "numpy is not installed; InMemoryStore ignores embeddings and "
+                "searches by keyword. Install with: pip install numpy"
+            )
+        return None
+    return numpy
+
+
+class _VectorIndex:
+    """Unit vectors in the rows of a float32 matrix, with their memory IDs.
+
+    The matrix keeps spare rows so that adding is amortised O(1); a deleted
+    row is filled with the last one.  A memory-mapped matrix is read-only
+    and is copied into memory on the first change.
+    """
+
+    def __init__(self, dim: int, matrix: Any = None, ids: Optional[List[str]] = None) -> None:
+        self._np = _numpy()
+        self.dim = dim
+        self.ids: List[str] = list(ids or [])
+        self._rows: Dict[str, int] = {memory_id: i for i, memory_id in enumerate(self.ids)}
+        self._matrix = (
+            matrix if matrix is not None else self._np.empty((16, dim), dtype=self._np.float32)
+        )
+
+    @classmethod
+    def load(cls, path: str, ids: List[str]) -> "_VectorIndex":
+        matrix = _numpy().load(path, mmap_mode="r")
+        if matrix.ndim != 2 or matrix.shape[0] != len(ids):
+            raise ValueError(f"{path} does not match its memory index")
+        return cls(matrix.shape[1], matrix, ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def put(self, memory_id: str, unit: Any) -> None:
+        """Stores *unit*, a vector returned by :meth:`unit`, for *memory_id*."""
+        row = self._rows.get(memory_id)
+        if row is None:
+            row = len(self.ids)
+            self._reserve(row + 1)
+            self.ids.append(memory_id)
+            self._rows[memory_id] = row
+        else:
+            self._reserve(len(self.ids))
+        self._matrix[row] = unit
+
+    def remove(self, memory_id: str) -> None:
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return
+        self._reserve(len(self.ids))
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self._matrix[row] = self._matrix[last]
+            self.ids[row] = moved
+            self._rows[moved] = row
+        self.ids.pop()
+
+    def top_k(self, vector: Sequence[float], k: int) -> List[Tuple[float, str]]:
+        """The *k* best ``(cosine similarity, memory ID)`` pairs, best first."""
+        np = self._np
+        count = len(self.ids)
+        if count == 0 or k <= 0:
+            return []
+        scores = self._matrix[:count] @ self.unit(vector)
+        if k < count:
+            # O(N) selection of the k best, then sorting only those.
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(count)
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(float(scores[i]), self.ids[i]) for i in best]
+
+    def save(self, f: Any) -> None:
+        self._np.save(f, self._np.ascontiguousarray(self._matrix[: len(self.ids)]))
+
+    def _reserve(self, rows: int) -> None:
+        matrix = self._matrix
+        if rows <= matrix.shape[0] and matrix.flags.writeable:
+            return
+        capacity = max(16, rows, 2 * matrix.shape[0])
+        grown = self._np.empty((capacity, self.dim), dtype=self._np.float32)
+        grown[: len(self.ids)] = matrix[: len(self.ids)]
+        self._matrix = grown
+
+    def unit(self, vector: Sequence[float]) -> Any:
+        """*vector* scaled to unit length; raises ``ValueError`` on a wrong dimension."""
+        np = self._np
+        array = np.asarray(vector, dtype=np.float32)
+        if array.shape != (self.dim,):
+            raise ValueError(
+                f"Expected an embedding of {self.dim} dimensions, got shape {array.shape}"
+            )
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm else array
+
+
+def _remove_vector_files(path: str, keep: Optional[str]) -> None:
+    """Removes the vector files of *path* other than *keep*, left by earlier saves."""
+    directory = os.path.dirname(os.path.abspath(path))
+    prefix = os.path.basename(path) + "."
+    for name in os.listdir(directory):
+        if name == keep or not (name.startswith(prefix) and name.endswith(".npy")):
+            continue
+        generation = name[len(prefix) : -len(".npy")]
+        if generation and not all(c in "0123456789abcdef" for c in generation):
+            continue
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            # Still memory-mapped on Windows; the next save retries.
+            pass
+
+
+def _replace_atomically(path: str, write: Callable[[Any], Any]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
 
 class SemanticMemory:
     """High-level semantic memory for agents.
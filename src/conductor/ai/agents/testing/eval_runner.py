@@ -30,12 +30,25 @@ Usage::
 
     results.print_summary()
     assert results.all_passed
+
+Large suites can run cases concurrently, split across processes, and reuse
+earlier agent results::
+
+    eval = CorrectnessEval(runtime, max_workers=8, timeout=300, cache_dir=".eval-cache")
+    results = eval.run(cases, shard=(int(os.environ["SHARD"]), 4))
+    results.to_junit_xml("eval-results.xml")
 """
 
 from __future__ import annotations
 
+import inspect
+import logging
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from conductor.ai.agents.result import AgentResult, EventType
 from conductor.ai.agents.testing.assertions import (
@@ -50,6 +63,8 @@ from conductor.ai.agents.testing.assertions import (
 )
 from conductor.ai.agents.testing.strategy_validators import validate_strategy
 
+logger = logging.getLogger("conductor.ai.agents.testing.eval_runner")
+
 # ── Eval case definition ───────────────────────────────────────────────
 
 
@@ -129,6 +144,8 @@ class EvalCaseResult:
     result: Optional[AgentResult] = None
     error: Optional[str] = None
     tags: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    cached: bool = False
 
 
 @dataclass
@@ -179,6 +196,54 @@ class EvalSuiteResult:
         """Return only the failed cases."""
         return [c for c in self.cases if not c.passed]
 
+    def to_junit_xml(self, path: Optional[str] = None, *, suite_name: str = "agent-evals") -> str:
+        """Render the results as a JUnit XML report, for CI test dashboards.
+
+        Each case becomes a ``<testcase>``; failed checks are listed in its
+        ``<failure>`` and agent execution errors become an ``<error>``.
+
+        Args:
+            path: If given, the report is also written to this file.
+            suite_name: The ``name`` of the ``<testsuite>`` element.
+
+        Returns:
+            The XML document as a string.
+        """
+        errors = sum(1 for c in self.cases if c.error)
+        suite = ET.Element(
+            "testsuite",
+            name=suite_name,
+            tests=str(self.total),
+            failures=str(self.fail_count - errors),
+            errors=str(errors),
+            time=f"{sum(c.duration for c in self.cases):.3f}",
+        )
+        for case in self.cases:
+            element = ET.SubElement(
+                suite, "testcase", classname=suite_name, name=case.name, time=f"{case.duration:.3f}"
+            )
+            if case.error:
+                ET.SubElement(element, "error", message=case.error).text = case.error
+            elif not case.passed:
+                failed = [c for c in case.checks if not c.passed]
+                ET.SubElement(
+                    element, "failure", message=", ".join(c.check for c in failed)
+                ).text = "\n".join(f"{c.check}: {c.message}" for c in failed)
+            properties = [("tags", ",".join(case.tags))] if case.tags else []
+            if case.cached:
+                properties.append(("cached", "true"))
+            if case.result is not None and case.result.execution_id:
+                properties.append(("execution_id", case.result.execution_id))
+            if properties:
+                props = ET.SubElement(element, "properties")
+                for name, value in properties:
+                    ET.SubElement(props, "property", name=name, value=value)
+        xml = ET.tostring(suite, encoding="unicode")
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('<?xml version="1.0" encoding="UTF-8"?>\n' + xml + "\n")
+        return xml
+
 
 # ── Eval runner ────────────────────────────────────────────────────────
 
@@ -189,51 +254,119 @@ class CorrectnessEval:
     Args:
         runtime: An :class:`AgentRuntime` instance (or any object with a
             ``run(agent, prompt)`` method).
+        max_workers: Cases executed at once.  The default of 1 runs them
+            one after another.
+        timeout: Seconds a case may take before it fails; ``None`` waits
+            for the agent's own timeout.
+        cache_dir: Directory of cached agent results.  A case whose agent
+            config and prompt are unchanged since a successful run re-runs
+            its checks against the cached result instead of the agent.
+            Only cases given an :class:`Agent` are cached; an agent named by
+            a string is defined on the server and always runs.
     """
 
-    def __init__(self, runtime: Any) -> None:
+    def __init__(
+        self,
+        runtime: Any,
+        *,
+        max_workers: int = 1,
+        timeout: Optional[float] = None,
+        cache_dir: Optional[str] = None,
+    ) -> None:
         self._runtime = runtime
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._cache = None
+        if cache_dir:
+            from conductor.ai.agents.runtime.compile_cache import CompileCache
+
+            self._cache = CompileCache(cache_dir, max_bytes=512 * 1024 * 1024)
 
     def run(
         self,
         cases: Sequence[EvalCase],
         *,
         tags: Optional[List[str]] = None,
+        shard: Optional[Tuple[int, int]] = None,
+        on_progress: Optional[Callable[[EvalCaseResult, int, int], None]] = None,
     ) -> EvalSuiteResult:
         """Run all eval cases and return aggregated results.
 
         Args:
             cases: List of :class:`EvalCase` definitions.
             tags: If provided, only run cases with at least one matching tag.
+            shard: ``(index, count)`` to run only every *count*-th case,
+                starting at *index*, so that *count* processes given the
+                same case list split it between them.
+            on_progress: Called as ``on_progress(case_result, done, total)``
+                when each case finishes, in completion order.
 
         Returns:
-            An :class:`EvalSuiteResult` with per-case and aggregated results.
+            An :class:`EvalSuiteResult` with per-case and aggregated results,
+            in the order of *cases*.
         """
-        suite = EvalSuiteResult()
-
-        for case in cases:
-            if tags and not set(tags) & set(case.tags):
-                continue
-            case_result = self._run_case(case)
-            suite.cases.append(case_result)
+        selected = [case for case in cases if not tags or set(tags) & set(case.tags)]
+        if shard is not None:
+            index, count = shard
+            if count < 1 or not 0 <= index < count:
+                raise ValueError(
+                    f"Invalid shard {shard!r}: expected (index, count) with 0 <= index < count"
+                )
+            selected = selected[index::count]
 
+        suite = EvalSuiteResult()
+        total = len(selected)
+        if self.max_workers <= 1 or total <= 1:
+            for done, case in enumerate(selected, 1):
+                case_result = self._run_case(case)
+                suite.cases.append(case_result)
+                if on_progress is not None:
+                    on_progress(case_result, done, total)
+            return suite
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agent-eval")
+        try:
+            futures = [pool.submit(self._run_case, case) for case in selected]
+            done = 0
+            for future in as_completed(futures):
+                done += 1
+                if on_progress is not None:
+                    on_progress(future.result(), done, total)
+            suite.cases = [future.result() for future in futures]
+        finally:
+            # Timed-out executions cannot be interrupted; don't wait for them.
+            pool.shutdown(wait=False)
         return suite
 
     def _run_case(self, case: EvalCase) -> EvalCaseResult:
         """Run a single eval case."""
+        started = time.monotonic()
+        case_result = self._evaluate(case)
+        case_result.duration = time.monotonic() - started
+        return case_result
+
+    def _evaluate(self, case: EvalCase) -> EvalCaseResult:
         checks: List[EvalCheckResult] = []
         agent_result: Optional[AgentResult] = None
-
-        # Execute the agent
-        try:
-            agent_result = self._runtime.run(case.agent, case.prompt)
-        except Exception as exc:
-            return EvalCaseResult(
-                name=case.name,
-                passed=False,
-                error=f"Agent execution failed: {exc}",
-                tags=case.tags,
-            )
+        cached = False
+
+        # Execute the agent, unless an earlier run of the same case is cached
+        key = self._cache_key(case)
+        if key is not None:
+            agent_result = self._cached_result(key)
+            cached = agent_result is not None
+        if agent_result is None:
+            try:
+                agent_result = self._execute(case)
+            except Exception as exc:
+                return EvalCaseResult(
+                    name=case.name,
+                    passed=False,
+                    error=f"Agent execution failed: {exc}",
+                    tags=case.tags,
+                )
+            if key is not None and not agent_result.is_failed:
+                self._store_result(key, agent_result)
 
         # Run all checks
         checks.append(
@@ -326,8 +459,62 @@ class CorrectnessEval:
             checks=checks,
             result=agent_result,
             tags=case.tags,
+            cached=cached,
         )
 
+    def _execute(self, case: EvalCase) -> AgentResult:
+        """Run the case's agent, failing with ``TimeoutError`` past ``timeout``."""
+        if self.timeout is None:
+            return self._runtime.run(case.agent, case.prompt)
+        kwargs = {}
+        if _accepts_keyword(self._runtime.run, "timeout"):
+            # Lets the runtime stop polling an execution that overruns.
+            kwargs["timeout"] = max(1, int(self.timeout))
+        # The runtime's own timeout only bounds polling; this one bounds the
+        # whole case, including compilation and worker startup.
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-eval-case")
+        try:
+            future = pool.submit(self._runtime.run, case.agent, case.prompt, **kwargs)
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                raise TimeoutError(f"timed out after {self.timeout:g}s") from None
+        finally:
+            pool.shutdown(wait=False)
+
+    def _cache_key(self, case: EvalCase) -> Optional[str]:
+        """Hash of the case's agent config and prompt, or ``None`` if not cacheable."""
+        if self._cache is None:
+            return None
+        from conductor.ai.agents.agent import Agent
+        from conductor.ai.agents.runtime.compile_cache import compile_cache_key
+
+        if isinstance(case.agent, Agent):
+            from conductor.ai.agents.config_serializer import AgentConfigSerializer
+
+            try:
+                agent_config: Any = AgentConfigSerializer().serialize(case.agent)
+            except Exception as exc:
+                logger.debug("Not caching eval case %r: %s", case.name, exc)
+                return None
+        else:
+            # An agent run by name is defined on the server, where it can
+            # change without the key changing; foreign framework agents have
+            # no stable serialized form.
+            return None
+        return compile_cache_key({"eval": {"agent": agent_config, "prompt": case.prompt}})
+
+    def _cached_result(self, key: str) -> Optional[AgentResult]:
+        from conductor.ai.agents.testing.recording import _dict_to_result
+
+        data = self._cache.get(key)
+        return _dict_to_result(data) if data is not None else None
+
+    def _store_result(self, key: str, result: AgentResult) -> None:
+        from conductor.ai.agents.testing.recording import _result_to_dict
+
+        self._cache.put(key, _result_to_dict(result))
+
     @staticmethod
     def _check(name: str, fn: Callable[[], None]) -> EvalCheckResult:
         """Run a single assertion and capture the result."""
@@ -338,6 +525,16 @@ class CorrectnessEval:
             return EvalCheckResult(check=name, passed=False, message=str(exc))
 
 
+def _accepts_keyword(fn: Callable[..., Any], name: str) -> bool:
+    try:
+        parameters = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.name == name or p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters
+    )
+
+
 def _assert_no_handoff(result: AgentResult, agent_name: str) -> None:
     """Assert that NO handoff to the given agent occurred."""
     handoffs = [
@@ -12,9 +12,11 @@ from conductor.client.context.task_context import _set_task_context, _clear_task
 from conductor.client.event.task_runner_events import (
     TaskRunnerEvent, PollStarted, PollCompleted, PollFailure,
     TaskExecutionStarted, TaskExecutionCompleted, TaskExecutionFailure,
-    TaskUpdateFailure
+    TaskUpdateCompleted,
+    TaskUpdateFailure,
+    trace_context_from_input,
 )
-from conductor.client.event.sync_event_dispatcher import SyncEventDispatcher
+from conductor.client.event.sync_event_dispatcher import SyncEventDispatcher, async_delivery_from_env
 from conductor.client.event.sync_listener_register import register_task_runner_listener
 from conductor.client.http.api.async_task_resource_api import AsyncTaskResourceApi
 from conductor.client.http.async_api_client import AsyncApiClient
@@ -33,6 +35,7 @@ from conductor.client.worker.worker_config import resolve_worker_config, get_wor
 from conductor.client.worker.exception import NonRetryableException
 from conductor.client.automator.json_schema_generator import generate_json_schema_from_function
 from conductor.client.automator.lease_tracker import LeaseManager
+from conductor.client.automator.phase_profiler import PhaseProfiler, install_api_client_hooks
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -81,7 +84,10 @@ class AsyncTaskRunner:
         self.configuration = configuration
 
         # Set up event dispatcher and register listeners (same as TaskRunner)
-        self.event_dispatcher = SyncEventDispatcher[TaskRunnerEvent]()
+        # CONDUCTOR_EVENT_DELIVERY=async moves listener calls off the poll loop
+        self.event_dispatcher = SyncEventDispatcher[TaskRunnerEvent](
+            async_delivery=async_delivery_from_env()
+        )
         if event_listeners:
             for listener in event_listeners:
                 register_task_runner_listener(listener, self.event_dispatcher)
@@ -114,6 +120,7 @@ class AsyncTaskRunner:
         self._shutdown = False  # Flag to indicate graceful shutdown
         self._use_update_v2 = True  # Will be set to False if server doesn't support v2 endpoint
         self._lease_manager = LeaseManager.get_instance()
+        self._profiler = PhaseProfiler.get_instance()
         self._tracked_task_ids = set()  # Local set for cleanup on shutdown
         self._sync_task_client = None  # Created after fork for LeaseManager heartbeats
 
@@ -125,26 +132,29 @@ class AsyncTaskRunner:
             logger.setLevel(logging.DEBUG)
 
         # Create async HTTP client in subprocess (after fork)
-        # This must be done here because httpx.AsyncClient is not picklable
-        self.async_api_client = AsyncApiClient(
-            configuration=self.configuration,
-            metrics_collector=self.metrics_collector
-        )
+        # This must be done here because httpx.AsyncClient is not picklable.
+        # Clients injected before run() (e.g. LocalWorkflowEngine.attach) are kept.
+        if self.async_task_client is None:
+            self.async_api_client = AsyncApiClient(
+                configuration=self.configuration,
+                metrics_collector=self.metrics_collector
+            )
 
-        self.async_task_client = AsyncTaskResourceApi(
-            api_client=self.async_api_client
-        )
+            self.async_task_client = AsyncTaskResourceApi(
+                api_client=self.async_api_client
+            )
 
         # Create a sync TaskResourceApi for LeaseManager heartbeats
         # (LeaseManager sends heartbeats from its own ThreadPoolExecutor)
-        from conductor.client.http.api.task_resource_api import TaskResourceApi
-        from conductor.client.http.api_client import ApiClient
-        self._sync_task_client = TaskResourceApi(
-            ApiClient(
-                configuration=self.configuration,
-                metrics_collector=self.metrics_collector
+        if self._sync_task_client is None:
+            from conductor.client.http.api.task_resource_api import TaskResourceApi
+            from conductor.client.http.api_client import ApiClient
+            self._sync_task_client = TaskResourceApi(
+                ApiClient(
+                    configuration=self.configuration,
+                    metrics_collector=self.metrics_collector
+                )
             )
-        )
 
         # Create semaphore in the event loop (must be created within the loop)
         self._semaphore = asyncio.Semaphore(self._max_workers)
@@ -154,8 +164,8 @@ class AsyncTaskRunner:
         config_summary = get_worker_config_oneline(task_name, self._resolved_config)
         logger.info(config_summary)
 
-        # Register task definition if configured
-        if self.worker.register_task_def:
+        # Register task definition if configured and not already done by the parent process
+        if self.worker.register_task_def and not getattr(self.worker, 'task_def_registered', False):
             await self.__async_register_task_definition()
 
         task_names = ",".join(self.worker.task_definition_names)
@@ -209,9 +219,19 @@ class AsyncTaskRunner:
             except Exception:
                 pass
 
-        # Clear event listeners
+        # Deliver queued events (async delivery mode) and clear event listeners
+        if self.event_dispatcher is not None:
+            self.event_dispatcher.close()
         self.event_dispatcher = None
 
+        # Write metric updates still aggregated in memory (flush_interval mode)
+        if self.metrics_collector is not None:
+            self.metrics_collector.close()
+
+        # Persist phase timings gathered so far (profiling mode)
+        if self._profiler.enabled:
+            self._profiler.write_summary()
+
         logger.debug("AsyncTaskRunner cleanup completed")
 
     async def __aenter__(self):
@@ -463,6 +483,9 @@ class AsyncTaskRunner:
     async def run_once(self) -> None:
         """Execute one iteration of the polling loop (async version)."""
         try:
+            # Pick up profiling control-file changes (rate limited, no-op without a profile dir)
+            self._profiler.maybe_check_control()
+
             # No need for manual cleanup - tasks remove themselves via add_done_callback
             # Just check capacity directly
             current_capacity = len(self._running_tasks)
@@ -529,11 +552,12 @@ class AsyncTaskRunner:
                 return []
 
         # Publish PollStarted event (same as TaskRunner:245)
-        self.event_dispatcher.publish(PollStarted(
-            task_type=task_definition_name,
-            worker_id=self.worker.get_identity(),
-            poll_count=count
-        ))
+        if self.event_dispatcher.has_listeners(PollStarted):
+            self.event_dispatcher.publish(PollStarted(
+                task_type=task_definition_name,
+                worker_id=self.worker.get_identity(),
+                poll_count=count
+            ))
 
         try:
             start_time = time.time()
@@ -547,18 +571,29 @@ class AsyncTaskRunner:
             if domain is not None and domain != "":
                 params["domain"] = domain
 
+            profiling = self._profiler.enabled
+            if profiling:
+                install_api_client_hooks(self._profiler, getattr(self.async_task_client, "api_client", None))
+                self._profiler.begin()
+                poll_start = time.perf_counter()
+
             # Async batch poll
             tasks = await self.async_task_client.batch_poll(tasktype=task_definition_name, **params)
 
+            if profiling:
+                self._profiler.record_split(
+                    task_definition_name, "poll", "deserialize", time.perf_counter() - poll_start)
+
             finish_time = time.time()
             time_spent = finish_time - start_time
 
             # Publish PollCompleted event (same as TaskRunner:268)
-            self.event_dispatcher.publish(PollCompleted(
-                task_type=task_definition_name,
-                duration_ms=time_spent * 1000,
-                tasks_received=len(tasks) if tasks else 0
-            ))
+            if self.event_dispatcher.has_listeners(PollCompleted):
+                self.event_dispatcher.publish(PollCompleted(
+                    task_type=task_definition_name,
+                    duration_ms=time_spent * 1000,
+                    tasks_received=len(tasks) if tasks else 0
+                ))
 
             # Success - reset auth failure counter (any successful HTTP response means auth is working)
             self._auth_failures = 0
@@ -571,11 +606,12 @@ class AsyncTaskRunner:
             backoff_seconds = min(2 ** self._auth_failures, 60)
 
             # Publish PollFailure event (same as TaskRunner:286)
-            self.event_dispatcher.publish(PollFailure(
-                task_type=task_definition_name,
-                duration_ms=(time.time() - start_time) * 1000,
-                cause=auth_exception
-            ))
+            if self.event_dispatcher.has_listeners(PollFailure):
+                self.event_dispatcher.publish(PollFailure(
+                    task_type=task_definition_name,
+                    duration_ms=(time.time() - start_time) * 1000,
+                    cause=auth_exception
+                ))
 
             if auth_exception.invalid_token:
                 logger.error(
@@ -591,11 +627,12 @@ class AsyncTaskRunner:
             return []
         except Exception as e:
             # Publish PollFailure event (same as TaskRunner:306)
-            self.event_dispatcher.publish(PollFailure(
-                task_type=task_definition_name,
-                duration_ms=(time.time() - start_time) * 1000,
-                cause=e
-            ))
+            if self.event_dispatcher.has_listeners(PollFailure):
+                self.event_dispatcher.publish(PollFailure(
+                    task_type=task_definition_name,
+                    duration_ms=(time.time() - start_time) * 1000,
+                    cause=e
+                ))
             logger.error(
                 "Failed to batch poll task for: %s, reason: %s",
                 task_definition_name,
@@ -662,16 +699,22 @@ class AsyncTaskRunner:
         _set_task_context(task, initial_task_result)
 
         # Publish TaskExecutionStarted event (same as TaskRunner:420)
-        self.event_dispatcher.publish(TaskExecutionStarted(
-            task_type=task_definition_name,
-            task_id=task.task_id,
-            worker_id=self.worker.get_identity(),
-            workflow_instance_id=task.workflow_instance_id
-        ))
+        if self.event_dispatcher.has_listeners(TaskExecutionStarted):
+            self.event_dispatcher.publish(TaskExecutionStarted(
+                task_type=task_definition_name,
+                task_id=task.task_id,
+                worker_id=self.worker.get_identity(),
+                workflow_instance_id=task.workflow_instance_id,
+                trace_context=trace_context_from_input(task.input_data)
+            ))
 
         try:
             start_time = time.time()
 
+            profiling = self._profiler.enabled
+            if profiling:
+                bind_start = time.perf_counter()
+
             # Get worker function parameters (same as TaskRunner, but for async function)
             params = inspect.signature(self.worker.execute_function).parameters
             task_input = {}
@@ -690,8 +733,23 @@ class AsyncTaskRunner:
                 else:
                     task_input[input_name] = None
 
+            if profiling:
+                execute_start = time.perf_counter()
+                self._profiler.record(task_definition_name, "bind", execute_start - bind_start)
+
+            # cProfile samples here cover the event loop thread while the task runs
+            sample = self._profiler.sample(task_definition_name)
+            if sample is not None:
+                sample.__enter__()
+
             # Direct await of async worker function - NO THREADS!
-            task_output = await self.worker.execute_function(**task_input)
+            try:
+                task_output = await self.worker.execute_function(**task_input)
+            finally:
+                if sample is not None:
+                    sample.__exit__(None, None, None)
+            if profiling:
+                self._profiler.record(task_definition_name, "execute", time.perf_counter() - execute_start)
 
             # Handle different return types (same as TaskRunner:441-474)
             if isinstance(task_output, TaskResult):
@@ -727,15 +785,16 @@ class AsyncTaskRunner:
             time_spent = finish_time - start_time
 
             # Publish TaskExecutionCompleted event (same as TaskRunner:484)
-            output_size = sys.getsizeof(task_result) if task_result else 0
-            self.event_dispatcher.publish(TaskExecutionCompleted(
-                task_type=task_definition_name,
-                task_id=task.task_id,
-                worker_id=self.worker.get_identity(),
-                workflow_instance_id=task.workflow_instance_id,
-                duration_ms=time_spent * 1000,
-                output_size_bytes=output_size
-            ))
+            if self.event_dispatcher.has_listeners(TaskExecutionCompleted):
+                output_size = sys.getsizeof(task_result) if task_result else 0
+                self.event_dispatcher.publish(TaskExecutionCompleted(
+                    task_type=task_definition_name,
+                    task_id=task.task_id,
+                    worker_id=self.worker.get_identity(),
+                    workflow_instance_id=task.workflow_instance_id,
+                    duration_ms=time_spent * 1000,
+                    output_size_bytes=output_size
+                ))
             logger.debug(
                 "Executed async task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
                 task.task_id,
@@ -748,14 +807,15 @@ class AsyncTaskRunner:
             time_spent = finish_time - start_time
 
             # Publish TaskExecutionFailure event
-            self.event_dispatcher.publish(TaskExecutionFailure(
-                task_type=task_definition_name,
-                task_id=task.task_id,
-                worker_id=self.worker.get_identity(),
-                workflow_instance_id=task.workflow_instance_id,
-                cause=ne,
-                duration_ms=time_spent * 1000
-            ))
+            if self.event_dispatcher.has_listeners(TaskExecutionFailure):
+                self.event_dispatcher.publish(TaskExecutionFailure(
+                    task_type=task_definition_name,
+                    task_id=task.task_id,
+                    worker_id=self.worker.get_identity(),
+                    workflow_instance_id=task.workflow_instance_id,
+                    cause=ne,
+                    duration_ms=time_spent * 1000
+                ))
 
             task_result = TaskResult(
                 task_id=task.task_id,
@@ -781,14 +841,15 @@ class AsyncTaskRunner:
             time_spent = finish_time - start_time
 
             # Publish TaskExecutionFailure event (same as TaskRunner:503)
-            self.event_dispatcher.publish(TaskExecutionFailure(
-                task_type=task_definition_name,
-                task_id=task.task_id,
-                worker_id=self.worker.get_identity(),
-                workflow_instance_id=task.workflow_instance_id,
-                cause=e,
-                duration_ms=time_spent * 1000
-            ))
+            if self.event_dispatcher.has_listeners(TaskExecutionFailure):
+                self.event_dispatcher.publish(TaskExecutionFailure(
+                    task_type=task_definition_name,
+                    task_id=task.task_id,
+                    worker_id=self.worker.get_identity(),
+                    workflow_instance_id=task.workflow_instance_id,
+                    cause=e,
+                    duration_ms=time_spent * 1000
+                ))
             task_result = TaskResult(
                 task_id=task.task_id,
                 workflow_instance_id=task.workflow_instance_id,
@@ -841,6 +902,21 @@ class AsyncTaskRunner:
             else:
                 task_result.output_data = context_result.output_data
 
+    def _record_update_success(self, task_definition_name: str, task_result: TaskResult, update_start: float) -> None:
+        duration = time.time() - update_start
+        if self._profiler.enabled:
+            self._profiler.record_split(task_definition_name, "update", "serialize", duration)
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_update_time(task_definition_name, duration, status="SUCCESS")
+        if self.event_dispatcher.has_listeners(TaskUpdateCompleted):
+            self.event_dispatcher.publish(TaskUpdateCompleted(
+                task_type=task_definition_name,
+                task_id=task_result.task_id,
+                worker_id=self.worker.get_identity(),
+                workflow_instance_id=task_result.workflow_instance_id,
+                duration_ms=duration * 1000
+            ))
+
     async def __async_update_task(self, task_result: TaskResult):
         """Async update task result using v2 endpoint. Returns the next Task to process, or None."""
         if not isinstance(task_result, TaskResult):
@@ -864,6 +940,8 @@ class AsyncTaskRunner:
                 # Exponential backoff: [10s, 20s, 30s] before retry
                 await asyncio.sleep(attempt * 10)
             update_start = time.time()
+            if self._profiler.enabled:
+                self._profiler.begin()
             try:
                 if self._use_update_v2:
                     next_task = await self.async_task_client.update_task_v2(body=task_result)
@@ -874,10 +952,7 @@ class AsyncTaskRunner:
                         task_definition_name,
                         next_task.task_id if next_task else None
                     )
-                    if self.metrics_collector is not None:
-                        self.metrics_collector.record_task_update_time(
-                            task_definition_name, time.time() - update_start, status="SUCCESS"
-                        )
+                    self._record_update_success(task_definition_name, task_result, update_start)
                     return next_task
                 else:
                     await self.async_task_client.update_task(body=task_result)
@@ -887,10 +962,7 @@ class AsyncTaskRunner:
                         task_result.workflow_instance_id,
                         task_definition_name,
                     )
-                    if self.metrics_collector is not None:
-                        self.metrics_collector.record_task_update_time(
-                            task_definition_name, time.time() - update_start, status="SUCCESS"
-                        )
+                    self._record_update_success(task_definition_name, task_result, update_start)
                     return None
             except ApiException as e:
                 if e.status in (404, 405) and self._use_update_v2:
@@ -904,10 +976,7 @@ class AsyncTaskRunner:
                     # Retry immediately with v1
                     try:
                         await self.async_task_client.update_task(body=task_result)
-                        if self.metrics_collector is not None:
-                            self.metrics_collector.record_task_update_time(
-                                task_definition_name, time.time() - update_start, status="SUCCESS"
-                            )
+                        self._record_update_success(task_definition_name, task_result, update_start)
                         return None
                     except Exception as fallback_e:
                         last_exception = fallback_e
@@ -958,15 +1027,16 @@ class AsyncTaskRunner:
         )
 
         # Publish TaskUpdateFailure event for external handling
-        self.event_dispatcher.publish(TaskUpdateFailure(
-            task_type=task_definition_name,
-            task_id=task_result.task_id,
-            worker_id=self.worker.get_identity(),
-            workflow_instance_id=task_result.workflow_instance_id,
-            cause=last_exception,
-            retry_count=retry_count,
-            task_result=task_result
-        ))
+        if self.event_dispatcher.has_listeners(TaskUpdateFailure):
+            self.event_dispatcher.publish(TaskUpdateFailure(
+                task_type=task_definition_name,
+                task_id=task_result.task_id,
+                worker_id=self.worker.get_identity(),
+                workflow_instance_id=task_result.workflow_instance_id,
+                cause=last_exception,
+                retry_count=retry_count,
+                task_result=task_result
+            ))
 
         return None
 
@@ -85,6 +85,17 @@ class LeaseManager:
             cls._instance = None
             cls._instance_pid = None
 
+    @classmethod
+    def _reset_after_fork(cls):
+        """Drop the parent's instance and lock in a forked child.
+
+        The PID check in get_instance() already replaces the instance, but the
+        class lock may have been held by a parent thread at fork time.
+        """
+        cls._instance_lock = threading.Lock()
+        cls._instance = None
+        cls._instance_pid = None
+
     def __init__(self, check_interval: float = 1.0, max_heartbeat_workers: int = 4):
         self._tracked: Dict[str, LeaseInfo] = {}
         self._lock = threading.Lock()
@@ -224,3 +235,7 @@ class LeaseManager:
         with self._lock:
             self._tracked.clear()
         logger.debug("LeaseManager shut down")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=LeaseManager._reset_after_fork)
@@ -0,0 +1,418 @@
+"""Per-task-type phase profiling for Conductor task runners.
+
+Architecture:
+    PhaseProfiler is a process-wide singleton that TaskRunner and
+    AsyncTaskRunner report phase timings into, keyed by task type:
+
+        poll         batch-poll HTTP round trip (minus response decoding)
+        deserialize  JSON decode + model construction of the poll response
+        bind         converting task input into worker function arguments
+        execute      the worker function itself (minus binding)
+        serialize    TaskResult -> JSON-ready dict for the update call
+        update       update HTTP round trip (minus serialization)
+
+    Profiling is off by default.  While off, runners pay one attribute check
+    per phase.  It can be switched on and off at runtime, and cProfile or
+    tracemalloc samples can be requested for the next N executions of a task
+    type; samples are written to the profile directory.
+
+    Worker processes are spawned, so runtime control goes through a control
+    file in the profile directory that each runner checks about once a second
+    (see ``write_control``).  In-process callers can use the methods directly.
+
+Environment:
+    CONDUCTOR_WORKER_PROFILE_DIR  directory for control file, summaries and
+                                  samples; enables control-file checks
+    CONDUCTOR_WORKER_PROFILING    ``true`` to start with phase timing enabled
+
+Usage (from any process)::
+
+    from conductor.client.automator.phase_profiler import write_control
+    write_control("/tmp/conductor-profile", enabled=True, cprofile={"my_task": 5})
+    # -> /tmp/conductor-profile/phases-<pid>.json (timings per task type)
+    # -> /tmp/conductor-profile/my_task-<pid>-<ts>-<n>.pstats (5 profiled executions)
+"""
+
+import contextvars
+import cProfile
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR_ENV = "CONDUCTOR_WORKER_PROFILE_DIR"
+PROFILING_ENV = "CONDUCTOR_WORKER_PROFILING"
+CONTROL_FILE_NAME = "profiling.json"
+
+PHASES = ("poll", "deserialize", "bind", "execute", "serialize", "update")
+
+DEFAULT_CONTROL_INTERVAL = 1.0
+DEFAULT_SUMMARY_INTERVAL = 10.0
+TRACEMALLOC_TOP_N = 50
+
+# Nested sub-phase time for the current thread / asyncio task.
+_nested_phases: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "conductor_nested_phases", default=None)
+
+
+def write_control(directory: str, enabled: Optional[bool] = None,
+                  cprofile: Optional[Dict[str, int]] = None,
+                  tracemalloc: Optional[Dict[str, int]] = None) -> str:
+    """Atomically write a profiling control file into *directory*.
+
+    Args:
+        directory: The workers' ``CONDUCTOR_WORKER_PROFILE_DIR``.
+        enabled: Turn phase timing on or off (``None`` leaves it unchanged).
+        cprofile: ``{task_type: executions}`` to profile with cProfile.
+        tracemalloc: ``{task_type: executions}`` to sample with tracemalloc.
+
+    Returns:
+        Path of the control file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    control: Dict[str, Any] = {"issued_at": time.time()}
+    if enabled is not None:
+        control["enabled"] = enabled
+    if cprofile:
+        control["cprofile"] = cprofile
+    if tracemalloc:
+        control["tracemalloc"] = tracemalloc
+    path = os.path.join(directory, CONTROL_FILE_NAME)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".profiling-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(control, f)
+    os.replace(tmp_path, path)
+    return path
+
+
+class _PhaseStats:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_s": self.total,
+            "mean_ms": (self.total / self.count) * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+        }
+
+
+class _Sample:
+    """Context manager profiling one execution with cProfile or tracemalloc."""
+
+    def __init__(self, profiler: "PhaseProfiler", task_type: str, kind: str):
+        self._profiler = profiler
+        self._task_type = task_type
+        self._kind = kind
+        self._profile = None
+        self._snapshot = None
+        self._started_tracemalloc = False
+
+    def __enter__(self):
+        if self._kind == "cprofile":
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self._snapshot = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if self._kind == "cprofile":
+                self._profile.disable()
+                path = self._profiler._sample_path(self._task_type, "pstats")
+                self._profile.dump_stats(path)
+            else:
+                after = tracemalloc.take_snapshot()
+                if self._started_tracemalloc:
+                    tracemalloc.stop()
+                path = self._profiler._sample_path(self._task_type, "tracemalloc.txt")
+                with open(path, "w") as f:
+                    for stat in after.compare_to(self._snapshot, "lineno")[:TRACEMALLOC_TOP_N]:
+                        f.write(f"{stat}\n")
+            logger.info("Wrote %s sample for %s to %s", self._kind, self._task_type, path)
+        except Exception as e:
+            logger.warning("Failed to write %s sample for %s: %s", self._kind, self._task_type, e)
+        finally:
+            self._profiler._sample_lock.release()
+        return False
+
+
+class PhaseProfiler:
+    """Process-wide phase timing and on-demand sampling for task runners.
+
+    Usage:
+        profiler = PhaseProfiler.get_instance()
+        profiler.enable()
+        profiler.request_cprofile("my_task", executions=3)
+        ...
+        profiler.summary()  # {task_type: {phase: {count, total_s, mean_ms, max_ms}}}
+    """
+
+    _instance: Optional['PhaseProfiler'] = None
+    _instance_lock = threading.Lock()
+    _instance_pid: Optional[int] = None
+
+    @classmethod
+    def get_instance(cls) -> 'PhaseProfiler':
+        """Get or create the process-wide PhaseProfiler (configured from env)."""
+        current_pid = os.getpid()
+        if cls._instance is None or cls._instance_pid != current_pid:
+            with cls._instance_lock:
+                if cls._instance is None or cls._instance_pid != current_pid:
+                    enabled = os.environ.get(PROFILING_ENV, "").strip().lower() in ("true", "1", "yes")
+                    cls._instance = cls(directory=os.environ.get(PROFILE_DIR_ENV) or None, enabled=enabled)
+                    cls._instance_pid = current_pid
+        return cls._instance
+
+    @classmethod
+    def _reset_instance(cls):
+        """Reset the singleton. For testing only."""
+        with cls._instance_lock:
+            cls._instance = None
+            cls._instance_pid = None
+
+    @classmethod
+    def _reset_after_fork(cls):
+        """Drop the parent's instance and lock in a forked child."""
+        cls._instance_lock = threading.Lock()
+        cls._instance = None
+        cls._instance_pid = None
+
+    def __init__(self, directory: Optional[str] = None, enabled: bool = False,
+                 control_interval: float = DEFAULT_CONTROL_INTERVAL,
+                 summary_interval: float = DEFAULT_SUMMARY_INTERVAL):
+        self.directory = directory
+        self.enabled = enabled
+        self.control_interval = control_interval
+        self.summary_interval = summary_interval
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, _PhaseStats]] = {}
+        # task_type -> remaining executions to sample
+        self._cprofile_requests: Dict[str, int] = {}
+        self._tracemalloc_requests: Dict[str, int] = {}
+        # Only one sample at a time: cProfile and tracemalloc are process-global.
+        self._sample_lock = threading.Lock()
+        self._sample_seq = 0
+        self._next_control_check = 0.0
+        self._control_mtime: Optional[float] = None
+        self._next_summary = 0.0
+        self._dirty = False
+
+    # -- Runtime toggles ----------------------------------------------------
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+        self.write_summary()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+    def request_cprofile(self, task_type: str, executions: int = 1) -> None:
+        """Profile the next *executions* runs of *task_type* with cProfile."""
+        with self._lock:
+            self._cprofile_requests[task_type] = executions
+
+    def request_tracemalloc(self, task_type: str, executions: int = 1) -> None:
+        """Record allocation diffs for the next *executions* runs of *task_type*."""
+        with self._lock:
+            self._tracemalloc_requests[task_type] = executions
+
+    # -- Recording ----------------------------------------------------------
+
+    def record(self, task_type: str, phase: str, seconds: float) -> None:
+        with self._lock:
+            phases = self._stats.get(task_type)
+            if phases is None:
+                phases = self._stats[task_type] = {}
+            stats = phases.get(phase)
+            if stats is None:
+                stats = phases[phase] = _PhaseStats()
+            stats.add(seconds)
+            self._dirty = True
+
+    def begin(self) -> None:
+        """Start an enclosing phase: drop nested time left by earlier calls."""
+        _nested_phases.set({})
+
+    def add_nested(self, phase: str, seconds: float) -> None:
+        """Accumulate time of a sub-phase measured inside an enclosing phase.
+
+        Used where the code that can see the sub-phase (ApiClient decoding,
+        Worker argument binding) does not know the task type; the runner
+        collects it with ``take_nested`` when the enclosing phase ends.
+        Tracked per thread and per asyncio task.
+        """
+        nested = _nested_phases.get()
+        if nested is None:
+            nested = {}
+            _nested_phases.set(nested)
+        nested[phase] = nested.get(phase, 0.0) + seconds
+
+    def take_nested(self, phase: str) -> float:
+        nested = _nested_phases.get()
+        if not nested:
+            return 0.0
+        return nested.pop(phase, 0.0)
+
+    def record_split(self, task_type: str, outer: str, inner: str, seconds: float) -> None:
+        """Record an enclosing phase and the nested sub-phase carved out of it."""
+        inner_seconds = self.take_nested(inner)
+        self.record(task_type, inner, inner_seconds)
+        self.record(task_type, outer, max(0.0, seconds - inner_seconds))
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            return {
+                task_type: {phase: stats.as_dict() for phase, stats in phases.items()}
+                for task_type, phases in self._stats.items()
+            }
+
+    # -- Sampling -----------------------------------------------------------
+
+    def sample(self, task_type: str) -> Optional[_Sample]:
+        """Return a context manager profiling this execution, or None."""
+        if not (self._cprofile_requests or self._tracemalloc_requests):
+            return None
+        with self._lock:
+            if self._cprofile_requests.get(task_type):
+                kind, requests = "cprofile", self._cprofile_requests
+            elif self._tracemalloc_requests.get(task_type):
+                kind, requests = "tracemalloc", self._tracemalloc_requests
+            else:
+                return None
+            if not self._sample_lock.acquire(blocking=False):
+                return None
+            requests[task_type] -= 1
+            if requests[task_type] <= 0:
+                del requests[task_type]
+        return _Sample(self, task_type, kind)
+
+    def _sample_path(self, task_type: str, suffix: str) -> str:
+        directory = self._output_directory()
+        safe_type = "".join(c if c.isalnum() or c in "-_." else "_" for c in task_type)
+        with self._lock:
+            self._sample_seq += 1
+            seq = self._sample_seq
+        return os.path.join(directory, f"{safe_type}-{os.getpid()}-{int(time.time())}-{seq}.{suffix}")
+
+    def _output_directory(self) -> str:
+        directory = self.directory or os.path.join(tempfile.gettempdir(), "conductor-profile")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    # -- Control file and summaries ---------------------------------------------
+
+    def maybe_check_control(self) -> None:
+        """Apply control-file changes and write summaries; rate limited."""
+        if self.directory is None:
+            return
+        now = time.monotonic()
+        if now < self._next_control_check:
+            return
+        self._next_control_check = now + self.control_interval
+        self._apply_control_file()
+        if self.enabled and now >= self._next_summary:
+            self._next_summary = now + self.summary_interval
+            self.write_summary()
+
+    def _apply_control_file(self) -> None:
+        path = os.path.join(self.directory, CONTROL_FILE_NAME)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return
+        if mtime == self._control_mtime:
+            return
+        self._control_mtime = mtime
+        try:
+            with open(path) as f:
+                control = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable profiling control file %s: %s", path, e)
+            return
+        if "enabled" in control:
+            if control["enabled"]:
+                self.enable()
+            else:
+                self.disable()
+        for task_type, executions in (control.get("cprofile") or {}).items():
+            self.request_cprofile(task_type, int(executions))
+        for task_type, executions in (control.get("tracemalloc") or {}).items():
+            self.request_tracemalloc(task_type, int(executions))
+
+    def write_summary(self) -> Optional[str]:
+        """Write ``phases-<pid>.json`` with the current timings, if any changed."""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        path = os.path.join(self._output_directory(), f"phases-{os.getpid()}.json")
+        try:
+            with open(path, "w") as f:
+                json.dump({"pid": os.getpid(), "written_at": time.time(), "task_types": self.summary()},
+                          f, indent=2, sort_keys=True)
+        except OSError as e:
+            logger.warning("Failed to write phase summary %s: %s", path, e)
+            return None
+        return path
+
+
+def profiled_call(profiler: PhaseProfiler, phase: str, func):
+    """Wrap *func* so its outermost calls add to *phase* as nested time.
+
+    Installed on a runner's own ApiClient instance (``deserialize`` and the
+    recursive ``sanitize_for_serialization``) once profiling is first enabled.
+    """
+    depth = threading.local()
+
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled or getattr(depth, "value", 0):
+            return func(*args, **kwargs)
+        depth.value = 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            depth.value = 0
+            profiler.add_nested(phase, time.perf_counter() - start)
+
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def install_api_client_hooks(profiler: PhaseProfiler, api_client) -> None:
+    """Attribute *api_client* decode/encode time to deserialize/serialize."""
+    if api_client is None or getattr(api_client, "_phase_profiler_hooks", False):
+        return
+    api_client.deserialize = profiled_call(profiler, "deserialize", api_client.deserialize)
+    api_client.sanitize_for_serialization = profiled_call(
+        profiler, "serialize", api_client.sanitize_for_serialization)
+    api_client._phase_profiler_hooks = True
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=PhaseProfiler._reset_after_fork)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+import copy
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from conductor.client.automator.json_schema_generator import generate_json_schema_from_function
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.schema_def import SchemaDef, SchemaType
+from conductor.client.http.models.task_def import TaskDef
+from conductor.client.metadata_client import MetadataClient
+from conductor.client.schema_client import SchemaClient
+from conductor.client.worker.worker_interface import WorkerInterface
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+_SERIALIZER = ApiClient.__new__(ApiClient)
+
+
+@dataclass
+class TaskDefRegistrationResult:
+    """Task definition names by outcome of :func:`register_task_definitions`."""
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    schemas_registered: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+def content_hash(value: Any, keys: Optional[Iterable[str]] = None) -> str:
+    """SHA-256 of the JSON form of a model or dict, optionally restricted to ``keys``.
+
+    Definitions read back from the server carry extra fields (``createTime``, ``ownerApp``, ...);
+    hashing them with the keys of the local definition compares only what the SDK would send.
+    """
+    payload = _SERIALIZER.sanitize_for_serialization(value) or {}
+    if keys is not None:
+        payload = {key: payload.get(key) for key in keys}
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def task_definition_for_worker(worker: WorkerInterface,
+                               configuration: Optional[Configuration] = None) -> Tuple[TaskDef, List[SchemaDef]]:
+    """The task definition and JSON schemas a worker's runner would register for it.
+
+    Mirrors ``TaskRunner``'s registration: the worker's ``task_def_template`` (or a minimal
+    ``TaskDef``) named after the task, linked to ``{task}_input`` / ``{task}_output`` schemas
+    generated from the function signature when schema registration is enabled.
+    """
+    task_name = worker.get_task_definition_name()
+    template = getattr(worker, "task_def_template", None)
+    if template:
+        task_def = copy.deepcopy(template)
+        task_def.name = task_name
+    else:
+        task_def = TaskDef(name=task_name)
+
+    register_schema = getattr(worker, "register_schema", False)
+    if not hasattr(worker, "register_schema") and configuration is not None \
+            and getattr(configuration, "register_schema", None) is not None:
+        register_schema = configuration.register_schema
+
+    schemas = []
+    if register_schema and hasattr(worker, "execute_function"):
+        generated = generate_json_schema_from_function(
+            worker.execute_function, task_name, strict_schema=getattr(worker, "strict_schema", False)) or {}
+        for kind in ("input", "output"):
+            if generated.get(kind):
+                schemas.append(SchemaDef(name=f"{task_name}_{kind}", version=1, type=SchemaType.JSON,
+                                         data=generated[kind]))
+    for schema in schemas:
+        link = {"name": schema.name, "version": schema.version}
+        if schema.name.endswith("_input"):
+            task_def.input_schema = link
+        else:
+            task_def.output_schema = link
+    return task_def, schemas
+
+
+def register_task_definitions(workers: Iterable[WorkerInterface], metadata_client: MetadataClient,
+                              schema_client: Optional[SchemaClient] = None,
+                              configuration: Optional[Configuration] = None) -> TaskDefRegistrationResult:
+    """Registers the task definitions of ``workers`` with a handful of requests instead of several per worker.
+
+    The server's task definitions are read with one request and compared by :func:`content_hash`;
+    definitions that already match are skipped, new ones are created with one bulk request and
+    changed ones (for workers with ``overwrite_task_def``) are updated. Generated JSON schemas
+    that differ from the server's are saved with one bulk request as well.
+
+    Workers whose definition is in place afterwards are marked ``task_def_registered`` so their
+    runners skip the per-process registration; on any failure the affected workers are left
+    unmarked and register themselves as before.
+    """
+    result = TaskDefRegistrationResult()
+    pending: Dict[str, Tuple[TaskDef, List[SchemaDef], List[WorkerInterface]]] = {}
+    for worker in workers:
+        if not worker.register_task_def or getattr(worker, "task_def_registered", False):
+            continue
+        name = worker.get_task_definition_name()
+        if name in pending:
+            pending[name][2].append(worker)
+            continue
+        try:
+            task_def, schemas = task_definition_for_worker(worker, configuration)
+        except Exception as e:
+            logger.debug("Could not build task definition for %s: %s", name, e)
+            continue
+        pending[name] = (task_def, schemas, [worker])
+    if not pending:
+        return result
+
+    try:
+        existing = {task_def.name: task_def for task_def in metadata_client.get_all_task_defs() or []}
+    except Exception as e:
+        logger.warning("Could not list task definitions, workers will register their own: %s", e)
+        return result
+
+    if schema_client is not None:
+        _register_schemas(pending, schema_client, result)
+    else:
+        for task_def, schemas, workers_for_name in pending.values():
+            _unlink_schemas(task_def, schemas, workers_for_name[0])
+
+    to_create, to_update, done = [], [], []
+    for name, (task_def, _, workers_for_name) in pending.items():
+        current = existing.get(name)
+        if current is None:
+            to_create.append(task_def)
+            continue
+        desired_keys = (_SERIALIZER.sanitize_for_serialization(task_def) or {}).keys()
+        if content_hash(current, desired_keys) == content_hash(task_def, desired_keys):
+            result.unchanged.append(name)
+            done.append(name)
+        elif all(getattr(w, "overwrite_task_def", True) for w in workers_for_name):
+            to_update.append(task_def)
+        else:
+            result.unchanged.append(name)
+            done.append(name)
+
+    if to_create:
+        try:
+            metadata_client.register_task_defs(to_create)
+            result.created.extend(task_def.name for task_def in to_create)
+            done.extend(task_def.name for task_def in to_create)
+        except Exception as e:
+            logger.warning("Bulk registration of %d task definitions failed: %s", len(to_create), e)
+            result.failed.update({task_def.name: str(e) for task_def in to_create})
+    for task_def in to_update:
+        try:
+            metadata_client.update_task_def(task_def)
+            result.updated.append(task_def.name)
+            done.append(task_def.name)
+        except Exception as e:
+            logger.warning("Could not update task definition %s: %s", task_def.name, e)
+            result.failed[task_def.name] = str(e)
+
+    for name in done:
+        for worker in pending[name][2]:
+            worker.task_def_registered = True
+    logger.info(
+        "Task definitions: %d created, %d updated, %d unchanged, %d failed",
+        len(result.created), len(result.updated), len(result.unchanged), len(result.failed),
+    )
+    return result
+
+
+def _register_schemas(pending: Dict[str, Tuple[TaskDef, List[SchemaDef], List[WorkerInterface]]],
+                      schema_client: SchemaClient, result: TaskDefRegistrationResult) -> None:
+    wanted = [schema for _, schemas, _ in pending.values() for schema in schemas]
+    if not wanted:
+        return
+    try:
+        existing = {(s.name, s.version): s for s in schema_client.get_all_schemas() or []}
+        changed = [s for s in wanted
+                   if (s.name, s.version) not in existing
+                   or content_hash(existing[(s.name, s.version)], ("data", "type")) != content_hash(s, ("data", "type"))]
+        if changed:
+            schema_client.register_schemas(changed)
+            result.schemas_registered.extend(s.name for s in changed)
+    except Exception as e:
+        if getattr(e, "status", None) == 404:
+            logger.debug("Schema registry not available on server, registering task definitions without schemas")
+        else:
+            logger.warning("Could not register %d JSON schemas: %s", len(wanted), e)
+        for task_def, schemas, workers_for_name in pending.values():
+            _unlink_schemas(task_def, schemas, workers_for_name[0])
+
+
+def _unlink_schemas(task_def: TaskDef, schemas: List[SchemaDef], worker: WorkerInterface) -> None:
+    """Points ``task_def`` back at its template's schemas after the generated ones could not be saved."""
+    if schemas:
+        template = getattr(worker, "task_def_template", None)
+        task_def.input_schema = template.input_schema if template else None
+        task_def.output_schema = template.output_schema if template else None
+        schemas.clear()
@@ -151,6 +151,9 @@ class TaskHandler:
         - Always uses multiprocessing: One Python process per worker
         - Each process continuously polls for tasks
         - Execution mode automatically selected based on function signature
+        - CONDUCTOR_WORKER_ISOLATION=forkserver forks worker processes from a
+          template that has preloaded the SDK and worker modules (faster
+          startup, shared memory); see worker_isolation
 
     Sync Workers (def):
         - Use TaskRunner with ThreadPoolExecutor
@@ -314,6 +317,15 @@ class TaskHandler:
                 logger.debug("created worker with name=%s and domain=%s", task_def_name, resolved_config['domain'])
                 workers.append(worker)
 
+        # CONDUCTOR_WORKER_ISOLATION=forkserver: fork workers from a template
+        # process that has already imported the SDK and the worker modules.
+        # The logger and metrics provider keep the default start method.
+        self._worker_context = None
+        if worker_isolation.isolation_mode() == worker_isolation.ISOLATION_FORKSERVER:
+            self._worker_context = worker_isolation.forkserver_context(
+                worker_isolation.worker_preload_modules(workers, import_modules)
+            )
+
         self.__create_task_runner_processes(workers, configuration, metrics_settings)
         self.__create_metrics_provider_process(metrics_settings)
         self._worker_restart_counter = None
@@ -424,14 +436,15 @@ class TaskHandler:
             # Class-based worker (implements WorkerInterface)
             is_async_worker = inspect.iscoroutinefunction(worker.execute)
 
+        process_class = self.__worker_process_class()
         if is_async_worker:
-            process = Process(
+            process = process_class(
                 target=_run_async_worker_process,
                 args=(worker, configuration, metrics_settings, self.event_listeners)
             )
             logger.debug(f"Created AsyncTaskRunner process for async worker: {worker.get_task_definition_name()}")
         else:
-            process = Process(
+            process = process_class(
                 target=_run_sync_worker_process,
                 args=(worker, configuration, metrics_settings, self.event_listeners)
             )
@@ -581,16 +594,24 @@ class TaskHandler:
         else:
             is_async_worker = inspect.iscoroutinefunction(worker.execute)
 
+        process_class = self.__worker_process_class()
         if is_async_worker:
-            return Process(
+            return process_class(
                 target=_run_async_worker_process,
                 args=(worker, self._configuration, self._metrics_settings, self.event_listeners)
             )
-        return Process(
+        return process_class(
             target=_run_sync_worker_process,
             args=(worker, self._configuration, self._metrics_settings, self.event_listeners)
         )
 
+    def __worker_process_class(self):
+        """Process class for worker processes: fork-server context or the module default."""
+        context = getattr(self, "_worker_context", None)
+        if context is not None:
+            return context.Process
+        return Process
+
     def get_worker_process_status(self) -> List[Dict[str, Any]]:
         """Return basic worker process status for health checks / observability."""
         statuses: List[Dict[str, Any]] = []
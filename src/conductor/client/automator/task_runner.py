@@ -15,9 +15,11 @@ from conductor.client.context.task_context import _set_task_context, _clear_task
 from conductor.client.event.task_runner_events import (
     TaskRunnerEvent, PollStarted, PollCompleted, PollFailure,
     TaskExecutionStarted, TaskExecutionCompleted, TaskExecutionFailure,
-    TaskUpdateFailure
+    TaskUpdateCompleted,
+    TaskUpdateFailure,
+    trace_context_from_input,
 )
-from conductor.client.event.sync_event_dispatcher import SyncEventDispatcher
+from conductor.client.event.sync_event_dispatcher import SyncEventDispatcher, async_delivery_from_env
 from conductor.client.event.sync_listener_register import register_task_runner_listener
 from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.api_client import ApiClient
@@ -37,6 +39,7 @@ from conductor.client.worker.worker_config import resolve_worker_config, get_wor
 from conductor.client.worker.exception import NonRetryableException
 from conductor.client.automator.json_schema_generator import generate_json_schema_from_function
 from conductor.client.automator.lease_tracker import LeaseManager
+from conductor.client.automator.phase_profiler import PhaseProfiler, install_api_client_hooks
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -62,7 +65,10 @@ class TaskRunner:
         self.configuration = configuration
 
         # Set up event dispatcher and register listeners
-        self.event_dispatcher = SyncEventDispatcher[TaskRunnerEvent]()
+        # CONDUCTOR_EVENT_DELIVERY=async moves listener calls off the poll loop
+        self.event_dispatcher = SyncEventDispatcher[TaskRunnerEvent](
+            async_delivery=async_delivery_from_env()
+        )
         if event_listeners:
             for listener in event_listeners:
                 register_task_runner_listener(listener, self.event_dispatcher)
@@ -113,6 +119,7 @@ class TaskRunner:
         self._shutdown = False  # Flag to indicate graceful shutdown
         self._use_update_v2 = True  # Will be set to False if server doesn't support v2 endpoint
         self._lease_manager = LeaseManager.get_instance()
+        self._profiler = PhaseProfiler.get_instance()
         self._tracked_task_ids = set()  # Local set for cleanup on shutdown
         self._tracked_task_ids_lock = threading.Lock()
 
@@ -127,8 +134,8 @@ class TaskRunner:
         config_summary = get_worker_config_oneline(task_name, self._resolved_config)
         logger.info(config_summary)
 
-        # Register task definition if configured
-        if self.worker.register_task_def:
+        # Register task definition if configured and not already done by the parent process
+        if self.worker.register_task_def and not getattr(self.worker, 'task_def_registered', False):
             self.__register_task_definition()
 
         task_names = ",".join(self.worker.task_definition_names)
@@ -180,9 +187,19 @@ class TaskRunner:
         except (IOError, OSError) as e:
             logger.warning(f"Error closing HTTP client: {e}")
 
-        # Clear event listeners
+        # Deliver queued events (async delivery mode) and clear event listeners
+        if self.event_dispatcher is not None:
+            self.event_dispatcher.close()
         self.event_dispatcher = None
 
+        # Write metric updates still aggregated in memory (flush_interval mode)
+        if self.metrics_collector is not None:
+            self.metrics_collector.close()
+
+        # Persist phase timings gathered so far (profiling mode)
+        if self._profiler.enabled:
+            self._profiler.write_summary()
+
         logger.debug("TaskRunner cleanup completed")
 
     def __enter__(self):
@@ -433,6 +450,9 @@ class TaskRunner:
 
     def run_once(self) -> None:
         try:
+            # Pick up profiling control-file changes (rate limited, no-op without a profile dir)
+            self._profiler.maybe_check_control()
+
             # Check completed async tasks first (non-blocking)
             self.__check_completed_async_tasks()
 
@@ -524,15 +544,16 @@ class TaskRunner:
                 )
 
                 # Publish TaskExecutionCompleted event with actual execution time
-                output_size = sys.getsizeof(task_result) if task_result else 0
-                self.event_dispatcher.publish(TaskExecutionCompleted(
-                    task_type=task.task_def_name,
-                    task_id=task_id,
-                    worker_id=self.worker.get_identity(),
-                    workflow_instance_id=task.workflow_instance_id,
-                    duration_ms=time_spent * 1000,
-                    output_size_bytes=output_size
-                ))
+                if self.event_dispatcher.has_listeners(TaskExecutionCompleted):
+                    output_size = sys.getsizeof(task_result) if task_result else 0
+                    self.event_dispatcher.publish(TaskExecutionCompleted(
+                        task_type=task.task_def_name,
+                        task_id=task_id,
+                        worker_id=self.worker.get_identity(),
+                        workflow_instance_id=task.workflow_instance_id,
+                        duration_ms=time_spent * 1000,
+                        output_size_bytes=output_size
+                    ))
 
                 next_task = self.__update_task(task_result)
                 logger.debug("Successfully updated async task %s with output %s, next_task: %s", task_id, task_result.output_data, next_task.task_id if next_task else None)
@@ -625,11 +646,12 @@ class TaskRunner:
                 return []
 
         # Publish PollStarted event (metrics collector will handle via event)
-        self.event_dispatcher.publish(PollStarted(
-            task_type=task_definition_name,
-            worker_id=self.worker.get_identity(),
-            poll_count=count
-        ))
+        if self.event_dispatcher.has_listeners(PollStarted):
+            self.event_dispatcher.publish(PollStarted(
+                task_type=task_definition_name,
+                worker_id=self.worker.get_identity(),
+                poll_count=count
+            ))
 
         try:
             start_time = time.time()
@@ -643,17 +665,28 @@ class TaskRunner:
             if domain is not None and domain != "":
                 params["domain"] = domain
 
+            profiling = self._profiler.enabled
+            if profiling:
+                install_api_client_hooks(self._profiler, getattr(self.task_client, "api_client", None))
+                self._profiler.begin()
+                poll_start = time.perf_counter()
+
             tasks = self.task_client.batch_poll(tasktype=task_definition_name, **params)
 
+            if profiling:
+                self._profiler.record_split(
+                    task_definition_name, "poll", "deserialize", time.perf_counter() - poll_start)
+
             finish_time = time.time()
             time_spent = finish_time - start_time
 
             # Publish PollCompleted event (metrics collector will handle via event)
-            self.event_dispatcher.publish(PollCompleted(
-                task_type=task_definition_name,
-                duration_ms=time_spent * 1000,
-                tasks_received=len(tasks) if tasks else 0
-            ))
+            if self.event_dispatcher.has_listeners(PollCompleted):
+                self.event_dispatcher.publish(PollCompleted(
+                    task_type=task_definition_name,
+                    duration_ms=time_spent * 1000,
+                    tasks_received=len(tasks) if tasks else 0
+                ))
 
             # Success - reset both failure counters (any successful HTTP
             # response means auth and connectivity are working).
@@ -671,11 +704,12 @@ class TaskRunner:
             )
 
             # Publish PollFailure event (metrics collector will handle via event)
-            self.event_dispatcher.publish(PollFailure(
-                task_type=task_definition_name,
-                duration_ms=(time.time() - start_time) * 1000,
-                cause=auth_exception
-            ))
+            if self.event_dispatcher.has_listeners(PollFailure):
+                self.event_dispatcher.publish(PollFailure(
+                    task_type=task_definition_name,
+                    duration_ms=(time.time() - start_time) * 1000,
+                    cause=auth_exception
+                ))
 
             if auth_exception.invalid_token:
                 logger.error(
@@ -691,11 +725,12 @@ class TaskRunner:
             return []
         except Exception as e:
             # Publish PollFailure event (metrics collector will handle via event)
-            self.event_dispatcher.publish(PollFailure(
-                task_type=task_definition_name,
-                duration_ms=(time.time() - start_time) * 1000,
-                cause=e
-            ))
+            if self.event_dispatcher.has_listeners(PollFailure):
+                self.event_dispatcher.publish(PollFailure(
+                    task_type=task_definition_name,
+                    duration_ms=(time.time() - start_time) * 1000,
+                    cause=e
+                ))
 
             # Bump the poll-failure counter so the next poll waits with
             # exponential backoff instead of hot-looping on a broken server
@@ -770,18 +805,32 @@ class TaskRunner:
         _set_task_context(task, initial_task_result)
 
         # Publish TaskExecutionStarted event
-        self.event_dispatcher.publish(TaskExecutionStarted(
-            task_type=task_definition_name,
-            task_id=task.task_id,
-            worker_id=self.worker.get_identity(),
-            workflow_instance_id=task.workflow_instance_id
-        ))
+        if self.event_dispatcher.has_listeners(TaskExecutionStarted):
+            self.event_dispatcher.publish(TaskExecutionStarted(
+                task_type=task_definition_name,
+                task_id=task.task_id,
+                worker_id=self.worker.get_identity(),
+                workflow_instance_id=task.workflow_instance_id,
+                trace_context=trace_context_from_input(task.input_data)
+            ))
 
         try:
             start_time = time.time()
 
             # Execute worker function - worker.execute() handles both sync and async correctly
-            task_output = self.worker.execute(task)
+            profiling = self._profiler.enabled
+            if profiling:
+                self._profiler.begin()
+                execute_start = time.perf_counter()
+            sample = self._profiler.sample(task_definition_name)
+            if sample is not None:
+                with sample:
+                    task_output = self.worker.execute(task)
+            else:
+                task_output = self.worker.execute(task)
+            if profiling:
+                self._profiler.record_split(
+                    task_definition_name, "execute", "bind", time.perf_counter() - execute_start)
 
             # If worker returned ASYNC_TASK_RUNNING sentinel, it's an async task running in background
             # Don't create TaskResult or publish events - will be handled when task completes
@@ -833,15 +882,16 @@ class TaskRunner:
             time_spent = finish_time - start_time
 
             # Publish TaskExecutionCompleted event (metrics collector will handle via event)
-            output_size = sys.getsizeof(task_result) if task_result else 0
-            self.event_dispatcher.publish(TaskExecutionCompleted(
-                task_type=task_definition_name,
-                task_id=task.task_id,
-                worker_id=self.worker.get_identity(),
-                workflow_instance_id=task.workflow_instance_id,
-                duration_ms=time_spent * 1000,
-                output_size_bytes=output_size
-            ))
+            if self.event_dispatcher.has_listeners(TaskExecutionCompleted):
+                output_size = sys.getsizeof(task_result) if task_result else 0
+                self.event_dispatcher.publish(TaskExecutionCompleted(
+                    task_type=task_definition_name,
+                    task_id=task.task_id,
+                    worker_id=self.worker.get_identity(),
+                    workflow_instance_id=task.workflow_instance_id,
+                    duration_ms=time_spent * 1000,
+                    output_size_bytes=output_size
+                ))
             logger.debug(
                 "Executed task, id: %s, workflow_instance_id: %s, task_definition_name: %s",
                 task.task_id,
@@ -854,14 +904,15 @@ class TaskRunner:
             time_spent = finish_time - start_time
 
             # Publish TaskExecutionFailure event
-            self.event_dispatcher.publish(TaskExecutionFailure(
-                task_type=task_definition_name,
-                task_id=task.task_id,
-                worker_id=self.worker.get_identity(),
-                workflow_instance_id=task.workflow_instance_id,
-                cause=ne,
-                duration_ms=time_spent * 1000
-            ))
+            if self.event_dispatcher.has_listeners(TaskExecutionFailure):
+                self.event_dispatcher.publish(TaskExecutionFailure(
+                    task_type=task_definition_name,
+                    task_id=task.task_id,
+                    worker_id=self.worker.get_identity(),
+                    workflow_instance_id=task.workflow_instance_id,
+                    cause=ne,
+                    duration_ms=time_spent * 1000
+                ))
 
             task_result = TaskResult(
                 task_id=task.task_id,
@@ -887,14 +938,15 @@ class TaskRunner:
             time_spent = finish_time - start_time
 
             # Publish TaskExecutionFailure event (metrics collector will handle via event)
-            self.event_dispatcher.publish(TaskExecutionFailure(
-                task_type=task_definition_name,
-                task_id=task.task_id,
-                worker_id=self.worker.get_identity(),
-                workflow_instance_id=task.workflow_instance_id,
-                cause=e,
-                duration_ms=time_spent * 1000
-            ))
+            if self.event_dispatcher.has_listeners(TaskExecutionFailure):
+                self.event_dispatcher.publish(TaskExecutionFailure(
+                    task_type=task_definition_name,
+                    task_id=task.task_id,
+                    worker_id=self.worker.get_identity(),
+                    workflow_instance_id=task.workflow_instance_id,
+                    cause=e,
+                    duration_ms=time_spent * 1000
+                ))
             task_result = TaskResult(
                 task_id=task.task_id,
                 workflow_instance_id=task.workflow_instance_id,
@@ -951,6 +1003,21 @@ class TaskRunner:
             else:
                 task_result.output_data = context_result.output_data
 
+    def _record_update_success(self, task_definition_name: str, task_result: TaskResult, update_start: float) -> None:
+        duration = time.time() - update_start
+        if self._profiler.enabled:
+            self._profiler.record_split(task_definition_name, "update", "serialize", duration)
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_update_time(task_definition_name, duration, status="SUCCESS")
+        if self.event_dispatcher.has_listeners(TaskUpdateCompleted):
+            self.event_dispatcher.publish(TaskUpdateCompleted(
+                task_type=task_definition_name,
+                task_id=task_result.task_id,
+                worker_id=self.worker.get_identity(),
+                workflow_instance_id=task_result.workflow_instance_id,
+                duration_ms=duration * 1000
+            ))
+
     def __update_task(self, task_result: TaskResult):
         """Update task result using v2 endpoint. Returns the next Task to process, or None."""
         if not isinstance(task_result, TaskResult):
@@ -973,6 +1040,8 @@ class TaskRunner:
                 # Exponential backoff: [10s, 20s, 30s] before retry
                 time.sleep(attempt * 10)
             update_start = time.time()
+            if self._profiler.enabled:
+                self._profiler.begin()
             try:
                 if self._use_update_v2:
                     next_task = self.task_client.update_task_v2(body=task_result)
@@ -983,10 +1052,7 @@ class TaskRunner:
                         task_definition_name,
                         next_task.task_id if next_task else None
                     )
-                    if self.metrics_collector is not None:
-                        self.metrics_collector.record_task_update_time(
-                            task_definition_name, time.time() - update_start, status="SUCCESS"
-                        )
+                    self._record_update_success(task_definition_name, task_result, update_start)
                     return next_task
                 else:
                     self.task_client.update_task(body=task_result)
@@ -996,10 +1062,7 @@ class TaskRunner:
                         task_result.workflow_instance_id,
                         task_definition_name,
                     )
-                    if self.metrics_collector is not None:
-                        self.metrics_collector.record_task_update_time(
-                            task_definition_name, time.time() - update_start, status="SUCCESS"
-                        )
+                    self._record_update_success(task_definition_name, task_result, update_start)
                     return None
             except ApiException as e:
                 if e.status in (404, 405) and self._use_update_v2:
@@ -1013,10 +1076,7 @@ class TaskRunner:
                     # Retry immediately with v1
                     try:
                         self.task_client.update_task(body=task_result)
-                        if self.metrics_collector is not None:
-                            self.metrics_collector.record_task_update_time(
-                                task_definition_name, time.time() - update_start, status="SUCCESS"
-                            )
+                        self._record_update_success(task_definition_name, task_result, update_start)
                         return None
                     except Exception as fallback_e:
                         last_exception = fallback_e
@@ -1085,15 +1145,16 @@ class TaskRunner:
         )
 
         # Publish TaskUpdateFailure event for external handling
-        self.event_dispatcher.publish(TaskUpdateFailure(
-            task_type=task_definition_name,
-            task_id=task_result.task_id,
-            worker_id=self.worker.get_identity(),
-            workflow_instance_id=task_result.workflow_instance_id,
-            cause=last_exception,
-            retry_count=retry_count,
-            task_result=task_result
-        ))
+        if self.event_dispatcher.has_listeners(TaskUpdateFailure):
+            self.event_dispatcher.publish(TaskUpdateFailure(
+                task_type=task_definition_name,
+                task_id=task_result.task_id,
+                worker_id=self.worker.get_identity(),
+                workflow_instance_id=task_result.workflow_instance_id,
+                cause=last_exception,
+                retry_count=retry_count,
+                task_result=task_result
+            ))
 
         return None
 
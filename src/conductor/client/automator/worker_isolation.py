@@ -1,4 +1,4 @@
-"""Worker isolation mode — ``process`` (default) or ``thread``.
+"""Worker isolation mode — ``process`` (default), ``forkserver`` or ``thread``.
 
 ``CONDUCTOR_WORKER_ISOLATION=thread`` replaces :class:`TaskHandler`'s
 multiprocessing primitives (``Process``, ``Queue``) with thread equivalents.
@@ -14,22 +14,43 @@ Tradeoffs (thread mode only): no per-worker force-kill (``terminate``/``kill``
 are no-ops; shutdown is cooperative), CPU-bound workers share the GIL, and
 ``signal.signal`` becomes a no-op off the main thread instead of raising
 ``ValueError``.
+
+``CONDUCTOR_WORKER_ISOLATION=forkserver`` keeps one process per worker but
+forks them from a warm template process instead of spawning cold
+interpreters. The template (multiprocessing's fork server) imports the SDK
+and every module that defines a worker exactly once; each worker process is
+then a copy-on-write ``fork()`` of it, so module import cost is paid once and
+the imported code pages are shared between workers. Only available where the
+``forkserver`` start method exists (Linux, macOS); elsewhere it warns and
+falls back to ``process``.
+
+State that must not cross a fork is rebuilt in the child: the
+``BackgroundEventLoop`` and ``LeaseManager`` singletons reset themselves via
+``os.register_at_fork``, and ``RESTClientObject`` drops an inherited httpx
+client (without closing the parent's sockets) on first use in a new PID.
 """
 
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import os
 import queue
+import sys
 import threading
-from typing import Any
+from typing import Any, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
 WORKER_ISOLATION_ENV = "CONDUCTOR_WORKER_ISOLATION"
 ISOLATION_PROCESS = "process"
 ISOLATION_THREAD = "thread"
-_VALID_MODES = frozenset({ISOLATION_PROCESS, ISOLATION_THREAD})
+ISOLATION_FORKSERVER = "forkserver"
+_VALID_MODES = frozenset({ISOLATION_PROCESS, ISOLATION_THREAD, ISOLATION_FORKSERVER})
+
+# Always warmed in the fork server: the process targets live in task_handler,
+# which transitively imports the runners, HTTP stack and models.
+_SDK_PRELOAD_MODULES = ("conductor.client.automator.task_handler",)
 
 _invalid_mode_warned = False
 
@@ -114,3 +135,49 @@ def apply_thread_isolation() -> None:
     _signal_mod.signal = _thread_safe_signal  # type: ignore[assignment]
 
     _th_module._thread_isolation_applied = True  # type: ignore[attr-defined]
+
+
+def worker_preload_modules(
+    workers: Iterable[Any], import_modules: Optional[Iterable[str]] = None
+) -> List[str]:
+    """Return the modules the fork server should import before forking workers.
+
+    Covers the SDK itself, ``__main__`` (where scripts usually define their
+    workers; multiprocessing imports it as ``__mp_main__`` so an
+    ``if __name__ == "__main__"`` guard is not re-run), ``import_modules``,
+    and the defining module of each worker's execute function or class.
+    Order is preserved and duplicates removed.
+    """
+    modules: List[str] = ["__main__", *_SDK_PRELOAD_MODULES]
+    modules.extend(import_modules or ())
+    for worker in workers:
+        fn = getattr(worker, "execute_function", None)
+        owner = fn if fn is not None else type(worker)
+        module_name = getattr(owner, "__module__", None)
+        if module_name and module_name != "__main__":
+            modules.append(module_name)
+    return list(dict.fromkeys(modules))
+
+
+def forkserver_context(preload_modules: Iterable[str]) -> Optional[Any]:
+    """Return a ``forkserver`` multiprocessing context warmed with *preload_modules*.
+
+    Returns None (callers keep the default ``spawn`` primitives) when the
+    platform has no fork server. The preload list only takes effect if the
+    fork server has not been started yet in this interpreter; a second
+    TaskHandler reuses the already-running server and its imports.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        logger.warning(
+            "%s=%s is not supported on %s; using %r",
+            WORKER_ISOLATION_ENV,
+            ISOLATION_FORKSERVER,
+            sys.platform,
+            ISOLATION_PROCESS,
+        )
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    preload = list(preload_modules)
+    ctx.set_forkserver_preload(preload)
+    logger.info("Worker processes will fork from a fork server preloaded with %s", preload)
+    return ctx
@@ -38,6 +38,17 @@ def _env_bool(name: str, default: bool) -> bool:
     return value.strip().lower() in ("true", "1", "yes")
 
 
+def _env_float(name: str) -> Optional[float]:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r (expected seconds)", name, value)
+        return None
+
+
 def get_default_temporary_folder() -> str:
     return f"{Path.home()!s}/tmp/"
 
@@ -50,7 +61,8 @@ class MetricsSettings:
             update_interval: float = 0.1,
             http_port: Optional[int] = None,
             clean_directory: bool = False,
-            clean_dead_pids: bool = False):
+            clean_dead_pids: bool = False,
+            flush_interval: Optional[float] = None):
         """
         Configure metrics collection settings.
 
@@ -82,6 +94,12 @@ class MetricsSettings:
             clean_dead_pids: If True, remove .db files whose owning PID no
                       longer exists.  Safer than ``clean_directory`` in shared
                       environments.  Defaults to False.
+            flush_interval: If set (seconds), collectors aggregate counters,
+                      gauges and histogram observations in process memory and
+                      write the deltas to the multiprocess ``.db`` files on
+                      this interval instead of on every event.  Falls back to
+                      the ``CONDUCTOR_METRICS_FLUSH_INTERVAL`` env var; ``None``
+                      or ``0`` keeps the write-through behavior.
         """
         if directory is None:
             directory = get_default_temporary_folder()
@@ -91,6 +109,9 @@ class MetricsSettings:
         self.http_port = http_port
         self.clean_directory = clean_directory
         self.clean_dead_pids = clean_dead_pids
+        if flush_interval is None:
+            flush_interval = _env_float("CONDUCTOR_METRICS_FLUSH_INTERVAL")
+        self.flush_interval = flush_interval
         self._subdir: str = (
             CANONICAL_SUBDIR
             if _env_bool("WORKER_CANONICAL_METRICS", False)
@@ -15,6 +15,7 @@ from conductor.client.event.task_runner_events import (
     TaskExecutionStarted,
     TaskExecutionCompleted,
     TaskExecutionFailure,
+    TaskUpdateCompleted,
     TaskUpdateFailure,
 )
 from conductor.client.event.workflow_events import (
@@ -69,6 +70,10 @@ class TaskRunnerEventsListener(Protocol):
         """Handle task execution failure event."""
         ...
 
+    def on_task_update_completed(self, event: TaskUpdateCompleted) -> None:
+        """Handle task update completed event."""
+        ...
+
     def on_task_update_failure(self, event: TaskUpdateFailure) -> None:
         """
         Handle task update failure event (after all retries exhausted).
@@ -3,14 +3,21 @@ Synchronous event dispatcher for multiprocessing contexts.
 
 This module provides thread-safe event routing without asyncio dependencies,
 suitable for use in multiprocessing worker processes.
+
+The listener registry is copy-on-write: register/unregister build a new
+immutable snapshot under a lock, while publish() and has_listeners() only read
+the current snapshot and never lock or copy. Publishers on hot paths can
+therefore guard event construction with has_listeners() at the cost of a
+single dict lookup.
 """
 
 import inspect
 import logging
+import os
+import queue
 import threading
-from collections import defaultdict
-from copy import copy
-from typing import Callable, Dict, Generic, List, Type, TypeVar
+import time
+from typing import Callable, Dict, Generic, Optional, Tuple, Type, TypeVar
 
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.event.conductor_event import ConductorEvent
@@ -21,6 +28,19 @@ logger = logging.getLogger(
 
 T = TypeVar('T', bound=ConductorEvent)
 
+DEFAULT_ASYNC_QUEUE_SIZE = 10000
+
+EVENT_DELIVERY_ENV = "CONDUCTOR_EVENT_DELIVERY"
+EVENT_DELIVERY_SYNC = "sync"
+EVENT_DELIVERY_ASYNC = "async"
+
+_STOP = object()
+
+
+def async_delivery_from_env() -> bool:
+    """True when ``CONDUCTOR_EVENT_DELIVERY=async`` (default ``sync``)."""
+    return os.environ.get(EVENT_DELIVERY_ENV, "").strip().lower() == EVENT_DELIVERY_ASYNC
+
 
 class SyncEventDispatcher(Generic[T]):
     """
@@ -30,6 +50,12 @@ class SyncEventDispatcher(Generic[T]):
     making it suitable for use in multiprocessing worker processes where
     event loops may not be available.
 
+    By default listeners run inline on the publishing thread. With
+    ``async_delivery=True`` publish() only enqueues the event and a single
+    daemon thread delivers events in publish order, so a slow listener cannot
+    stall the poll loop. The queue is bounded by ``max_queue_size``; when it
+    is full the event is dropped and counted in ``dropped_events``.
+
     Type Parameters:
         T: The base event type this dispatcher handles (must extend ConductorEvent)
 
@@ -44,10 +70,30 @@ class SyncEventDispatcher(Generic[T]):
         >>> dispatcher.publish(PollStarted(task_type="my_task", worker_id="worker1", poll_count=1))
     """
 
-    def __init__(self):
-        """Initialize the event dispatcher with empty listener registry."""
-        self._listeners: Dict[Type[T], List[Callable[[T], None]]] = defaultdict(list)
+    def __init__(self, async_delivery: bool = False, max_queue_size: int = DEFAULT_ASYNC_QUEUE_SIZE):
+        """
+        Initialize the event dispatcher with empty listener registry.
+
+        Args:
+            async_delivery: Deliver events on a background thread instead of
+                the publishing thread
+            max_queue_size: Bound of the async delivery queue (ignored when
+                async_delivery is False)
+        """
+        # Immutable snapshot: replaced wholesale (never mutated) under _lock.
+        self._listeners: Dict[Type[T], Tuple[Callable[[T], None], ...]] = {}
         self._lock = threading.Lock()
+        self._async_delivery = async_delivery
+        self._queue: Optional[queue.Queue] = None
+        self._delivery_thread: Optional[threading.Thread] = None
+        self.dropped_events = 0
+        if async_delivery:
+            self._queue = queue.Queue(maxsize=max_queue_size)
+
+    @property
+    def async_delivery(self) -> bool:
+        """True if events are delivered on a background thread."""
+        return self._async_delivery
 
     def register(self, event_type: Type[T], listener: Callable[[T], None]) -> None:
         """
@@ -64,8 +110,11 @@ class SyncEventDispatcher(Generic[T]):
             >>> dispatcher.register(PollStarted, handle_poll_started)
         """
         with self._lock:
-            if listener not in self._listeners[event_type]:
-                self._listeners[event_type].append(listener)
+            current = self._listeners.get(event_type, ())
+            if listener not in current:
+                updated = dict(self._listeners)
+                updated[event_type] = (*current, listener)
+                self._listeners = updated
                 logger.debug(
                     f"Registered listener for event type: {event_type.__name__}"
                 )
@@ -82,25 +131,32 @@ class SyncEventDispatcher(Generic[T]):
             >>> dispatcher.unregister(PollStarted, handle_poll_started)
         """
         with self._lock:
-            if event_type in self._listeners:
-                try:
-                    self._listeners[event_type].remove(listener)
-                    logger.debug(
-                        f"Unregistered listener for event type: {event_type.__name__}"
-                    )
-                    if not self._listeners[event_type]:
-                        del self._listeners[event_type]
-                except ValueError:
-                    logger.warning(
-                        f"Attempted to unregister non-existent listener for {event_type.__name__}"
-                    )
+            current = self._listeners.get(event_type)
+            if current is None:
+                return
+            if listener not in current:
+                logger.warning(
+                    f"Attempted to unregister non-existent listener for {event_type.__name__}"
+                )
+                return
+            updated = dict(self._listeners)
+            remaining = tuple(l for l in current if l != listener)
+            if remaining:
+                updated[event_type] = remaining
+            else:
+                del updated[event_type]
+            self._listeners = updated
+            logger.debug(
+                f"Unregistered listener for event type: {event_type.__name__}"
+            )
 
     def publish(self, event: T) -> None:
         """
-        Publish an event to all registered listeners synchronously.
+        Publish an event to all registered listeners.
 
         Listeners are called in registration order. If a listener raises an exception,
-        it is logged but does not affect other listeners.
+        it is logged but does not affect other listeners. In async delivery mode
+        the call returns as soon as the event is queued.
 
         Args:
             event: The event instance to publish
@@ -112,17 +168,115 @@ class SyncEventDispatcher(Generic[T]):
             ...     poll_count=1
             ... ))
         """
-        # Get listeners without holding lock during callback execution
-        with self._lock:
-            listeners = copy(self._listeners.get(type(event), []))
-
+        # Lock-free read of the current snapshot; tuples are never mutated.
+        listeners = self._listeners.get(type(event))
         if not listeners:
             return
 
-        # Call listeners outside the lock to avoid blocking
+        if self._async_delivery:
+            self._enqueue(event, listeners)
+            return
+
         self._dispatch_to_listeners(event, listeners)
 
-    def _dispatch_to_listeners(self, event: T, listeners: List[Callable[[T], None]]) -> None:
+    def _enqueue(self, event: T, listeners: Tuple[Callable[[T], None], ...]) -> None:
+        """Hand an event to the delivery thread, dropping it if the queue is full."""
+        if self._delivery_thread is None:
+            self._start_delivery_thread()
+        try:
+            self._queue.put_nowait((event, listeners))
+        except queue.Full:
+            self.dropped_events += 1
+            if self.dropped_events == 1 or self.dropped_events % 1000 == 0:
+                logger.warning(
+                    f"Event queue full; dropped {self.dropped_events} event(s) so far "
+                    f"(latest: {type(event).__name__})"
+                )
+
+    def _start_delivery_thread(self) -> None:
+        with self._lock:
+            if self._delivery_thread is not None:
+                return
+            thread = threading.Thread(
+                target=self._deliver_forever, daemon=True, name="EventDelivery"
+            )
+            thread.start()
+            self._delivery_thread = thread
+
+    def _deliver_forever(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                event, listeners = item
+                self._dispatch_to_listeners(event, listeners)
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been delivered (async mode only).
+
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        if self._queue is None or self._delivery_thread is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Deliver queued events and stop the delivery thread (async mode only).
+
+        If the queue is still full when *timeout* expires, the events still
+        queued are dropped so that the thread can be stopped.
+
+        Args:
+            timeout: Maximum seconds to wait for the delivery thread;
+                None waits indefinitely
+        """
+        thread = self._delivery_thread
+        if thread is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self._drop_queued_and_stop()
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        thread.join(remaining)
+        self._delivery_thread = None
+
+    def _drop_queued_and_stop(self) -> None:
+        """Discard undelivered events and queue the stop marker in their place."""
+        dropped = 0
+        while True:
+            try:
+                self._queue.put_nowait(_STOP)
+                break
+            except queue.Full:
+                pass
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                continue
+            self._queue.task_done()
+            dropped += 1
+        self.dropped_events += dropped
+        logger.warning(f"Event queue still full on close; dropped {dropped} undelivered event(s)")
+
+    def _dispatch_to_listeners(self, event: T, listeners: Tuple[Callable[[T], None], ...]) -> None:
         """
         Internal method to dispatch an event to all listeners.
 
@@ -131,7 +285,7 @@ class SyncEventDispatcher(Generic[T]):
 
         Args:
             event: The event to dispatch
-            listeners: List of listener callbacks to invoke
+            listeners: Listener callbacks to invoke
         """
         for listener in listeners:
             try:
@@ -146,6 +300,8 @@ class SyncEventDispatcher(Generic[T]):
         """
         Check if there are any listeners registered for an event type.
 
+        Lock-free; cheap enough to guard event construction on hot paths.
+
         Args:
             event_type: The event type to check
 
@@ -154,10 +310,9 @@ class SyncEventDispatcher(Generic[T]):
 
         Example:
             >>> if dispatcher.has_listeners(PollStarted):
-            ...     dispatcher.publish(event)
+            ...     dispatcher.publish(PollStarted(...))
         """
-        with self._lock:
-            return event_type in self._listeners and len(self._listeners[event_type]) > 0
+        return event_type in self._listeners
 
     def listener_count(self, event_type: Type[T]) -> int:
         """
@@ -173,5 +328,4 @@ class SyncEventDispatcher(Generic[T]):
             >>> count = dispatcher.listener_count(PollStarted)
             >>> print(f"There are {count} listeners for PollStarted")
         """
-        with self._lock:
-            return len(self._listeners.get(event_type, []))
+        return len(self._listeners.get(event_type, ()))
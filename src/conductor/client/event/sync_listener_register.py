@@ -19,6 +19,7 @@ from conductor.client.event.task_runner_events import (
     TaskExecutionStarted,
     TaskExecutionCompleted,
     TaskExecutionFailure,
+    TaskUpdateCompleted,
     TaskUpdateFailure,
 )
 from conductor.client.event.workflow_events import (
@@ -65,6 +66,8 @@ def register_task_runner_listener(
         dispatcher.register(TaskExecutionCompleted, listener.on_task_execution_completed)
     if hasattr(listener, 'on_task_execution_failure'):
         dispatcher.register(TaskExecutionFailure, listener.on_task_execution_failure)
+    if hasattr(listener, 'on_task_update_completed'):
+        dispatcher.register(TaskUpdateCompleted, listener.on_task_update_completed)
     if hasattr(listener, 'on_task_update_failure'):
         dispatcher.register(TaskUpdateFailure, listener.on_task_update_failure)
 
@@ -7,7 +7,7 @@ They match the Java SDK's TaskRunnerEvent hierarchy.
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from conductor.client.event.conductor_event import ConductorEvent
 
@@ -15,6 +15,22 @@ if TYPE_CHECKING:
     from conductor.client.http.models.task_result import TaskResult
 
 
+# W3C Trace Context headers a caller may place in a task's input to parent the
+# worker-side spans (https://www.w3.org/TR/trace-context/).
+TRACE_CONTEXT_KEYS = ("traceparent", "tracestate")
+
+
+def trace_context_from_input(input_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """Return the W3C trace context carried in *input_data*, or None."""
+    if not input_data or "traceparent" not in input_data:
+        return None
+    return {
+        key: input_data[key]
+        for key in TRACE_CONTEXT_KEYS
+        if isinstance(input_data.get(key), str)
+    } or None
+
+
 @dataclass(frozen=True)
 class TaskRunnerEvent(ConductorEvent):
     """
@@ -86,11 +102,13 @@ class TaskExecutionStarted(TaskRunnerEvent):
         worker_id: Identifier of the worker executing the task
         workflow_instance_id: ID of the workflow instance this task belongs to
         timestamp: UTC timestamp when the event was created (inherited)
+        trace_context: W3C ``traceparent``/``tracestate`` found in the task input, if any
     """
     task_id: str
     worker_id: str
     workflow_instance_id: Optional[str] = None
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    trace_context: Optional[Dict[str, str]] = None
 
 
 @dataclass(frozen=True)
@@ -137,6 +155,26 @@ class TaskExecutionFailure(TaskRunnerEvent):
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+@dataclass(frozen=True)
+class TaskUpdateCompleted(TaskRunnerEvent):
+    """
+    Event published when a task result is accepted by Conductor.
+
+    Attributes:
+        task_type: The task definition name
+        task_id: Unique identifier of the task instance
+        worker_id: Identifier of the worker that executed the task
+        workflow_instance_id: ID of the workflow instance this task belongs to
+        duration_ms: Time taken by the successful update call in milliseconds
+        timestamp: UTC timestamp when the event was created (inherited)
+    """
+    task_id: str
+    worker_id: str
+    workflow_instance_id: Optional[str]
+    duration_ms: float
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
 @dataclass(frozen=True)
 class TaskUpdateFailure(TaskRunnerEvent):
     """
@@ -65,6 +65,10 @@ class RESTClientObject(object):
         # discovering the same broken connection produces at most ONE real
         # reset + warning line, not N.
         self._reset_lock = threading.Lock()
+        # PID that created the connection; a different PID at request time
+        # means this object was inherited through fork() (e.g. a client built
+        # at import time in a forkserver template process).
+        self._owner_pid = os.getpid()
         if connection is None:
             self._http2_enabled = self._is_http2_enabled()
             self.connection = self._create_default_httpx_client()
@@ -147,8 +151,27 @@ class RESTClientObject(object):
             self._owns_connection = True
             return True
 
+    def _reset_after_fork(self) -> None:
+        """Replace a connection inherited from the parent process.
+
+        The inherited httpx client shares socket file descriptors (and TLS /
+        HTTP/2 session state) with the parent, so it is abandoned rather than
+        closed: closing it would send close_notify/GOAWAY on the parent's
+        connections. Clients passed in by the caller are left alone.
+        """
+        self._reset_lock = threading.Lock()
+        self._owner_pid = os.getpid()
+        if not getattr(self, "_owns_connection", False):
+            return
+        if getattr(self, "_http2_enabled", None) is None:
+            self._http2_enabled = self._is_http2_enabled()
+        self.connection = self._create_default_httpx_client()
+
     def __del__(self):
         """Cleanup httpx client on object destruction."""
+        if getattr(self, "_owner_pid", None) not in (None, os.getpid()):
+            # Inherited through fork(): the sockets belong to the parent.
+            return
         if hasattr(self, '_owns_connection') and self._owns_connection:
             if hasattr(self, 'connection') and self.connection is not None:
                 try:
@@ -216,6 +239,8 @@ class RESTClientObject(object):
         # cleanup) has closed our underlying client out from under us.
         # Use compare-and-swap with a snapshot so that concurrent proactive
         # heals don't churn the client.
+        if getattr(self, "_owner_pid", None) not in (None, os.getpid()):
+            self._reset_after_fork()
         pre_check_client = self.connection
         if self._is_client_closed():
             if self._reset_connection(expected=pre_check_client):
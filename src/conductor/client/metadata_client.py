@@ -37,6 +37,10 @@ class MetadataClient(ABC):
     def register_task_def(self, task_def: TaskDef):
         pass
 
+    def register_task_defs(self, task_defs: List[TaskDef]):
+        for task_def in task_defs:
+            self.register_task_def(task_def)
+
     @abstractmethod
     def update_task_def(self, task_def: TaskDef):
         pass
@@ -39,6 +39,9 @@ class OrkesMetadataClient(OrkesBaseClient, MetadataClient):
     def register_task_def(self, task_def: TaskDef):
         self.metadataResourceApi.register_task_def([task_def])
 
+    def register_task_defs(self, task_defs: List[TaskDef]):
+        self.metadataResourceApi.register_task_def(task_defs)
+
     def update_task_def(self, task_def: TaskDef):
         self.metadataResourceApi.update_task_def(task_def)
 
@@ -13,6 +13,9 @@ class OrkesSchemaClient(OrkesBaseClient, SchemaClient):
     def register_schema(self, schema: SchemaDef) -> None:
         self.schemaApi.save(schema)
 
+    def register_schemas(self, schemas: List[SchemaDef]) -> None:
+        self.schemaApi.save(schemas)
+
     def get_schema(self, schema_name: str, version: int) -> SchemaDef:
         return self.schemaApi.get_schema_by_name_and_version(name=schema_name, version=version)
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
-from typing import Optional, List, Dict, TYPE_CHECKING
+from typing import Callable, Iterable, Optional, List, Dict, TYPE_CHECKING
 
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
 from conductor.client.http.models import SkipTaskRequest, WorkflowStatus, \
     ScrollableSearchResultWorkflowSummary, SignalResponse
+from conductor.client.http.models.bulk_response import BulkResponse
 from conductor.client.http.models.correlation_ids_search_request import CorrelationIdsSearchRequest
 from conductor.client.http.models.rerun_workflow_request import RerunWorkflowRequest
 from conductor.client.http.models.start_workflow_request import StartWorkflowRequest
@@ -12,6 +14,10 @@ from conductor.client.http.models.workflow_run import WorkflowRun
 from conductor.client.http.models.workflow_state_update import WorkflowStateUpdate
 from conductor.client.http.models.workflow_test_request import WorkflowTestRequest
 from conductor.client.orkes.orkes_base_client import OrkesBaseClient
+from conductor.client.orkes.workflow_bulk_operations import BulkProgress, MAX_BULK_REQUEST_SIZE, \
+    WorkflowBulkOperations
+from conductor.client.orkes.workflow_start_pipeline import WorkflowStartPipeline
+from conductor.client.orkes.workflow_tree import WorkflowTree, fetch_workflow_tree
 from conductor.client.workflow_client import WorkflowClient
 
 if TYPE_CHECKING:
@@ -25,6 +31,7 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
             metrics_collector: Optional[MetricsCollectorBase] = None,
     ):
         super(OrkesWorkflowClient, self).__init__(configuration, metrics_collector=metrics_collector)
+        self.workflowBulkResourceApi = WorkflowBulkResourceApi(self.api_client)
 
     def start_workflow_by_name(
             self,
@@ -86,6 +93,13 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
 
         return data
 
+    def start_pipeline(self, name: str, version: Optional[int] = None,
+                       idempotency_key: Optional[Callable[[object], str]] = None, max_in_flight: int = 32,
+                       **kwargs) -> WorkflowStartPipeline:
+        """Pipeline for starting many workflows with bounded concurrency, retries and idempotency-key de-duplication"""
+        return WorkflowStartPipeline(self, name, version=version, idempotency_key=idempotency_key,
+                                     max_in_flight=max_in_flight, **kwargs)
+
     def execute_workflow(
             self,
             start_workflow_request: StartWorkflowRequest,
@@ -174,6 +188,25 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
             kwargs["include_tasks"] = include_tasks
         return self.workflowResourceApi.get_execution_status(workflow_id, **kwargs)
 
+    def get_workflow_tree(self, workflow_id: str, max_workers: int = 8, max_depth: Optional[int] = None,
+                          summarize: bool = False) -> WorkflowTree[Workflow]:
+        """Fetches a workflow with its tasks and all nested sub-workflows, loading sub-workflows concurrently.
+
+        ``summarize`` asks the server for summarized task and workflow inputs/outputs to keep payloads small.
+        """
+        kwargs = {"include_tasks": True}
+        if summarize:
+            kwargs["summarize"] = True
+
+        def fetch(wf_id: str) -> Workflow:
+            return self.workflowResourceApi.get_execution_status(wf_id, **kwargs)
+
+        def sub_workflow_ids(workflow: Workflow) -> List[str]:
+            return [task.sub_workflow_id for task in (workflow.tasks or [])
+                    if task.task_type == "SUB_WORKFLOW" and task.sub_workflow_id]
+
+        return fetch_workflow_tree(workflow_id, fetch, sub_workflow_ids, max_workers=max_workers, max_depth=max_depth)
+
     def get_workflow_status(self, workflow_id: str, include_output: Optional[bool] = None,
                             include_variables: Optional[bool] = None) -> WorkflowStatus:
         kwargs = {}
@@ -272,3 +305,42 @@ class OrkesWorkflowClient(OrkesBaseClient, WorkflowClient):
             The UUID string assigned to the message by the server.
         """
         return self.workflowResourceApi.send_workflow_message(message, workflow_id)
+
+    def bulk_operations(self, chunk_size: int = MAX_BULK_REQUEST_SIZE, max_workers: int = 4,
+                        retries: int = 2) -> WorkflowBulkOperations:
+        """Bulk pause/resume/restart/retry/terminate over any number of workflow ids, sent in concurrent chunks"""
+        return WorkflowBulkOperations(self.workflowBulkResourceApi, chunk_size=chunk_size,
+                                      max_workers=max_workers, retries=retries)
+
+    def bulk_pause_workflows(self, workflow_ids: Iterable[str], max_workers: int = 4,
+                             on_progress: Optional[Callable[[BulkProgress], None]] = None,
+                             checkpoint: Optional[str] = None) -> BulkResponse:
+        return self.bulk_operations(max_workers=max_workers).pause(
+            workflow_ids, on_progress=on_progress, checkpoint=checkpoint)
+
+    def bulk_resume_workflows(self, workflow_ids: Iterable[str], max_workers: int = 4,
+                              on_progress: Optional[Callable[[BulkProgress], None]] = None,
+                              checkpoint: Optional[str] = None) -> BulkResponse:
+        return self.bulk_operations(max_workers=max_workers).resume(
+            workflow_ids, on_progress=on_progress, checkpoint=checkpoint)
+
+    def bulk_restart_workflows(self, workflow_ids: Iterable[str], use_latest_definitions: bool = False,
+                               max_workers: int = 4, on_progress: Optional[Callable[[BulkProgress], None]] = None,
+                               checkpoint: Optional[str] = None) -> BulkResponse:
+        return self.bulk_operations(max_workers=max_workers).restart(
+            workflow_ids, use_latest_definitions=use_latest_definitions, on_progress=on_progress,
+            checkpoint=checkpoint)
+
+    def bulk_retry_workflows(self, workflow_ids: Iterable[str], max_workers: int = 4,
+                             on_progress: Optional[Callable[[BulkProgress], None]] = None,
+                             checkpoint: Optional[str] = None) -> BulkResponse:
+        return self.bulk_operations(max_workers=max_workers).retry(
+            workflow_ids, on_progress=on_progress, checkpoint=checkpoint)
+
+    def bulk_terminate_workflows(self, workflow_ids: Iterable[str], reason: Optional[str] = None,
+                                 trigger_failure_workflow: bool = False, max_workers: int = 4,
+                                 on_progress: Optional[Callable[[BulkProgress], None]] = None,
+                                 checkpoint: Optional[str] = None) -> BulkResponse:
+        return self.bulk_operations(max_workers=max_workers).terminate(
+            workflow_ids, reason=reason, trigger_failure_workflow=trigger_failure_workflow,
+            on_progress=on_progress, checkpoint=checkpoint)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import httpx
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
+from conductor.client.http.models.bulk_response import BulkResponse
+from conductor.client.http.rest import ApiException
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+# The server rejects bulk requests with more than this many workflow ids.
+MAX_BULK_REQUEST_SIZE = 1000
+
+
+@dataclass
+class BulkProgress:
+    """Progress of a bulk operation, passed to ``on_progress`` after every chunk."""
+    operation: str
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    chunks_done: int
+    chunks_total: int
+
+
+class WorkflowBulkOperations:
+    """Runs bulk workflow operations over arbitrarily many workflow ids.
+
+    Ids are split into chunks of at most ``chunk_size`` (capped at the server's limit of
+    :data:`MAX_BULK_REQUEST_SIZE`), up to ``max_workers`` chunks are sent concurrently, and the
+    per-chunk :class:`BulkResponse` results are merged into one. A chunk whose request fails with a
+    server error, a throttling response, a connection error or a timeout is retried ``retries``
+    times; if it still fails, or fails with any other error, each of its ids is reported in
+    ``bulk_error_results`` with the error and the other chunks carry on.
+
+    With ``checkpoint`` set to a file path, every finished chunk is appended to that file, and a
+    later call with the same operation, ids and chunk size skips the chunks already finished, so an
+    interrupted run can be resumed. Chunks that failed as a whole are not recorded and are retried
+    on resume.
+    """
+
+    def __init__(self, bulk_api: WorkflowBulkResourceApi, chunk_size: int = MAX_BULK_REQUEST_SIZE,
+                 max_workers: int = 4, retries: int = 2, retry_backoff_seconds: float = 1.0) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.bulk_api = bulk_api
+        self.chunk_size = min(chunk_size, MAX_BULK_REQUEST_SIZE)
+        self.max_workers = max(1, max_workers)
+        self.retries = retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+
+    def pause(self, workflow_ids: Iterable[str], **kwargs) -> BulkResponse:
+        return self.run("pause", workflow_ids, **kwargs)
+
+    def resume(self, workflow_ids: Iterable[str], **kwargs) -> BulkResponse:
+        return self.run("resume", workflow_ids, **kwargs)
+
+    def restart(self, workflow_ids: Iterable[str], use_latest_definitions: bool = False, **kwargs) -> BulkResponse:
+        params = {"use_latest_definitions": True} if use_latest_definitions else {}
+        return self.run("restart", workflow_ids, params=params, **kwargs)
+
+    def retry(self, workflow_ids: Iterable[str], **kwargs) -> BulkResponse:
+        return self.run("retry", workflow_ids, **kwargs)
+
+    def terminate(self, workflow_ids: Iterable[str], reason: Optional[str] = None,
+                  trigger_failure_workflow: bool = False, **kwargs) -> BulkResponse:
+        params = {}
+        if reason is not None:
+            params["reason"] = reason
+        if trigger_failure_workflow:
+            params["triggerFailureWorkflow"] = True
+        return self.run("terminate", workflow_ids, params=params, **kwargs)
+
+    def run(self, operation: str, workflow_ids: Iterable[str], params: Optional[Dict[str, object]] = None,
+            on_progress: Optional[Callable[[BulkProgress], None]] = None,
+            checkpoint: Optional[str] = None) -> BulkResponse:
+        """Applies ``operation`` (pause, resume, restart, retry or terminate) to every id."""
+        call = self._operations().get(operation)
+        if call is None:
+            raise ValueError(f"Unknown bulk operation: {operation}")
+        ids = list(dict.fromkeys(workflow_ids))
+        chunks = [ids[i:i + self.chunk_size] for i in range(0, len(ids), self.chunk_size)]
+        merged = BulkResponse(bulk_error_results={}, bulk_successful_results=[])
+        done: Set[int] = set()
+        if checkpoint:
+            done = self._load_checkpoint(checkpoint, operation, ids, merged)
+        progress = BulkProgress(operation, len(ids), sum(len(chunks[i]) for i in done if i < len(chunks)),
+                                len(merged.bulk_successful_results), len(merged.bulk_error_results),
+                                len(done), len(chunks))
+        lock = threading.Lock()
+        checkpoint_file = open(checkpoint, "a") if checkpoint else None
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bulk-" + operation) as pool:
+                pending = set()
+                for index, chunk in enumerate(chunks):
+                    if index in done:
+                        continue
+                    if len(pending) >= self.max_workers:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            future.result()
+                    pending.add(pool.submit(self._run_chunk, call, params or {}, index, chunk, merged, progress,
+                                            lock, checkpoint_file, on_progress))
+                for future in wait(pending).done:
+                    future.result()
+        finally:
+            if checkpoint_file is not None:
+                checkpoint_file.close()
+        return merged
+
+    def _operations(self) -> Dict[str, Callable]:
+        return {
+            "pause": self.bulk_api.pause_workflow,
+            "resume": self.bulk_api.resume_workflow,
+            "restart": self.bulk_api.restart,
+            "retry": self.bulk_api.retry,
+            "terminate": self.bulk_api.terminate,
+        }
+
+    def _run_chunk(self, call: Callable, params: Dict[str, object], index: int, chunk: List[str],
+                   merged: BulkResponse, progress: BulkProgress, lock: threading.Lock, checkpoint_file,
+                   on_progress: Optional[Callable[[BulkProgress], None]]) -> None:
+        response, error = self._call_with_retries(call, params, chunk)
+        if response is not None:
+            succeeded = list(response.bulk_successful_results or [])
+            errors = dict(response.bulk_error_results or {})
+        else:
+            succeeded, errors = [], {workflow_id: error for workflow_id in chunk}
+        with lock:
+            merged.bulk_successful_results.extend(succeeded)
+            merged.bulk_error_results.update(errors)
+            progress.succeeded += len(succeeded)
+            progress.failed += len(errors)
+            progress.processed += len(chunk)
+            progress.chunks_done += 1
+            if checkpoint_file is not None and response is not None:
+                checkpoint_file.write(json.dumps({"chunk": index, "succeeded": succeeded, "errors": errors}) + "\n")
+                checkpoint_file.flush()
+            snapshot = BulkProgress(**vars(progress))
+        if on_progress is not None:
+            try:
+                on_progress(snapshot)
+            except Exception as e:
+                logger.warning("Bulk %s progress callback failed: %s", progress.operation, e)
+
+    def _call_with_retries(self, call: Callable, params: Dict[str, object],
+                           chunk: List[str]) -> Tuple[Optional[BulkResponse], Optional[str]]:
+        for attempt in range(self.retries + 1):
+            try:
+                return call(chunk, **params), None
+            except ApiException as e:
+                if attempt == self.retries or (e.status is not None and 400 <= e.status < 500 and e.status != 429):
+                    return None, f"{e.status}: {e.reason}"
+                logger.warning("Bulk request for %d workflows failed (%s), retrying", len(chunk), e.status)
+            except (httpx.TransportError, OSError) as e:
+                if attempt == self.retries:
+                    return None, f"{type(e).__name__}: {e}"
+                logger.warning("Bulk request for %d workflows failed (%s), retrying", len(chunk), type(e).__name__)
+            except Exception as e:
+                # Not retryable, but only this chunk fails; the other chunks carry on.
+                logger.error("Bulk request for %d workflows failed: %s", len(chunk), e)
+                return None, f"{type(e).__name__}: {e}"
+            time.sleep(self.retry_backoff_seconds * (2 ** attempt))
+        return None, None
+
+    def _load_checkpoint(self, path: str, operation: str, ids: List[str], merged: BulkResponse) -> Set[int]:
+        digest = hashlib.sha256("\n".join(ids).encode()).hexdigest()
+        header = {"operation": operation, "chunk_size": self.chunk_size, "total": len(ids), "ids_sha256": digest}
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "w") as f:
+                f.write(json.dumps(header) + "\n")
+            return set()
+        done = set()
+        with open(path) as f:
+            lines = f.readlines()
+        recorded = json.loads(lines[0])
+        if recorded != header:
+            raise ValueError(f"Checkpoint {path} belongs to a different bulk operation "
+                             f"({recorded.get('operation')} of {recorded.get('total')} workflows)")
+        valid = lines[:1]
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # a partial line left by an interrupted write
+            valid.append(line if line.endswith("\n") else line + "\n")
+            if entry["chunk"] in done:
+                continue
+            done.add(entry["chunk"])
+            merged.bulk_successful_results.extend(entry["succeeded"])
+            merged.bulk_error_results.update(entry["errors"])
+        if len(valid) != len(lines) or not lines[-1].endswith("\n"):
+            with open(path, "w") as f:
+                f.writelines(valid)
+        return done
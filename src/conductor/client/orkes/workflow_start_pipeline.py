@@ -0,0 +1,207 @@
+from __future__ import annotations
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models.start_workflow_request import IdempotencyStrategy, StartWorkflowRequest
+from conductor.client.http.rest import ApiException
+from conductor.client.workflow_client import WorkflowClient
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+_RETRYABLE_STATUSES = {0, 429, 502, 503, 504}
+
+
+@dataclass
+class StartPipelineStats:
+    """Counters of a :class:`WorkflowStartPipeline`; ``started`` excludes ``duplicates_skipped``."""
+    submitted: int = 0
+    started: int = 0
+    duplicates_skipped: int = 0
+    retries: int = 0
+    failed: int = 0
+    in_flight: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def starts_per_second(self) -> float:
+        return self.started / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class WorkflowStartPipeline:
+    """Starts workflows from a stream of inputs with bounded concurrency, retries and de-duplication.
+
+    Every input gets an idempotency key from ``idempotency_key(input)`` and is started with
+    ``idempotency_strategy`` (default ``RETURN_EXISTING``), so a request that is retried after a
+    timeout or a dropped connection returns the workflow the first attempt created instead of
+    starting a second one.
+    Requests are retried with exponential backoff and full jitter when the failure is transient
+    (``ApiException.transient``, connection errors and timeouts, 429, 502, 503 and 504), up to
+    ``max_attempts`` attempts.
+
+    At most ``max_in_flight`` starts run at once, sharing the workflow client's connection pool;
+    :meth:`submit` blocks while the window is full. Keys whose start was acknowledged are kept in an
+    LRU of ``dedup_capacity`` entries and later inputs with the same key resolve to the recorded
+    workflow id without a request; inputs whose key is already in flight share that start's future.
+    """
+
+    def __init__(self, workflow_client: WorkflowClient, name: str, version: Optional[int] = None,
+                 idempotency_key: Optional[Callable[[Any], str]] = None,
+                 request_factory: Optional[Callable[[Any], StartWorkflowRequest]] = None,
+                 max_in_flight: int = 32, max_attempts: int = 5, base_delay_seconds: float = 0.1,
+                 max_delay_seconds: float = 5.0, dedup_capacity: int = 100_000,
+                 idempotency_strategy: IdempotencyStrategy = IdempotencyStrategy.RETURN_EXISTING) -> None:
+        self.workflow_client = workflow_client
+        self.name = name
+        self.version = version
+        self.idempotency_key = idempotency_key
+        self.request_factory = request_factory
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.dedup_capacity = dedup_capacity
+        self.idempotency_strategy = idempotency_strategy
+        self._acknowledged: OrderedDict[str, str] = OrderedDict()
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._window = threading.BoundedSemaphore(self.max_in_flight)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="workflow-start")
+        self._stats = StartPipelineStats()
+        self._started_at: Optional[float] = None
+        self._closed = False
+
+    def submit(self, workflow_input: Any) -> Future:
+        """Queues one start and returns a future resolved with the workflow id."""
+        request = self._build_request(workflow_input)
+        key = request.idempotency_key
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WorkflowStartPipeline is closed")
+            if self._started_at is None:
+                self._started_at = time.monotonic()
+            self._stats.submitted += 1
+            if key is not None:
+                duplicate = self._duplicate(key)
+                if duplicate is not None:
+                    self._stats.duplicates_skipped += 1
+                    return duplicate
+        self._window.acquire()
+        future: Future = Future()
+        with self._lock:
+            if key is not None:
+                # Another thread may have started the same key while this one waited for the window.
+                duplicate = self._duplicate(key)
+                if duplicate is not None:
+                    self._window.release()
+                    self._stats.duplicates_skipped += 1
+                    return duplicate
+                self._in_flight[key] = future
+            self._stats.in_flight += 1
+        self._pool.submit(self._start, request, future)
+        return future
+
+    def start_all(self, inputs: Iterable[Any]) -> Iterator[Tuple[Any, Future]]:
+        """Submits every input and yields ``(input, future)`` pairs once each start has finished, in input order."""
+        pending = []
+        for workflow_input in inputs:
+            pending.append((workflow_input, self.submit(workflow_input)))
+            while pending and pending[0][1].done():
+                yield pending.pop(0)
+        for workflow_input, future in pending:
+            future.exception()
+            yield workflow_input, future
+
+    @property
+    def stats(self) -> StartPipelineStats:
+        """A snapshot of the pipeline's counters."""
+        with self._lock:
+            snapshot = StartPipelineStats(**vars(self._stats))
+            if self._started_at is not None:
+                snapshot.elapsed_seconds = time.monotonic() - self._started_at
+            return snapshot
+
+    def close(self, wait: bool = True) -> None:
+        with self._lock:
+            self._closed = True
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> WorkflowStartPipeline:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _duplicate(self, key: str) -> Optional[Future]:
+        """Returns a future for ``key`` if it was already acknowledged or is in flight; call with the lock held."""
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return in_flight
+        workflow_id = self._acknowledged.get(key)
+        if workflow_id is None:
+            return None
+        self._acknowledged.move_to_end(key)
+        done: Future = Future()
+        done.set_result(workflow_id)
+        return done
+
+    def _build_request(self, workflow_input: Any) -> StartWorkflowRequest:
+        if self.request_factory is not None:
+            request = self.request_factory(workflow_input)
+        else:
+            request = StartWorkflowRequest(name=self.name, version=self.version, input=workflow_input)
+        if request.idempotency_key is None and self.idempotency_key is not None:
+            request.idempotency_key = self.idempotency_key(workflow_input)
+        if request.idempotency_key is not None:
+            request.idempotency_strategy = self.idempotency_strategy
+        return request
+
+    def _start(self, request: StartWorkflowRequest, future: Future) -> None:
+        key = request.idempotency_key
+        try:
+            workflow_id = self._start_with_retries(request)
+        except Exception as e:
+            with self._lock:
+                self._stats.failed += 1
+                self._finish(key)
+            future.set_exception(e)
+            return
+        with self._lock:
+            self._stats.started += 1
+            if key is not None and self.dedup_capacity > 0:
+                self._acknowledged[key] = workflow_id
+                if len(self._acknowledged) > self.dedup_capacity:
+                    self._acknowledged.popitem(last=False)
+            self._finish(key)
+        future.set_result(workflow_id)
+
+    def _finish(self, key: Optional[str]) -> None:
+        if key is not None:
+            self._in_flight.pop(key, None)
+        self._stats.in_flight -= 1
+        self._window.release()
+
+    def _start_with_retries(self, request: StartWorkflowRequest) -> str:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return self.workflow_client.start_workflow(request)
+            except ApiException as e:
+                retryable = e.transient or e.status in _RETRYABLE_STATUSES
+                if not retryable or attempt == self.max_attempts:
+                    raise
+                delay = random.uniform(0, min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)))
+                logger.debug("Start of %s failed (%s: %s), retry %d in %.2fs",
+                             request.name, e.status, e.reason, attempt, delay)
+                with self._lock:
+                    self._stats.retries += 1
+                time.sleep(delay)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+from conductor.client.configuration.configuration import Configuration
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class WorkflowTreeNode(Generic[T]):
+    """One execution in a workflow tree; ``children`` holds the ids of its sub-workflows in task order."""
+    workflow_id: str
+    workflow: T
+    parent_id: Optional[str] = None
+    depth: int = 0
+    children: List[str] = field(default_factory=list)
+
+
+@dataclass
+class WorkflowTree(Generic[T]):
+    """A workflow and its sub-workflows, indexed by workflow id.
+
+    ``errors`` holds the ids that could not be fetched and the exception raised for each; their
+    subtrees are missing from ``nodes``.
+    """
+    root_id: str
+    nodes: Dict[str, WorkflowTreeNode[T]] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def root(self) -> Optional[WorkflowTreeNode[T]]:
+        return self.nodes.get(self.root_id)
+
+    def __getitem__(self, workflow_id: str) -> WorkflowTreeNode[T]:
+        return self.nodes[workflow_id]
+
+    def __contains__(self, workflow_id: str) -> bool:
+        return workflow_id in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[WorkflowTreeNode[T]]:
+        return self.walk()
+
+    def walk(self, workflow_id: Optional[str] = None) -> Iterator[WorkflowTreeNode[T]]:
+        """Yields the nodes of the (sub)tree rooted at ``workflow_id`` depth-first, parents before children."""
+        stack = [workflow_id or self.root_id]
+        while stack:
+            node = self.nodes.get(stack.pop())
+            if node is None:
+                continue
+            yield node
+            stack.extend(reversed(node.children))
+
+
+def fetch_workflow_tree(root_id: str, fetch: Callable[[str], Optional[T]],
+                        sub_workflow_ids: Callable[[T], Iterable[str]], max_workers: int = 8,
+                        max_depth: Optional[int] = None) -> WorkflowTree[T]:
+    """Fetches a workflow and, recursively, its sub-workflows with up to ``max_workers`` requests in flight.
+
+    ``fetch`` returns one execution by id (``None`` if it does not exist) and ``sub_workflow_ids`` lists
+    the sub-workflow ids an execution references. A sub-workflow is requested as soon as its parent
+    arrives, so siblings at every level load concurrently. Each id is fetched once even when referenced
+    by several tasks (e.g. retried SUB_WORKFLOW tasks), and ``max_depth`` (root = 0) bounds the recursion.
+    """
+    tree: WorkflowTree[T] = WorkflowTree(root_id)
+    seen = {root_id}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="workflow-tree") as pool:
+        pending = {pool.submit(fetch, root_id): (root_id, None, 0)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                workflow_id, parent_id, depth = pending.pop(future)
+                try:
+                    workflow = future.result()
+                except Exception as e:
+                    logger.debug("Failed to fetch workflow %s: %s", workflow_id, e)
+                    tree.errors[workflow_id] = e
+                    continue
+                if workflow is None:
+                    continue
+                node = WorkflowTreeNode(workflow_id, workflow, parent_id, depth)
+                tree.nodes[workflow_id] = node
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                for child_id in sub_workflow_ids(workflow):
+                    if not child_id or child_id in seen:
+                        continue
+                    seen.add(child_id)
+                    node.children.append(child_id)
+                    pending[pool.submit(fetch, child_id)] = (child_id, workflow_id, depth + 1)
+    # Parents are recorded before their children arrive, so drop links to children that failed or were missing.
+    for node in tree.nodes.values():
+        node.children = [child for child in node.children if child in tree.nodes]
+    return tree
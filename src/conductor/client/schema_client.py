@@ -17,6 +17,14 @@ class SchemaClient(ABC):
         """
         ...
 
+    def register_schemas(self, schemas: List[SchemaDef]) -> None:
+        """
+        Register several schemas. Implementations may override this to
+        register them with one request.
+        """
+        for schema in schemas:
+            self.register_schema(schema)
+
     @abstractmethod
     def get_schema(self, schema_name: str, version: int) -> SchemaDef:
         """
@@ -26,6 +26,7 @@ class LegacyMetricsCollector(MetricsCollectorBase):
         super().__init__(settings)
         self.quantile_metrics: Dict[str, Any] = {}
         self.quantile_data: Dict[str, deque] = {}
+        self._dirty_quantiles: Dict[str, tuple] = {}
 
     def collector_name(self) -> str:
         return "legacy"
@@ -238,35 +239,67 @@ class LegacyMetricsCollector(MetricsCollectorBase):
         if not self.must_collect_metrics:
             return
 
-        with self._lock:
-            label_values = tuple(labels.values())
-            data_key = f"{name}_{label_values}"
+        label_values = tuple(labels.values())
+        data_key = f"{name}_{label_values}"
+
+        if self._flush_interval:
+            # Sorting the window on every observation dominates the per-task
+            # cost; with local aggregation the quantiles are recomputed once
+            # per flush for each touched series instead.
+            with self._pending_lock:
+                window = self.quantile_data.get(data_key)
+                if window is None:
+                    window = self.quantile_data[data_key] = deque(maxlen=self.QUANTILE_WINDOW_SIZE)
+                window.append(value)
+                self._dirty_quantiles[data_key] = (name, documentation, labels)
+            self._ensure_flush_thread()
+            return
 
+        with self._lock:
             if data_key not in self.quantile_data:
                 self.quantile_data[data_key] = deque(maxlen=self.QUANTILE_WINDOW_SIZE)
 
             self.quantile_data[data_key].append(value)
+            self._publish_quantiles(name, documentation, labels, list(self.quantile_data[data_key]))
+
+    def flush(self) -> None:
+        super().flush()
+        with self._pending_lock:
+            dirty, self._dirty_quantiles = self._dirty_quantiles, {}
+            windows = {data_key: list(self.quantile_data[data_key]) for data_key in dirty}
+        if not dirty:
+            return
+        with self._lock:
+            for data_key, (name, documentation, labels) in dirty.items():
+                self._publish_quantiles(name, documentation, labels, windows[data_key])
 
-            observations = sorted(self.quantile_data[data_key])
-            n = len(observations)
-
-            if n > 0:
-                quantiles = [0.5, 0.75, 0.9, 0.95, 0.99]
-                for q in quantiles:
-                    quantile_value = self._calculate_quantile(observations, q)
-                    gauge = self._get_quantile_gauge(
-                        name=name,
-                        documentation=documentation,
-                        labelnames=[label.value for label in labels.keys()] + ["quantile"],
-                    )
-                    gauge.labels(*labels.values(), str(q)).set(quantile_value)
-
-                self._update_summary_aggregates(
+    def _publish_quantiles(
+            self,
+            name: MetricName,
+            documentation: MetricDocumentation,
+            labels: Dict[MetricLabel, str],
+            window: List[float]
+    ) -> None:
+        observations = sorted(window)
+        n = len(observations)
+
+        if n > 0:
+            quantiles = [0.5, 0.75, 0.9, 0.95, 0.99]
+            for q in quantiles:
+                quantile_value = self._calculate_quantile(observations, q)
+                gauge = self._get_quantile_gauge(
                     name=name,
                     documentation=documentation,
-                    labels=labels,
-                    observations=list(self.quantile_data[data_key]),
+                    labelnames=[label.value for label in labels.keys()] + ["quantile"],
                 )
+                gauge.labels(*labels.values(), str(q)).set(quantile_value)
+
+            self._update_summary_aggregates(
+                name=name,
+                documentation=documentation,
+                labels=labels,
+                observations=window,
+            )
 
     @staticmethod
     def _calculate_quantile(sorted_values: List[float], quantile: float) -> float:
@@ -1,11 +1,13 @@
 import abc
+import atexit
+import bisect
 import collections
 import logging
 import os
 import signal
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 # Lazy imports - these will be imported when first needed.
 # PROMETHEUS_MULTIPROC_DIR must be set before prometheus_client is imported.
@@ -87,6 +89,29 @@ logger = logging.getLogger(
 )
 
 
+class _CachedCollector:
+    """Serve the last ``collect()`` result of *inner* for up to *ttl* seconds.
+
+    Scrapes (and file writes) that arrive within the window reuse the merged
+    view instead of re-reading every worker's multiprocess file.
+    """
+
+    def __init__(self, inner, ttl: float):
+        self._inner = inner
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._metrics: Optional[list] = None
+        self._collected_at = 0.0
+
+    def collect(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._metrics is None or now - self._collected_at >= self._ttl:
+                self._metrics = list(self._inner.collect())
+                self._collected_at = now
+            return iter(self._metrics)
+
+
 class MetricsCollectorBase(abc.ABC):
     """
     Abstract base class for Conductor metrics collectors.
@@ -107,6 +132,15 @@ class MetricsCollectorBase(abc.ABC):
         self.must_collect_metrics = False
         self._lock = threading.RLock()
         self._active_worker_counts: Dict[str, int] = collections.defaultdict(int)
+        # Local aggregation (MetricsSettings.flush_interval): writes are
+        # buffered here and applied to the multiprocess files by flush().
+        self._flush_interval: float = 0.0
+        self._pending_lock = threading.Lock()
+        self._pending_counters: Dict[tuple, float] = {}
+        self._pending_gauges: Dict[tuple, Any] = {}
+        self._pending_observations: Dict[tuple, List[float]] = {}
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = threading.Event()
 
         if settings is None:
             return
@@ -118,10 +152,14 @@ class MetricsCollectorBase(abc.ABC):
         self.registry = CollectorRegistry()
 
         self.must_collect_metrics = True
+        self._flush_interval = float(getattr(settings, "flush_interval", None) or 0.0)
+        if self._flush_interval:
+            atexit.register(self.flush)
         logger.debug(
-            "MetricsCollector initialized with directory=%s, must_collect=%s",
+            "MetricsCollector initialized with directory=%s, must_collect=%s, flush_interval=%s",
             settings.metrics_directory,
             self.must_collect_metrics,
+            self._flush_interval,
         )
 
     # =========================================================================
@@ -150,6 +188,39 @@ class MetricsCollectorBase(abc.ABC):
             settings.file_name
         )
 
+        registry = MetricsCollectorBase._build_provider_registry(settings)
+
+        http_server = None
+        if settings.http_port is not None:
+            http_server = MetricsCollectorBase._start_http_server(settings.http_port, registry)
+            logger.info(f"Metrics HTTP server mode: serving from memory (no file writes) (pid={os.getpid()})")
+
+            while True:
+                time.sleep(settings.update_interval)
+        else:
+            logger.info(f"Metrics file mode: writing to {OUTPUT_FILE_PATH} (pid={os.getpid()})")
+            while True:
+                try:
+                    write_to_textfile(
+                        OUTPUT_FILE_PATH,
+                        registry
+                    )
+                except Exception as e:
+                    logger.debug(f"Error writing metrics (will retry): {e}")
+
+                time.sleep(settings.update_interval)
+
+    @staticmethod
+    def _build_provider_registry(settings: MetricsSettings):
+        """Build the registry served by the metrics provider process.
+
+        The multiprocess ``.db`` files are merged (pid label dropped) by
+        ``NoPidCollector``.  Re-reading every worker's file is the expensive
+        part of a scrape, so the merged view is cached for
+        ``max(update_interval, flush_interval)`` seconds: workers that buffer
+        locally cannot change the files faster than that anyway.
+        """
+        _ensure_prometheus_imported()
         registry = CollectorRegistry()
         from prometheus_client.multiprocess import MultiProcessCollector as MPCollector
         from prometheus_client.samples import Sample
@@ -196,27 +267,9 @@ class MetricsCollectorBase(abc.ABC):
                     new_metric.samples = filtered_samples
                     yield new_metric
 
-        NoPidCollector(registry)
-
-        http_server = None
-        if settings.http_port is not None:
-            http_server = MetricsCollectorBase._start_http_server(settings.http_port, registry)
-            logger.info(f"Metrics HTTP server mode: serving from memory (no file writes) (pid={os.getpid()})")
-
-            while True:
-                time.sleep(settings.update_interval)
-        else:
-            logger.info(f"Metrics file mode: writing to {OUTPUT_FILE_PATH} (pid={os.getpid()})")
-            while True:
-                try:
-                    write_to_textfile(
-                        OUTPUT_FILE_PATH,
-                        registry
-                    )
-                except Exception as e:
-                    logger.debug(f"Error writing metrics (will retry): {e}")
-
-                time.sleep(settings.update_interval)
+        ttl = max(settings.update_interval or 0.0, getattr(settings, "flush_interval", None) or 0.0)
+        registry.register(_CachedCollector(NoPidCollector(None, path=settings.metrics_directory), ttl))
+        return registry
 
     @staticmethod
     def _start_http_server(port: int, registry) -> 'HTTPServer':
@@ -279,6 +332,12 @@ class MetricsCollectorBase(abc.ABC):
     ) -> None:
         if not self.must_collect_metrics:
             return
+        if self._flush_interval:
+            key = (name, documentation, tuple(labels.keys()), tuple(labels.values()))
+            with self._pending_lock:
+                self._pending_counters[key] = self._pending_counters.get(key, 0) + 1
+            self._ensure_flush_thread()
+            return
         with self._lock:
             counter = self._get_counter(
                 name=name,
@@ -297,6 +356,12 @@ class MetricsCollectorBase(abc.ABC):
     ) -> None:
         if not self.must_collect_metrics:
             return
+        if self._flush_interval:
+            key = (name, documentation, tuple(labels.keys()), tuple(labels.values()), multiprocess_mode)
+            with self._pending_lock:
+                self._pending_gauges[key] = value
+            self._ensure_flush_thread()
+            return
         with self._lock:
             gauge = self._get_gauge(
                 name=name,
@@ -316,6 +381,16 @@ class MetricsCollectorBase(abc.ABC):
     ) -> None:
         if not self.must_collect_metrics:
             return
+        if self._flush_interval:
+            key = (name, documentation, tuple(labels.keys()), tuple(labels.values()),
+                   tuple(buckets) if buckets is not None else None)
+            with self._pending_lock:
+                pending = self._pending_observations.get(key)
+                if pending is None:
+                    pending = self._pending_observations[key] = []
+                pending.append(value)
+            self._ensure_flush_thread()
+            return
         with self._lock:
             histogram = self._get_histogram(
                 name=name,
@@ -325,6 +400,104 @@ class MetricsCollectorBase(abc.ABC):
             )
             histogram.labels(*labels.values()).observe(value)
 
+    # =========================================================================
+    # Local aggregation (MetricsSettings.flush_interval)
+    # =========================================================================
+
+    def flush(self) -> None:
+        """Apply locally aggregated metric updates to the multiprocess files.
+
+        Counters are written as one ``inc(delta)`` per label set, gauges as
+        their latest value, and histogram observations as one increment per
+        touched bucket.  A no-op when local aggregation is disabled.
+        """
+        with self._pending_lock:
+            counters, self._pending_counters = self._pending_counters, {}
+            gauges, self._pending_gauges = self._pending_gauges, {}
+            observations, self._pending_observations = self._pending_observations, {}
+        if not (counters or gauges or observations):
+            return
+        with self._lock:
+            for (name, documentation, label_keys, label_values), delta in counters.items():
+                counter = self._get_counter(
+                    name=name,
+                    documentation=documentation,
+                    labelnames=[label.value for label in label_keys]
+                )
+                counter.labels(*label_values).inc(delta)
+            for (name, documentation, label_keys, label_values, mode), value in gauges.items():
+                gauge = self._get_gauge(
+                    name=name,
+                    documentation=documentation,
+                    labelnames=[label.value for label in label_keys],
+                    multiprocess_mode=mode
+                )
+                gauge.labels(*label_values).set(value)
+            for (name, documentation, label_keys, label_values, buckets), values in observations.items():
+                histogram = self._get_histogram(
+                    name=name,
+                    documentation=documentation,
+                    labelnames=[label.value for label in label_keys],
+                    buckets=list(buckets) if buckets is not None else None
+                )
+                self._apply_observations(histogram.labels(*label_values), values)
+
+    @staticmethod
+    def _apply_observations(child, values: List[float]) -> None:
+        """Fold a batch of observations into a histogram child.
+
+        Mirrors ``Histogram.observe`` (non-cumulative bucket values plus a
+        running sum) so a batch costs one write per touched bucket rather than
+        two per observation.  Falls back to ``observe`` if the child does not
+        expose those internals.
+        """
+        upper_bounds = getattr(child, "_upper_bounds", None)
+        bucket_values = getattr(child, "_buckets", None)
+        sum_value = getattr(child, "_sum", None)
+        if upper_bounds is None or bucket_values is None or sum_value is None:
+            for value in values:
+                child.observe(value)
+            return
+        counts: Dict[int, int] = collections.defaultdict(int)
+        for value in values:
+            counts[bisect.bisect_left(upper_bounds, value)] += 1
+        sum_value.inc(sum(values))
+        for index, count in counts.items():
+            bucket_values[index].inc(count)
+
+    def _ensure_flush_thread(self) -> None:
+        thread = self._flush_thread
+        if thread is not None and thread.is_alive():
+            return
+        with self._pending_lock:
+            thread = self._flush_thread
+            if thread is not None and thread.is_alive():
+                return
+            self._flush_stop.clear()
+            thread = threading.Thread(
+                target=self._flush_forever,
+                name="MetricsFlush",
+                daemon=True,
+            )
+            self._flush_thread = thread
+            thread.start()
+
+    def _flush_forever(self) -> None:
+        while not self._flush_stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.debug("Error flushing aggregated metrics (will retry): %s", e)
+
+    def close(self) -> None:
+        """Stop the background flusher and write any pending updates."""
+        self._flush_stop.set()
+        thread = self._flush_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=max(1.0, self._flush_interval))
+        self._flush_thread = None
+        self.flush()
+
     def _get_counter(self, name, documentation, labelnames):
         if name not in self.counters:
             self.counters[name] = Counter(
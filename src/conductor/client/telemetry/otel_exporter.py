@@ -0,0 +1,341 @@
+"""
+OpenTelemetry export for task runner events.
+
+``OpenTelemetryExporter`` implements the ``TaskRunnerEventsListener`` protocol
+and turns the events every ``TaskRunner`` / ``AsyncTaskRunner`` already
+publishes into OTel spans and metrics:
+
+- ``conductor.task.poll``    -- one span per sampled batch poll
+- ``conductor.task.execute`` -- one span per sampled task, parented to the W3C
+  ``traceparent`` / ``tracestate`` found in the task input when present
+- ``conductor.task.update``  -- child of the task's execute span
+
+Spans are rebuilt from event timestamps and durations when the phase ends, so
+no span is held open across events.  Tasks carry ``conductor.task.id`` and
+``conductor.workflow.instance_id`` attributes for correlation with the server.
+
+Metrics (histograms in seconds plus an error counter) are recorded for every
+event regardless of span sampling.
+
+Requires ``opentelemetry-api``; install the SDK and an exporter to ship data::
+
+    pip install opentelemetry-sdk opentelemetry-exporter-otlp
+
+Worker processes are spawned, so the exporter is pickled into each of them and
+resolves its tracer and meter lazily in the worker.  Pass a module-level
+``configure`` function to install providers there::
+
+    def configure_otel():
+        from opentelemetry import metrics, trace
+        from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+        trace.set_tracer_provider(tracer_provider)
+        metrics.set_meter_provider(MeterProvider(
+            metric_readers=[PeriodicExportingMetricReader(OTLPMetricExporter())]))
+
+    TaskHandler(
+        configuration=config,
+        event_listeners=[OpenTelemetryExporter(configure=configure_otel, sample_ratio=0.1)],
+    )
+"""
+
+import collections
+import logging
+import random
+import threading
+import zlib
+from typing import Any, Callable, Dict, Optional
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.event.task_runner_events import (
+    PollCompleted,
+    PollFailure,
+    TaskExecutionCompleted,
+    TaskExecutionFailure,
+    TaskExecutionStarted,
+    TaskUpdateCompleted,
+    TaskUpdateFailure,
+)
+
+_HAS_OTEL = False
+try:
+    from opentelemetry import metrics, trace
+    from opentelemetry.trace import NonRecordingSpan, SpanKind, Status, StatusCode
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+    _HAS_OTEL = True
+except ImportError:
+    pass
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+INSTRUMENTATION_NAME = "conductor.client.worker"
+
+DEFAULT_MAX_TRACKED_TASKS = 10000
+
+
+def _epoch_ns(timestamp) -> int:
+    return int(timestamp.timestamp() * 1_000_000_000)
+
+
+def _ratio_sampled(key: str, ratio: float) -> bool:
+    """Deterministic per-key sampling so every span of one task agrees."""
+    if ratio >= 1.0:
+        return True
+    if ratio <= 0.0:
+        return False
+    return zlib.crc32(key.encode("utf-8")) < ratio * 0x100000000
+
+
+def _traceparent_sampled(trace_context: Optional[Dict[str, str]]) -> bool:
+    if not trace_context:
+        return False
+    parts = trace_context.get("traceparent", "").split("-")
+    if len(parts) < 4:
+        return False
+    try:
+        return bool(int(parts[3], 16) & 0x01)
+    except ValueError:
+        return False
+
+
+class OpenTelemetryExporter:
+    """
+    Task runner events listener that exports OpenTelemetry spans and metrics.
+
+    Args:
+        configure: Optional picklable callable run once per worker process
+            before the first export, typically to install tracer and meter
+            providers.  Without it the global providers are used.
+        sample_ratio: Fraction of tasks whose execute/update spans are
+            recorded, decided deterministically from the task id.  Tasks whose
+            input carries a sampled ``traceparent`` are always recorded so the
+            caller's trace stays complete.
+        poll_sample_ratio: Fraction of polls that produce a span.
+        trace_empty_polls: Also emit poll spans for polls that returned no
+            tasks.  Off by default; idle workers poll continuously.
+        max_tracked_tasks: Bound on per-task state kept between events (trace
+            context awaiting execution end, span context awaiting update).
+        tracer_provider / meter_provider: Explicit providers for in-process
+            use (thread isolation, tests).  They are not pickled; spawned
+            workers rely on ``configure`` or the global providers.
+    """
+
+    def __init__(
+            self,
+            configure: Optional[Callable[[], None]] = None,
+            sample_ratio: float = 1.0,
+            poll_sample_ratio: float = 0.1,
+            trace_empty_polls: bool = False,
+            max_tracked_tasks: int = DEFAULT_MAX_TRACKED_TASKS,
+            tracer_provider=None,
+            meter_provider=None,
+    ):
+        if not _HAS_OTEL:
+            raise ImportError(
+                "OpenTelemetryExporter requires opentelemetry-api: "
+                "pip install opentelemetry-api opentelemetry-sdk"
+            )
+        self.configure = configure
+        self.sample_ratio = sample_ratio
+        self.poll_sample_ratio = poll_sample_ratio
+        self.trace_empty_polls = trace_empty_polls
+        self.max_tracked_tasks = max_tracked_tasks
+        self._tracer_provider = tracer_provider
+        self._meter_provider = meter_provider
+        self._init_runtime_state()
+
+    def _init_runtime_state(self) -> None:
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._tracer = None
+        self._poll_duration = None
+        self._execute_duration = None
+        self._update_duration = None
+        self._poll_received = None
+        self._errors = None
+        self._propagator = None
+        # task_id -> W3C carrier from the task input (until execution ends)
+        self._trace_contexts: "collections.OrderedDict[str, Dict[str, str]]" = collections.OrderedDict()
+        # task_id -> execute SpanContext (until the update is reported)
+        self._execute_spans: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "configure": self.configure,
+            "sample_ratio": self.sample_ratio,
+            "poll_sample_ratio": self.poll_sample_ratio,
+            "trace_empty_polls": self.trace_empty_polls,
+            "max_tracked_tasks": self.max_tracked_tasks,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._tracer_provider = None
+        self._meter_provider = None
+        self._init_runtime_state()
+
+    def _ensure_initialized(self) -> None:
+        if self._initialized:
+            return
+        with self._lock:
+            if self._initialized:
+                return
+            if self.configure is not None:
+                try:
+                    self.configure()
+                except Exception as e:
+                    logger.warning("OpenTelemetry configure callback failed: %s", e)
+            self._tracer = trace.get_tracer(INSTRUMENTATION_NAME, tracer_provider=self._tracer_provider)
+            meter = metrics.get_meter(INSTRUMENTATION_NAME, meter_provider=self._meter_provider)
+            self._poll_duration = meter.create_histogram(
+                "conductor.task.poll.duration", unit="s", description="Batch poll duration")
+            self._execute_duration = meter.create_histogram(
+                "conductor.task.execute.duration", unit="s", description="Worker function execution duration")
+            self._update_duration = meter.create_histogram(
+                "conductor.task.update.duration", unit="s", description="Task result update duration")
+            self._poll_received = meter.create_counter(
+                "conductor.task.poll.received", unit="{task}", description="Tasks received by polls")
+            self._errors = meter.create_counter(
+                "conductor.task.errors", unit="{error}", description="Poll, execution and update failures")
+            self._propagator = TraceContextTextMapPropagator()
+            self._initialized = True
+
+    # ------------------------------------------------------------------
+    # TaskRunnerEventsListener
+    # ------------------------------------------------------------------
+
+    def on_poll_completed(self, event: PollCompleted) -> None:
+        self._ensure_initialized()
+        attributes = {"conductor.task.type": event.task_type, "status": "SUCCESS"}
+        self._poll_duration.record(event.duration_ms / 1000, attributes)
+        if event.tasks_received:
+            self._poll_received.add(event.tasks_received, {"conductor.task.type": event.task_type})
+        if not event.tasks_received and not self.trace_empty_polls:
+            return
+        if not self._poll_sampled():
+            return
+        self._emit_span(
+            "conductor.task.poll", SpanKind.CLIENT, None, event, event.duration_ms,
+            {"conductor.task.type": event.task_type, "conductor.poll.tasks_received": event.tasks_received},
+        )
+
+    def on_poll_failure(self, event: PollFailure) -> None:
+        self._ensure_initialized()
+        self._poll_duration.record(
+            event.duration_ms / 1000, {"conductor.task.type": event.task_type, "status": "FAILURE"})
+        self._count_error("poll", event.task_type, event.cause)
+        if not self._poll_sampled():
+            return
+        self._emit_span(
+            "conductor.task.poll", SpanKind.CLIENT, None, event, event.duration_ms,
+            {"conductor.task.type": event.task_type}, cause=event.cause,
+        )
+
+    def on_task_execution_started(self, event: TaskExecutionStarted) -> None:
+        if not event.trace_context:
+            return
+        with self._lock:
+            self._remember(self._trace_contexts, event.task_id, event.trace_context)
+
+    def on_task_execution_completed(self, event: TaskExecutionCompleted) -> None:
+        self._ensure_initialized()
+        self._execute_duration.record(
+            event.duration_ms / 1000, {"conductor.task.type": event.task_type, "status": "SUCCESS"})
+        self._emit_execute_span(event)
+
+    def on_task_execution_failure(self, event: TaskExecutionFailure) -> None:
+        self._ensure_initialized()
+        self._execute_duration.record(
+            event.duration_ms / 1000, {"conductor.task.type": event.task_type, "status": "FAILURE"})
+        self._count_error("execute", event.task_type, event.cause)
+        self._emit_execute_span(event, cause=event.cause)
+
+    def on_task_update_completed(self, event: TaskUpdateCompleted) -> None:
+        self._ensure_initialized()
+        self._update_duration.record(
+            event.duration_ms / 1000, {"conductor.task.type": event.task_type, "status": "SUCCESS"})
+        self._emit_update_span(event, event.duration_ms)
+
+    def on_task_update_failure(self, event: TaskUpdateFailure) -> None:
+        self._ensure_initialized()
+        self._count_error("update", event.task_type, event.cause)
+        self._emit_update_span(event, 0.0, cause=event.cause, retry_count=event.retry_count)
+
+    # ------------------------------------------------------------------
+    # Span construction
+    # ------------------------------------------------------------------
+
+    def _emit_execute_span(self, event, cause: Optional[BaseException] = None) -> None:
+        with self._lock:
+            carrier = self._trace_contexts.pop(event.task_id, None)
+        if not (_traceparent_sampled(carrier) or _ratio_sampled(event.task_id, self.sample_ratio)):
+            return
+        parent = self._propagator.extract(carrier=carrier) if carrier else None
+        span_context = self._emit_span(
+            "conductor.task.execute", SpanKind.CONSUMER, parent, event, event.duration_ms,
+            self._task_attributes(event), cause=cause,
+        )
+        with self._lock:
+            self._remember(self._execute_spans, event.task_id, span_context)
+
+    def _emit_update_span(self, event, duration_ms: float, cause: Optional[BaseException] = None,
+                          retry_count: Optional[int] = None) -> None:
+        with self._lock:
+            execute_span = self._execute_spans.pop(event.task_id, None)
+        if execute_span is None:
+            # Execute span was not sampled (or already evicted).
+            return
+        attributes = self._task_attributes(event)
+        if retry_count is not None:
+            attributes["conductor.update.retry_count"] = retry_count
+        parent = trace.set_span_in_context(NonRecordingSpan(execute_span))
+        self._emit_span("conductor.task.update", SpanKind.CLIENT, parent, event, duration_ms, attributes,
+                        cause=cause)
+
+    def _emit_span(self, name: str, kind, parent, event, duration_ms: float, attributes: Dict[str, Any],
+                   cause: Optional[BaseException] = None):
+        end_ns = _epoch_ns(event.timestamp)
+        start_ns = end_ns - int(duration_ms * 1_000_000)
+        span = self._tracer.start_span(name, context=parent, kind=kind, attributes=attributes,
+                                       start_time=start_ns)
+        if cause is not None:
+            span.set_status(Status(StatusCode.ERROR, type(cause).__name__))
+            if isinstance(cause, BaseException):
+                span.record_exception(cause, timestamp=end_ns)
+        span.end(end_time=end_ns)
+        return span.get_span_context()
+
+    @staticmethod
+    def _task_attributes(event) -> Dict[str, Any]:
+        attributes = {
+            "conductor.task.type": event.task_type,
+            "conductor.task.id": event.task_id,
+            "conductor.worker.id": event.worker_id,
+        }
+        if event.workflow_instance_id:
+            attributes["conductor.workflow.instance_id"] = event.workflow_instance_id
+        return attributes
+
+    def _count_error(self, phase: str, task_type: str, cause) -> None:
+        exception = type(cause).__name__ if isinstance(cause, BaseException) else str(cause)
+        self._errors.add(1, {"conductor.task.type": task_type, "phase": phase, "exception": exception})
+
+    def _poll_sampled(self) -> bool:
+        return self.poll_sample_ratio >= 1.0 or random.random() < self.poll_sample_ratio
+
+    def _remember(self, store: "collections.OrderedDict", key: str, value: Any) -> None:
+        store[key] = value
+        if len(store) > self.max_tracked_tasks:
+            store.popitem(last=False)
@@ -0,0 +1,19 @@
+"""Local stand-ins for a Conductor server, for exercising workers and workflows in tests and benchmarks."""
+
+from conductor.client.testing.expression_evaluator import ExpressionError, evaluate_expression
+from conductor.client.testing.local_server import FaultInjection, LocalConductorServer
+from conductor.client.testing.local_workflow_engine import (
+    LocalAsyncTaskClient,
+    LocalTaskClient,
+    LocalWorkflowEngine,
+)
+
+__all__ = [
+    "ExpressionError",
+    "FaultInjection",
+    "LocalAsyncTaskClient",
+    "LocalConductorServer",
+    "LocalTaskClient",
+    "LocalWorkflowEngine",
+    "evaluate_expression",
+]
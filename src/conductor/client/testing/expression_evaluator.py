@@ -0,0 +1,140 @@
+"""
+Expression evaluation for the local workflow engine.
+
+Conductor evaluates SWITCH, INLINE and DO_WHILE expressions with a JavaScript
+engine on the server. Locally, :func:`evaluate_expression` supports
+``value-param`` and a best-effort subset of JavaScript that covers what the
+DSL and most hand-written definitions use:
+
+* ``$.path.to.value`` / ``$['key']`` property access (missing keys are ``null``)
+* comparison, arithmetic and logical operators (``===``, ``!==``, ``&&``,
+  ``||``, ``!``), ``true``/``false``/``null``/``undefined``, ``.length``
+* ``if (cond) { value; } else { value; }`` and ``cond ? a : b`` returning a value
+* ``(function () { ... return value; })()`` wrappers around a single
+  ``return`` statement
+
+Anything else raises :class:`ExpressionError`; plug a real JavaScript engine
+in through ``LocalWorkflowEngine(evaluator=...)``.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict
+
+Evaluator = Callable[[str, str, Dict[str, Any]], Any]
+"""(evaluator_type, expression, context) -> value; ``context`` is bound to ``$``."""
+
+JAVASCRIPT_EVALUATORS = ("javascript", "graaljs")
+VALUE_PARAM_EVALUATOR = "value-param"
+
+_STRING_LITERAL = re.compile(r"""('(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")""")
+_IF_ELSE = re.compile(r"^\s*if\s*\((.*)\)\s*\{\s*(?:return\s+)?(.*?);?\s*\}\s*else\s*\{\s*(?:return\s+)?(.*?);?\s*\}\s*;?\s*$",
+                      re.DOTALL)
+_FUNCTION_WRAPPER = re.compile(r"^\s*\(\s*function\s*\w*\s*\(\s*\)\s*\{\s*return\s+(.*?);?\s*\}\s*\)\s*\(\s*\)\s*;?\s*$",
+                               re.DOTALL)
+_TERNARY = re.compile(r"^(.*?)\?(.*):(.*)$", re.DOTALL)
+_JS_TOKENS = [
+    (re.compile(r"===|!=="), lambda m: "==" if m.group(0) == "===" else "!="),
+    (re.compile(r"&&"), lambda m: " and "),
+    (re.compile(r"\|\|"), lambda m: " or "),
+    (re.compile(r"!(?!=)"), lambda m: " not "),
+    (re.compile(r"\btrue\b"), lambda m: "True"),
+    (re.compile(r"\bfalse\b"), lambda m: "False"),
+    (re.compile(r"\b(?:null|undefined)\b"), lambda m: "None"),
+    (re.compile(r"\$"), lambda m: "_ctx"),
+]
+
+
+class ExpressionError(Exception):
+    """The expression could not be evaluated locally."""
+
+
+class _JsValue:
+    """Wraps dicts and lists so that JavaScript-style property access works in translated expressions."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def __getattr__(self, name: str) -> Any:
+        value = self._value
+        if name == "length" and isinstance(value, (list, str)):
+            return len(value)
+        if isinstance(value, dict):
+            return _wrap(value.get(name))
+        return None
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._value
+        try:
+            return _wrap(value[key])
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    def __eq__(self, other: Any) -> bool:
+        return self._value == _unwrap(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return self._value != _unwrap(other)
+
+    def __bool__(self) -> bool:
+        return bool(self._value)
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+    __hash__ = None
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return _JsValue(value)
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, _JsValue):
+        return value._value
+    return value
+
+
+def translate_javascript(expression: str) -> str:
+    """Translate a JavaScript expression from the supported subset into a Python expression over ``_ctx``."""
+    match = _FUNCTION_WRAPPER.match(expression)
+    if match:
+        return translate_javascript(match.group(1))
+    match = _IF_ELSE.match(expression)
+    if match:
+        condition, then, otherwise = (translate_javascript(part) for part in match.groups())
+        return f"(({then}) if ({condition}) else ({otherwise}))"
+
+    parts = _STRING_LITERAL.split(expression.strip().rstrip(";"))
+    code_parts = parts[0::2]
+    joined = "\x00".join(code_parts)
+    if any(token in joined for token in ("{", "function", "=>", "var ", "let ", "const ", "return", "__")):
+        raise ExpressionError(f"unsupported JavaScript for local evaluation: {expression!r}")
+    match = _TERNARY.match(joined)
+    if match and "?" not in match.group(1):
+        condition, then, otherwise = match.groups()
+        joined = f"(({then}) if ({condition}) else ({otherwise}))"
+    for pattern, replacement in _JS_TOKENS:
+        joined = pattern.sub(replacement, joined)
+    code_parts = joined.split("\x00")
+    parts[0::2] = code_parts
+    return "".join(parts).strip()
+
+
+def evaluate_expression(evaluator_type: str, expression: str, context: Dict[str, Any]) -> Any:
+    """Default evaluator of :class:`LocalWorkflowEngine`."""
+    if evaluator_type == VALUE_PARAM_EVALUATOR:
+        return context.get(expression)
+    if evaluator_type not in JAVASCRIPT_EVALUATORS:
+        raise ExpressionError(f"unsupported evaluator type: {evaluator_type!r}")
+    code = translate_javascript(expression)
+    try:
+        result = eval(code, {"__builtins__": {}}, {"_ctx": _JsValue(context)})
+    except Exception as e:
+        raise ExpressionError(f"failed to evaluate {expression!r} locally: {e}") from e
+    return _unwrap(result)
@@ -0,0 +1,421 @@
+"""
+Local HTTP stand-in for a Conductor server, for load-testing worker fleets.
+
+``LocalConductorServer`` serves the endpoints workers and the workflow client
+use most — task poll (batch and single), task update (v1 and ``update-v2``),
+``/token``, workflow start/get and task/workflow definition registration —
+from a :class:`LocalWorkflowEngine`, over plain HTTP/1.1 with keep-alive.
+Any ``Configuration(server_api_url=server.url)`` can point at it, so
+``TaskHandler`` worker processes run unchanged.
+
+:class:`FaultInjection` adds latency and injects failures per request:
+5xx responses, ``401 EXPIRED_TOKEN`` (which makes clients refresh their token),
+abrupt disconnects, and graceful connection recycling after a number of
+requests (the HTTP/1.1 analogue of an HTTP/2 GOAWAY).
+
+Two extra endpoints drive load tests: ``POST /api/_local/seed/{taskType}?count=N``
+enqueues N single-task workflows, and ``GET /api/_local/stats`` returns request,
+task and pickup-latency counters.
+
+Run standalone::
+
+    python -m conductor.client.testing.local_server --port 8080 --latency-ms 5 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import TaskDef, TaskResult
+from conductor.client.testing.local_workflow_engine import LocalWorkflowEngine
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+_SERIALIZER = ApiClient.__new__(ApiClient)
+_REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+            500: "Internal Server Error", 503: "Service Unavailable"}
+_DISCONNECT = object()
+
+
+@dataclass
+class FaultInjection:
+    """
+    Latency and failures applied to requests whose path (without ``/api``) starts with one of ``paths``.
+
+    Rates are probabilities per request, checked in order: disconnect, 401, 5xx.
+    """
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    unauthorized_rate: float = 0.0
+    disconnect_rate: float = 0.0
+    max_requests_per_connection: int = 0
+    paths: Tuple[str, ...] = ()
+    seed: Optional[int] = None
+
+    def applies_to(self, path: str) -> bool:
+        return not self.paths or path.startswith(self.paths)
+
+
+class _Response:
+    __slots__ = ("status", "body", "content_type")
+
+    def __init__(self, status: int = 200, body: Any = None, content_type: str = "application/json"):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+
+    def encode(self) -> bytes:
+        if self.body is None:
+            return b""
+        if isinstance(self.body, str) and self.content_type == "text/plain":
+            return self.body.encode("utf-8")
+        return json.dumps(_SERIALIZER.sanitize_for_serialization(self.body), separators=(",", ":")).encode("utf-8")
+
+
+class LocalConductorServer:
+    """
+    Asyncio HTTP server exposing a :class:`LocalWorkflowEngine` through the Conductor REST API.
+
+    Use ``await start()`` / ``await stop()`` inside a running loop, or ``start_in_thread()`` /
+    ``stop_in_thread()`` (also ``with LocalConductorServer() as server:``) to run it on a background thread.
+    When ``key_id`` and ``key_secret`` are set, every call other than ``/token`` and ``/_local/...`` requires
+    the issued token.
+    """
+
+    def __init__(self,
+                 engine: Optional[LocalWorkflowEngine] = None,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 faults: Optional[FaultInjection] = None,
+                 key_id: Optional[str] = None,
+                 key_secret: Optional[str] = None,
+                 max_long_polls: int = 256):
+        self.engine = engine or LocalWorkflowEngine()
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultInjection()
+        self.key_id = key_id
+        self.key_secret = key_secret
+        self._tokens = set()
+        self._random = random.Random(self.faults.seed)
+        self._long_polls = ThreadPoolExecutor(max_workers=max_long_polls, thread_name_prefix="local-server-poll")
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self._started_cpu = time.process_time()
+        self.stats: Dict[str, int] = {"requests": 0, "connections": 0, "injected_errors": 0,
+                                      "injected_unauthorized": 0, "injected_disconnects": 0,
+                                      "recycled_connections": 0}
+
+    @property
+    def url(self) -> str:
+        """``server_api_url`` for a ``Configuration`` pointed at this server."""
+        return f"http://{self.host}:{self.port}/api"
+
+    # -- Lifecycle ---------------------------------------------------------------------------------
+
+    async def start(self) -> "LocalConductorServer":
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._serve_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Local Conductor server listening on %s", self.url)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for writer in list(self._connections.values()):
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        self._long_polls.shutdown(wait=False, cancel_futures=True)
+
+    def start_in_thread(self) -> "LocalConductorServer":
+        started = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True, name="LocalConductorServer")
+        self._thread.start()
+        if not started.wait(10):
+            raise RuntimeError("local Conductor server failed to start")
+        return self
+
+    def stop_in_thread(self) -> None:
+        loop = self._loop
+        if loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), loop).result(10)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(10)
+        self._thread = None
+        loop.close()
+
+    def __enter__(self) -> "LocalConductorServer":
+        return self.start_in_thread()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop_in_thread()
+
+    # -- HTTP --------------------------------------------------------------------------------------
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.stats["connections"] += 1
+        connection = asyncio.current_task()
+        self._connections[connection] = writer
+        served = 0
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    return
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await self._read_body(reader, headers)
+
+                response = await self._handle(method, target, headers, body)
+                if response is _DISCONNECT:
+                    writer.transport.abort()
+                    return
+                served += 1
+                limit = self.faults.max_requests_per_connection
+                close = headers.get("connection", "").lower() == "close" or (limit and served >= limit)
+                if close and limit and served >= limit:
+                    self.stats["recycled_connections"] += 1
+                payload = response.encode()
+                writer.write(
+                    f"HTTP/1.1 {response.status} {_REASONS.get(response.status, 'Error')}\r\n"
+                    f"Content-Type: {response.content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode("latin-1") + payload
+                )
+                await writer.drain()
+                if close:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            return
+        finally:
+            self._connections.pop(connection, None)
+            writer.close()
+
+    @staticmethod
+    async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                chunk = await reader.readexactly(size + 2)
+                if size == 0:
+                    return b"".join(chunks)
+                chunks.append(chunk[:-2])
+        length = int(headers.get("content-length") or 0)
+        return await reader.readexactly(length) if length else b""
+
+    async def _handle(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Any:
+        self.stats["requests"] += 1
+        parts = urlsplit(target)
+        path = parts.path[4:] if parts.path.startswith("/api/") else parts.path
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+        faults = self.faults
+        if faults.applies_to(path):
+            delay = faults.latency_ms + (self._random.uniform(0, faults.latency_jitter_ms)
+                                         if faults.latency_jitter_ms else 0)
+            if delay > 0:
+                await asyncio.sleep(delay / 1000.0)
+            roll = self._random.random()
+            if roll < faults.disconnect_rate and not path.startswith("/_local/"):
+                self.stats["injected_disconnects"] += 1
+                return _DISCONNECT
+            roll -= faults.disconnect_rate
+            if roll < faults.unauthorized_rate and path != "/token":
+                self.stats["injected_unauthorized"] += 1
+                return _Response(401, {"error": "EXPIRED_TOKEN", "message": "injected"})
+            roll -= faults.unauthorized_rate
+            if roll < faults.error_rate:
+                self.stats["injected_errors"] += 1
+                return _Response(faults.error_status, {"message": "injected failure"})
+
+        if self.key_id and path != "/token" and not path.startswith("/_local/") \
+                and headers.get("x-authorization") not in self._tokens:
+            return _Response(401, {"error": "INVALID_TOKEN", "message": "missing or unknown token"})
+        try:
+            payload = json.loads(body) if body else None
+            return await self._route(method, path, query, payload)
+        except KeyError as e:
+            return _Response(404, {"message": f"not found: {e}"})
+        except Exception as e:
+            logger.debug("Local server failed %s %s: %s", method, path, e)
+            return _Response(500, {"message": str(e)})
+
+    # -- Routes ------------------------------------------------------------------------------------
+
+    async def _route(self, method: str, path: str, query: Dict[str, str], payload: Any) -> _Response:
+        engine = self.engine
+        segments = [unquote(segment) for segment in path.strip("/").split("/")]
+        route = (method, *segments[:2])
+
+        if route == ("GET", "tasks", "poll"):
+            if segments[2] == "batch":
+                tasks = await self._poll(segments[3], query, int(query.get("count", 1)))
+                return _Response(200, tasks)
+            tasks = await self._poll(segments[2], query, 1)
+            return _Response(200, tasks[0] if tasks else None)
+        if method == "POST" and segments == ["tasks"]:
+            result = _SERIALIZER.deserialize_class(payload, TaskResult)
+            engine.update(result)
+            return _Response(200, result.task_id, "text/plain")
+        if method == "POST" and segments == ["tasks", "update-v2"]:
+            return _Response(200, engine.update(_SERIALIZER.deserialize_class(payload, TaskResult), return_next=True))
+        if method == "POST" and segments == ["token"]:
+            if self.key_id and (payload or {}).get("keyId") != self.key_id \
+                    or self.key_secret and (payload or {}).get("keySecret") != self.key_secret:
+                return _Response(401, {"error": "INVALID_CREDENTIALS"})
+            token = uuid.uuid4().hex
+            self._tokens.add(token)
+            return _Response(200, {"token": token})
+        if method == "GET" and segments == ["health"]:
+            return _Response(200, {"healthy": True})
+
+        if route[:2] == ("POST", "workflow"):
+            if len(segments) == 1:
+                request = payload or {}
+                workflow = request.get("workflowDef") or request["name"]
+                workflow_id = engine.start_workflow(workflow, request.get("input") or {},
+                                                    request.get("correlationId"), request.get("taskToDomain"),
+                                                    version=request.get("version"))
+            else:
+                version = query.get("version")
+                workflow_id = engine.start_workflow(segments[1], payload or {}, query.get("correlationId"),
+                                                    version=int(version) if version else None)
+            return _Response(200, workflow_id, "text/plain")
+        if route[:2] == ("GET", "workflow") and len(segments) == 2:
+            include_tasks = query.get("includeTasks", "true").lower() != "false"
+            return _Response(200, engine.get_workflow(segments[1], include_tasks=include_tasks))
+
+        if route in (("POST", "metadata", "workflow"), ("PUT", "metadata", "workflow")):
+            for definition in payload if isinstance(payload, list) else [payload]:
+                engine.register_workflow(definition, overwrite=method == "PUT" or None)
+            return _Response(200)
+        if route in (("POST", "metadata", "taskdefs"), ("PUT", "metadata", "taskdefs")):
+            for definition in payload if isinstance(payload, list) else [payload]:
+                engine.register_task_def(_SERIALIZER.deserialize_class(definition, TaskDef))
+            return _Response(200)
+
+        if route == ("POST", "_local", "seed"):
+            workflow_ids = engine.seed_tasks(segments[2], int(query.get("count", 1)), payload,
+                                             query.get("domain"))
+            return _Response(200, {"seeded": len(workflow_ids)})
+        if route == ("GET", "_local", "stats"):
+            return _Response(200, self.snapshot())
+        raise KeyError(f"{method} {path}")
+
+    async def _poll(self, task_type: str, query: Dict[str, str], count: int) -> List[Any]:
+        worker_id = query.get("workerid")
+        domain = query.get("domain") or None
+        tasks = self.engine.poll(task_type, worker_id, count, 0, domain)
+        timeout_ms = int(query.get("timeout", 0))
+        if tasks or timeout_ms <= 0:
+            return tasks
+        return await asyncio.get_running_loop().run_in_executor(
+            self._long_polls, self.engine.poll, task_type, worker_id, count, timeout_ms, domain)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Request/fault counters, engine stats and pickup-latency percentiles (ms)."""
+        latencies = sorted(self.engine.pickup_latencies_ms())
+        pickup = {}
+        if latencies:
+            pickup = {
+                "count": len(latencies),
+                "mean": round(statistics.fmean(latencies), 2),
+                "p50": latencies[len(latencies) // 2],
+                "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+                "max": latencies[-1],
+            }
+        return {**self.stats, **self.engine.stats, "pickup_ms": pickup,
+                "server_cpu_seconds": round(time.process_time() - self._started_cpu, 3)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local Conductor stand-in server for load-testing workers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080, help="0 picks a free port (printed on startup)")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of a 5xx response")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0,
+                        help="probability of a 401 EXPIRED_TOKEN response")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0,
+                        help="probability of dropping the connection without a response")
+    parser.add_argument("--max-requests-per-connection", type=int, default=0,
+                        help="close keep-alive connections after this many requests (0 = never)")
+    parser.add_argument("--fault-path", action="append", default=[],
+                        help="apply faults only to paths with this prefix, e.g. /tasks/poll (repeatable)")
+    parser.add_argument("--response-timeout-seconds", type=float, default=None,
+                        help="requeue polled tasks not updated within this time (default: never)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--key-id", default=None)
+    parser.add_argument("--key-secret", default=None)
+    args = parser.parse_args(argv)
+
+    faults = FaultInjection(
+        latency_ms=args.latency_ms, latency_jitter_ms=args.latency_jitter_ms,
+        error_rate=args.error_rate, error_status=args.error_status,
+        unauthorized_rate=args.unauthorized_rate, disconnect_rate=args.disconnect_rate,
+        max_requests_per_connection=args.max_requests_per_connection,
+        paths=tuple(args.fault_path), seed=args.seed,
+    )
+    engine = LocalWorkflowEngine(response_timeout_seconds=args.response_timeout_seconds)
+    server = LocalConductorServer(engine, host=args.host, port=args.port, faults=faults,
+                                  key_id=args.key_id, key_secret=args.key_secret)
+
+    async def serve():
+        await server.start()
+        print(server.url, flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,984 @@
+"""
+In-process workflow engine for running workers and DSL workflows without a server.
+
+``LocalWorkflowEngine`` interprets the ``WorkflowDef`` produced by
+``ConductorWorkflow`` and serves the task poll/update calls ``TaskRunner`` and
+``AsyncTaskRunner`` make, so real workers can be exercised end to end in CI and
+SDK-side throughput can be measured without network or server cost::
+
+    engine = LocalWorkflowEngine()
+    workflow = ConductorWorkflow(executor=engine, name="greetings")
+    workflow >> greet(task_ref_name="greet", name=workflow.input("name"))
+
+    runner = TaskRunner(worker=Worker("greet", greet))
+    engine.attach(runner)
+    threading.Thread(target=runner.run, daemon=True).start()
+
+    workflow_id = workflow.start_workflow_with_input({"name": "Orkes"})
+    engine.wait_for_workflow(workflow_id, timeout=5)
+
+Supported task types: SIMPLE, DYNAMIC, SWITCH, FORK_JOIN, FORK_JOIN_DYNAMIC,
+JOIN, DO_WHILE, SUB_WORKFLOW, INLINE, WAIT, SET_VARIABLE and TERMINATE. Other
+system tasks can be supplied through ``system_task_handlers``. Polled tasks
+that are not updated within their response timeout are requeued. Not modelled:
+other task timeouts, rate limits, event handlers and the full JSONPath syntax
+(``${...}`` references support dotted paths and ``[index]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import itertools
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import StartWorkflowRequest, Task, TaskDef, TaskResult, Workflow, WorkflowDef
+from conductor.client.http.models.workflow_run import WorkflowRun
+from conductor.client.testing.expression_evaluator import Evaluator, evaluate_expression
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+SystemTaskHandler = Callable[[Dict[str, Any]], Dict[str, Any]]
+"""Executes a system task locally: resolved task input -> task output."""
+
+RUNNING = "RUNNING"
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+TERMINATED = "TERMINATED"
+
+SCHEDULED = "SCHEDULED"
+IN_PROGRESS = "IN_PROGRESS"
+FAILED_WITH_TERMINAL_ERROR = "FAILED_WITH_TERMINAL_ERROR"
+COMPLETED_WITH_ERRORS = "COMPLETED_WITH_ERRORS"
+CANCELED = "CANCELED"
+
+_WORKER_TASK_TYPES = ("SIMPLE", "DYNAMIC")
+_REFERENCE = re.compile(r"\$\{([^}]+)\}")
+_PATH_TOKEN = re.compile(r"[^.\[\]]+")
+_DURATION = re.compile(r"(\d+)\s*(d|days?|h|hrs?|hours?|m|mins?|minutes?|s|secs?|seconds?)\b", re.IGNORECASE)
+_DURATION_SECONDS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+
+_SERIALIZER = ApiClient.__new__(ApiClient)
+
+
+def _status_name(status: Any) -> str:
+    if isinstance(status, Enum):
+        return status.name
+    return str(status)
+
+
+def _parse_duration(duration: str) -> float:
+    matches = _DURATION.findall(duration)
+    if not matches:
+        raise ValueError(f"invalid WAIT duration: {duration!r}")
+    return sum(int(amount) * _DURATION_SECONDS[unit[0].lower()] for amount, unit in matches)
+
+
+def _parse_until(until: str) -> float:
+    for fmt in ("%Y-%m-%d %H:%M %Z", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            parsed = datetime.datetime.strptime(until, fmt)
+            break
+        except ValueError:
+            continue
+    else:
+        parsed = datetime.datetime.fromisoformat(until)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def _lookup_path(value: Any, tokens: List[str]) -> Any:
+    for token in tokens:
+        if isinstance(value, dict):
+            value = value.get(token)
+        elif isinstance(value, list) and token.lstrip("-").isdigit():
+            index = int(token)
+            value = value[index] if -len(value) <= index < len(value) else None
+        else:
+            return None
+    return value
+
+
+class _TaskRecord:
+    __slots__ = (
+        "task_id", "execution", "definition", "reference_name", "task_type", "task_def_name", "status",
+        "input_data", "output_data", "reason", "domain", "worker_id", "poll_count", "retry_count", "seq",
+        "iteration", "scheduled_time", "start_time", "end_time", "on_done", "timer", "sub_workflow_id",
+        "lease_deadline",
+    )
+
+    def __init__(self, execution: "_Execution", definition: Dict[str, Any], reference_name: str,
+                 task_type: str, task_def_name: str, iteration: int, seq: int):
+        self.task_id = str(uuid.uuid4())
+        self.execution = execution
+        self.definition = definition
+        self.reference_name = reference_name
+        self.task_type = task_type
+        self.task_def_name = task_def_name
+        self.status = SCHEDULED
+        self.input_data: Dict[str, Any] = {}
+        self.output_data: Dict[str, Any] = {}
+        self.reason = None
+        self.domain = None
+        self.worker_id = None
+        self.poll_count = 0
+        self.retry_count = 0
+        self.seq = seq
+        self.iteration = iteration
+        self.scheduled_time = int(time.time() * 1000)
+        self.start_time = None
+        self.end_time = None
+        self.on_done: Optional[Callable[[], None]] = None
+        self.timer: Optional[threading.Timer] = None
+        self.sub_workflow_id = None
+        self.lease_deadline: Optional[float] = None
+
+    def to_task(self) -> Task:
+        return Task(
+            task_type=self.task_type,
+            status=self.status,
+            input_data=self.input_data,
+            output_data=self.output_data,
+            reference_task_name=self.reference_name,
+            retry_count=self.retry_count,
+            seq=self.seq,
+            correlation_id=self.execution.correlation_id,
+            poll_count=self.poll_count,
+            task_def_name=self.task_def_name,
+            scheduled_time=self.scheduled_time,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            reason_for_incompletion=self.reason,
+            worker_id=self.worker_id,
+            workflow_instance_id=self.execution.workflow_id,
+            workflow_type=self.execution.name,
+            task_id=self.task_id,
+            domain=self.domain,
+            iteration=self.iteration or None,
+            sub_workflow_id=self.sub_workflow_id,
+        )
+
+
+class _Execution:
+    __slots__ = (
+        "workflow_id", "definition", "name", "version", "input", "output", "variables", "status", "reason",
+        "correlation_id", "task_to_domain", "tasks", "refs", "parent", "start_time", "end_time", "done",
+    )
+
+    def __init__(self, workflow_id: str, definition: Dict[str, Any], workflow_input: Dict[str, Any],
+                 correlation_id: Optional[str], task_to_domain: Optional[Dict[str, str]],
+                 parent: Optional[_TaskRecord]):
+        self.workflow_id = workflow_id
+        self.definition = definition
+        self.name = definition.get("name")
+        self.version = definition.get("version")
+        self.input = workflow_input
+        self.output: Dict[str, Any] = {}
+        self.variables = dict(definition.get("variables") or {})
+        self.status = RUNNING
+        self.reason = None
+        self.correlation_id = correlation_id
+        self.task_to_domain = task_to_domain or {}
+        self.tasks: List[_TaskRecord] = []
+        self.refs: Dict[str, _TaskRecord] = {}
+        self.parent = parent
+        self.start_time = int(time.time() * 1000)
+        self.end_time = None
+        self.done = threading.Event()
+
+
+class LocalWorkflowEngine:
+    """
+    In-memory interpreter for Conductor workflow definitions.
+
+    Duck-types the ``WorkflowExecutor`` methods ``ConductorWorkflow`` calls (``register_workflow``,
+    ``start_workflow``, ``execute_workflow``), and serves worker polls through :meth:`task_client` /
+    :meth:`async_task_client` or :meth:`attach`. All state is guarded by one lock; workflows advance on the
+    thread that completes the task they were waiting on.
+    """
+
+    def __init__(self,
+                 evaluator: Optional[Evaluator] = None,
+                 system_task_handlers: Optional[Dict[str, SystemTaskHandler]] = None,
+                 skip_wait_durations: bool = False,
+                 default_retry_count: int = 0,
+                 response_timeout_seconds: Optional[float] = None):
+        self.evaluator = evaluator or evaluate_expression
+        self.system_task_handlers = dict(system_task_handlers or {})
+        self.skip_wait_durations = skip_wait_durations
+        self.default_retry_count = default_retry_count
+        self.response_timeout_seconds = response_timeout_seconds
+        self._lock = threading.RLock()
+        self._definitions: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._task_defs: Dict[str, TaskDef] = {}
+        self._executions: Dict[str, _Execution] = {}
+        self._tasks: Dict[str, _TaskRecord] = {}
+        self._queues: Dict[Tuple[str, Optional[str]], Deque[_TaskRecord]] = {}
+        self._queue_conditions: Dict[Tuple[str, Optional[str]], threading.Condition] = {}
+        self._leases: Dict[Tuple[str, Optional[str]], Deque[Tuple[float, _TaskRecord]]] = {}
+        self._seq = itertools.count(1)
+        self.stats = {"polls": 0, "tasks_polled": 0, "updates": 0, "tasks_timed_out": 0, "workflows_started": 0,
+                      "workflows_completed": 0, "workflows_failed": 0}
+
+    # -- Definitions -----------------------------------------------------------------------------
+
+    def register_workflow(self, workflow: Any, overwrite: Optional[bool] = None) -> None:
+        """Register a WorkflowDef, ConductorWorkflow or camelCase definition dict for start-by-name."""
+        definition = self._to_definition(workflow)
+        key = (definition["name"], definition.get("version") or 1)
+        with self._lock:
+            if key in self._definitions and overwrite is False:
+                raise ValueError(f"workflow {key[0]} version {key[1]} is already registered")
+            self._definitions[key] = definition
+
+    def register_task_def(self, task_def: TaskDef) -> None:
+        """
+        Use ``task_def.retry_count`` and ``response_timeout_seconds`` for SIMPLE tasks of that name (defaulting to
+        ``default_retry_count`` and ``response_timeout_seconds``).
+        """
+        with self._lock:
+            self._task_defs[task_def.name] = task_def
+
+    @staticmethod
+    def _to_definition(workflow: Any) -> Dict[str, Any]:
+        if hasattr(workflow, "to_workflow_def"):
+            workflow = workflow.to_workflow_def()
+        if isinstance(workflow, WorkflowDef):
+            workflow = _SERIALIZER.sanitize_for_serialization(workflow)
+        if not isinstance(workflow, dict) or not workflow.get("name"):
+            raise ValueError(f"not a workflow definition: {type(workflow)}")
+        return workflow
+
+    def _find_definition(self, name: str, version: Optional[int]) -> Dict[str, Any]:
+        if version is not None and (name, version) in self._definitions:
+            return self._definitions[(name, version)]
+        versions = [v for (n, v) in self._definitions if n == name]
+        if version is None and versions:
+            return self._definitions[(name, max(versions))]
+        raise KeyError(f"workflow {name} version {version} is not registered")
+
+    # -- Workflow API ------------------------------------------------------------------------------
+
+    def start_workflow(self,
+                       workflow: Union[StartWorkflowRequest, WorkflowDef, Dict[str, Any], str, Any],
+                       workflow_input: Optional[Dict[str, Any]] = None,
+                       correlation_id: Optional[str] = None,
+                       task_to_domain: Optional[Dict[str, str]] = None,
+                       version: Optional[int] = None) -> str:
+        """
+        Start a workflow and run it until it waits on a worker, a timer or a signal.
+
+        ``workflow`` is a StartWorkflowRequest (with an inline ``workflow_def`` or a registered name), a registered
+        workflow name, or a definition (WorkflowDef, ConductorWorkflow or camelCase dict).
+        """
+        with self._lock:
+            if isinstance(workflow, StartWorkflowRequest):
+                request = workflow
+                if request.workflow_def is not None:
+                    definition = self._to_definition(request.workflow_def)
+                else:
+                    definition = self._find_definition(request.name, request.version)
+                return self._start(definition, request.input or {}, request.correlation_id,
+                                   request.task_to_domain, None)
+            if isinstance(workflow, str):
+                definition = self._find_definition(workflow, version)
+            else:
+                definition = self._to_definition(workflow)
+            return self._start(definition, workflow_input or {}, correlation_id, task_to_domain, None)
+
+    def execute_workflow(self, request: StartWorkflowRequest, wait_until_task_ref: Optional[str] = None,
+                         wait_for_seconds: int = 10, request_id: Optional[str] = None) -> WorkflowRun:
+        """Start a workflow and wait for it to finish (or reach ``wait_until_task_ref``), like the server does."""
+        workflow_id = self.start_workflow(request)
+        deadline = time.monotonic() + wait_for_seconds
+        execution = self._executions[workflow_id]
+        while time.monotonic() < deadline and not execution.done.is_set():
+            if wait_until_task_ref:
+                with self._lock:
+                    if wait_until_task_ref in execution.refs:
+                        break
+            execution.done.wait(0.01)
+        with self._lock:
+            return WorkflowRun(
+                correlation_id=execution.correlation_id,
+                create_time=execution.start_time,
+                input=execution.input,
+                output=execution.output,
+                request_id=request_id,
+                status=execution.status,
+                tasks=[record.to_task() for record in execution.tasks],
+                update_time=execution.end_time,
+                variables=execution.variables,
+                workflow_id=workflow_id,
+                reason_for_incompletion=execution.reason,
+            )
+
+    def get_workflow(self, workflow_id: str, include_tasks: bool = True) -> Workflow:
+        with self._lock:
+            execution = self._executions[workflow_id]
+            return Workflow(
+                status=execution.status,
+                workflow_id=workflow_id,
+                parent_workflow_id=execution.parent.execution.workflow_id if execution.parent else None,
+                tasks=[record.to_task() for record in execution.tasks] if include_tasks else None,
+                input=execution.input,
+                output=execution.output,
+                correlation_id=execution.correlation_id,
+                reason_for_incompletion=execution.reason,
+                task_to_domain=execution.task_to_domain,
+                variables=execution.variables,
+                start_time=execution.start_time,
+                end_time=execution.end_time,
+                workflow_name=execution.name,
+                workflow_version=execution.version,
+            )
+
+    def wait_for_workflow(self, workflow_id: str, timeout: Optional[float] = None) -> str:
+        """Block until the workflow reaches a terminal status (or ``timeout``) and return its status."""
+        execution = self._executions[workflow_id]
+        execution.done.wait(timeout)
+        return execution.status
+
+    def complete_task(self, workflow_id: str, task_reference_name: str,
+                      output: Optional[Dict[str, Any]] = None, status: str = COMPLETED) -> None:
+        """Signal a WAIT task (or complete any pending task) by reference name."""
+        with self._lock:
+            record = self._executions[workflow_id].refs.get(task_reference_name)
+            if record is None or record.status not in (SCHEDULED, IN_PROGRESS):
+                raise ValueError(f"no pending task {task_reference_name} in workflow {workflow_id}")
+            self._remove_from_queue(record)
+            record.output_data.update(output or {})
+            self._finish_task(record, status)
+
+    def terminate_workflow(self, workflow_id: str, reason: Optional[str] = None) -> None:
+        with self._lock:
+            self._end_workflow(self._executions[workflow_id], TERMINATED, reason)
+
+    def queue_size(self, task_type: str, domain: Optional[str] = None) -> int:
+        with self._lock:
+            return len(self._queues.get((task_type, domain), ()))
+
+    def seed_tasks(self, task_type: str, count: int, task_input: Optional[Dict[str, Any]] = None,
+                   domain: Optional[str] = None) -> List[str]:
+        """Start ``count`` single-task workflows for ``task_type`` to build up queue depth; returns their ids."""
+        definition = {
+            "name": f"seed_{task_type}", "version": 1,
+            "tasks": [{"name": task_type, "taskReferenceName": task_type, "type": "SIMPLE",
+                       "inputParameters": dict(task_input or {})}],
+        }
+        task_to_domain = {task_type: domain} if domain else None
+        with self._lock:
+            return [self._start(definition, {}, None, task_to_domain, None) for _ in range(count)]
+
+    def pickup_latencies_ms(self, task_type: Optional[str] = None) -> List[int]:
+        """Milliseconds from scheduling to (latest) pickup for every task that has been polled."""
+        with self._lock:
+            return [record.start_time - record.scheduled_time for record in self._tasks.values()
+                    if record.start_time is not None and (task_type is None or record.task_def_name == task_type)]
+
+    # -- Worker API --------------------------------------------------------------------------------
+
+    def task_client(self) -> "LocalTaskClient":
+        return LocalTaskClient(self)
+
+    def async_task_client(self) -> "LocalAsyncTaskClient":
+        return LocalAsyncTaskClient(self)
+
+    def attach(self, runner: Any) -> Any:
+        """Point a TaskRunner or AsyncTaskRunner at this engine instead of a server; returns the runner."""
+        if hasattr(runner, "async_task_client"):
+            runner.async_task_client = self.async_task_client()
+            runner._sync_task_client = self.task_client()
+        else:
+            runner.task_client = self.task_client()
+        return runner
+
+    def poll(self, task_type: str, worker_id: Optional[str] = None, count: int = 1, timeout_ms: int = 0,
+             domain: Optional[str] = None) -> List[Task]:
+        key = (task_type, domain or None)
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        with self._lock:
+            self.stats["polls"] += 1
+            queue = self._queues.setdefault(key, deque())
+            condition = self._queue_conditions.setdefault(key, threading.Condition(self._lock))
+            self._expire_leases(key)
+            while not queue:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                condition.wait(remaining)
+            tasks = []
+            while queue and len(tasks) < count:
+                tasks.append(self._start_polled(queue.popleft(), worker_id))
+            return tasks
+
+    def update(self, result: TaskResult, return_next: bool = False) -> Optional[Task]:
+        with self._lock:
+            self.stats["updates"] += 1
+            record = self._tasks.get(result.task_id)
+            if record is None or record.status not in (SCHEDULED, IN_PROGRESS):
+                return None
+            status = _status_name(result.status)
+            if record.status == SCHEDULED:
+                self._remove_from_queue(record)
+            if result.output_data:
+                record.output_data.update(result.output_data)
+            record.reason = result.reason_for_incompletion
+            if status == IN_PROGRESS:
+                if result.extend_lease:
+                    self._lease(record)
+                else:
+                    self._requeue(record, result.callback_after_seconds or 0)
+            else:
+                self._finish_task(record, status)
+            if return_next:
+                queue = self._queues.get((record.task_def_name, record.domain))
+                if queue:
+                    return self._start_polled(queue.popleft(), result.worker_id)
+            return None
+
+    def _start_polled(self, record: _TaskRecord, worker_id: Optional[str]) -> Task:
+        record.status = IN_PROGRESS
+        record.worker_id = worker_id
+        record.poll_count += 1
+        record.start_time = int(time.time() * 1000)
+        self.stats["tasks_polled"] += 1
+        self._lease(record)
+        return record.to_task()
+
+    def _lease(self, record: _TaskRecord) -> None:
+        task_def = self._task_defs.get(record.task_def_name)
+        timeout = task_def.response_timeout_seconds if task_def is not None else None
+        timeout = timeout or self.response_timeout_seconds
+        if timeout:
+            record.lease_deadline = time.monotonic() + timeout
+            self._leases.setdefault((record.task_def_name, record.domain), deque()).append(
+                (record.lease_deadline, record))
+
+    def _expire_leases(self, key: Tuple[str, Optional[str]]) -> None:
+        """Requeue tasks on ``key`` whose worker did not update them within the response timeout."""
+        leases = self._leases.get(key)
+        now = time.monotonic()
+        while leases and leases[0][0] <= now:
+            deadline, record = leases.popleft()
+            if record.status == IN_PROGRESS and record.lease_deadline == deadline and record.execution.status == RUNNING:
+                self.stats["tasks_timed_out"] += 1
+                self._enqueue(record)
+
+    def _enqueue(self, record: _TaskRecord) -> None:
+        record.status = SCHEDULED
+        key = (record.task_def_name, record.domain)
+        self._queues.setdefault(key, deque()).append(record)
+        condition = self._queue_conditions.get(key)
+        if condition is not None:
+            condition.notify()
+
+    def _remove_from_queue(self, record: _TaskRecord) -> None:
+        if record.timer is not None:
+            record.timer.cancel()
+            record.timer = None
+        queue = self._queues.get((record.task_def_name, record.domain))
+        if queue and record.status == SCHEDULED:
+            try:
+                queue.remove(record)
+            except ValueError:
+                pass
+
+    def _requeue(self, record: _TaskRecord, delay_seconds: float) -> None:
+        record.status = SCHEDULED
+        if delay_seconds <= 0:
+            self._enqueue(record)
+        else:
+            self._after(delay_seconds, record, lambda: record.status == SCHEDULED and self._enqueue(record))
+
+    def _after(self, delay_seconds: float, record: _TaskRecord, action: Callable[[], Any]) -> None:
+        def fire():
+            with self._lock:
+                record.timer = None
+                if record.execution.status == RUNNING:
+                    action()
+
+        record.timer = threading.Timer(delay_seconds, fire)
+        record.timer.daemon = True
+        record.timer.start()
+
+    # -- Interpreter -------------------------------------------------------------------------------
+
+    def _start(self, definition: Dict[str, Any], workflow_input: Dict[str, Any], correlation_id: Optional[str],
+               task_to_domain: Optional[Dict[str, str]], parent: Optional[_TaskRecord]) -> str:
+        workflow_id = str(uuid.uuid4())
+        execution = _Execution(workflow_id, definition, workflow_input, correlation_id, task_to_domain, parent)
+        self._executions[workflow_id] = execution
+        self.stats["workflows_started"] += 1
+        if self._run_sequence(execution, definition.get("tasks") or [], 0, 0, lambda: self._complete(execution)):
+            self._complete(execution)
+        return workflow_id
+
+    def _complete(self, execution: _Execution) -> None:
+        if execution.status != RUNNING:
+            return
+        output_parameters = execution.definition.get("outputParameters")
+        if output_parameters:
+            execution.output = self._resolve(output_parameters, execution)
+        elif execution.tasks:
+            execution.output = dict(execution.tasks[-1].output_data)
+        self._end_workflow(execution, COMPLETED, None)
+
+    def _end_workflow(self, execution: _Execution, status: str, reason: Optional[str]) -> None:
+        if execution.status != RUNNING:
+            return
+        execution.status = status
+        execution.reason = reason
+        execution.end_time = int(time.time() * 1000)
+        self.stats["workflows_completed" if status == COMPLETED else "workflows_failed"] += 1
+        for record in execution.tasks:
+            if record.status in (SCHEDULED, IN_PROGRESS):
+                self._remove_from_queue(record)
+                record.status = CANCELED
+            if record.sub_workflow_id is not None:
+                child = self._executions.get(record.sub_workflow_id)
+                if child is not None and child.status == RUNNING:
+                    self._end_workflow(child, TERMINATED, f"parent workflow {status.lower()}")
+        execution.done.set()
+        parent = execution.parent
+        if parent is not None and parent.status == IN_PROGRESS:
+            parent.output_data.update(execution.output)
+            parent.output_data["subWorkflowId"] = execution.workflow_id
+            if status != COMPLETED:
+                parent.reason = reason or f"sub workflow {status.lower()}"
+            self._finish_task(parent, COMPLETED if status == COMPLETED else FAILED)
+
+    def _run_sequence(self, execution: _Execution, tasks: List[Dict[str, Any]], index: int, iteration: int,
+                      on_done: Callable[[], None]) -> bool:
+        """
+        Run ``tasks[index:]``. Returns True if the sequence finished synchronously; otherwise ``on_done`` is
+        called when it finishes later (and never if the workflow ends first).
+        """
+        while index < len(tasks):
+            if execution.status != RUNNING:
+                return False
+            next_index = index + 1
+
+            def resume(next_index=next_index):
+                if self._run_sequence(execution, tasks, next_index, iteration, on_done):
+                    on_done()
+
+            if not self._run_task(execution, tasks[index], iteration, resume):
+                return False
+            index = next_index
+        return execution.status == RUNNING
+
+    def _new_record(self, execution: _Execution, definition: Dict[str, Any], iteration: int,
+                    task_def_name: Optional[str] = None) -> _TaskRecord:
+        reference_name = definition["taskReferenceName"]
+        task_type = definition.get("type") or "SIMPLE"
+        record = _TaskRecord(
+            execution, definition,
+            f"{reference_name}__{iteration}" if iteration else reference_name,
+            task_type if task_type not in _WORKER_TASK_TYPES else (task_def_name or definition.get("name")),
+            task_def_name or definition.get("name") or task_type,
+            iteration, next(self._seq),
+        )
+        record.input_data = self._resolve(definition.get("inputParameters") or {}, execution)
+        execution.tasks.append(record)
+        execution.refs[reference_name] = record
+        if record.reference_name != reference_name:
+            execution.refs[record.reference_name] = record
+        self._tasks[record.task_id] = record
+        return record
+
+    def _run_task(self, execution: _Execution, definition: Dict[str, Any], iteration: int,
+                  resume: Callable[[], None]) -> bool:
+        """Start one task. Returns True if it finished synchronously, else ``resume`` is called on completion."""
+        task_type = definition.get("type") or "SIMPLE"
+        handler = getattr(self, f"_run_{task_type.lower()}", None)
+        if handler is None and task_type in self.system_task_handlers:
+            handler = self._run_system_task
+        if handler is None:
+            record = self._new_record(execution, definition, iteration)
+            record.reason = (f"task type {task_type} is not supported by LocalWorkflowEngine; "
+                             f"pass a handler in system_task_handlers")
+            return self._settle(record, FAILED, resume)
+        return handler(execution, definition, iteration, resume)
+
+    def _settle(self, record: _TaskRecord, status: str, resume: Callable[[], None]) -> bool:
+        """Finish a system task synchronously; returns whether the sequence may continue."""
+        record.on_done = None
+        self._finish_task(record, status, notify=False)
+        return record.status in (COMPLETED, COMPLETED_WITH_ERRORS) and record.execution.status == RUNNING
+
+    def _finish_task(self, record: _TaskRecord, status: str, notify: bool = True) -> None:
+        execution = record.execution
+        record.end_time = int(time.time() * 1000)
+        if status in (FAILED, FAILED_WITH_TERMINAL_ERROR) and execution.status == RUNNING:
+            task_def = self._task_defs.get(record.task_def_name)
+            retries = task_def.retry_count if task_def is not None and task_def.retry_count is not None \
+                else self.default_retry_count
+            worker_task = (record.definition.get("type") or "SIMPLE") in _WORKER_TASK_TYPES
+            if status == FAILED and worker_task and record.retry_count < retries:
+                record.status = FAILED
+                retry = self._new_record(execution, record.definition, record.iteration, record.task_def_name)
+                retry.retry_count = record.retry_count + 1
+                retry.input_data = record.input_data
+                retry.domain = record.domain
+                retry.on_done = record.on_done
+                record.on_done = None
+                self._enqueue(retry)
+                return
+            if record.definition.get("optional"):
+                record.status = COMPLETED_WITH_ERRORS
+                status = COMPLETED
+            else:
+                record.status = status
+                self._end_workflow(execution, FAILED, record.reason or f"task {record.reference_name} failed")
+                return
+        else:
+            record.status = status
+        if status == COMPLETED and notify and record.on_done is not None and execution.status == RUNNING:
+            on_done, record.on_done = record.on_done, None
+            on_done()
+
+    # SIMPLE / DYNAMIC
+
+    def _run_simple(self, execution, definition, iteration, resume, task_def_name=None) -> bool:
+        record = self._new_record(execution, definition, iteration, task_def_name)
+        record.domain = execution.task_to_domain.get(record.task_def_name) or execution.task_to_domain.get("*")
+        record.on_done = resume
+        self._enqueue(record)
+        return False
+
+    def _run_dynamic(self, execution, definition, iteration, resume) -> bool:
+        task_input = self._resolve(definition.get("inputParameters") or {}, execution)
+        task_name = task_input.get(definition.get("dynamicTaskNameParam") or "taskToExecute")
+        if not task_name:
+            record = self._new_record(execution, definition, iteration)
+            record.reason = "dynamic task name is not set"
+            return self._settle(record, FAILED, resume)
+        return self._run_simple(execution, definition, iteration, resume, task_def_name=task_name)
+
+    # System tasks
+
+    def _run_system_task(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        try:
+            record.output_data = dict(self.system_task_handlers[record.task_type](record.input_data) or {})
+            status = COMPLETED
+        except Exception as e:
+            record.reason = str(e)
+            status = FAILED
+        return self._settle(record, status, resume)
+
+    def _run_inline(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        try:
+            record.output_data = {"result": self.evaluator(
+                record.input_data.get("evaluatorType", "javascript"),
+                record.input_data.get("expression", ""),
+                record.input_data,
+            )}
+            status = COMPLETED
+        except Exception as e:
+            record.reason = str(e)
+            status = FAILED
+        return self._settle(record, status, resume)
+
+    def _run_set_variable(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        execution.variables.update(record.input_data)
+        return self._settle(record, COMPLETED, resume)
+
+    def _run_terminate(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        status = _status_name(record.input_data.get("terminationStatus") or COMPLETED)
+        record.output_data = {"output": record.input_data.get("workflowOutput") or {}}
+        self._settle(record, COMPLETED, resume)
+        execution.output = record.input_data.get("workflowOutput") or {}
+        self._end_workflow(execution, status, record.input_data.get("terminationReason"))
+        return False
+
+    def _run_wait(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        duration = record.input_data.get("duration")
+        until = record.input_data.get("until") or record.input_data.get("wait_until")
+        try:
+            if duration:
+                delay = _parse_duration(duration)
+            elif until:
+                delay = _parse_until(until) - time.time()
+            else:
+                delay = None
+        except ValueError as e:
+            record.reason = str(e)
+            return self._settle(record, FAILED, resume)
+        if delay is not None and (delay <= 0 or self.skip_wait_durations):
+            return self._settle(record, COMPLETED, resume)
+        record.status = IN_PROGRESS
+        record.on_done = resume
+        if delay is not None:
+            self._after(delay, record, lambda: self._finish_task(record, COMPLETED))
+        return False
+
+    def _run_join(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        for reference_name in definition.get("joinOn") or []:
+            joined = execution.refs.get(reference_name)
+            if joined is not None:
+                record.output_data[reference_name] = joined.output_data
+        return self._settle(record, COMPLETED, resume)
+
+    # Control flow
+
+    def _run_switch(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        evaluator_type = definition.get("evaluatorType") or "value-param"
+        try:
+            value = self.evaluator(evaluator_type, definition.get("expression") or "", record.input_data)
+        except Exception as e:
+            record.reason = str(e)
+            return self._settle(record, FAILED, resume)
+        case = "" if value is None else str(value).lower() if isinstance(value, bool) else str(value)
+        record.output_data = {"evaluationResult": [case]}
+        branch = (definition.get("decisionCases") or {}).get(case)
+        if branch is None:
+            branch = definition.get("defaultCase") or []
+        record.status = IN_PROGRESS
+
+        def finish():
+            self._finish_task(record, COMPLETED, notify=False)
+            resume()
+
+        if self._run_sequence(execution, branch, 0, iteration, finish):
+            return self._settle(record, COMPLETED, resume)
+        return False
+
+    def _run_fork_join(self, execution, definition, iteration, resume, branches=None) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        if branches is None:
+            branches = definition.get("forkTasks") or []
+        record.status = IN_PROGRESS
+        pending = [len(branches)]
+
+        def branch_done():
+            pending[0] -= 1
+            if pending[0] == 0:
+                self._finish_task(record, COMPLETED, notify=False)
+                resume()
+
+        for branch in branches:
+            if self._run_sequence(execution, branch, 0, iteration, branch_done):
+                pending[0] -= 1
+            if execution.status != RUNNING:
+                return False
+        if pending[0] == 0:
+            return self._settle(record, COMPLETED, resume)
+        return False
+
+    def _run_fork_join_dynamic(self, execution, definition, iteration, resume) -> bool:
+        task_input = self._resolve(definition.get("inputParameters") or {}, execution)
+        dynamic_tasks = task_input.get(definition.get("dynamicForkTasksParam") or "dynamicTasks") or []
+        dynamic_inputs = task_input.get(definition.get("dynamicForkTasksInputParamName") or "dynamicTasksInputs") or {}
+        branches = []
+        for dynamic_task in dynamic_tasks:
+            dynamic_task = dict(_SERIALIZER.sanitize_for_serialization(dynamic_task))
+            dynamic_task.setdefault("type", "SIMPLE")
+            dynamic_task["inputParameters"] = dynamic_inputs.get(dynamic_task.get("taskReferenceName"),
+                                                                 dynamic_task.get("inputParameters") or {})
+            branches.append([dynamic_task])
+        return self._run_fork_join(execution, definition, iteration, resume, branches)
+
+    def _run_do_while(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        reference_name = definition["taskReferenceName"]
+        loop_over = definition.get("loopOver") or []
+        record.status = IN_PROGRESS
+        counter = [0]
+
+        def condition_holds() -> bool:
+            counter_value = counter[0]
+            record.output_data["iteration"] = counter_value
+            record.output_data[str(counter_value)] = {
+                task["taskReferenceName"]: execution.refs[task["taskReferenceName"]].output_data
+                for task in loop_over if task["taskReferenceName"] in execution.refs
+            }
+            context = dict(record.input_data)
+            for task in loop_over:
+                inner = execution.refs.get(task["taskReferenceName"])
+                if inner is not None:
+                    context[task["taskReferenceName"]] = {"output": inner.output_data, "input": inner.input_data}
+            context[reference_name] = {"iteration": counter_value, "output": record.output_data,
+                                       **record.output_data}
+            return bool(self.evaluator(definition.get("evaluatorType") or "javascript",
+                                       definition.get("loopCondition") or "false", context))
+
+        def iterate() -> bool:
+            # Runs iterations until one is pending on a worker; True when the loop has ended synchronously.
+            while execution.status == RUNNING:
+                counter[0] += 1
+                if not self._run_sequence(execution, loop_over, 0, counter[0], iteration_done):
+                    return False
+                if not check():
+                    return True
+            return False
+
+        def check() -> bool:
+            try:
+                return condition_holds()
+            except Exception as e:
+                record.reason = str(e)
+                self._finish_task(record, FAILED)
+                return False
+
+        def iteration_done():
+            if check():
+                if not iterate():
+                    return
+            if record.status == IN_PROGRESS:
+                self._finish_task(record, COMPLETED, notify=False)
+                resume()
+
+        if iterate() and record.status == IN_PROGRESS:
+            return self._settle(record, COMPLETED, resume)
+        return False
+
+    def _run_sub_workflow(self, execution, definition, iteration, resume) -> bool:
+        record = self._new_record(execution, definition, iteration)
+        params = definition.get("subWorkflowParam") or {}
+        try:
+            if params.get("workflowDefinition"):
+                child_definition = self._to_definition(params["workflowDefinition"])
+            else:
+                child_definition = self._find_definition(params.get("name"), params.get("version"))
+        except (KeyError, ValueError) as e:
+            record.reason = str(e)
+            return self._settle(record, FAILED, resume)
+        record.status = IN_PROGRESS
+        record.on_done = resume
+        task_to_domain = params.get("taskToDomain") or execution.task_to_domain
+        child_id = str(uuid.uuid4())
+        record.sub_workflow_id = child_id
+        record.output_data["subWorkflowId"] = child_id
+        child = _Execution(child_id, child_definition, record.input_data, execution.correlation_id, task_to_domain,
+                           record)
+        self._executions[child_id] = child
+        self.stats["workflows_started"] += 1
+        if self._run_sequence(child, child_definition.get("tasks") or [], 0, 0, lambda: self._complete(child)):
+            record.on_done = None
+            self._complete(child)
+            return record.status in (COMPLETED, COMPLETED_WITH_ERRORS) and execution.status == RUNNING
+        return False
+
+    # -- Parameter resolution --------------------------------------------------------------------
+
+    def _resolve(self, value: Any, execution: _Execution) -> Any:
+        if isinstance(value, str):
+            if "${" not in value:
+                return value
+            match = _REFERENCE.fullmatch(value)
+            if match:
+                return self._lookup(match.group(1), execution)
+            return _REFERENCE.sub(lambda m: self._format(self._lookup(m.group(1), execution)), value)
+        if isinstance(value, dict):
+            return {key: self._resolve(item, execution) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item, execution) for item in value]
+        return value
+
+    @staticmethod
+    def _format(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return str(value).lower()
+        return str(value)
+
+    @staticmethod
+    def _lookup(path: str, execution: _Execution) -> Any:
+        tokens = _PATH_TOKEN.findall(path.strip())
+        if not tokens:
+            return None
+        head, rest = tokens[0], tokens[1:]
+        if head == "workflow":
+            if not rest:
+                return None
+            root = {
+                "input": execution.input,
+                "output": execution.output,
+                "variables": execution.variables,
+                "workflowId": execution.workflow_id,
+                "correlationId": execution.correlation_id,
+                "workflowType": execution.name,
+                "version": execution.version,
+                "status": execution.status,
+            }
+            return _lookup_path(root, rest)
+        record = execution.refs.get(head)
+        if record is None:
+            return None
+        root = {
+            "input": record.input_data,
+            "output": record.output_data,
+            "status": record.status,
+            "taskId": record.task_id,
+            "referenceTaskName": record.reference_name,
+            "retryCount": record.retry_count,
+            "iteration": record.iteration,
+        }
+        return _lookup_path(root, rest)
+
+
+class LocalTaskClient:
+    """Stands in for ``TaskResourceApi`` in ``TaskRunner``, serving polls and updates from a LocalWorkflowEngine."""
+
+    def __init__(self, engine: LocalWorkflowEngine):
+        self.engine = engine
+
+    def batch_poll(self, tasktype: str, **kwargs) -> List[Task]:
+        return self.engine.poll(tasktype, worker_id=kwargs.get("workerid"), count=kwargs.get("count", 1),
+                                timeout_ms=kwargs.get("timeout", 0), domain=kwargs.get("domain"))
+
+    def poll(self, tasktype: str, **kwargs) -> Optional[Task]:
+        tasks = self.engine.poll(tasktype, worker_id=kwargs.get("workerid"), count=1, domain=kwargs.get("domain"))
+        return tasks[0] if tasks else None
+
+    def update_task(self, body: TaskResult, **kwargs) -> str:
+        self.engine.update(body)
+        return body.task_id
+
+    def update_task_v2(self, body: TaskResult, **kwargs) -> Optional[Task]:
+        return self.engine.update(body, return_next=True)
+
+
+class LocalAsyncTaskClient:
+    """Stands in for ``AsyncTaskResourceApi`` in ``AsyncTaskRunner``; long polls wait in a worker thread."""
+
+    def __init__(self, engine: LocalWorkflowEngine):
+        self.engine = engine
+
+    async def batch_poll(self, tasktype: str, **kwargs) -> List[Task]:
+        poll_kwargs = dict(worker_id=kwargs.get("workerid"), count=kwargs.get("count", 1),
+                           domain=kwargs.get("domain"))
+        tasks = self.engine.poll(tasktype, **poll_kwargs)
+        if tasks or not kwargs.get("timeout"):
+            return tasks
+        return await asyncio.to_thread(self.engine.poll, tasktype, timeout_ms=kwargs["timeout"], **poll_kwargs)
+
+    async def update_task(self, body: TaskResult, **kwargs) -> str:
+        self.engine.update(body)
+        return body.task_id
+
+    async def update_task_v2(self, body: TaskResult, **kwargs) -> Optional[Task]:
+        return self.engine.update(body, return_next=True)
@@ -5,6 +5,7 @@ import dataclasses
 import importlib
 import inspect
 import logging
+import os
 import sys
 import threading
 import time
@@ -15,6 +16,7 @@ from typing import Any, Callable, Union, Optional
 from typing_extensions import Self
 
 from conductor.client.automator import utils
+from conductor.client.automator.phase_profiler import PhaseProfiler
 from conductor.client.automator.utils import convert_from_dict_or_list
 from conductor.client.configuration.configuration import Configuration
 from conductor.client.http.api_client import ApiClient
@@ -248,6 +250,23 @@ class BackgroundEventLoop:
             logger.debug(f"Exception in coroutine: {type(e).__name__}: {e}")
             raise
 
+    @classmethod
+    def _reset_after_fork(cls):
+        """Forget the parent's loop in a forked child.
+
+        The loop thread does not survive fork() and the class lock may have
+        been held by another parent thread at fork time, so the child starts
+        from a fresh lock and builds a new instance on next use.
+        """
+        cls._lock = threading.Lock()
+        instance = cls._instance
+        cls._instance = None
+        if instance is not None:
+            # The inherited atexit hook must not try to stop a loop owned
+            # by the parent process.
+            instance._shutdown = True
+            instance._loop_started = False
+
     def _cleanup(self):
         """Stop the background event loop.
 
@@ -277,6 +296,10 @@ class BackgroundEventLoop:
         logger.debug("Background event loop stopped")
 
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=BackgroundEventLoop._reset_after_fork)
+
+
 class _ExecuteFunctionReference:
     """Pickle surrogate for functions whose module-level name was rebound.
 
@@ -464,6 +487,8 @@ class Worker(WorkerInterface):
             if self._is_execute_function_input_parameter_a_task:
                 task_output = self.execute_function(task)
             else:
+                profiler = PhaseProfiler.get_instance()
+                bind_start = time.perf_counter() if profiler.enabled else None
                 params = inspect.signature(self.execute_function).parameters
                 for input_name in params:
                     typ = params[input_name].annotation
@@ -477,6 +502,8 @@ class Worker(WorkerInterface):
                         task_input[input_name] = default_value
                     else:
                         task_input[input_name] = None
+                if bind_start is not None:
+                    profiler.add_nested("bind", time.perf_counter() - bind_start)
                 task_output = self.execute_function(**task_input)
 
             # If the function is async (coroutine), run it in the background event loop
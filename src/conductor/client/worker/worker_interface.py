@@ -50,6 +50,7 @@ class WorkerInterface(abc.ABC):
         self._poll_interval = DEFAULT_POLLING_INTERVAL
         self.thread_count = 1
         self.register_task_def = False
+        self.task_def_registered = False  # Set when the parent process already registered the task definition
         self.poll_timeout = 100  # milliseconds
         self.lease_extend_enabled = False
         self.overwrite_task_def = True  # Default: overwrite existing task definitions
@@ -1,10 +1,14 @@
 from __future__ import annotations
+import hashlib
+import json
+import threading
 from copy import deepcopy
 from typing import Any, Dict, List, Union, Optional
 
 from shortuuid import uuid
 from typing_extensions import Self
 
+from conductor.client.http.api_client import ApiClient
 from conductor.client.http.models import (
     StartWorkflowRequest,
     WorkflowDef,
@@ -19,6 +23,50 @@ from conductor.client.workflow.task.join_task import JoinTask
 from conductor.client.workflow.task.task import TaskInterface
 from conductor.client.workflow.task.task_type import TaskType
 from conductor.client.workflow.task.timeout_policy import TimeoutPolicy
+from conductor.client.workflow.workflow_def_index import WorkflowDefIndex, WorkflowDefIssue
+
+
+# sanitize_for_serialization does not touch instance state, so an uninitialised
+# ApiClient is enough to turn a WorkflowDef into its JSON payload.
+_SERIALIZER = ApiClient.__new__(ApiClient)
+
+# Attributes that hold derived state; assigning them must not invalidate the
+# compiled definition.
+_DERIVED_ATTRIBUTES = frozenset({
+    "_compiled", "_executor", "_register_lock", "_registered_hash",
+    "_use_registered_definition", "_register_overwrite",
+})
+
+
+class _CompiledDefinition:
+    """A built WorkflowDef plus its serialized payload and content hash, both computed lazily."""
+
+    __slots__ = ("workflow_def", "_payload", "_content_hash", "_index")
+
+    def __init__(self, workflow_def: WorkflowDef):
+        self.workflow_def = workflow_def
+        self._payload = None
+        self._content_hash = None
+        self._index = None
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        if self._payload is None:
+            self._payload = _SERIALIZER.sanitize_for_serialization(self.workflow_def)
+        return self._payload
+
+    @property
+    def content_hash(self) -> str:
+        if self._content_hash is None:
+            canonical = json.dumps(self.payload, sort_keys=True, separators=(",", ":"), default=str)
+            self._content_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return self._content_hash
+
+    @property
+    def index(self) -> WorkflowDefIndex:
+        if self._index is None:
+            self._index = WorkflowDefIndex.build(self.payload)
+        return self._index
 
 
 class ConductorWorkflow:
@@ -29,6 +77,11 @@ class ConductorWorkflow:
                  name: str,
                  version: Optional[int] = None,
                  description: Optional[str] = None) -> Self:
+        self._compiled = None
+        self._register_lock = threading.Lock()
+        self._registered_hash = None
+        self._use_registered_definition = False
+        self._register_overwrite = True
         self._executor = executor
         self.name = name
         self.version = version
@@ -55,17 +108,33 @@ class ConductorWorkflow:
         result = cls.__new__(cls)
         memo[id(self)] = result
 
-        # Copy all attributes except _executor (which is shared, not copied)
+        # Copy all attributes except _executor (which is shared, not copied). Assigned through __dict__ so the
+        # copy keeps the compiled definition, which is never mutated, only replaced.
+        state = result.__dict__
         for k, v in self.__dict__.items():
-            if k == '_executor':
+            if k in ('_executor', '_compiled'):
                 # Share the executor reference, don't copy it
-                setattr(result, k, v)
+                state[k] = v
+            elif k == '_register_lock':
+                state[k] = threading.Lock()
             else:
                 # Deep copy all other attributes
-                setattr(result, k, deepcopy(v, memo))
+                state[k] = deepcopy(v, memo)
 
         return result
 
+    def __setattr__(self, key, value):
+        if key not in _DERIVED_ATTRIBUTES:
+            self.__dict__["_compiled"] = None
+        object.__setattr__(self, key, value)
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached definition. Assigning any attribute does this automatically; call it after mutating
+        a task object that was added to this workflow by reference (e.g. inside a fork).
+        """
+        self._compiled = None
+
     @property
     def name(self) -> str:
         return self._name
@@ -157,6 +226,7 @@ class ConductorWorkflow:
             self._output_parameters = {}
 
         self._output_parameters[key] = value
+        self.invalidate()
         return self
 
     # InputTemplate template input to the workflow.  Can have combination of variables (e.g. ${workflow.input.abc}) and static values
@@ -205,12 +275,84 @@ class ConductorWorkflow:
 
     # Register the workflow definition with the server. If overwrite is set, the definition on the server will be
     # overwritten. When not set, the call fails if there is any change in the workflow definition between the server
-    # and what is being registered.
-    def register(self, overwrite: bool):
-        return self._executor.register_workflow(
+    # and what is being registered. With validate, the definition is checked locally first and
+    # WorkflowDefValidationError is raised instead of sending a definition the server would reject.
+    def register(self, overwrite: bool, validate: bool = False):
+        compiled = self.__compile()
+        if validate:
+            compiled.index.raise_for_errors()
+        result = self._executor.register_workflow(
             overwrite=overwrite,
-            workflow=self.to_workflow_def(),
+            workflow=compiled.workflow_def,
         )
+        self._registered_hash = compiled.content_hash
+        return result
+
+    def index(self) -> WorkflowDefIndex:
+        """
+        Lookup tables over the compiled definition (reference name to task, nesting, fork/join pairs, expression
+        references); built once per version of the definition.
+        """
+        return self.__compile().index
+
+    def validate(self, raise_on_error: bool = False) -> List[WorkflowDefIssue]:
+        """
+        Checks the definition locally for dangling ${...} references, duplicate reference names, forks without a
+        JOIN, JOINs waiting on tasks outside their fork and tasks that can never run.
+
+        Returns
+        -------
+        The issues found; with raise_on_error, raises WorkflowDefValidationError if any of them is an error
+        """
+        index = self.__compile().index
+        if raise_on_error:
+            index.raise_for_errors()
+        return index.validate()
+
+    # When enabled, start_workflow / start_workflow_with_input / execute register the definition the first time and
+    # again only when its content hash changes, then start it by name and version instead of sending the full
+    # definition inline with every request.
+    def use_registered_definition(self, enabled: bool = True, overwrite: bool = True) -> Self:
+        if not isinstance(enabled, bool) or not isinstance(overwrite, bool):
+            raise Exception("invalid type")
+        self._use_registered_definition = enabled
+        self._register_overwrite = overwrite
+        return self
+
+    def ensure_registered(self) -> bool:
+        """
+        Registers the workflow definition unless this exact definition (by content hash) was already registered
+        from this object.
+
+        Returns
+        -------
+        True if the definition was registered by this call
+        """
+        compiled = self.__compile()
+        if compiled.content_hash == self._registered_hash:
+            return False
+        with self._register_lock:
+            if compiled.content_hash == self._registered_hash:
+                return False
+            self._executor.register_workflow(overwrite=self._register_overwrite, workflow=compiled.workflow_def)
+            self._registered_hash = compiled.content_hash
+            return True
+
+    def content_hash(self) -> str:
+        """
+        Stable SHA-256 hash of the serialized workflow definition; changes whenever the definition does.
+        """
+        return self.__compile().content_hash
+
+    def __prepare_start_request(self, request: StartWorkflowRequest, version: Optional[int]) -> None:
+        if self._use_registered_definition:
+            self.ensure_registered()
+            request.workflow_def = None
+            request.version = self.version
+        else:
+            request.workflow_def = self.__compile().payload
+            request.version = version
+        request.name = self.name
 
     def start_workflow(self, start_workflow_request: StartWorkflowRequest) -> str:
         """
@@ -223,9 +365,7 @@ class ConductorWorkflow:
         -------
         Workflow Execution Id
         """
-        start_workflow_request.workflow_def = self.to_workflow_def()
-        start_workflow_request.name = self.name
-        start_workflow_request.version = self.version
+        self.__prepare_start_request(start_workflow_request, self.version)
         return self._executor.start_workflow(start_workflow_request)
 
     def start_workflow_with_input(self, workflow_input: Optional[dict] = None, correlation_id: Optional[str] = None, task_to_domain: Optional[Dict[str, str]] = None,
@@ -235,9 +375,7 @@ class ConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         start_workflow_request = StartWorkflowRequest()
-        start_workflow_request.workflow_def = self.to_workflow_def()
-        start_workflow_request.name = self.name
-        start_workflow_request.version = self.version
+        self.__prepare_start_request(start_workflow_request, self.version)
         start_workflow_request.input = workflow_input
         start_workflow_request.correlation_id = correlation_id
         start_workflow_request.idempotency_key = idempotency_key
@@ -265,10 +403,8 @@ class ConductorWorkflow:
         """
         workflow_input = workflow_input or {}
         request = StartWorkflowRequest()
-        request.workflow_def = self.to_workflow_def()
+        self.__prepare_start_request(request, 1)
         request.input = workflow_input
-        request.name = request.workflow_def.name
-        request.version = 1
         if idempotency_key is not None:
             request.idempotency_key = idempotency_key
             request.idempotency_strategy = idempotency_strategy
@@ -280,6 +416,25 @@ class ConductorWorkflow:
         return run
 
     def to_workflow_def(self) -> WorkflowDef:
+        """
+        Returns a newly built workflow definition, which the caller may change without affecting the definition
+        this workflow caches for register / start requests. Rebuilding is cheaper than deep-copying the cached one.
+        """
+        return self.__build_workflow_def()
+
+    def _shared_workflow_def(self) -> WorkflowDef:
+        # The cached definition itself, for callers in this package that only read it. It is replaced, never
+        # mutated, when the workflow changes.
+        return self.__compile().workflow_def
+
+    def __compile(self) -> _CompiledDefinition:
+        compiled = self._compiled
+        if compiled is None:
+            compiled = _CompiledDefinition(self.__build_workflow_def())
+            self._compiled = compiled
+        return compiled
+
+    def __build_workflow_def(self) -> WorkflowDef:
         return WorkflowDef(
             name=self._name,
             description=self._description,
@@ -354,6 +509,7 @@ class ConductorWorkflow:
                 f"invalid task -- if using @worker_task or @WorkerTask decorator ensure task_ref_name is passed as "
                 f"argument.  task is {type(task)}")
         self._tasks.append(deepcopy(task))
+        self.invalidate()
         return self
 
     def __add_fork_join_tasks(self, forked_tasks: List[List[TaskInterface]]) -> Self:
@@ -369,6 +525,7 @@ class ConductorWorkflow:
             forked_tasks=forked_tasks
         )
         self._tasks.append(fork_task)
+        self.invalidate()
         return self
 
     def __call__(self, **kwargs) -> WorkflowRun:
@@ -398,7 +555,7 @@ class InlineSubWorkflowTask(TaskInterface):
         )
         self._workflow_name = deepcopy(workflow.name)
         self._workflow_version = deepcopy(workflow.version)
-        self._workflow_definition = deepcopy(workflow.to_workflow_def())
+        self._workflow_definition = workflow._shared_workflow_def()
 
     def to_workflow_task(self) -> WorkflowTask:
         workflow = super().to_workflow_task()
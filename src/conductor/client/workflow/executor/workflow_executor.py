@@ -1,4 +1,6 @@
 from __future__ import annotations
+import asyncio
+import threading
 import uuid
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
@@ -24,6 +26,7 @@ from conductor.client.http.models.correlation_ids_search_request import (
     CorrelationIdsSearchRequest,
 )
 from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.client.workflow.executor.workflow_watcher import WorkflowWatcher
 
 if TYPE_CHECKING:
     from conductor.client.telemetry.metrics_collector_base import MetricsCollectorBase
@@ -35,6 +38,8 @@ class WorkflowExecutor:
         self.metadata_client = MetadataResourceApi(api_client)
         self.task_client = TaskResourceApi(api_client)
         self.workflow_client = OrkesWorkflowClient(configuration, metrics_collector=metrics_collector)
+        self._watcher: Optional[WorkflowWatcher] = None
+        self._watcher_lock = threading.Lock()
 
     def register_workflow(self, workflow: WorkflowDef, overwrite: Optional[bool] = None) -> object:
         """Create a new workflow definition"""
@@ -129,6 +134,28 @@ class WorkflowExecutor:
             wait_for_seconds=wait_for_seconds,
         )
 
+    @property
+    def watcher(self) -> WorkflowWatcher:
+        """Shared :class:`WorkflowWatcher` used by :meth:`wait_for_workflow`, created on first use"""
+        if self._watcher is None:
+            with self._watcher_lock:
+                if self._watcher is None:
+                    self._watcher = WorkflowWatcher(self.workflow_client)
+        return self._watcher
+
+    def wait_for_workflow(self, workflow_id: str, timeout: Optional[float] = None) -> Optional[Workflow]:
+        """Waits until the workflow reaches a terminal status and returns it, or ``None`` after ``timeout`` seconds.
+        Waits for many workflows share one batched poller instead of polling each workflow separately"""
+        return self.watcher.wait(workflow_id, timeout)
+
+    async def wait_for_workflow_async(self, workflow_id: str, timeout: Optional[float] = None) -> Optional[Workflow]:
+        """Async version of :meth:`wait_for_workflow`"""
+        future = self.watcher.watch_async(workflow_id)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+
     def remove_workflow(self, workflow_id: str, archive_workflow: Optional[bool] = None) -> None:
         """Removes the workflow permanently from the system"""
         kwargs = {}
@@ -0,0 +1,240 @@
+from __future__ import annotations
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models import Workflow
+from conductor.client.http.models.workflow_status import terminal_status
+from conductor.client.http.rest import ApiException
+from conductor.client.workflow_client import WorkflowClient
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+# Finished workflows that only direct checks found, with none found by the search, before the watcher
+# concludes that the server has no index. More than one, so that a single result lagging in the index
+# does not disable the search.
+_MISSES_BEFORE_FALLBACK = 2
+
+
+class _Watch:
+    __slots__ = ("futures", "last_direct_check")
+
+    def __init__(self) -> None:
+        self.futures: List[Future] = []
+        self.last_direct_check = time.monotonic()
+
+
+class WorkflowWatcher:
+    """Waits for many workflows to finish using one background poller.
+
+    Instead of every caller polling ``get_workflow`` on its own, callers register workflow ids with
+    :meth:`watch` and get a :class:`concurrent.futures.Future` (or an awaitable from :meth:`watch_async`)
+    that resolves to the finished :class:`Workflow`. The poller looks up all watched ids in batches of
+    ``batch_size`` with one ``search`` call each (``workflowId IN (...) AND status IN (<terminal>)``) and
+    fetches the full workflow only for ids the search reports as finished.
+
+    The poll interval adapts: it starts at ``min_interval``, grows by ``backoff`` after every cycle that
+    finishes nothing, up to ``max_interval``, and drops back to ``min_interval`` when a workflow finishes
+    or a new id is watched.
+
+    Search results come from the server's index and may lag behind the workflow state, and some servers
+    have no index at all; ids that the search has not reported within ``direct_check_interval`` seconds
+    are therefore checked individually with ``get_workflow_status``. If the search call itself fails, or
+    those checks find finished workflows while the search has never reported one (a server without an
+    indexing backend returns empty results rather than an error), the watcher switches to individual
+    status checks for every id.
+    """
+
+    def __init__(self, workflow_client: WorkflowClient, min_interval: float = 0.5, max_interval: float = 5.0,
+                 backoff: float = 1.5, batch_size: int = 100, direct_check_interval: float = 5.0,
+                 include_tasks: bool = False) -> None:
+        self.workflow_client = workflow_client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self.direct_check_interval = direct_check_interval
+        self.include_tasks = include_tasks
+        self.lookups = 0
+        self._use_search = True
+        # Finished workflows found by the search, and found only by direct checks.
+        self._search_hits = 0
+        self._search_misses = 0
+        self._watches: Dict[str, _Watch] = {}
+        self._condition = threading.Condition()
+        self._interval = min_interval
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def watch(self, workflow_id: str) -> Future:
+        """Returns a future resolved with the workflow once it reaches a terminal status.
+
+        Cancelling the future stops watching for that caller; other callers watching the same id are
+        unaffected.
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("WorkflowWatcher is stopped")
+            self._watches.setdefault(workflow_id, _Watch()).futures.append(future)
+            self._interval = self.min_interval
+            self._ensure_started()
+            self._condition.notify()
+        return future
+
+    def watch_async(self, workflow_id: str) -> asyncio.Future:
+        """Awaitable variant of :meth:`watch` for the running event loop."""
+        return asyncio.wrap_future(self.watch(workflow_id))
+
+    def wait(self, workflow_id: str, timeout: Optional[float] = None) -> Optional[Workflow]:
+        """Blocks until the workflow finishes; returns ``None`` if ``timeout`` seconds pass first."""
+        future = self.watch(workflow_id)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return None
+
+    @property
+    def watched_count(self) -> int:
+        with self._condition:
+            return len(self._watches)
+
+    def stop(self) -> None:
+        """Stops the poller and cancels every pending future."""
+        with self._condition:
+            self._stopped = True
+            watches, self._watches = self._watches, {}
+            self._condition.notify()
+        for watch in watches.values():
+            for future in watch.futures:
+                future.cancel()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.max_interval + 1)
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="WorkflowWatcher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and not self._watches:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                ids = self._prune()
+            try:
+                finished = self.poll_once(ids)
+            except Exception as e:
+                logger.warning("WorkflowWatcher lookup failed: %s", e)
+                finished = 0
+            with self._condition:
+                if finished:
+                    self._interval = self.min_interval
+                else:
+                    self._interval = min(self._interval * self.backoff, self.max_interval)
+                self._condition.wait(self._interval)
+
+    def _prune(self) -> List[str]:
+        """Drops cancelled futures and ids nobody waits for any more; returns the ids still watched."""
+        for workflow_id in list(self._watches):
+            watch = self._watches[workflow_id]
+            watch.futures = [f for f in watch.futures if not f.done()]
+            if not watch.futures:
+                del self._watches[workflow_id]
+        return list(self._watches)
+
+    def poll_once(self, workflow_ids: Optional[List[str]] = None) -> int:
+        """Runs one lookup cycle over ``workflow_ids`` (default: all watched ids); returns how many finished."""
+        if workflow_ids is None:
+            with self._condition:
+                workflow_ids = self._prune()
+        reported = set()
+        if self._use_search:
+            for start in range(0, len(workflow_ids), self.batch_size):
+                try:
+                    reported.update(self._search_finished(workflow_ids[start:start + self.batch_size]))
+                except ApiException as e:
+                    logger.warning("Workflow search unavailable (%s); checking workflow status individually", e)
+                    self._use_search = False
+                    break
+        unreported = []
+        now = time.monotonic()
+        with self._condition:
+            for workflow_id in workflow_ids:
+                watch = self._watches.get(workflow_id)
+                if watch is None or workflow_id in reported:
+                    continue
+                if not self._use_search or now - watch.last_direct_check >= self.direct_check_interval:
+                    watch.last_direct_check = now
+                    unreported.append(workflow_id)
+        finished = 0
+        for workflow_id in [w for w in workflow_ids if w in reported] + unreported:
+            try:
+                workflow = self._fetch_if_finished(workflow_id, check_status=workflow_id not in reported)
+            except ApiException as e:
+                if e.status != 404:
+                    logger.warning("Failed to look up workflow %s: %s", workflow_id, e)
+                    continue
+                finished += self._resolve(workflow_id, exception=e)
+                continue
+            if workflow is not None:
+                finished += self._resolve(workflow_id, workflow)
+                if self._use_search:
+                    self._record_search_result(found=workflow_id in reported)
+        return finished
+
+    def _record_search_result(self, found: bool) -> None:
+        if found:
+            self._search_hits += 1
+            return
+        self._search_misses += 1
+        if not self._search_hits and self._search_misses >= _MISSES_BEFORE_FALLBACK:
+            logger.info("Workflow search reports no finished workflows (no indexing backend?); "
+                        "checking workflow status individually")
+            self._use_search = False
+
+    def _search_finished(self, workflow_ids: List[str]) -> List[str]:
+        query = f"workflowId IN ({','.join(workflow_ids)}) AND status IN ({','.join(terminal_status)})"
+        self.lookups += 1
+        result = self.workflow_client.search(start=0, size=len(workflow_ids), free_text="*", query=query)
+        return [summary.workflow_id for summary in (result.results or [])]
+
+    def _fetch_if_finished(self, workflow_id: str, check_status: bool) -> Optional[Workflow]:
+        if check_status:
+            self.lookups += 1
+            status = self.workflow_client.get_workflow_status(workflow_id, include_output=False,
+                                                              include_variables=False)
+            if status.status not in terminal_status:
+                return None
+        self.lookups += 1
+        workflow = self.workflow_client.get_workflow(workflow_id, include_tasks=self.include_tasks)
+        return workflow if workflow.status in terminal_status else None
+
+    def _resolve(self, workflow_id: str, workflow: Optional[Workflow] = None,
+                 exception: Optional[BaseException] = None) -> int:
+        with self._condition:
+            watch = self._watches.pop(workflow_id, None)
+        if watch is None:
+            return 0
+        for future in watch.futures:
+            try:
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(workflow)
+            except concurrent.futures.InvalidStateError:
+                pass  # cancelled by its caller
+        return 1
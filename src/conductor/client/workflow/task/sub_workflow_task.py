@@ -40,7 +40,7 @@ class InlineSubWorkflowTask(TaskInterface):
         )
         self._workflow_name = deepcopy(workflow.name)
         self._workflow_version = deepcopy(workflow.version)
-        self._workflow_definition = deepcopy(workflow.to_workflow_def())
+        self._workflow_definition = workflow._shared_workflow_def()
 
     def to_workflow_task(self) -> WorkflowTask:
         workflow = super().to_workflow_task()
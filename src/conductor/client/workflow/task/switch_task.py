@@ -27,6 +27,7 @@ class SwitchTask(TaskInterface):
         self._use_javascript = deepcopy(use_javascript)
 
     def switch_case(self, case_name: str, tasks: List[TaskInterface]) -> Self:
+        self._unshare()
         if isinstance(tasks, List):
             self._decision_cases[case_name] = deepcopy(tasks)
         else:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import marshal
 from copy import deepcopy
+from enum import Enum
 from typing import Any, Dict, List, Union, Optional
 
 from typing_extensions import Self
@@ -8,6 +10,31 @@ from typing_extensions import Self
 from conductor.client.http.models.workflow_task import WorkflowTask, CacheConfig
 from conductor.client.workflow.task.task_type import TaskType
 
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None), Enum)
+
+
+def _copy_value(value: Any) -> Any:
+    """
+    Copies the dict/list/tuple structure of a value, sharing immutable leaves. Anything else is deep-copied;
+    for tasks that is a cheap copy-on-write snapshot.
+    """
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        try:
+            # plain JSON-like templates (the common case) round-trip through marshal several times faster
+            return marshal.loads(marshal.dumps(value))
+        except ValueError:
+            pass
+    if value_type is dict:
+        return {key: _copy_value(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_value(item) for item in value]
+    if value_type is tuple:
+        return tuple(_copy_value(item) for item in value)
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    return deepcopy(value)
+
 
 def get_task_interface_list_as_workflow_task_list(*tasks: Self) -> List[WorkflowTask]:
     converted_tasks = []
@@ -17,11 +44,15 @@ def get_task_interface_list_as_workflow_task_list(*tasks: Self) -> List[Workflow
             # to_workflow_task() returned a list. E.g.: DynamicFork.to_workflow_task() returns the DynamicFork and the Join task.
             converted_tasks.extend(wf_task)
         else:
-            converted_tasks.append(task.to_workflow_task())
+            converted_tasks.append(wf_task)
     return converted_tasks
 
 
 class TaskInterface():
+    # Tasks are copy-on-write: deepcopy() returns a snapshot that shares its dicts and lists with the original,
+    # and whichever side is mutated first copies them (see _unshare). Adding a task to a workflow, loop, fork or
+    # switch therefore costs O(1) instead of a copy of the whole subtree.
+
     def __init__(self,
                  task_reference_name: str,
                  task_type: TaskType,
@@ -31,6 +62,7 @@ class TaskInterface():
                  input_parameters: Optional[Dict[str, Any]] = None,
                  cache_key: Optional[str] = None,
                  cache_ttl_second: int = 0) -> Self:
+        self._shared = False
         self._name = task_name or task_reference_name
         self._cache_ttl_second = 0
         self.task_reference_name = task_reference_name
@@ -44,6 +76,24 @@ class TaskInterface():
         self._expression = None
         self._evaluator_type = None
 
+    def __deepcopy__(self, memo):
+        snapshot = object.__new__(type(self))
+        memo[id(self)] = snapshot
+        state = self.__dict__
+        state["_shared"] = True
+        snapshot.__dict__.update(state)
+        return snapshot
+
+    def _unshare(self) -> None:
+        """Take private copies of containers shared with a snapshot; call before mutating one in place."""
+        state = self.__dict__
+        if not state.get("_shared"):
+            return
+        for key, value in list(state.items()):
+            if type(value) is dict or type(value) is list:
+                state[key] = _copy_value(value)
+        state["_shared"] = False
+
     @property
     def task_reference_name(self) -> str:
         return self._task_reference_name
@@ -52,7 +102,7 @@ class TaskInterface():
     def task_reference_name(self, task_reference_name: str) -> None:
         if not isinstance(task_reference_name, str):
             raise Exception("invalid type")
-        self._task_reference_name = deepcopy(task_reference_name)
+        self._task_reference_name = task_reference_name
 
     @property
     def task_type(self) -> TaskType:
@@ -62,7 +112,7 @@ class TaskInterface():
     def task_type(self, task_type: TaskType) -> None:
         if not isinstance(task_type, TaskType):
             raise Exception("invalid type")
-        self._task_type = deepcopy(task_type)
+        self._task_type = task_type
 
     @property
     def name(self) -> str:
@@ -102,7 +152,7 @@ class TaskInterface():
     def description(self, description: str) -> None:
         if description is not None and not isinstance(description, str):
             raise Exception("invalid type")
-        self._description = deepcopy(description)
+        self._description = description
 
     @property
     def optional(self) -> bool:
@@ -112,10 +162,12 @@ class TaskInterface():
     def optional(self, optional: bool) -> None:
         if optional is not None and not isinstance(optional, bool):
             raise Exception("invalid type")
-        self._optional = deepcopy(optional)
+        self._optional = optional
 
     @property
     def input_parameters(self) -> Dict[str, Any]:
+        # callers mutate the returned dict in place
+        self._unshare()
         return self._input_parameters
 
     @input_parameters.setter
@@ -125,16 +177,17 @@ class TaskInterface():
             return
         if not isinstance(input_parameters, dict):
             try:
-                self._input_parameters = input_parameters.__dict__
+                input_parameters = input_parameters.__dict__
             except AttributeError as err:
                 raise ValueError(f"Invalid type: {type(input_parameters)}") from err
 
-        self._input_parameters = deepcopy(input_parameters)
+        self._input_parameters = _copy_value(input_parameters)
 
     def input_parameter(self, key: str, value: Any) -> Self:
         if not isinstance(key, str):
             raise Exception("invalid type")
-        self._input_parameters[key] = deepcopy(value)
+        self._unshare()
+        self._input_parameters[key] = _copy_value(value)
         return self
 
     def to_workflow_task(self) -> WorkflowTask:
@@ -146,7 +199,7 @@ class TaskInterface():
             task_reference_name=self._task_reference_name,
             type=self._task_type.value,
             description=self._description,
-            input_parameters=self._input_parameters,
+            input_parameters=dict(self._input_parameters),
             optional=self._optional,
             cache_config=cache_config,
             expression=self._expression,
@@ -177,11 +230,8 @@ class TaskInterface():
             else:
                 return "${" + f"{self.task_reference_name}.input.{json_path}" + "}"
 
-    def __getattribute__(self, __name: str, /) -> Any:
-        try:
-            val = super().__getattribute__(__name)
-            return val
-        except AttributeError as ae:
-            if not __name.startswith("_"):
-                return "${" + self.task_reference_name + ".output." + __name + "}"
-            raise ae
+    def __getattr__(self, __name: str, /) -> Any:
+        # only reached when normal lookup fails, so regular attribute access stays on the fast path
+        if not __name.startswith("_"):
+            return "${" + self.task_reference_name + ".output." + __name + "}"
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{__name}'")
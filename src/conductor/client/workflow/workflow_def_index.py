@@ -0,0 +1,215 @@
+from __future__ import annotations
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import WorkflowDef
+
+_SERIALIZER = ApiClient.__new__(ApiClient)
+
+# ${ref.output.x}, ${ref}, ${workflow.input.x}; the first path segment names the source.
+_EXPRESSION = re.compile(r"\$\{\s*([^.\[\}\s]+)")
+
+# Expression roots that are not task reference names.
+_BUILTIN_ROOTS = frozenset({"workflow", "CPEWF_TASK_ID", "CPEWF_PARENT_TASK_ID"})
+
+_FORK_TYPES = ("FORK_JOIN", "FORK_JOIN_DYNAMIC")
+
+
+@dataclass
+class WorkflowDefIssue:
+    """One problem found by :meth:`WorkflowDefIndex.validate`; ``severity`` is ``"error"`` or ``"warning"``."""
+    code: str
+    message: str
+    task_ref: Optional[str] = None
+    severity: str = "error"
+
+    def __str__(self) -> str:
+        return f"{self.severity}: {self.message}"
+
+
+class WorkflowDefValidationError(ValueError):
+    def __init__(self, issues: List[WorkflowDefIssue]):
+        self.issues = issues
+        super().__init__("Invalid workflow definition:\n" + "\n".join(f"  {issue}" for issue in issues))
+
+
+@dataclass
+class _Position:
+    parent: Optional[str]
+    branch: Optional[str]
+    index: int
+
+
+@dataclass
+class WorkflowDefIndex:
+    """Lookup tables over a workflow definition, built in one pass over its (nested) tasks.
+
+    ``tasks`` maps reference names to task JSON (``taskReferenceName``, ``inputParameters``, ...,
+    the format the server receives); ``parent`` and ``children`` give the enclosing fork, switch or
+    loop; ``fork_join`` / ``join_fork`` pair each fork with the JOIN that follows it; ``references``
+    lists the task reference names each task's input expressions (``${ref.output...}``) point at
+    and ``referenced_by`` is its inverse.
+    """
+    tasks: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    parent: Dict[str, Optional[str]] = field(default_factory=dict)
+    children: Dict[str, List[str]] = field(default_factory=dict)
+    fork_join: Dict[str, Optional[str]] = field(default_factory=dict)
+    join_fork: Dict[str, Optional[str]] = field(default_factory=dict)
+    references: Dict[str, Set[str]] = field(default_factory=dict)
+    referenced_by: Dict[str, Set[str]] = field(default_factory=dict)
+    output_references: Set[str] = field(default_factory=set)
+    duplicates: List[str] = field(default_factory=list)
+    unnamed: int = 0
+    _positions: Dict[str, _Position] = field(default_factory=dict, repr=False)
+    _sequences: List[Tuple[Optional[str], Optional[str], List[Dict[str, Any]]]] = field(default_factory=list,
+                                                                                        repr=False)
+
+    @classmethod
+    def build(cls, workflow_def: Union[WorkflowDef, Dict[str, Any]]) -> WorkflowDefIndex:
+        """Indexes a :class:`WorkflowDef` or its JSON form."""
+        payload = workflow_def if isinstance(workflow_def, dict) else _SERIALIZER.sanitize_for_serialization(
+            workflow_def)
+        index = cls()
+        stack = [(None, None, payload.get("tasks") or [])]
+        while stack:
+            parent, branch, sequence = stack.pop()
+            index._sequences.append((parent, branch, sequence))
+            for position, task in enumerate(sequence):
+                ref = task.get("taskReferenceName")
+                if not ref:
+                    index.unnamed += 1
+                    continue
+                if ref in index.tasks:
+                    index.duplicates.append(ref)
+                    continue
+                index.tasks[ref] = task
+                index.parent[ref] = parent
+                index._positions[ref] = _Position(parent, branch, position)
+                index.children[ref] = []
+                if parent is not None:
+                    index.children[parent].append(ref)
+                index.references[ref] = _input_references(task)
+                for root in index.references[ref]:
+                    index.referenced_by.setdefault(root, set()).add(ref)
+                # Reversed so that branches are popped, and children recorded, in definition order.
+                for child_branch, child_sequence in reversed(list(_nested_sequences(task))):
+                    stack.append((ref, child_branch, child_sequence))
+            index._pair_forks(sequence)
+        index.output_references = _expression_roots(payload.get("outputParameters"))
+        return index
+
+    def _pair_forks(self, sequence: List[Dict[str, Any]]) -> None:
+        for position, task in enumerate(sequence):
+            ref = task.get("taskReferenceName")
+            if task.get("type") in _FORK_TYPES and ref:
+                following = sequence[position + 1] if position + 1 < len(sequence) else None
+                join = following.get("taskReferenceName") if following and following.get("type") == "JOIN" else None
+                self.fork_join[ref] = join
+            elif task.get("type") == "JOIN" and ref:
+                previous = sequence[position - 1] if position > 0 else None
+                fork = previous.get("taskReferenceName") if previous and previous.get("type") in _FORK_TYPES else None
+                self.join_fork[ref] = fork
+
+    def __contains__(self, ref: str) -> bool:
+        return ref in self.tasks
+
+    def __getitem__(self, ref: str) -> Dict[str, Any]:
+        return self.tasks[ref]
+
+    def ancestors(self, ref: str) -> Iterator[str]:
+        """Yields the enclosing tasks of ``ref``, innermost first."""
+        parent = self.parent.get(ref)
+        while parent is not None:
+            yield parent
+            parent = self.parent.get(parent)
+
+    def branch_of(self, ref: str) -> Optional[str]:
+        """The fork branch index, switch case or ``"loopOver"`` that directly contains ``ref``."""
+        position = self._positions.get(ref)
+        return position.branch if position else None
+
+    def validate(self) -> List[WorkflowDefIssue]:
+        """Checks the definition in time linear in its size; returns the issues found (empty if none)."""
+        issues = []
+        if self.unnamed:
+            issues.append(WorkflowDefIssue("missing_reference_name",
+                                           f"{self.unnamed} task(s) have no taskReferenceName"))
+        for ref in self.duplicates:
+            issues.append(WorkflowDefIssue("duplicate_reference_name",
+                                           f"taskReferenceName '{ref}' is used more than once", ref))
+        for ref, roots in self.references.items():
+            for root in sorted(roots - self.tasks.keys()):
+                issues.append(WorkflowDefIssue("dangling_reference",
+                                               f"task '{ref}' references unknown task '{root}'", ref))
+        for root in sorted(self.output_references - self.tasks.keys()):
+            issues.append(WorkflowDefIssue("dangling_reference",
+                                           f"workflow output references unknown task '{root}'"))
+        for fork, join in self.fork_join.items():
+            if join is None:
+                issues.append(WorkflowDefIssue("missing_join",
+                                               f"fork '{fork}' is not immediately followed by a JOIN task", fork))
+            elif self.tasks[fork].get("type") == "FORK_JOIN":
+                branches = set(self.children[fork])
+                for awaited in self.tasks[join].get("joinOn") or []:
+                    if awaited not in branches and not any(a in branches for a in self.ancestors(awaited)):
+                        issues.append(WorkflowDefIssue(
+                            "join_on_outside_fork",
+                            f"join '{join}' waits on '{awaited}', which is not part of fork '{fork}'", join))
+        for join, fork in self.join_fork.items():
+            if fork is None:
+                issues.append(WorkflowDefIssue("orphan_join", f"join '{join}' does not follow a fork task", join))
+        for _, _, sequence in self._sequences:
+            for position, task in enumerate(sequence[:-1]):
+                if task.get("type") == "TERMINATE":
+                    for unreachable in sequence[position + 1:]:
+                        issues.append(WorkflowDefIssue(
+                            "unreachable_task",
+                            f"task '{unreachable.get('taskReferenceName')}' follows TERMINATE task "
+                            f"'{task.get('taskReferenceName')}' and never runs",
+                            unreachable.get("taskReferenceName"), severity="warning"))
+                    break
+        return issues
+
+    def raise_for_errors(self) -> None:
+        """Raises :class:`WorkflowDefValidationError` if :meth:`validate` finds any error-level issue."""
+        errors = [issue for issue in self.validate() if issue.severity == "error"]
+        if errors:
+            raise WorkflowDefValidationError(errors)
+
+
+def _nested_sequences(task: Dict[str, Any]) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    for i, branch in enumerate(task.get("forkTasks") or []):
+        yield str(i), branch
+    for case, branch in (task.get("decisionCases") or {}).items():
+        yield case, branch
+    if task.get("defaultCase"):
+        yield "defaultCase", task["defaultCase"]
+    if task.get("loopOver"):
+        yield "loopOver", task["loopOver"]
+
+
+def _input_references(task: Dict[str, Any]) -> Set[str]:
+    inputs = task.get("inputParameters")
+    if task.get("type") == "INLINE" and isinstance(inputs, dict) and "expression" in inputs:
+        # The script may contain JavaScript template literals, which are not Conductor expressions.
+        inputs = {key: value for key, value in inputs.items() if key != "expression"}
+    return _expression_roots(inputs)
+
+
+def _expression_roots(value: Any) -> Set[str]:
+    """Reference roots of every ``${...}`` expression inside a (nested) parameter value."""
+    roots: Set[str] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if "${" in item:
+                roots.update(root for root in _EXPRESSION.findall(item)
+                             if root not in _BUILTIN_ROOTS and not root.startswith("$"))
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return roots
@@ -0,0 +1,157 @@
+"""
+Benchmark: per-task metrics overhead and provider scrape latency.
+
+Measures, for the legacy and canonical collectors:
+
+    * per-task overhead - wall time of the metric events a TaskRunner emits for
+                          one task (poll started/completed, execution
+                          started/completed, update time), write-through vs
+                          locally aggregated (``MetricsSettings.flush_interval``)
+    * scrape latency    - time to render the provider registry over the
+                          ``.db`` files of N worker processes, uncached vs
+                          with the cached aggregated view
+
+Every measurement runs in a fresh interpreter because prometheus_client picks
+its multiprocess value class from ``PROMETHEUS_MULTIPROC_DIR`` at import time.
+
+Run:
+
+    python -m tests.benchmark.bench_metrics
+    python -m tests.benchmark.bench_metrics --tasks 50000 --processes 32
+
+Not collected by pytest; numbers depend heavily on the host.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+COLLECTORS = ("legacy", "canonical")
+TASK_TYPES = 8
+
+
+def _make_collector(kind: str, directory: str, flush_interval: Optional[float]):
+    from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+    from conductor.client.telemetry.canonical_metrics_collector import CanonicalMetricsCollector
+    from conductor.client.telemetry.legacy_metrics_collector import LegacyMetricsCollector
+
+    settings = MetricsSettings(directory=directory, flush_interval=flush_interval)
+    if kind == "canonical":
+        return CanonicalMetricsCollector(settings)
+    return LegacyMetricsCollector(settings)
+
+
+def _emit_tasks(collector, tasks: int) -> None:
+    from conductor.client.event.task_runner_events import (
+        PollCompleted,
+        PollStarted,
+        TaskExecutionCompleted,
+        TaskExecutionStarted,
+    )
+
+    for i in range(tasks):
+        task_type = f"task_{i % TASK_TYPES}"
+        collector.on_poll_started(PollStarted(task_type=task_type, worker_id="w", poll_count=1))
+        collector.on_poll_completed(PollCompleted(task_type=task_type, duration_ms=1.5, tasks_received=1))
+        collector.on_task_execution_started(TaskExecutionStarted(
+            task_type=task_type, task_id=str(i), worker_id="w", workflow_instance_id="wf"))
+        collector.on_task_execution_completed(TaskExecutionCompleted(
+            task_type=task_type, task_id=str(i), worker_id="w", workflow_instance_id="wf",
+            duration_ms=12.0, output_size_bytes=256))
+        collector.record_task_update_time(task_type, 0.004)
+
+
+def _single_overhead(kind: str, flush_interval: Optional[float], tasks: int) -> Dict[str, float]:
+    collector = _make_collector(kind, os.environ["PROMETHEUS_MULTIPROC_DIR"], flush_interval)
+    _emit_tasks(collector, min(tasks, 500))  # warm up metric objects
+
+    start = time.perf_counter()
+    _emit_tasks(collector, tasks)
+    elapsed = time.perf_counter() - start
+
+    flush_start = time.perf_counter()
+    collector.close()
+    flush_elapsed = time.perf_counter() - flush_start
+    return {"us_per_task": elapsed / tasks * 1e6, "final_flush_ms": flush_elapsed * 1e3}
+
+
+def _single_scrape(directory: str, ttl: float, scrapes: int) -> Dict[str, float]:
+    from prometheus_client import generate_latest
+
+    from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+    from conductor.client.telemetry.metrics_collector_base import MetricsCollectorBase
+
+    settings = MetricsSettings(directory=directory, update_interval=ttl)
+    registry = MetricsCollectorBase._build_provider_registry(settings)
+    generate_latest(registry)
+
+    start = time.perf_counter()
+    for _ in range(scrapes):
+        generate_latest(registry)
+    elapsed = time.perf_counter() - start
+    return {"ms_per_scrape": elapsed / scrapes * 1e3}
+
+
+def _run(args: List[str], directory: str) -> Dict[str, float]:
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=directory)
+    cmd = [sys.executable, "-m", "tests.benchmark.bench_metrics"] + args
+    output = subprocess.run(cmd, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=16,
+                        help="worker processes whose .db files the provider merges")
+    parser.add_argument("--scrapes", type=int, default=50)
+    parser.add_argument("--flush-interval", type=float, default=1.0)
+    parser.add_argument("--single", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.single:
+        if args.single[0] == "overhead":
+            flush_interval = float(args.single[2]) or None
+            result = _single_overhead(args.single[1], flush_interval, args.tasks)
+        elif args.single[0] == "populate":
+            collector = _make_collector(args.single[1], os.environ["PROMETHEUS_MULTIPROC_DIR"], None)
+            _emit_tasks(collector, 200)
+            result = {}
+        else:
+            result = _single_scrape(os.environ["PROMETHEUS_MULTIPROC_DIR"], float(args.single[1]), args.scrapes)
+        print(json.dumps(result))
+        return 0
+
+    print(f"per-task overhead ({args.tasks} tasks, {TASK_TYPES} task types)")
+    for kind in COLLECTORS:
+        for label, interval in (("write-through", 0.0), ("aggregated", args.flush_interval)):
+            directory = tempfile.mkdtemp(prefix="bench-metrics-")
+            try:
+                result = _run(["--tasks", str(args.tasks), "--single", "overhead", kind, str(interval)], directory)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+            print(f"  {kind:<10} {label:<14} {result['us_per_task']:8.1f} us/task"
+                  f"  (final flush {result['final_flush_ms']:.1f} ms)")
+
+    print(f"scrape latency ({args.processes} worker .db files, {args.scrapes} scrapes)")
+    for kind in COLLECTORS:
+        directory = tempfile.mkdtemp(prefix="bench-metrics-")
+        try:
+            for _ in range(args.processes):
+                _run(["--single", "populate", kind], directory)
+            for label, ttl in (("uncached", 0.0), ("cached", 15.0)):
+                result = _run(["--scrapes", str(args.scrapes), "--single", "scrape", str(ttl)], directory)
+                print(f"  {kind:<10} {label:<14} {result['ms_per_scrape']:8.2f} ms/scrape")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
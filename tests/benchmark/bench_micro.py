@@ -0,0 +1,399 @@
+"""
+Benchmark: micro-benchmarks of SDK hot paths, with stored baselines.
+
+Each case times one call of a hot path (serializing and deserializing Task,
+Workflow and SearchResult payloads, Worker.execute argument binding,
+convert_from_dict, event publishing, metrics collectors, the LeaseManager
+scan, ConductorWorkflow.to_workflow_def). Loops are calibrated per case so one
+run takes at least ``--min-time``; the best of ``--repeat`` runs is reported,
+which is the least noise-sensitive statistic for short CPU-bound code.
+
+Baselines are JSON files (``tests/benchmark/baselines/micro.json`` by default)
+recording per-case timings plus the Python version and host they were taken
+on. ``--compare`` re-runs the suite and exits non-zero when a case is slower
+than its baseline by more than ``--threshold``; compare on the same host and
+interpreter that produced the baseline.
+
+Run:
+
+    python -m tests.benchmark.bench_micro
+    python -m tests.benchmark.bench_micro --filter serialize --repeat 10
+    python -m tests.benchmark.bench_micro --save          # refresh the stored baseline
+    python -m tests.benchmark.bench_micro --compare --threshold 0.15
+
+Not collected by pytest; numbers depend heavily on the host.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "micro.json")
+
+CASES: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def case(name: str):
+    """Register a case: the decorated function does the setup and returns the zero-argument callable to time."""
+    def register(setup: Callable[[], Callable[[], object]]):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# -- Payloads -------------------------------------------------------------------------------------
+
+def _task_dict(i: int = 0) -> dict:
+    return {
+        "taskType": "process_order", "status": "IN_PROGRESS", "referenceTaskName": f"process_order_{i}",
+        "retryCount": 0, "seq": i, "pollCount": 1, "taskDefName": "process_order",
+        "scheduledTime": 1700000000000, "startTime": 1700000000100, "workflowInstanceId": "wf-1",
+        "workflowType": "orders", "taskId": f"task-{i}", "callbackAfterSeconds": 0, "responseTimeoutSeconds": 600,
+        "inputData": {"order_id": f"ORD-{i}", "amount": 99.5, "items": [{"sku": f"SKU-{n}", "qty": n} for n in range(5)],
+                      "customer": {"id": "C-1", "tier": "gold", "tags": ["a", "b", "c"]}},
+        "outputData": {}, "workflowTask": {"name": "process_order", "taskReferenceName": f"process_order_{i}",
+                                           "type": "SIMPLE", "inputParameters": {"order_id": "${workflow.input.id}"}},
+    }
+
+
+def _workflow_dict(tasks: int = 50) -> dict:
+    return {
+        "workflowId": "wf-1", "workflowName": "orders", "workflowVersion": 1, "status": "RUNNING",
+        "input": {"id": "ORD-1"}, "output": {}, "correlationId": "corr", "startTime": 1700000000000,
+        "tasks": [_task_dict(i) for i in range(tasks)], "variables": {"attempt": 1},
+    }
+
+
+def _search_result_dict(results: int = 100) -> dict:
+    return {
+        "totalHits": results,
+        "results": [{
+            "workflowType": "orders", "version": 1, "workflowId": f"wf-{i}", "correlationId": f"corr-{i}",
+            "startTime": "2024-01-01T00:00:00Z", "updateTime": "2024-01-01T00:00:01Z", "status": "COMPLETED",
+            "input": '{"id": 1}', "output": '{"ok": true}', "executionTime": 1000, "failedReferenceTaskNames": "",
+        } for i in range(results)],
+    }
+
+
+# -- ApiClient serialization ----------------------------------------------------------------------
+
+def _api_client():
+    from conductor.client.configuration.configuration import Configuration
+    from conductor.client.http.api_client import ApiClient
+
+    return ApiClient(Configuration(server_api_url="http://localhost:8080/api"))
+
+
+@case("serialize.task")
+def _serialize_task():
+    from conductor.client.http.models import Task
+
+    client = _api_client()
+    task = client.deserialize_class(_task_dict(), Task)
+    return lambda: client.sanitize_for_serialization(task)
+
+
+@case("serialize.workflow_50_tasks")
+def _serialize_workflow():
+    from conductor.client.http.models import Workflow
+
+    client = _api_client()
+    workflow = client.deserialize_class(_workflow_dict(), Workflow)
+    return lambda: client.sanitize_for_serialization(workflow)
+
+
+@case("deserialize.task")
+def _deserialize_task():
+    client = _api_client()
+    data = _task_dict()
+    return lambda: client.deserialize_class(data, "Task")
+
+
+@case("deserialize.task_list_10")
+def _deserialize_task_list():
+    client = _api_client()
+    data = [_task_dict(i) for i in range(10)]
+    return lambda: client.deserialize_class(data, "list[Task]")
+
+
+@case("deserialize.workflow_50_tasks")
+def _deserialize_workflow():
+    client = _api_client()
+    data = _workflow_dict()
+    return lambda: client.deserialize_class(data, "Workflow")
+
+
+@case("deserialize.search_result_100")
+def _deserialize_search_result():
+    client = _api_client()
+    data = _search_result_dict()
+    return lambda: client.deserialize_class(data, "SearchResultWorkflowSummary")
+
+
+# -- Worker argument binding ----------------------------------------------------------------------
+
+@dataclass
+class _Customer:
+    id: str
+    tier: str
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _Item:
+    sku: str
+    qty: int
+
+
+def _process_order(order_id: str, amount: float, customer: dict) -> dict:
+    return {"order_id": order_id}
+
+
+def _process_typed_order(order_id: str, amount: float, items: List[_Item], customer: _Customer) -> dict:
+    return {"order_id": order_id}
+
+
+def _worker_case(function):
+    from conductor.client.http.models import Task
+    from conductor.client.worker.worker import Worker
+
+    worker = Worker("process_order", function)
+    task = _api_client().deserialize_class(_task_dict(), Task)
+    return lambda: worker.execute(task)
+
+
+@case("worker.execute.simple_params")
+def _worker_simple():
+    return _worker_case(_process_order)
+
+
+@case("worker.execute.dataclass_param")
+def _worker_dataclass():
+    return _worker_case(_process_typed_order)
+
+
+@case("utils.convert_from_dict")
+def _convert_from_dict():
+    from conductor.client.automator.utils import convert_from_dict
+
+    data = {"id": "C-1", "tier": "gold", "tags": ["a", "b", "c"]}
+    return lambda: convert_from_dict(_Customer, data)
+
+
+# -- Events and metrics ---------------------------------------------------------------------------
+
+def _poll_started():
+    from conductor.client.event.task_runner_events import PollStarted
+
+    return PollStarted(task_type="process_order", worker_id="w", poll_count=1)
+
+
+@case("events.publish.no_listeners")
+def _publish_no_listeners():
+    from conductor.client.event.sync_event_dispatcher import SyncEventDispatcher
+
+    dispatcher = SyncEventDispatcher()
+    event = _poll_started()
+    return lambda: dispatcher.publish(event)
+
+
+@case("events.publish.one_listener")
+def _publish_one_listener():
+    from conductor.client.event.sync_event_dispatcher import SyncEventDispatcher
+    from conductor.client.event.task_runner_events import PollStarted
+
+    dispatcher = SyncEventDispatcher()
+    dispatcher.register(PollStarted, lambda event: None)
+    event = _poll_started()
+    return lambda: dispatcher.publish(event)
+
+
+def _metrics_case(kind: str):
+    from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+    from conductor.client.event.task_runner_events import (
+        PollCompleted,
+        TaskExecutionCompleted,
+        TaskExecutionStarted,
+    )
+    from conductor.client.telemetry.canonical_metrics_collector import CanonicalMetricsCollector
+    from conductor.client.telemetry.legacy_metrics_collector import LegacyMetricsCollector
+
+    settings = MetricsSettings(directory=os.environ["PROMETHEUS_MULTIPROC_DIR"])
+    collector = (CanonicalMetricsCollector if kind == "canonical" else LegacyMetricsCollector)(settings)
+    poll_started = _poll_started()
+    poll_completed = PollCompleted(task_type="process_order", duration_ms=1.5, tasks_received=1)
+    started = TaskExecutionStarted(task_type="process_order", task_id="t", worker_id="w",
+                                   workflow_instance_id="wf")
+    completed = TaskExecutionCompleted(task_type="process_order", task_id="t", worker_id="w",
+                                       workflow_instance_id="wf", duration_ms=12.0, output_size_bytes=256)
+
+    def one_task():
+        collector.on_poll_started(poll_started)
+        collector.on_poll_completed(poll_completed)
+        collector.on_task_execution_started(started)
+        collector.on_task_execution_completed(completed)
+        collector.record_task_update_time("process_order", 0.004)
+
+    return one_task
+
+
+@case("metrics.legacy.per_task")
+def _metrics_legacy():
+    return _metrics_case("legacy")
+
+
+@case("metrics.canonical.per_task")
+def _metrics_canonical():
+    return _metrics_case("canonical")
+
+
+@case("lease_manager.scan_10k_tracked")
+def _lease_scan():
+    from conductor.client.automator.lease_tracker import LeaseManager
+
+    manager = LeaseManager()
+    manager._ensure_started = lambda: None  # keep the background thread out of the measurement
+    for i in range(10000):
+        manager.track(f"task-{i}", "wf", 3600, None)
+    return manager._check_and_send
+
+
+# -- Workflow DSL ---------------------------------------------------------------------------------
+
+def _workflow(tasks: int = 200):
+    from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+    from conductor.client.workflow.task.simple_task import SimpleTask
+
+    workflow = ConductorWorkflow(executor=None, name="orders", version=1)
+    for i in range(tasks):
+        task = SimpleTask("process_order", f"process_order_{i}")
+        task.input_parameters = {"order_id": "${workflow.input.id}", "attempt": i, "items": [1, 2, 3]}
+        workflow.add(task)
+    return workflow
+
+
+@case("workflow.to_workflow_def_200_tasks")
+def _to_workflow_def():
+    workflow = _workflow()
+
+    def compile_workflow():
+        workflow.invalidate()
+        return workflow._shared_workflow_def()
+
+    return compile_workflow
+
+
+@case("workflow.to_workflow_def_200_tasks_cached")
+def _to_workflow_def_cached():
+    workflow = _workflow()
+    workflow._shared_workflow_def()
+    return workflow._shared_workflow_def
+
+
+# -- Harness --------------------------------------------------------------------------------------
+
+def measure(function: Callable[[], object], min_time: float, repeat: int) -> Dict[str, float]:
+    """Best and median seconds per call over ``repeat`` runs of a calibrated loop count."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.2))
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        runs.append((time.perf_counter() - start) / number)
+    return {"best_us": round(min(runs) * 1e6, 3), "median_us": round(statistics.median(runs) * 1e6, 3),
+            "loops": number}
+
+
+def machine() -> Dict[str, str]:
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "platform": platform.platform(), "processor": platform.processor() or platform.machine(),
+            "cpus": str(os.cpu_count())}
+
+
+def run(names: List[str], min_time: float, repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name in names:
+        results[name] = measure(CASES[name](), min_time, repeat)
+        print(f"{name:<44}{results[name]['best_us']:>12.2f} us{results[name]['median_us']:>12.2f} us",
+              file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: dict, threshold: float) -> List[str]:
+    """Print a comparison table and return the names of cases slower than baseline by more than threshold."""
+    if baseline.get("machine") != machine():
+        print("warning: baseline was recorded on a different host or interpreter:\n"
+              f"  baseline: {baseline.get('machine')}\n  current:  {machine()}")
+    regressions = []
+    print(f"{'case':<44}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            print(f"{name:<44}{'-':>12}{result['best_us']:>12.2f}{'new':>10}")
+            continue
+        change = result["best_us"] / before["best_us"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<44}{before['best_us']:>12.2f}{result['best_us']:>12.2f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--filter", action="append", default=[], help="only run cases containing this substring")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per timed run")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, help="write results as a baseline file")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="compare against a baseline file")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative slowdown that counts as a regression (default 0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if not args.filter or any(f in name for f in args.filter)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    # The metrics collectors need a multiprocess directory before prometheus_client is imported.
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="conductor-bench-micro-"))
+    results = run(names, args.min_time, args.repeat)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump({"machine": machine(), "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written to {args.save}")
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+        return 0
+    if not args.save:
+        print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
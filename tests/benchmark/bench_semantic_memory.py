@@ -0,0 +1,119 @@
+"""
+Benchmark: SemanticMemory's InMemoryStore at 100k memories.
+
+Fills a store with N synthetic memories of 8-20 words from a 5000-word
+vocabulary (Zipf-distributed, like the words of real text) and measures:
+
+    * add             - adding all memories (keyword index, and the vector
+                        index with --dim > 0)
+    * keyword search  - mean latency of ``search()`` through the inverted index
+    * full scan       - the same queries scored against every memory and
+                        fully sorted, as the store did before it was indexed
+    * vector search   - mean latency of ``search_by_vector()`` (--dim > 0)
+    * save / load     - ``save()`` and reopening with the vectors memory-mapped
+
+Run:
+
+    python -m tests.benchmark.bench_semantic_memory
+    python -m tests.benchmark.bench_semantic_memory --memories 20000 --dim 0
+
+Not collected by pytest; numbers depend heavily on the host.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+from conductor.ai.agents.semantic_memory import InMemoryStore, MemoryEntry
+
+VOCABULARY = 5000
+
+
+WORDS = [f"w{rank}" for rank in range(VOCABULARY)]
+# Zipf's law: the word of rank r occurs with frequency proportional to 1/r.
+CUM_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(VOCABULARY)))
+
+
+def _words(rng: random.Random, count: int) -> List[str]:
+    return rng.choices(WORDS, cum_weights=CUM_WEIGHTS, k=count)
+
+
+def _full_scan(entries: List[MemoryEntry], query: str, top_k: int) -> List[MemoryEntry]:
+    query_words = set(query.lower().split())
+    scored = []
+    for entry in entries:
+        entry_words = set(entry.content.lower().split())
+        union = query_words | entry_words
+        scored.append((len(query_words & entry_words) / len(union) if union else 0.0, entry))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [entry for score, entry in scored[:top_k] if score > 0]
+
+
+def _mean_ms(fn, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries) * 1e3
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memories", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384, help="embedding dimensions; 0 for keyword search only")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=5, help="queries timed against the full scan")
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    contents = [" ".join(_words(rng, rng.randint(8, 20))) for _ in range(args.memories)]
+    queries = [" ".join(_words(rng, rng.randint(3, 8))) for _ in range(args.queries)]
+    vectors = query_vectors = None
+    if args.dim:
+        import numpy as np
+
+        generator = np.random.default_rng(42)
+        vectors = generator.normal(size=(args.memories, args.dim)).astype(np.float32)
+        query_vectors = generator.normal(size=(args.queries, args.dim)).astype(np.float32)
+
+    store = InMemoryStore()
+    start = time.perf_counter()
+    for i, content in enumerate(contents):
+        embedding = vectors[i] if vectors is not None else None
+        store.add(MemoryEntry(id=f"m{i}", content=content, created_at=1.0, embedding=embedding))
+    add = time.perf_counter() - start
+
+    keyword = _mean_ms(lambda q: store.search(q, top_k=args.top_k), queries)
+    entries = store.list_all()
+    scan = _mean_ms(lambda q: _full_scan(entries, q, args.top_k), queries[: args.scan_queries])
+
+    print(f"{args.memories} memories, {args.queries} queries, top_k={args.top_k}, dim={args.dim}")
+    print(f"  add             {add * 1e3:10.1f} ms total")
+    print(f"  keyword search  {keyword:10.3f} ms/query")
+    print(f"  full scan       {scan:10.3f} ms/query  ({scan / keyword:.0f}x slower)")
+
+    if query_vectors is not None:
+        vector = _mean_ms(lambda q: store.search_by_vector(q, top_k=args.top_k), query_vectors)
+        print(f"  vector search   {vector:10.3f} ms/query")
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/memories"
+            start = time.perf_counter()
+            store.save(path)
+            save = time.perf_counter() - start
+            start = time.perf_counter()
+            loaded = InMemoryStore(path=path)
+            load = time.perf_counter() - start
+            mapped = _mean_ms(lambda q: loaded.search_by_vector(q, top_k=args.top_k), query_vectors)
+            print(f"  save            {save * 1e3:10.1f} ms")
+            print(f"  load            {load * 1e3:10.1f} ms (vectors memory-mapped)")
+            print(f"  mapped search   {mapped:10.3f} ms/query")
+            del loaded
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
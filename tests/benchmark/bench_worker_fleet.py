@@ -0,0 +1,231 @@
+"""
+Benchmark: worker fleet throughput against a local Conductor stand-in server.
+
+Starts ``conductor.client.testing.local_server`` in a subprocess (optionally with
+injected latency, 5xx, 401 and disconnects), points a fleet of no-op workers at
+it and reports:
+
+    * throughput    - completed tasks per second, measured from the moment
+                      every worker has started polling
+    * pickup (ms)   - time a task sat queued before a worker polled it,
+                      p50 / p99 as recorded by the server
+    * CPU / task    - worker CPU time (user + sys) per completed task, in ms;
+                      the server's own CPU is reported separately
+    * redelivered   - tasks requeued because the worker never updated them
+                      within --response-timeout-seconds (e.g. a poll response
+                      lost to a dropped connection)
+
+Modes:
+
+    handler    TaskHandler with one process per worker (the production path)
+    inprocess  AsyncTaskRunner per worker inside this process
+
+Run:
+
+    python -m tests.benchmark.bench_worker_fleet --tasks 20000 --workers 4 --thread-count 10
+    python -m tests.benchmark.bench_worker_fleet --mode inprocess --async-workers
+    python -m tests.benchmark.bench_worker_fleet --latency-ms 5 --error-rate 0.01 \\
+        --disconnect-rate 0.005 --fault-path /tasks/poll
+
+Not collected by pytest; numbers depend heavily on the host.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+# The server requires these so that injected 401s exercise the clients' token refresh.
+KEY_ID = "bench-key"
+KEY_SECRET = "bench-secret"
+
+
+def noop_worker(task_index: int = 0) -> dict:
+    return {"task_index": task_index}
+
+
+async def async_noop_worker(task_index: int = 0) -> dict:
+    return {"task_index": task_index}
+
+
+def _request(url: str, method: str = "GET", body: Optional[dict] = None) -> dict:
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return json.loads(response.read() or b"{}")
+
+
+def _configuration(url: str):
+    from conductor.client.configuration.configuration import Configuration
+    from conductor.client.configuration.settings.authentication_settings import AuthenticationSettings
+
+    # ERROR level keeps injected-fault warnings out of the report.
+    return Configuration(server_api_url=url, log_level="ERROR",
+                         authentication_settings=AuthenticationSettings(key_id=KEY_ID, key_secret=KEY_SECRET))
+
+
+def _cpu_seconds(pid: int) -> float:
+    """User + system CPU seconds of *pid* from /proc (0 where unavailable)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return 0.0
+
+
+def _start_server(args: argparse.Namespace) -> (subprocess.Popen, str):
+    cmd = [
+        sys.executable, "-m", "conductor.client.testing.local_server", "--port", "0",
+        "--latency-ms", str(args.latency_ms), "--latency-jitter-ms", str(args.latency_jitter_ms),
+        "--error-rate", str(args.error_rate), "--unauthorized-rate", str(args.unauthorized_rate),
+        "--disconnect-rate", str(args.disconnect_rate),
+        "--max-requests-per-connection", str(args.max_requests_per_connection), "--seed", "1",
+        "--key-id", KEY_ID, "--key-secret", KEY_SECRET,
+        "--response-timeout-seconds", str(args.response_timeout_seconds),
+    ]
+    for path in args.fault_path:
+        cmd += ["--fault-path", path]
+    server = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    url = server.stdout.readline().strip()
+    if not url.startswith("http"):
+        server.kill()
+        raise RuntimeError("local server failed to start")
+    return server, url
+
+
+def _task_types(args: argparse.Namespace) -> List[str]:
+    return [f"bench_fleet_{i}" for i in range(args.workers)]
+
+
+def _drive(url: str, args: argparse.Namespace, cpu_seconds) -> Dict[str, float]:
+    """Wait for every worker to poll, feed tasks at the configured queue depth and time the drain."""
+    task_types = _task_types(args)
+    deadline = time.monotonic() + args.timeout
+    while _request(f"{url}/_local/stats")["polls"] < len(task_types):
+        if time.monotonic() > deadline:
+            raise TimeoutError("workers did not start polling")
+        time.sleep(0.05)
+
+    depth = args.queue_depth or args.tasks
+    seeded = 0
+    cpu_before = cpu_seconds()
+    started = time.perf_counter()
+    stats = _request(f"{url}/_local/stats")
+    baseline = stats["workflows_completed"]
+    while True:
+        completed = stats["workflows_completed"] - baseline
+        if completed >= args.tasks:
+            break
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"only {completed}/{args.tasks} tasks completed")
+        backlog = min(depth - (seeded - completed), args.tasks - seeded)
+        for i, task_type in enumerate(task_types):
+            count = backlog // len(task_types) + (1 if i < backlog % len(task_types) else 0)
+            if count > 0:
+                _request(f"{url}/_local/seed/{task_type}?count={count}", "POST", {"task_index": seeded})
+                seeded += count
+        time.sleep(0.01)
+        stats = _request(f"{url}/_local/stats")
+    elapsed = time.perf_counter() - started
+    worker_cpu = cpu_seconds() - cpu_before
+    pickup = stats["pickup_ms"]
+    return {
+        "tasks": args.tasks,
+        "seconds": round(elapsed, 3),
+        "tasks_per_second": round(args.tasks / elapsed, 1),
+        "pickup_p50_ms": pickup.get("p50"),
+        "pickup_p99_ms": pickup.get("p99"),
+        "worker_cpu_ms_per_task": round(worker_cpu * 1000 / args.tasks, 3),
+        "server_cpu_seconds": stats["server_cpu_seconds"],
+        "requests": stats["requests"],
+        "injected": stats["injected_errors"] + stats["injected_unauthorized"] + stats["injected_disconnects"],
+        "redelivered": stats["tasks_timed_out"],
+    }
+
+
+def run_handler(url: str, args: argparse.Namespace) -> Dict[str, float]:
+    from conductor.client.automator.task_handler import TaskHandler
+    from conductor.client.worker.worker import Worker
+
+    workers = [
+        Worker(task_definition_name=task_type,
+               execute_function=async_noop_worker if args.async_workers else noop_worker,
+               poll_interval=args.poll_interval_ms, thread_count=args.thread_count)
+        for task_type in _task_types(args)
+    ]
+    handler = TaskHandler(workers=workers, configuration=_configuration(url),
+                          scan_for_annotated_workers=False, monitor_processes=False)
+    handler.start_processes()
+    try:
+        return _drive(url, args, lambda: sum(_cpu_seconds(p.pid) for p in handler.task_runner_processes))
+    finally:
+        handler.stop_processes()
+
+
+def run_inprocess(url: str, args: argparse.Namespace) -> Dict[str, float]:
+    from conductor.client.automator.async_task_runner import AsyncTaskRunner
+    from conductor.client.worker.worker import Worker
+
+    configuration = _configuration(url)
+    runners = [
+        AsyncTaskRunner(Worker(task_definition_name=task_type, execute_function=async_noop_worker,
+                               poll_interval=args.poll_interval_ms, thread_count=args.thread_count),
+                        configuration=configuration)
+        for task_type in _task_types(args)
+    ]
+
+    async def scenario():
+        tasks = [asyncio.create_task(runner.run()) for runner in runners]
+        try:
+            return await asyncio.to_thread(_drive, url, args, time.process_time)
+        finally:
+            await asyncio.gather(*(runner.stop() for runner in runners))
+            await asyncio.wait(tasks, timeout=10)
+
+    return asyncio.run(scenario())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=["handler", "inprocess"], default="handler")
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=4, help="number of task types, one worker each")
+    parser.add_argument("--thread-count", type=int, default=10)
+    parser.add_argument("--poll-interval-ms", type=int, default=100)
+    parser.add_argument("--async-workers", action="store_true", help="use async def workers in handler mode")
+    parser.add_argument("--queue-depth", type=int, default=0, help="tasks kept queued (0 = enqueue all upfront)")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0)
+    parser.add_argument("--disconnect-rate", type=float, default=0.0)
+    parser.add_argument("--max-requests-per-connection", type=int, default=0)
+    parser.add_argument("--fault-path", action="append", default=[])
+    parser.add_argument("--response-timeout-seconds", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--json", action="store_true", help="print the result as one JSON line")
+    args = parser.parse_args(argv)
+
+    server, url = _start_server(args)
+    try:
+        result = (run_handler if args.mode == "handler" else run_inprocess)(url, args)
+    finally:
+        server.terminate()
+        server.wait(10)
+
+    if args.json:
+        print(json.dumps(result))
+        return 0
+    for key, value in result.items():
+        print(f"{key:<26}{value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Benchmark: worker-process cold start and memory under each isolation mode.
+
+Starts a TaskHandler with N no-op workers pointed at an unreachable server and
+measures, per CONDUCTOR_WORKER_ISOLATION mode:
+
+    * ready time  - from start_processes() until every worker process has
+                    reached its first poll (imports done, TaskRunner built)
+    * RSS / PSS   - summed across worker processes once all are ready. PSS
+                    (proportional set size, Linux only) charges shared
+                    copy-on-write pages fractionally, so it shows the memory
+                    actually saved by forking from a warm template.
+
+Each mode runs in a fresh interpreter because the multiprocessing start method
+and the fork server are process-global.
+
+Run:
+
+    python -m tests.benchmark.bench_worker_startup --workers 40
+    python -m tests.benchmark.bench_worker_startup --workers 40 \
+        --import-module conductor.ai.agents --modes process forkserver
+
+Not collected by pytest; numbers depend heavily on the host.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+UNREACHABLE_SERVER = "http://127.0.0.1:9/api"
+
+
+def noop_worker(task_index: int = 0) -> dict:
+    return {"task_index": task_index}
+
+
+class ReadyMarker:
+    """Task runner listener that drops a ``<pid>`` file on the first poll."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._marked = False
+
+    def on_poll_started(self, event) -> None:
+        if self._marked:
+            return
+        self._marked = True
+        path = os.path.join(self.directory, str(os.getpid()))
+        with open(path, "w") as f:
+            f.write(str(time.time()))
+
+
+def _memory_kb(pid: int) -> Dict[str, int]:
+    """Return {'rss': kB, 'pss': kB} for *pid* (zeros where /proc is unavailable)."""
+    result = {"rss": 0, "pss": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in ("Rss", "Pss"):
+                    result[key.lower()] = int(rest.split()[0])
+    except OSError:
+        pass
+    return result
+
+
+def run_mode(workers: int, import_modules: List[str], timeout: float) -> Dict[str, float]:
+    """Run one measurement in the current interpreter (mode comes from the env)."""
+    from conductor.client.automator.task_handler import TaskHandler
+    from conductor.client.configuration.configuration import Configuration
+    from conductor.client.worker.worker import Worker
+
+    marker_dir = tempfile.mkdtemp(prefix="conductor-bench-startup-")
+    worker_list = [
+        Worker(
+            task_definition_name=f"bench_startup_{i}",
+            execute_function=noop_worker,
+            poll_interval=1000,
+        )
+        for i in range(workers)
+    ]
+    # ERROR level keeps the expected connection failures quiet.
+    configuration = Configuration(server_api_url=UNREACHABLE_SERVER, log_level="ERROR")
+
+    handler = TaskHandler(
+        workers=worker_list,
+        configuration=configuration,
+        scan_for_annotated_workers=False,
+        import_modules=import_modules or None,
+        event_listeners=[ReadyMarker(marker_dir)],
+        monitor_processes=False,
+    )
+    try:
+        started = time.perf_counter()
+        handler.start_processes()
+        deadline = started + timeout
+        while len(os.listdir(marker_dir)) < workers:
+            if time.perf_counter() > deadline:
+                raise TimeoutError(
+                    f"only {len(os.listdir(marker_dir))}/{workers} workers ready after {timeout}s"
+                )
+            time.sleep(0.01)
+        ready_seconds = time.perf_counter() - started
+
+        rss = pss = 0
+        for process in handler.task_runner_processes:
+            mem = _memory_kb(process.pid)
+            rss += mem["rss"]
+            pss += mem["pss"]
+    finally:
+        handler.stop_processes()
+
+    return {
+        "workers": workers,
+        "ready_seconds": round(ready_seconds, 3),
+        "rss_mb": round(rss / 1024, 1),
+        "pss_mb": round(pss / 1024, 1),
+    }
+
+
+def _run_in_subprocess(mode: str, args: argparse.Namespace) -> Optional[Dict[str, float]]:
+    env = dict(os.environ, CONDUCTOR_WORKER_ISOLATION=mode)
+    cmd = [
+        sys.executable, "-m", "tests.benchmark.bench_worker_startup",
+        "--single", "--workers", str(args.workers), "--timeout", str(args.timeout),
+    ]
+    for module in args.import_module:
+        cmd += ["--import-module", module]
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(f"[{mode}] failed:\n{proc.stderr[-2000:]}", file=sys.stderr)
+        return None
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=40)
+    parser.add_argument("--modes", nargs="+", default=["process", "forkserver"])
+    parser.add_argument("--import-module", action="append", default=[],
+                        help="extra module imported by every worker (simulates a heavy user module)")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.single:
+        print(json.dumps(run_mode(args.workers, args.import_module, args.timeout)))
+        return 0
+
+    print(f"{'mode':<12}{'workers':>8}{'ready (s)':>12}{'RSS (MB)':>12}{'PSS (MB)':>12}")
+    for mode in args.modes:
+        result = _run_in_subprocess(mode, args)
+        if result is None:
+            continue
+        print(f"{mode:<12}{result['workers']:>8}{result['ready_seconds']:>12}"
+              f"{result['rss_mb']:>12}{result['pss_mb']:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Benchmark: building and compiling a large generated workflow with the DSL.
+
+Builds a workflow of N tasks, each with an input template, grouped into
+DO_WHILE loops, FORK_JOIN branches and SWITCH cases the way generated
+workflows usually are, and measures:
+
+    * build      - constructing the task objects and composing them into the
+                   ConductorWorkflow (``>>`` / loop / fork / switch)
+    * compile    - the first ``to_workflow_def()``
+    * recompile  - a second ``to_workflow_def()`` on the unchanged workflow
+    * deepcopy   - ``copy.deepcopy`` of the whole workflow
+    * peak alloc - tracemalloc peak across build + compile (separate run)
+
+Run:
+
+    python -m tests.benchmark.bench_workflow_dsl
+    python -m tests.benchmark.bench_workflow_dsl --tasks 20000 --template-keys 50
+
+Not collected by pytest; numbers depend heavily on the host.
+"""
+
+import argparse
+import copy
+import sys
+import time
+import tracemalloc
+from typing import List, Optional
+
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.task.do_while_task import LoopTask
+from conductor.client.workflow.task.fork_task import ForkTask
+from conductor.client.workflow.task.simple_task import SimpleTask
+from conductor.client.workflow.task.switch_task import SwitchTask
+
+GROUP_SIZE = 10
+
+
+def _make_task(index: int, template_keys: int) -> SimpleTask:
+    task = SimpleTask(task_def_name=f"step_{index % 50}", task_reference_name=f"step_{index}")
+    task.input_parameters = {
+        f"field_{k}": {"source": f"${{workflow.input.record_{k}}}", "default": [k, str(k)], "required": k % 2 == 0}
+        for k in range(template_keys)
+    }
+    return task
+
+
+def build_workflow(tasks: int, template_keys: int) -> ConductorWorkflow:
+    workflow = ConductorWorkflow(executor=None, name="generated", version=1)
+    index = 0
+    group = 0
+    while index < tasks:
+        batch = [_make_task(index + i, template_keys) for i in range(min(GROUP_SIZE, tasks - index))]
+        index += len(batch)
+        kind = group % 4
+        if kind == 0:
+            workflow.add(batch)
+        elif kind == 1:
+            workflow >> LoopTask(task_ref_name=f"loop_{group}", iterations=3, tasks=batch)
+        elif kind == 2:
+            half = len(batch) // 2 or 1
+            workflow >> ForkTask(task_ref_name=f"fork_{group}", forked_tasks=[batch[:half], batch[half:]],
+                                 join_on=[])
+        else:
+            switch = SwitchTask(task_ref_name=f"switch_{group}", case_expression="${workflow.input.kind}")
+            switch.switch_case("a", batch[::2]).default_case(batch[1::2])
+            workflow >> switch
+        group += 1
+    return workflow
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--template-keys", type=int, default=20,
+                        help="input template entries per task")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    workflow = build_workflow(args.tasks, args.template_keys)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    workflow_def = workflow.to_workflow_def()
+    compile_ = time.perf_counter() - start
+
+    top_level = len(workflow_def.tasks)
+    start = time.perf_counter()
+    workflow.to_workflow_def()
+    recompile = time.perf_counter() - start
+
+    start = time.perf_counter()
+    copy.deepcopy(workflow)
+    deepcopy = time.perf_counter() - start
+
+    # separate run: tracemalloc slows allocation too much to time under it
+    del workflow, workflow_def
+    tracemalloc.start()
+    build_workflow(args.tasks, args.template_keys).to_workflow_def()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{args.tasks} tasks, {args.template_keys} template keys each, "
+          f"{top_level} top-level workflow tasks")
+    print(f"  build       {build * 1e3:10.1f} ms")
+    print(f"  compile     {compile_ * 1e3:10.1f} ms")
+    print(f"  recompile   {recompile * 1e3:10.1f} ms")
+    print(f"  deepcopy    {deepcopy * 1e3:10.1f} ms")
+    print(f"  peak alloc  {peak / 2 ** 20:10.1f} MiB (build + compile, tracemalloc)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Tests for the content-addressed agent compile cache."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from conductor.ai.agents.agent import Agent
+from conductor.ai.agents.runtime.compile_cache import CompileCache, compile_cache_key
+
+
+def _runtime(cache_dir=None):
+    with patch("conductor.client.orkes_clients.OrkesClients"):
+        with patch("conductor.ai.agents.runtime.worker_manager.TaskHandler", create=True):
+            from conductor.ai.agents.runtime.config import AgentConfig
+            from conductor.ai.agents.runtime.runtime import AgentRuntime
+
+            config = AgentConfig(auto_start_workers=False, compile_cache_dir=cache_dir)
+            runtime = AgentRuntime(settings=config)
+    runtime._agent_client.compile_agent = MagicMock(
+        side_effect=lambda payload: {"workflowDef": {"name": payload["agentConfig"]["name"], "tasks": []}}
+    )
+    return runtime
+
+
+class TestCompileCache:
+    def test_key_ignores_dict_order_but_not_content_or_server(self):
+        key = compile_cache_key({"agentConfig": {"name": "a", "model": "m"}}, "http://one")
+
+        assert key == compile_cache_key({"agentConfig": {"model": "m", "name": "a"}}, "http://one")
+        assert key != compile_cache_key({"agentConfig": {"name": "a", "model": "other"}}, "http://one")
+        assert key != compile_cache_key({"agentConfig": {"name": "a", "model": "m"}}, "http://two")
+
+    def test_key_changes_with_the_sdk_version(self):
+        payload = {"agentConfig": {"name": "a"}}
+        key = compile_cache_key(payload, "http://one")
+
+        with patch("conductor.ai.agents.runtime.compile_cache.__version__", "99.0.0"):
+            assert compile_cache_key(payload, "http://one") != key
+
+    def test_entries_expire_after_the_ttl(self, tmp_path):
+        CompileCache(str(tmp_path)).put("k", {"workflowDef": {"name": "wf"}})
+        cache = CompileCache(str(tmp_path), ttl_seconds=60)
+        assert cache.get("k") == {"workflowDef": {"name": "wf"}}
+
+        with patch("conductor.ai.agents.runtime.compile_cache.time.time", return_value=time.time() + 61):
+            assert cache.get("k") is None
+            assert CompileCache(str(tmp_path), ttl_seconds=60).get("k") is None
+        assert not (tmp_path / "k.json").exists()
+
+    def test_entries_are_shared_through_the_directory(self, tmp_path):
+        CompileCache(str(tmp_path)).put("k", {"workflowDef": {"name": "wf"}})
+
+        assert CompileCache(str(tmp_path)).get("k") == {"workflowDef": {"name": "wf"}}
+        assert CompileCache(str(tmp_path)).get("missing") is None
+        assert [name for name in os.listdir(tmp_path)] == ["k.json"]
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "k.json").write_text('{"workflowDef": ')
+
+        assert CompileCache(str(tmp_path)).get("k") is None
+        assert not (tmp_path / "k.json").exists()
+
+    def test_evicts_least_recently_used_entries_past_the_budget(self, tmp_path):
+        cache = CompileCache(str(tmp_path), max_bytes=400)
+        now = time.time()
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, {"pad": "x" * 80})
+            os.utime(tmp_path / f"{key}.json", (now - 100 + i, now - 100 + i))
+        CompileCache(str(tmp_path)).get("a")  # refreshes a's mtime
+
+        cache.put("d", {"pad": "x" * 80})
+
+        assert sorted(os.listdir(tmp_path)) == ["a.json", "c.json", "d.json"]
+
+
+class TestRuntimeCompileCache:
+    def test_changed_config_under_same_name_is_recompiled(self):
+        runtime = _runtime()
+        runtime._compile_agent(Agent(name="bot", model="openai/gpt-4o"))
+        runtime._compile_agent(Agent(name="bot", model="openai/gpt-4o"))
+        assert runtime._agent_client.compile_agent.call_count == 1
+
+        runtime._compile_agent(Agent(name="bot", model="anthropic/claude-sonnet-4"))
+        assert runtime._agent_client.compile_agent.call_count == 2
+
+    def test_new_runtime_reuses_compilations_from_disk(self, tmp_path):
+        first = _runtime(str(tmp_path))
+        first._compile_agent(Agent(name="bot", model="openai/gpt-4o"))
+
+        second = _runtime(str(tmp_path))
+        wf = second._compile_agent(Agent(name="bot", model="openai/gpt-4o"))
+
+        assert wf.name == "bot"
+        second._agent_client.compile_agent.assert_not_called()
+
+    def test_precompile_sends_misses_concurrently(self):
+        runtime = _runtime()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def compile_agent(payload):
+            barrier.wait()
+            return {"workflowDef": {"name": payload["agentConfig"]["name"], "tasks": []}}
+
+        runtime._agent_client.compile_agent = MagicMock(side_effect=compile_agent)
+        agents = [Agent(name=f"bot{i}", model="openai/gpt-4o") for i in range(3)]
+
+        compiled = runtime.precompile(*agents, Agent(name="bot0", model="openai/gpt-4o"))
+
+        assert [wf.name for wf in compiled] == ["bot0", "bot1", "bot2", "bot0"]
+        assert runtime._agent_client.compile_agent.call_count == 3
+
+    def test_precompile_raises_compile_errors(self):
+        runtime = _runtime()
+        runtime._agent_client.compile_agent = MagicMock(side_effect=RuntimeError("bad config"))
+
+        with pytest.raises(RuntimeError, match="bad config"):
+            runtime.precompile(Agent(name="bot", model="openai/gpt-4o"))
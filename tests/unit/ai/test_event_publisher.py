@@ -0,0 +1,107 @@
+"""Tests for the batched framework-worker event publisher."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from conductor.ai.agents._internal.event_publisher import EventPublisher
+
+SERVER = ("http://localhost:8080/api", "key", "secret")
+
+
+class _Recorder:
+    def __init__(self, delay=None):
+        self.posts = []
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, server_url, auth_key, auth_secret, path, body=None, **kwargs):
+        if self.delay is not None:
+            self.delay.wait(5)
+        with self.lock:
+            self.posts.append((path, body))
+
+
+def test_events_are_posted_in_order_per_execution_with_duplicates_coalesced():
+    recorder = _Recorder()
+    publisher = EventPublisher(flush_interval=60)
+    with patch("conductor.ai.agents._internal.event_publisher.agent_post", recorder):
+        for i in range(3):
+            publisher.publish("wf-1", {"type": "thinking", "content": "agent"}, *SERVER)
+            publisher.publish("wf-1", {"type": "tool_call", "toolName": f"t{i}"}, *SERVER)
+            publisher.publish("wf-2", {"type": "tool_result", "result": i}, *SERVER)
+        publisher.publish("wf-1", {"type": "thinking", "content": "agent"}, *SERVER)
+        publisher.publish("wf-1", {"type": "thinking", "content": "agent"}, *SERVER)
+        assert publisher.flush(timeout=5)
+
+    wf1 = [body for path, body in recorder.posts if path == "/agent/events/wf-1"]
+    wf2 = [body["result"] for path, body in recorder.posts if path == "/agent/events/wf-2"]
+    assert [e.get("toolName", e["type"]) for e in wf1] == [
+        "thinking", "t0", "thinking", "t1", "thinking", "t2", "thinking",
+    ]
+    assert wf2 == [0, 1, 2]
+    stats = publisher.stats
+    assert (stats.published, stats.sent, stats.coalesced, stats.dropped) == (11, 10, 1, 0)
+
+
+def test_posts_follow_the_events_published_before_them():
+    recorder = _Recorder()
+    publisher = EventPublisher(flush_interval=60, max_pending=2)
+    with patch("conductor.ai.agents._internal.event_publisher.agent_post", recorder):
+        publisher.publish("sub-1", {"type": "tool_call", "n": 0}, *SERVER)
+        publisher.publish("sub-1", {"type": "tool_result", "n": 1}, *SERVER)
+        publisher.post("sub-1", "/agent/execution/sub-1/complete", {}, *SERVER)
+        assert publisher.flush("sub-1", timeout=5)
+
+    assert [path for path, _ in recorder.posts] == [
+        "/agent/events/sub-1",
+        "/agent/events/sub-1",
+        "/agent/execution/sub-1/complete",
+    ]
+
+
+def test_full_queue_drops_new_events_and_triggers_an_early_flush():
+    release = threading.Event()
+    recorder = _Recorder(delay=release)
+    publisher = EventPublisher(flush_interval=60, max_batch=2, max_pending=3)
+    with patch("conductor.ai.agents._internal.event_publisher.agent_post", recorder):
+        publisher.publish("wf-1", {"type": "tool_call", "n": 0}, *SERVER)
+        publisher.publish("wf-1", {"type": "tool_call", "n": 1}, *SERVER)
+        # The early flush took events 0 and 1; its post blocks, so 2..6 queue up.
+        assert not publisher.flush("wf-1", timeout=0.2)
+        for n in range(2, 7):
+            publisher.publish("wf-1", {"type": "tool_call", "n": n}, *SERVER)
+        release.set()
+        assert publisher.flush("wf-1", timeout=5)
+
+    assert [body["n"] for _, body in recorder.posts] == [0, 1, 2, 3, 4]
+    assert publisher.stats.dropped == 2
+
+
+def test_progress_updates_are_coalesced_to_the_latest_per_task():
+    api = MagicMock()
+    publisher = EventPublisher(flush_interval=60)
+    with patch("conductor.client.http.api.task_resource_api.TaskResourceApi", return_value=api), \
+            patch("conductor.ai.agents._internal.event_publisher._agent_api_client"):
+        for count in range(5):
+            publisher.update_progress("task-1", "wf-1", {"tool_call_count": count}, *SERVER)
+        publisher.update_progress("task-2", "wf-2", {"tool_call_count": 9}, *SERVER)
+        assert publisher.flush(timeout=5)
+
+    sent = {call.args[0].task_id: call.args[0].output_data for call in api.update_task.call_args_list}
+    assert sent == {"task-1": {"tool_call_count": 4}, "task-2": {"tool_call_count": 9}}
+    assert api.update_task.call_args_list[0].args[0].status == "IN_PROGRESS"
+    assert (publisher.stats.progress_sent, publisher.stats.progress_coalesced) == (2, 4)
+
+
+def test_late_and_failed_deliveries_are_counted():
+    publisher = EventPublisher(flush_interval=60, late_after=0)
+    with patch(
+        "conductor.ai.agents._internal.event_publisher.agent_post",
+        side_effect=[None, RuntimeError("down")],
+    ):
+        publisher.publish("wf-1", {"type": "tool_call"}, *SERVER)
+        publisher.publish("wf-1", {"type": "tool_result"}, *SERVER)
+        assert publisher.flush(timeout=5)
+
+    stats = publisher.stats
+    assert (stats.sent, stats.failed, stats.late) == (1, 1, 2)
@@ -1,10 +1,13 @@
 """Unit tests for MCP tool discovery, expansion, and caching."""
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from conductor.ai.agents.runtime.mcp_discovery import (
+    McpToolDiscovery,
     _discovery_cache,
     clear_discovery_cache,
     discover_mcp_tools,
@@ -246,3 +249,117 @@ class TestExpandMcpToolDef:
 
 
 # Compiler-specific tests removed — compilation is now server-side only.
+
+
+# ── McpToolDiscovery: concurrency, TTL and the shared disk cache ──────
+
+_RUN_PATH = "conductor.ai.agents.runtime.mcp_discovery._run_discovery"
+_TIME_PATH = "conductor.ai.agents.runtime.mcp_discovery.time.time"
+
+
+class _Servers:
+    """Fake LIST_MCP_TOOLS runs: per-URL tool lists (``None`` fails), with call counts."""
+
+    def __init__(self, tools, delay=0.0):
+        self.tools = tools
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, executor, server_url, headers):
+        with self._lock:
+            self.calls.append(server_url)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        tools = self.tools[server_url]
+        return [dict(t) for t in tools] if tools is not None else None
+
+
+class TestMcpToolDiscovery:
+    def test_servers_of_an_agent_tree_are_discovered_concurrently_once_each(self):
+        from conductor.ai.agents import Agent
+
+        urls = [f"http://mcp-{i}.example.com" for i in range(4)]
+        servers = _Servers({url: [{"name": f"tool_{i}"}] for i, url in enumerate(urls)}, delay=0.2)
+        agent = Agent(
+            name="root",
+            model="openai/gpt-4o",
+            tools=[mcp_tool(server_url=urls[0]), mcp_tool(server_url=urls[1])],
+            agents=[
+                Agent(
+                    name="child",
+                    model="openai/gpt-4o",
+                    tools=[mcp_tool(server_url=url) for url in urls[1:]],
+                )
+            ],
+        )
+        discovery = McpToolDiscovery()
+
+        started = time.monotonic()
+        with patch(_RUN_PATH, servers):
+            result = discovery.discover_agent(MagicMock(), agent)
+            again = discovery.discover_agent(MagicMock(), agent)
+
+        assert time.monotonic() - started < 0.6
+        assert {url: [t["name"] for t in tools] for url, tools in result.items()} == {
+            url: [f"tool_{i}"] for i, url in enumerate(urls)
+        }
+        assert sorted(servers.calls) == urls
+        assert servers.max_in_flight == 4
+        assert again == result
+
+    def test_expired_lists_are_refreshed_and_kept_when_unchanged_or_unreachable(self):
+        url = "http://mcp.example.com"
+        servers = _Servers({url: [{"name": "search"}]})
+        discovery = McpToolDiscovery(ttl_seconds=60, failure_ttl_seconds=10)
+        clock = [1000.0]
+
+        with patch(_RUN_PATH, servers), patch(_TIME_PATH, lambda: clock[0]):
+            first = discovery.discover(MagicMock(), url)
+            clock[0] += 59
+            assert discovery.discover(MagicMock(), url) is first
+            assert len(servers.calls) == 1
+
+            clock[0] += 2
+            assert discovery.discover(MagicMock(), url) is first  # refreshed, unchanged
+            assert len(servers.calls) == 2
+
+            clock[0] += 61
+            servers.tools[url] = None
+            assert discovery.discover(MagicMock(), url) is first  # unreachable: stale list
+            clock[0] += 5
+            discovery.discover(MagicMock(), url)
+            assert len(servers.calls) == 3
+
+            clock[0] += 6
+            servers.tools[url] = [{"name": "search"}, {"name": "fetch"}]
+            assert [t["name"] for t in discovery.discover(MagicMock(), url)] == ["search", "fetch"]
+            assert len(servers.calls) == 4
+
+    def test_discoveries_are_shared_through_the_cache_dir(self, tmp_path):
+        url = "http://mcp.example.com"
+        headers = {"Authorization": "Bearer secret-token"}
+        servers = _Servers({url: [{"name": "search"}]})
+
+        with patch(_RUN_PATH, servers):
+            McpToolDiscovery(cache_dir=str(tmp_path)).discover(MagicMock(), url, headers)
+            other_process = McpToolDiscovery(cache_dir=str(tmp_path))
+            assert other_process.discover(MagicMock(), url, headers) == [{"name": "search"}]
+            # Different credentials are a different cache entry.
+            other_process.discover(MagicMock(), url, {"Authorization": "Bearer other"})
+
+        assert servers.calls == [url, url]
+        files = [p for p in tmp_path.iterdir() if p.suffix == ".json"]
+        assert len(files) == 2
+        assert all("secret-token" not in p.read_text() for p in files)
+
+        expired = McpToolDiscovery(cache_dir=str(tmp_path), ttl_seconds=60)
+        later = time.time() + 120
+        with patch(_RUN_PATH, servers), patch(_TIME_PATH, lambda: later):
+            expired.discover(MagicMock(), url, headers)
+        assert len(servers.calls) == 3
@@ -1,6 +1,8 @@
 """Unit tests for ConversationMemory."""
 
-from conductor.ai.agents.memory import ConversationMemory
+import copy
+
+from conductor.ai.agents.memory import ConversationMemory, estimate_tokens
 
 
 class TestConversationMemoryBasic:
@@ -201,3 +203,113 @@ class TestConversationMemoryMutationIsolation:
         # Mutate the nested tool_calls list
         msgs[0]["tool_calls"][0]["name"] = "hacked"
         assert mem.messages[0]["tool_calls"][0]["name"] == "weather"
+
+
+class TestConversationMemoryMessagesList:
+    """In-place changes to ``messages`` reach the memory, as with a plain list."""
+
+    def test_append_and_item_changes_are_written_back(self):
+        mem = ConversationMemory()
+        mem.add_user_message("Hello")
+        messages = mem.messages
+        mem.add_assistant_message("Hi")
+
+        messages.append({"role": "user", "message": "Bye"})
+        mem.messages[0] = {"role": "user", "message": "Hey"}
+        del mem.messages[1]
+
+        assert mem.messages == [
+            {"role": "user", "message": "Hey"},
+            {"role": "user", "message": "Bye"},
+        ]
+        assert [m["message"] for m in mem.to_chat_messages()] == ["Hey", "Bye"]
+        assert mem.token_count == sum(estimate_tokens(m) for m in mem.messages)
+
+    def test_copies_are_plain_lists(self):
+        mem = ConversationMemory()
+        mem.add_user_message("Hello")
+        snapshot = copy.deepcopy(mem.messages)
+        snapshot.append({"role": "user", "message": "again"})
+
+        assert type(snapshot) is list
+        assert len(mem.messages) == 1
+
+    def test_editing_a_message_dict_leaves_the_memory_and_its_tokens_alone(self):
+        mem = ConversationMemory(token_budget=100)
+        mem.add_user_message("Hello")
+        mem.messages[0]["message"] = "x" * 4000
+
+        assert mem.messages[0]["message"] == "Hello"
+        assert mem.token_count == estimate_tokens({"role": "user", "message": "Hello"})
+
+    def test_containers_added_through_messages_are_not_shared(self):
+        mem = ConversationMemory()
+        message = {"role": "user", "message": "Hello", "meta": {"a": 1}}
+        mem.messages.append(message)
+        message["meta"]["a"] = 2
+        mem.messages[0]["meta"]["a"] = 3
+        mem.to_chat_messages()[0]["meta"]["a"] = 4
+
+        assert mem.messages == [{"role": "user", "message": "Hello", "meta": {"a": 1}}]
+
+
+class TestConversationMemoryTokenBudget:
+    """Test trimming by estimated tokens."""
+
+    def test_trims_oldest_non_system_messages_past_budget(self):
+        mem = ConversationMemory(token_budget=60)
+        mem.add_system_message("You are a helpful assistant.")
+        for i in range(10):
+            mem.add_user_message(f"question {i} " + "x" * 40)
+
+        assert mem.token_count <= 60
+        assert mem.messages[0]["role"] == "system"
+        assert mem.messages[-1]["message"].startswith("question 9")
+        assert len(mem.messages) < 11
+
+    def test_keeps_the_newest_message_even_if_over_budget(self):
+        mem = ConversationMemory(token_budget=5)
+        mem.add_user_message("short")
+        mem.add_user_message("y" * 200)
+        assert [m["message"] for m in mem.messages] == ["y" * 200]
+        assert mem.token_count > 5
+
+    def test_token_count_follows_trimming_and_clear(self):
+        from conductor.ai.agents.memory import estimate_tokens
+
+        mem = ConversationMemory(max_messages=2)
+        for text in ("a", "bb", "ccc"):
+            mem.add_user_message(text)
+        assert mem.token_count == sum(estimate_tokens(m) for m in mem.messages)
+        mem.clear()
+        assert mem.token_count == 0
+
+
+class TestConversationMemoryLongSessions:
+    """Test behaviour over many messages."""
+
+    def test_trimming_matches_full_rebuild(self):
+        mem = ConversationMemory(max_messages=7)
+        expected = []
+        for i in range(200):
+            if i % 13 == 0:
+                mem.add_system_message(f"s{i}")
+                expected.append({"role": "system", "message": f"s{i}"})
+            else:
+                mem.add_user_message(f"u{i}")
+                expected.append({"role": "user", "message": f"u{i}"})
+            system = [m for m in expected if m["role"] == "system"]
+            if len(expected) > 7:
+                if len(system) >= 7:
+                    expected = system[-7:]
+                else:
+                    keep = [m for m in expected if m["role"] != "system"][-(7 - len(system)):]
+                    expected = [m for m in expected if m["role"] == "system" or m in keep]
+            assert mem.messages == expected
+
+    def test_stored_tool_arguments_are_isolated_from_the_caller(self):
+        mem = ConversationMemory()
+        arguments = {"city": "NYC", "units": ["F"]}
+        mem.add_tool_call("weather", arguments)
+        arguments["units"].append("C")
+        assert mem.to_chat_messages()[0]["tool_calls"][0]["input"] == {"city": "NYC", "units": ["F"]}
@@ -0,0 +1,171 @@
+"""Tests for concurrent agent-tree preparation."""
+
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from conductor.ai.agents.agent import Agent, PromptTemplate
+from conductor.ai.agents.runtime.preparation import (
+    collect_models,
+    collect_template_models,
+    map_concurrently,
+    run_phases,
+)
+
+
+def _runtime(**settings):
+    with patch("conductor.client.orkes_clients.OrkesClients") as MockClients:
+        with patch("conductor.ai.agents.runtime.worker_manager.TaskHandler", create=True):
+            MockClients.return_value = MagicMock()
+
+            from conductor.ai.agents.runtime.config import AgentConfig
+            from conductor.ai.agents.runtime.runtime import AgentRuntime
+
+            return AgentRuntime(settings=AgentConfig(auto_start_workers=False, **settings))
+
+
+def _tree():
+    shared = PromptTemplate("shared-prompt")
+    return Agent(
+        name="lead",
+        model="openai/gpt-4o",
+        instructions=shared,
+        strategy="handoff",
+        agents=[
+            Agent(name="a", model="openai/gpt-4o-mini", instructions=shared),
+            Agent(name="b", model="anthropic/claude-sonnet-4-20250514", instructions=shared),
+            Agent(name="c", model="openai/gpt-4o", instructions=PromptTemplate("other")),
+        ],
+    )
+
+
+class TestCollect:
+    def test_models_and_templates_are_deduplicated(self):
+        tree = _tree()
+
+        assert collect_models(tree) == [
+            "openai/gpt-4o",
+            "openai/gpt-4o-mini",
+            "anthropic/claude-sonnet-4-20250514",
+        ]
+        assert collect_template_models(tree) == {
+            "shared-prompt": [
+                "openai/gpt-4o",
+                "openai/gpt-4o-mini",
+                "anthropic/claude-sonnet-4-20250514",
+            ],
+            "other": ["openai/gpt-4o"],
+        }
+
+
+class TestRunPhases:
+    def test_phases_run_concurrently_and_are_timed(self):
+        barrier = threading.Barrier(3, timeout=5)
+        phases = [(name, lambda name=name: (barrier.wait(), name)[1]) for name in ("c", "a", "b")]
+
+        report, results = run_phases("agent", phases, max_workers=3)
+
+        assert results == {"c": "c", "a": "a", "b": "b"}
+        assert list(report.phases) == ["c", "a", "b"]
+        assert report.total_seconds >= max(report.phases.values())
+        assert "prepared 'agent'" in str(report)
+
+    def test_dependent_phase_waits_and_is_skipped_on_failure(self):
+        order = []
+        phases = [
+            ("integrations", lambda: (threading.Event().wait(0.05), order.append("integrations"))[1]),
+            ("prompts", lambda: order.append("prompts")),
+            ("compile", lambda: order.append("compile") or "wf"),
+        ]
+
+        report, results = run_phases("agent", phases, max_workers=3, after={"prompts": "integrations"})
+
+        assert order.index("integrations") < order.index("prompts")
+        assert results["compile"] == "wf"
+        assert list(report.phases) == ["integrations", "prompts", "compile"]
+
+        called = []
+        failing = [("integrations", lambda: 1 / 0), ("prompts", lambda: called.append(1))]
+        with pytest.raises(ZeroDivisionError):
+            run_phases("agent", failing, max_workers=2, after={"prompts": "integrations"})
+        assert called == []
+
+    def test_map_concurrently_bounds_and_reraises(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def work(i):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.02)
+            with lock:
+                active[0] -= 1
+            if i == 5:
+                raise ValueError("boom")
+            return i
+
+        with pytest.raises(ValueError, match="boom"):
+            map_concurrently(work, range(8), max_workers=3)
+        assert peak[0] == 3
+        assert map_concurrently(lambda i: i * 2, [1, 2], max_workers=4) == [2, 4]
+
+
+class TestRuntimePreparation:
+    def test_integrations_are_saved_once_per_provider(self):
+        runtime = _runtime(auto_register_integrations=True)
+        client = runtime._integration_client
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test", "ANTHROPIC_API_KEY": "sk-ant"}):
+            runtime._ensure_models_for_agent(_tree())
+
+        assert sorted(c.args[0] for c in client.save_integration.call_args_list) == ["anthropic", "openai"]
+        assert sorted(c.args[1] for c in client.save_integration_api.call_args_list) == [
+            "claude-sonnet-4-20250514",
+            "gpt-4o",
+            "gpt-4o-mini",
+        ]
+
+    def test_shared_template_is_read_and_saved_once(self):
+        runtime = _runtime()
+        template = MagicMock(template="text", integrations=["openai:gpt-4o"], description="d")
+        runtime._prompt_client.get_prompt.return_value = template
+
+        runtime._associate_templates_with_models(_tree())
+
+        assert sorted(c.args[0] for c in runtime._prompt_client.get_prompt.call_args_list) == [
+            "other",
+            "shared-prompt",
+        ]
+        runtime._prompt_client.save_prompt.assert_called_once()
+        assert runtime._prompt_client.save_prompt.call_args.kwargs["models"] == [
+            "openai:gpt-4o",
+            "openai:gpt-4o-mini",
+            "anthropic:claude-sonnet-4-20250514",
+        ]
+
+    def test_prepare_overlaps_compile_with_prompt_association(self):
+        runtime = _runtime()
+        barrier = threading.Barrier(2, timeout=5)
+        runtime._associate_templates_with_models = lambda agent: barrier.wait()
+        runtime._compile_agent = MagicMock(side_effect=lambda agent: (barrier.wait(), "wf")[1])
+
+        assert runtime._prepare(_tree()) == "wf"
+
+        assert list(runtime.last_preparation.phases) == ["prompts", "compile", "workers"]
+        assert runtime.last_preparation.agent_name == "lead"
+
+    def test_prompts_are_associated_after_integrations(self):
+        runtime = _runtime(auto_register_integrations=True)
+        order = []
+        runtime._ensure_models_for_agent = lambda agent: (
+            threading.Event().wait(0.05),
+            order.append("integrations"),
+        )
+        runtime._associate_templates_with_models = lambda agent: order.append("prompts")
+        runtime._compile_agent = MagicMock(return_value="wf")
+
+        assert runtime._prepare(_tree()) == "wf"
+
+        assert order == ["integrations", "prompts"]
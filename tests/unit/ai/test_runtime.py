@@ -6,6 +6,7 @@ using mock workflow objects. Does NOT require a running Conductor server.
 
 import logging
 import threading
+import time
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -712,6 +713,7 @@ class TestStatefulWorkerDomains:
         rt._config = SimpleNamespace(
             auto_register_integrations=False,
             auto_start_workers=True,
+            prepare_concurrency=8,
         )
         rt._worker_start_lock = threading.Lock()
         rt._registered_tool_names = {"write_architecture"}
@@ -790,6 +792,26 @@ class TestExtractTokenUsage:
         runtime._agent_client.get_execution = MagicMock(return_value={"tasks": []})
         assert runtime._extract_token_usage("wf-123") is None
 
+    def test_sums_sub_agent_tree(self, runtime):
+        executions = {
+            "wf-root": {
+                "tokenUsage": {"promptTokens": 10, "completionTokens": 5, "totalTokens": 15},
+                "tasks": [
+                    {"taskType": "SUB_WORKFLOW", "subWorkflowId": "wf-a"},
+                    {"taskType": "SUB_WORKFLOW", "subWorkflowId": "wf-b"},
+                    {"taskType": "SUB_WORKFLOW", "subWorkflowId": "wf-a"},
+                ],
+            },
+            "wf-a": {"tokenUsage": {"promptTokens": 1, "completionTokens": 1, "totalTokens": 2},
+                     "tasks": [{"taskType": "SUB_WORKFLOW", "subWorkflowId": "wf-c"}]},
+            "wf-b": {"tokenUsage": {"promptTokens": 2, "completionTokens": 2, "totalTokens": 4}},
+            "wf-c": {"tokenUsage": {"promptTokens": 3, "completionTokens": 3, "totalTokens": 6}},
+        }
+        with patch.object(runtime, "_fetch_agent_workflow", side_effect=executions.get) as fetch:
+            usage = runtime._extract_token_usage("wf-root")
+        assert (usage.prompt_tokens, usage.completion_tokens, usage.total_tokens) == (16, 11, 27)
+        assert fetch.call_count == 4
+
     def test_computes_total_when_missing(self, runtime):
         with patch.object(
             runtime,
@@ -2089,6 +2111,42 @@ class TestPollStatusUntilComplete:
         assert result.status == "TIMED_OUT"
         mock_sleep.assert_not_called()
 
+    @patch("conductor.ai.agents.runtime.runtime.time.sleep", return_value=None)
+    def test_shared_status_watcher_replaces_polling(self, mock_sleep, runtime):
+        """With shared_status_watcher, waiting goes through the WorkflowWatcher instead of sleeping."""
+        running = AgentStatus(execution_id="wf-1", is_complete=False, is_running=True, status="RUNNING")
+        completed = AgentStatus(execution_id="wf-1", is_complete=True, status="COMPLETED", output="done")
+        runtime._config.shared_status_watcher = True
+        runtime._status_watcher = MagicMock()
+        runtime.get_status = MagicMock(side_effect=[running, completed])
+
+        result = runtime._poll_status_until_complete("wf-1", timeout=60)
+
+        assert result.status == "COMPLETED"
+        runtime._status_watcher.wait.assert_called_once_with("wf-1", timeout=60)
+        assert runtime.get_status.call_count == 2
+        mock_sleep.assert_not_called()
+
+    def test_concurrent_first_callers_share_one_status_watcher(self, runtime):
+        runtime._config.shared_status_watcher = True
+        barrier = threading.Barrier(8, timeout=5)
+        watchers = []
+
+        def first_call():
+            barrier.wait()
+            watchers.append(runtime._get_status_watcher())
+
+        with patch("conductor.client.workflow.executor.workflow_watcher.WorkflowWatcher",
+                   side_effect=lambda client: (time.sleep(0.01), MagicMock())[1]) as watcher_cls:
+            threads = [threading.Thread(target=first_call) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(5)
+
+        assert watcher_cls.call_count == 1
+        assert len({id(w) for w in watchers}) == 1
+
 
 # ── Prompt template resolution ───────────────────────────────────────
 
@@ -0,0 +1,171 @@
+"""Tests for the indexed InMemoryStore behind SemanticMemory."""
+
+import random
+import sys
+
+import pytest
+
+from conductor.ai.agents.semantic_memory import InMemoryStore, MemoryEntry, SemanticMemory
+
+np = pytest.importorskip("numpy")
+
+WORDS = ["python", "billing", "refund", "order", "weather", "sunny", "Python", "api", "key", "user"]
+
+
+def _linear_search(entries, query, top_k):
+    """The store's previous algorithm: score every memory, then sort them all."""
+    query_words = set(query.lower().split())
+    scored = []
+    for entry in entries:
+        entry_words = set(entry.content.lower().split())
+        if not query_words or not entry_words:
+            score = 0.0
+        else:
+            score = len(query_words & entry_words) / len(query_words | entry_words)
+        scored.append((score, entry))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [entry.id for score, entry in scored[:top_k] if score > 0]
+
+
+def test_keyword_search_ranks_like_a_full_scan():
+    rng = random.Random(7)
+    store = InMemoryStore()
+    for i in range(300):
+        store.add(MemoryEntry(id=f"m{i}", content=" ".join(rng.choices(WORDS, k=rng.randint(0, 6)))))
+    for i in range(0, 300, 7):
+        store.delete(f"m{i}")
+    for i in range(1, 300, 11):
+        store.add(MemoryEntry(id=f"m{i}", content=" ".join(rng.choices(WORDS, k=3))))
+
+    for _ in range(50):
+        query = " ".join(rng.choices(WORDS + ["unknown"], k=rng.randint(0, 4)))
+        for top_k in (1, 5, 500):
+            expected = _linear_search(store.list_all(), query, top_k)
+            assert [e.id for e in store.search(query, top_k=top_k)] == expected
+
+
+def _embedding(text):
+    """A deterministic toy embedding: counts of a few words."""
+    words = text.lower().split()
+    return [float(words.count(w)) for w in ("python", "billing", "weather")]
+
+
+def test_embeddings_rank_by_cosine_similarity():
+    memory = SemanticMemory(store=InMemoryStore(embed=_embedding), max_results=2)
+    memory.add("python python tutorial")
+    memory.add("billing question about python")
+    refund_id = memory.add("billing refund")
+    memory.add("weather report")
+
+    assert memory.search("python") == ["python python tutorial", "billing question about python"]
+    assert memory.search("billing billing") == ["billing refund", "billing question about python"]
+    assert memory.search("nothing relevant") == []
+
+    memory.delete(refund_id)
+    assert memory.search("billing") == ["billing question about python"]
+    with pytest.raises(ValueError):
+        memory.store.search_by_vector([1.0, 0.0])
+
+
+def test_vector_top_k_matches_a_full_sort():
+    rng = np.random.default_rng(3)
+    vectors = rng.normal(size=(500, 16))
+    store = InMemoryStore()
+    for i, vector in enumerate(vectors):
+        store.add(MemoryEntry(id=f"m{i}", content="", embedding=vector.tolist()))
+    for i in range(0, 500, 3):
+        store.delete(f"m{i}")
+
+    query = rng.normal(size=16)
+    kept = [i for i in range(500) if i % 3]
+    unit = vectors[kept] / np.linalg.norm(vectors[kept], axis=1, keepdims=True)
+    order = np.argsort(-(unit @ (query / np.linalg.norm(query))))[:10]
+    assert [e.id for e in store.search_by_vector(query.tolist(), top_k=10)] == [
+        f"m{kept[i]}" for i in order
+    ]
+
+
+def test_saved_store_reloads_with_memory_mapped_vectors(tmp_path):
+    path = str(tmp_path / "memories")
+    store = InMemoryStore(embed=_embedding, path=path)
+    store.add(MemoryEntry(id="a", content="python python", metadata={"type": "fact"}))
+    store.add(MemoryEntry(id="b", content="weather today"))
+    store.save()
+
+    loaded = InMemoryStore(embed=_embedding, path=path)
+    assert [(e.id, e.metadata) for e in loaded.list_all()] == [("a", {"type": "fact"}), ("b", {})]
+    assert isinstance(loaded._vectors._matrix, np.memmap)
+    assert [e.id for e in loaded.search("weather")] == ["b"]
+
+    # The mapped file is read-only; changes go to an in-memory copy.
+    loaded.add(MemoryEntry(id="c", content="billing"))
+    loaded.delete("a")
+    assert [e.id for e in loaded.search("billing")] == ["c"]
+    assert [e.id for e in InMemoryStore(path=path).search("python")] == ["a"]
+
+
+def test_a_save_interrupted_between_its_files_keeps_the_previous_one(tmp_path, monkeypatch):
+    import conductor.ai.agents.semantic_memory as semantic_memory
+
+    path = str(tmp_path / "memories")
+    store = InMemoryStore(embed=_embedding, path=path)
+    store.add(MemoryEntry(id="a", content="python python"))
+    store.save()
+    store.delete("a")
+    store.add(MemoryEntry(id="b", content="weather today"))
+    store.add(MemoryEntry(id="c", content="billing"))
+
+    replace = semantic_memory._replace_atomically
+
+    def crash_on_json(target, write):
+        if target.endswith(".json"):
+            raise KeyboardInterrupt
+        replace(target, write)
+
+    monkeypatch.setattr(semantic_memory, "_replace_atomically", crash_on_json)
+    with pytest.raises(KeyboardInterrupt):
+        store.save()
+    monkeypatch.undo()
+
+    loaded = InMemoryStore(embed=_embedding, path=path)
+    assert [e.id for e in loaded.list_all()] == ["a"]
+    assert [e.id for e in loaded.search_by_vector(_embedding("python"))] == ["a"]
+    store.save()
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+
+def test_missing_vectors_file_drops_only_the_vector_index(tmp_path):
+    path = str(tmp_path / "memories")
+    store = InMemoryStore(embed=_embedding, path=path)
+    store.add(MemoryEntry(id="a", content="python"))
+    store.save()
+    for vectors in tmp_path.glob("*.npy"):
+        vectors.unlink()
+
+    loaded = InMemoryStore(path=path)
+    assert loaded._vectors is None
+    assert [e.id for e in loaded.search("python")] == ["a"]
+
+
+def test_wrong_dimension_leaves_the_store_unchanged():
+    store = InMemoryStore()
+    store.add(MemoryEntry(id="a", content="python", embedding=[1.0, 0.0]))
+
+    with pytest.raises(ValueError):
+        store.add(MemoryEntry(id="b", content="billing", embedding=[1.0, 0.0, 0.0]))
+    assert [e.id for e in store.list_all()] == ["a"]
+    assert store.search("billing") == []
+
+
+def test_embeddings_without_numpy_fall_back_to_keywords(monkeypatch):
+    import conductor.ai.agents.semantic_memory as semantic_memory
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.setattr(semantic_memory, "_numpy_missing_logged", False)
+    store = InMemoryStore(embed=_embedding)
+    store.add(MemoryEntry(id="a", content="python tutorial", embedding=[1.0, 0.0, 0.0]))
+    store.add(MemoryEntry(id="b", content="weather report"))
+
+    assert store._vectors is None
+    assert [e.id for e in store.search("weather")] == ["b"]
+    assert store.search_by_vector([1.0, 0.0, 0.0]) == []
@@ -0,0 +1,204 @@
+"""Tests for the multiplexed StreamHub."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from conductor.ai.agents.result import AgentEvent, EventType
+from conductor.ai.agents.runtime.runtime import _SSEUnavailableError
+from conductor.ai.agents.runtime.stream_hub import PollCursor, StreamHub
+
+
+def _runtime(**settings):
+    with patch("conductor.client.orkes_clients.OrkesClients") as MockClients:
+        with patch("conductor.ai.agents.runtime.worker_manager.TaskHandler", create=True):
+            MockClients.return_value = MagicMock()
+
+            from conductor.ai.agents.runtime.config import AgentConfig
+            from conductor.ai.agents.runtime.runtime import AgentRuntime
+
+            return AgentRuntime(settings=AgentConfig(auto_start_workers=False, **settings))
+
+
+def _task(task_id, task_type="LLM_CHAT_COMPLETE", status="COMPLETED"):
+    return SimpleNamespace(
+        task_id=task_id,
+        task_type=task_type,
+        reference_task_name=f"{task_id}_ref",
+        status=status,
+        output_data={},
+        input_data={},
+    )
+
+
+class _Workflows:
+    """Replays workflow snapshots, one per task-less fetch, recording every call."""
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.position = 0
+        self.calls = []
+
+    def get_workflow(self, execution_id, include_tasks=True):
+        self.calls.append(include_tasks)
+        if not include_tasks:
+            self.position = min(self.position + 1, len(self.snapshots))
+        status, update_time, tasks = self.snapshots[self.position - 1]
+        return SimpleNamespace(
+            status=status,
+            update_time=update_time,
+            tasks=tasks if include_tasks else None,
+            output={"result": "done"},
+            reason=None,
+        )
+
+
+async def _collect(iterator):
+    return [event async for event in iterator]
+
+
+@pytest.mark.asyncio
+async def test_polling_fetches_tasks_only_when_workflow_changes_and_fans_out():
+    runtime = _runtime(streaming_enabled=False)
+    workflows = _Workflows(
+        [
+            ("RUNNING", 1, [_task("t1")]),
+            ("RUNNING", 1, [_task("t1")]),
+            ("RUNNING", 1, [_task("t1")]),
+            ("RUNNING", 2, [_task("t1"), _task("t2")]),
+            ("COMPLETED", 3, [_task("t1"), _task("t2")]),
+        ]
+    )
+    runtime._workflow_client = workflows
+    hub = StreamHub(runtime, poll_interval=0)
+
+    first, second = await asyncio.gather(
+        _collect(hub.subscribe("wf-1")), _collect(hub.subscribe("wf-1"))
+    )
+
+    assert [e.type for e in first] == ["thinking", "thinking", "done"]
+    assert [e.output for e in first] == [e.output for e in second]
+    # One reader for both subscribers: five probes, three task fetches.
+    assert workflows.calls.count(False) == 5
+    assert workflows.calls.count(True) == 3
+    assert hub.stats["executions"] == 0
+    await hub.aclose()
+
+
+@pytest.mark.asyncio
+async def test_sse_streams_are_capped_and_fall_back_to_polling():
+    runtime = _runtime()
+    release = asyncio.Event()
+
+    async def sse(execution_id):
+        await release.wait()
+        yield AgentEvent(type=EventType.DONE, output="sse", execution_id=execution_id)
+
+    runtime._stream_sse_async = sse
+    runtime._workflow_client = _Workflows([("COMPLETED", 1, [])])
+    hub = StreamHub(runtime, max_sse_streams=1, poll_interval=0)
+
+    over_sse = asyncio.ensure_future(_collect(hub.subscribe("wf-sse")))
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert hub.stats["sse"] == 1
+    polled = await _collect(hub.subscribe("wf-polled"))
+    release.set()
+
+    assert [e.output for e in await over_sse] == ["sse"]
+    assert [e.output for e in polled] == ["done"]
+    await hub.aclose()
+
+
+@pytest.mark.asyncio
+async def test_sse_unavailable_switches_every_execution_to_polling():
+    runtime = _runtime()
+    attempts = []
+
+    async def sse(execution_id):
+        attempts.append(execution_id)
+        raise _SSEUnavailableError("no sse")
+        yield  # pragma: no cover
+
+    runtime._stream_sse_async = sse
+    runtime._workflow_client = _Workflows([("COMPLETED", 1, [])])
+    hub = StreamHub(runtime, poll_interval=0)
+
+    assert [e.type for e in await _collect(hub.subscribe("a"))] == ["done"]
+    assert [e.type for e in await _collect(hub.subscribe("b"))] == ["done"]
+    assert attempts == ["a"]
+    await hub.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_pauses_its_execution_and_leaving_stops_it():
+    runtime = _runtime()
+    produced = []
+    stopped = asyncio.Event()
+
+    async def sse(execution_id):
+        try:
+            for i in range(100):
+                produced.append(i)
+                yield AgentEvent(type=EventType.THINKING, content=str(i), execution_id=execution_id)
+        finally:
+            stopped.set()
+
+    runtime._stream_sse_async = sse
+    hub = StreamHub(runtime, queue_size=2)
+
+    subscription = hub.subscribe("wf-1")
+    first = await subscription.__anext__()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    # The reader stays within the queue's bound instead of draining the stream.
+    assert first.content == "0"
+    assert len(produced) <= 4
+
+    await subscription.aclose()
+    await asyncio.wait_for(stopped.wait(), 1)
+    assert hub.stats["executions"] == 0
+    await hub.aclose()
+
+
+def test_poll_cursor_fetches_tasks_on_change_and_backs_off_while_idle():
+    cursor = PollCursor()
+    running = SimpleNamespace(status="RUNNING", update_time=1)
+    assert cursor.needs_tasks(running) is True
+    cursor.record_tasks(running)
+    assert cursor.needs_tasks(running) is False
+    assert cursor.needs_tasks(running) is False
+    assert cursor.delay(0.5, 2.0) == pytest.approx(1.125)
+    assert cursor.needs_tasks(running, max_staleness=0) is True
+    assert cursor.needs_tasks(SimpleNamespace(status="PAUSED", update_time=1)) is True
+    assert cursor.delay(0.5, 2.0) == 0.5
+    for _ in range(10):
+        cursor.needs_tasks(SimpleNamespace(status="PAUSED", update_time=1))
+    assert cursor.delay(0.5, 2.0) == 2.0
+
+
+@pytest.mark.asyncio
+async def test_subscriber_leaving_mid_stream_does_not_stall_the_others():
+    runtime = _runtime()
+
+    async def sse(execution_id):
+        for i in range(10):
+            yield AgentEvent(type=EventType.THINKING, content=str(i), execution_id=execution_id)
+
+    runtime._stream_sse_async = sse
+    hub = StreamHub(runtime, queue_size=1)
+
+    leaving = hub.subscribe("wf-1")
+    staying = hub.subscribe("wf-1")
+    firsts = await asyncio.gather(leaving.__anext__(), staying.__anext__())
+    for _ in range(5):
+        await asyncio.sleep(0)
+    # The reader is now blocked on the leaving subscriber's full queue.
+    await leaving.aclose()
+
+    events = await asyncio.wait_for(_collect(staying), 1)
+    assert [e.content for e in firsts] == ["0", "0"]
+    assert [e.content for e in events] == [str(i) for i in range(1, 10)]
+    await hub.aclose()
@@ -0,0 +1,116 @@
+"""Tests for the incremental polling fallback of AgentRuntime streams."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from conductor.ai.agents.result import EventType
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.workflow import Workflow
+
+_SERIALIZER = ApiClient.__new__(ApiClient)
+
+TURNS = 6
+TURN_SECONDS = 4.0
+TRANSCRIPT_BYTES = 50_000
+
+
+def _runtime():
+    with patch("conductor.client.orkes_clients.OrkesClients") as MockClients:
+        with patch("conductor.ai.agents.runtime.worker_manager.TaskHandler", create=True):
+            MockClients.return_value = MagicMock()
+
+            from conductor.ai.agents.runtime.config import AgentConfig
+            from conductor.ai.agents.runtime.runtime import AgentRuntime
+
+            return AgentRuntime(settings=AgentConfig(auto_start_workers=False))
+
+
+class _RecordedExecution:
+    """An agent run of TURNS LLM calls, replayed against a simulated clock.
+
+    Every LLM task carries a ~50 KB transcript, as long-running agents do.
+    ``bytes_sent`` counts the JSON the server would have returned.
+    """
+
+    def __init__(self):
+        self.clock = 0.0
+        self.bytes_sent = 0
+        self.requests = 0
+
+    def sleep(self, seconds):
+        self.clock += seconds
+
+    def get_workflow(self, execution_id, include_tasks=True):
+        turn = min(int(self.clock // TURN_SECONDS), TURNS)
+        tasks = [
+            Task(
+                task_id=f"llm-{i}",
+                task_type="LLM_CHAT_COMPLETE",
+                reference_task_name=f"agent_llm__{i}",
+                status="COMPLETED",
+                input_data={"messages": "m" * TRANSCRIPT_BYTES},
+                output_data={"result": "r" * 200},
+                update_time=1000 * (i + 1),
+            )
+            for i in range(turn)
+        ]
+        wf = Workflow(
+            workflow_id=execution_id,
+            status="COMPLETED" if turn == TURNS else "RUNNING",
+            update_time=1000 * (turn + 1),
+            input={"prompt": "summarise the quarter"},
+            output={"result": "done"} if turn == TURNS else {},
+            tasks=tasks if include_tasks else [],
+        )
+        self.requests += 1
+        self.bytes_sent += len(json.dumps(_SERIALIZER.sanitize_for_serialization(wf)))
+        return wf
+
+
+def _full_fetch_every_half_second(recording):
+    """The previous polling loop: the whole workflow, tasks included, twice a second."""
+    while True:
+        wf = recording.get_workflow("wf-1", include_tasks=True)
+        if wf.status == "COMPLETED":
+            return
+        recording.sleep(0.5)
+
+
+def test_polling_downloads_tasks_only_when_the_execution_changes():
+    before = _RecordedExecution()
+    _full_fetch_every_half_second(before)
+
+    after = _RecordedExecution()
+    runtime = _runtime()
+    runtime._workflow_client = after
+    with patch("conductor.ai.agents.runtime.runtime.time.sleep", side_effect=after.sleep):
+        events = list(runtime._stream_polling("wf-1"))
+
+    assert [e.type for e in events] == [EventType.THINKING] * TURNS + [EventType.DONE]
+    # One task-list download per LLM turn instead of one per poll: about
+    # 1 MB against 6.3 MB for this recording.
+    assert after.bytes_sent * 5 < before.bytes_sent
+    # Backing off while idle also means fewer requests, even counting the probes.
+    assert after.requests < before.requests
+
+
+@pytest.mark.asyncio
+async def test_async_polling_downloads_tasks_only_when_the_execution_changes():
+    before = _RecordedExecution()
+    _full_fetch_every_half_second(before)
+
+    after = _RecordedExecution()
+    runtime = _runtime()
+    runtime._workflow_client = after
+
+    async def sleep(seconds):
+        after.sleep(seconds)
+
+    with patch("conductor.ai.agents.runtime.runtime.asyncio.sleep", side_effect=sleep):
+        events = [event async for event in runtime._stream_polling_async("wf-1")]
+
+    assert [e.type for e in events] == [EventType.THINKING] * TURNS + [EventType.DONE]
+    assert after.bytes_sent * 5 < before.bytes_sent
@@ -1,10 +1,17 @@
 """Tests for conductor.ai.agents.testing.eval_runner."""
 
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+import pytest
+
 from conductor.ai.agents.result import AgentEvent, AgentResult, EventType
 from conductor.ai.agents.testing.eval_runner import (
     CorrectnessEval,
     EvalCase,
     EvalCaseResult,
+    EvalCheckResult,
     EvalSuiteResult,
 )
 
@@ -377,3 +384,166 @@ class TestCorrectnessEval:
         assert "PASS" in captured.out
         assert "FAIL" in captured.out
         assert "1/2 passed" in captured.out
+
+
+# ── Parallel runs, sharding, caching and reports ──────────────────────
+
+
+class SlowRuntime(FakeRuntime):
+    """Sleeps per agent name, recording the most runs in flight at once."""
+
+    def __init__(self, delays):
+        super().__init__()
+        self._delays = delays
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def run(self, agent, prompt, timeout=None):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self._delays.get(agent.name, 0))
+            return super().run(agent, prompt)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestParallelEval:
+    def test_cases_run_concurrently_and_keep_their_order(self):
+        delays = {"a": 0.2, "b": 0.05, "c": 0.1, "d": 0}
+        runtime = SlowRuntime(delays)
+        cases = [
+            EvalCase(name=name, agent=FakeAgent(name=name), prompt="hi", validate_orchestration=False)
+            for name in delays
+        ]
+        progress = []
+
+        suite = CorrectnessEval(runtime, max_workers=4).run(
+            cases, on_progress=lambda case, done, total: progress.append((case.name, done, total))
+        )
+
+        assert [c.name for c in suite.cases] == ["a", "b", "c", "d"]
+        assert suite.all_passed
+        assert runtime.max_in_flight > 1
+        assert [p[1:] for p in progress] == [(1, 4), (2, 4), (3, 4), (4, 4)]
+        assert progress[-1][0] == "a"
+        assert all(c.duration > 0 for c in suite.cases[:3])
+
+    def test_slow_case_times_out_without_holding_up_the_suite(self):
+        runtime = SlowRuntime({"slow": 2})
+        cases = [
+            EvalCase(name="slow", agent=FakeAgent(name="slow"), prompt="hi"),
+            EvalCase(name="fast", agent=FakeAgent(name="fast"), prompt="hi", validate_orchestration=False),
+        ]
+
+        started = time.monotonic()
+        suite = CorrectnessEval(runtime, max_workers=2, timeout=0.2).run(cases)
+
+        assert time.monotonic() - started < 1.5
+        assert [c.passed for c in suite.cases] == [False, True]
+        assert "timed out after 0.2s" in suite.cases[0].error
+
+    def test_shards_partition_the_cases(self):
+        cases = [EvalCase(name=f"case_{i}", agent=FakeAgent(), prompt="hi") for i in range(7)]
+
+        names = [
+            [c.name for c in CorrectnessEval(FakeRuntime()).run(cases, shard=(i, 3)).cases]
+            for i in range(3)
+        ]
+
+        assert sorted(sum(names, [])) == sorted(c.name for c in cases)
+        assert names[0] == ["case_0", "case_3", "case_6"]
+        with pytest.raises(ValueError):
+            CorrectnessEval(FakeRuntime()).run(cases, shard=(3, 3))
+
+    def test_unchanged_cases_are_asserted_against_cached_results(self, tmp_path):
+        from conductor.ai.agents import Agent
+
+        agent = Agent(name="support", model="openai/gpt-4o", instructions="Be brief.")
+        result = AgentResult(
+            output={"result": "Your refund is on its way"},
+            status="COMPLETED",
+            tool_calls=[{"name": "lookup_order", "args": {"order": "123"}}],
+        )
+        case = EvalCase(
+            name="refund",
+            agent=agent,
+            prompt="refund order #123",
+            expect_tools=["lookup_order"],
+            expect_output_contains=["refund"],
+            validate_orchestration=False,
+        )
+
+        first_runtime = FakeRuntime(results={"support": result})
+        first = CorrectnessEval(first_runtime, cache_dir=str(tmp_path)).run([case])
+        second_runtime = FakeRuntime(results={"support": result})
+        second = CorrectnessEval(second_runtime, cache_dir=str(tmp_path)).run([case])
+
+        assert first.all_passed and second.all_passed
+        assert len(first_runtime.calls) == 1 and not first.cases[0].cached
+        assert second_runtime.calls == [] and second.cases[0].cached
+
+        # A changed prompt or agent config misses the cache.
+        changed = Agent(name="support", model="openai/gpt-4o", instructions="Be thorough.")
+        third_runtime = FakeRuntime(results={"support": result})
+        CorrectnessEval(third_runtime, cache_dir=str(tmp_path)).run(
+            [
+                EvalCase(name="refund", agent=changed, prompt=case.prompt),
+                EvalCase(name="other", agent=agent, prompt="cancel order #123"),
+            ]
+        )
+        assert len(third_runtime.calls) == 2
+
+    def test_agents_run_by_name_are_not_cached(self, tmp_path):
+        result = AgentResult(output={"result": "done"}, status="COMPLETED")
+        case = EvalCase(name="by_name", agent="support", prompt="refund", validate_orchestration=False)
+
+        for _ in range(2):
+            runtime = FakeRuntime(results={"support": result})
+            outcome = CorrectnessEval(runtime, cache_dir=str(tmp_path)).run([case])
+            assert len(runtime.calls) == 1 and not outcome.cases[0].cached
+
+    def test_failed_executions_are_not_cached(self, tmp_path):
+        from conductor.ai.agents import Agent
+
+        agent = Agent(name="support", model="openai/gpt-4o")
+        failed = AgentResult(status="FAILED", error="LLM unavailable")
+        case = EvalCase(name="refund", agent=agent, prompt="refund", validate_orchestration=False)
+
+        for _ in range(2):
+            runtime = FakeRuntime(results={"support": failed})
+            CorrectnessEval(runtime, cache_dir=str(tmp_path)).run([case])
+            assert len(runtime.calls) == 1
+
+    def test_junit_report(self, tmp_path):
+        suite = EvalSuiteResult(
+            cases=[
+                EvalCaseResult(name="ok", passed=True, duration=1.5, tags=["smoke"]),
+                EvalCaseResult(
+                    name="wrong_tool",
+                    passed=False,
+                    checks=[
+                        EvalCheckResult(check="status", passed=True),
+                        EvalCheckResult(check="tool_used:refund", passed=False, message="not used"),
+                    ],
+                ),
+                EvalCaseResult(name="crashed", passed=False, error="Agent execution failed: boom"),
+            ]
+        )
+        path = tmp_path / "evals.xml"
+
+        suite.to_junit_xml(str(path), suite_name="support-evals")
+
+        root = ET.parse(path).getroot()
+        assert (root.get("name"), root.get("tests"), root.get("failures"), root.get("errors")) == (
+            "support-evals", "3", "1", "1",
+        )
+        ok, wrong_tool, crashed = root.findall("testcase")
+        assert ok.get("time") == "1.500" and ok.find("failure") is None
+        assert ok.find("properties/property").attrib == {"name": "tags", "value": "smoke"}
+        assert wrong_tool.find("failure").get("message") == "tool_used:refund"
+        assert wrong_tool.find("failure").text == "tool_used:refund: not used"
+        assert crashed.find("error").get("message") == "Agent execution failed: boom"
@@ -389,3 +389,38 @@ class TestWindowsThreadIsolation:
             mock_th.return_value.metrics_provider_process = None
             manager.start()
         mock_apply.assert_not_called()
+
+
+class TestWorkerManagerTaskDefRegistration:
+    """Task definitions are registered once, in bulk, from the parent process."""
+
+    @staticmethod
+    def _worker(name, domain=None):
+        from conductor.client.worker.worker import Worker
+
+        return Worker(name, lambda x: x, domain=domain, register_task_def=True)
+
+    @patch("conductor.client.orkes.orkes_schema_client.OrkesSchemaClient")
+    @patch("conductor.client.orkes.orkes_metadata_client.OrkesMetadataClient")
+    @patch("conductor.client.automator.task_def_registration.register_task_definitions")
+    def test_registers_each_task_name_once(self, mock_register, _metadata, _schema):
+        def register(workers, *args):
+            for w in workers:
+                w.task_def_registered = True
+
+        mock_register.side_effect = register
+        wm = WorkerManager(configuration=MagicMock())
+
+        wm._register_task_definitions([self._worker("search"), self._worker("fetch")])
+        late = self._worker("search", domain="run-1")
+        wm._register_task_definitions([late])
+
+        assert mock_register.call_count == 1
+        assert [w.get_task_definition_name() for w in mock_register.call_args.args[0]] == ["search", "fetch"]
+        assert late.task_def_registered is True
+
+    @patch("conductor.client.automator.task_def_registration.register_task_definitions")
+    def test_disabled(self, mock_register):
+        wm = WorkerManager(configuration=MagicMock(), bulk_register_task_defs=False)
+        wm._register_task_definitions([self._worker("search")])
+        mock_register.assert_not_called()
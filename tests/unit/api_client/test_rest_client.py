@@ -306,3 +306,35 @@ class TestRESTClientObject(unittest.TestCase):
         self.assertIs(client.connection, replacement)
         self.assertFalse(replacement.close.called)
 
+
+    @patch.object(rest.RESTClientObject, "_create_default_httpx_client")
+    def test_inherited_client_is_replaced_without_closing_after_fork(self, mock_create_client):
+        """A client built in a parent (e.g. forkserver template) must not reuse
+        or close the parent's connection from a forked child."""
+        inherited = _mock_client()
+        fresh = _mock_client()
+        fresh.request.return_value = _ok_response()
+        mock_create_client.side_effect = [inherited, fresh]
+
+        client = rest.RESTClientObject(connection=None)
+        client._owner_pid = -1  # simulate: created in another process
+
+        result = client.request("GET", "http://example")
+
+        self.assertEqual(result.status, 200)
+        self.assertIs(client.connection, fresh)
+        self.assertFalse(inherited.request.called)
+        self.assertFalse(inherited.close.called)
+        self.assertTrue(fresh.request.called)
+
+    def test_external_connection_is_kept_after_fork(self):
+        external = _mock_client()
+        external.request.return_value = _ok_response()
+
+        client = rest.RESTClientObject(connection=external)
+        client._owner_pid = -1
+
+        client.request("GET", "http://example")
+
+        self.assertIs(client.connection, external)
+        self.assertTrue(external.request.called)
@@ -228,6 +228,19 @@ class TestLeaseManagerSingleton(unittest.TestCase):
         a.shutdown()
         b.shutdown()
 
+    def test_reset_after_fork_replaces_held_lock(self):
+        """A lock held by a parent thread at fork time must not deadlock the child."""
+        a = LeaseManager.get_instance()
+        LeaseManager._instance_lock.acquire()  # simulate: held while forking
+        try:
+            LeaseManager._reset_after_fork()
+            b = LeaseManager.get_instance()
+        finally:
+            LeaseManager._instance_lock = threading.Lock()
+        self.assertIsNot(a, b)
+        a.shutdown()
+        b.shutdown()
+
 
 class TestLeaseManagerBackgroundThread(unittest.TestCase):
     """Test the background thread lifecycle."""
@@ -0,0 +1,189 @@
+"""
+Tests for PhaseProfiler and its TaskRunner integration.
+"""
+
+import json
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from conductor.client.automator.phase_profiler import (
+    PhaseProfiler,
+    install_api_client_hooks,
+    write_control,
+)
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.models.task import Task
+from conductor.client.worker.worker import Worker
+
+
+def add_numbers(a: int, b: int) -> dict:
+    return {"sum": a + b}
+
+
+class TestPhaseProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.profiler = PhaseProfiler(directory=self.directory, control_interval=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_record_aggregates_per_task_type_and_phase(self):
+        self.profiler.record("a", "poll", 0.010)
+        self.profiler.record("a", "poll", 0.030)
+        self.profiler.record("b", "execute", 0.5)
+
+        summary = self.profiler.summary()
+        self.assertEqual(summary["a"]["poll"]["count"], 2)
+        self.assertAlmostEqual(summary["a"]["poll"]["mean_ms"], 20.0)
+        self.assertAlmostEqual(summary["a"]["poll"]["max_ms"], 30.0)
+        self.assertEqual(summary["b"]["execute"]["count"], 1)
+
+    def test_record_split_carves_nested_time_out_of_outer_phase(self):
+        self.profiler.begin()
+        self.profiler.add_nested("deserialize", 0.004)
+        self.profiler.record_split("a", "poll", "deserialize", 0.010)
+
+        summary = self.profiler.summary()["a"]
+        self.assertAlmostEqual(summary["deserialize"]["total_s"], 0.004)
+        self.assertAlmostEqual(summary["poll"]["total_s"], 0.006)
+
+    def test_begin_discards_stale_nested_time(self):
+        self.profiler.add_nested("serialize", 1.0)
+        self.profiler.begin()
+        self.assertEqual(self.profiler.take_nested("serialize"), 0.0)
+
+    def test_api_client_hooks_time_outermost_call_only(self):
+        class FakeApiClient:
+            def __init__(self):
+                self.calls = 0
+
+            def deserialize(self, response, response_type):
+                return response
+
+            def sanitize_for_serialization(self, obj):
+                self.calls += 1
+                if isinstance(obj, list):
+                    return [self.sanitize_for_serialization(item) for item in obj]
+                return obj
+
+        client = FakeApiClient()
+        self.profiler.enable()
+        install_api_client_hooks(self.profiler, client)
+        install_api_client_hooks(self.profiler, client)  # idempotent
+
+        self.profiler.begin()
+        self.assertEqual(client.sanitize_for_serialization([1, 2, 3]), [1, 2, 3])
+        self.assertEqual(client.calls, 4)
+        self.assertGreater(self.profiler.take_nested("serialize"), 0.0)
+        self.assertEqual(client.deserialize("x", "str"), "x")
+        self.assertGreater(self.profiler.take_nested("deserialize"), 0.0)
+
+    def test_cprofile_sample_written_for_requested_executions(self):
+        self.profiler.request_cprofile("a", executions=2)
+
+        for _ in range(3):
+            sample = self.profiler.sample("a")
+            if sample is not None:
+                with sample:
+                    sum(range(1000))
+
+        files = sorted(f for f in os.listdir(self.directory) if f.endswith(".pstats"))
+        self.assertEqual(len(files), 2)
+        pstats.Stats(os.path.join(self.directory, files[0]))
+        self.assertIsNone(self.profiler.sample("b"))
+
+    def test_tracemalloc_sample_written(self):
+        self.profiler.request_tracemalloc("a")
+
+        with self.profiler.sample("a"):
+            data = [bytearray(1024) for _ in range(100)]
+
+        files = [f for f in os.listdir(self.directory) if f.endswith(".tracemalloc.txt")]
+        self.assertEqual(len(files), 1)
+        self.assertEqual(len(data), 100)
+
+    def test_only_one_sample_at_a_time(self):
+        self.profiler.request_cprofile("a", executions=2)
+        first = self.profiler.sample("a")
+        with first:
+            self.assertIsNone(self.profiler.sample("a"))
+        self.assertIsNotNone(self.profiler.sample("a"))
+
+    def test_control_file_toggles_and_requests_samples(self):
+        write_control(self.directory, enabled=True, cprofile={"a": 3})
+        self.profiler.maybe_check_control()
+
+        self.assertTrue(self.profiler.enabled)
+        self.assertEqual(self.profiler._cprofile_requests, {"a": 3})
+
+        self.profiler.record("a", "poll", 0.001)
+        write_control(self.directory, enabled=False)
+        os.utime(os.path.join(self.directory, "profiling.json"), (1, 1))
+        self.profiler.maybe_check_control()
+
+        self.assertFalse(self.profiler.enabled)
+        with open(os.path.join(self.directory, f"phases-{os.getpid()}.json")) as f:
+            self.assertEqual(json.load(f)["task_types"]["a"]["poll"]["count"], 1)
+
+    def test_get_instance_reads_env(self):
+        PhaseProfiler._reset_instance()
+        try:
+            with patch.dict(os.environ, {"CONDUCTOR_WORKER_PROFILING": "true",
+                                         "CONDUCTOR_WORKER_PROFILE_DIR": self.directory}):
+                profiler = PhaseProfiler.get_instance()
+            self.assertTrue(profiler.enabled)
+            self.assertEqual(profiler.directory, self.directory)
+            self.assertIs(PhaseProfiler.get_instance(), profiler)
+        finally:
+            PhaseProfiler._reset_instance()
+
+
+class TestTaskRunnerPhaseProfiling(unittest.TestCase):
+
+    def setUp(self):
+        PhaseProfiler._reset_instance()
+        self.profiler = PhaseProfiler.get_instance()
+        self.profiler.enable()
+
+    def tearDown(self):
+        PhaseProfiler._reset_instance()
+
+    def test_runner_records_all_phases(self):
+        worker = Worker(task_definition_name="add", execute_function=add_numbers)
+        runner = TaskRunner(worker=worker, configuration=Configuration())
+        task = Task(task_id="t1", workflow_instance_id="wf", task_def_name="add",
+                    input_data={"a": 1, "b": 2})
+
+        with patch.object(TaskResourceApi, "batch_poll", return_value=[task]), \
+                patch.object(TaskResourceApi, "update_task_v2", return_value=None):
+            tasks = runner._TaskRunner__batch_poll_tasks(1)
+            result = runner._TaskRunner__execute_task(tasks[0])
+            runner._TaskRunner__update_task(result)
+
+        summary = self.profiler.summary()["add"]
+        for phase in ("poll", "deserialize", "bind", "execute", "serialize", "update"):
+            self.assertEqual(summary[phase]["count"], 1, phase)
+        self.assertEqual(result.output_data, {"sum": 3})
+
+    def test_disabled_profiler_records_nothing(self):
+        self.profiler.disable()
+        worker = Worker(task_definition_name="add", execute_function=add_numbers)
+        runner = TaskRunner(worker=worker, configuration=Configuration())
+        task = Task(task_id="t1", workflow_instance_id="wf", task_def_name="add",
+                    input_data={"a": 1, "b": 2})
+
+        runner._TaskRunner__execute_task(task)
+
+        self.assertEqual(self.profiler.summary(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
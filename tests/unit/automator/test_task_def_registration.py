@@ -0,0 +1,135 @@
+import logging
+import unittest
+from dataclasses import dataclass
+from unittest.mock import MagicMock
+
+from conductor.client.automator.task_def_registration import register_task_definitions, task_definition_for_worker
+from conductor.client.http.models.schema_def import SchemaDef, SchemaType
+from conductor.client.http.models.task_def import TaskDef
+from conductor.client.http.rest import ApiException
+from conductor.client.metadata_client import MetadataClient
+from conductor.client.schema_client import SchemaClient
+from conductor.client.worker.worker import Worker
+
+
+@dataclass
+class Order:
+    order_id: str
+    amount: float
+
+
+def process_order(order: Order) -> dict:
+    return {"status": "processed"}
+
+
+def worker(name, domain=None, **kwargs):
+    return Worker(task_definition_name=name, execute_function=process_order, domain=domain,
+                  register_task_def=True, **kwargs)
+
+
+class TestRegisterTaskDefinitions(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.metadata = MagicMock(spec=MetadataClient)
+        self.metadata.get_all_task_defs.return_value = []
+        self.schemas = MagicMock(spec=SchemaClient)
+        self.schemas.get_all_schemas.return_value = []
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_new_definitions_are_created_in_one_request(self):
+        workers = [worker(f"tool_{i}") for i in range(5)] + [worker("tool_0", domain="run-1")]
+        workers.append(Worker("unregistered", process_order))
+
+        result = register_task_definitions(workers, self.metadata, self.schemas)
+
+        self.metadata.register_task_defs.assert_called_once()
+        self.assertEqual([d.name for d in self.metadata.register_task_defs.call_args.args[0]],
+                         [f"tool_{i}" for i in range(5)])
+        self.assertEqual(result.created, [f"tool_{i}" for i in range(5)])
+        self.assertTrue(all(w.task_def_registered for w in workers[:6]))
+        self.assertFalse(workers[6].task_def_registered)
+        self.metadata.update_task_def.assert_not_called()
+
+    def test_definitions_the_server_already_has_are_skipped(self):
+        desired, _ = task_definition_for_worker(worker("same", task_def_template=TaskDef(retry_count=5)))
+        on_server = TaskDef(name="same", retry_count=5, owner_email="ops@example.com", create_time=1)
+        self.metadata.get_all_task_defs.return_value = [
+            on_server, TaskDef(name="changed", retry_count=1), TaskDef(name="kept", retry_count=1)]
+        workers = [worker("same", task_def_template=TaskDef(retry_count=5)),
+                   worker("changed", task_def_template=TaskDef(retry_count=2)),
+                   worker("kept", task_def_template=TaskDef(retry_count=2), overwrite_task_def=False)]
+
+        result = register_task_definitions(workers, self.metadata, self.schemas)
+
+        self.assertEqual(desired.retry_count, 5)
+        self.assertEqual((result.unchanged, result.updated, result.created), (["same", "kept"], ["changed"], []))
+        self.metadata.register_task_defs.assert_not_called()
+        self.assertEqual(self.metadata.update_task_def.call_args.args[0].retry_count, 2)
+        self.assertTrue(all(w.task_def_registered for w in workers))
+
+    def test_generated_schemas_are_saved_in_one_request_when_changed(self):
+        input_schema, output_schema = task_definition_for_worker(worker("order", register_schema=True))[1]
+        self.schemas.get_all_schemas.return_value = [
+            SchemaDef(name="order_input", version=1, type=SchemaType.JSON, data=input_schema.data)]
+
+        result = register_task_definitions([worker("order", register_schema=True)], self.metadata, self.schemas)
+
+        self.schemas.register_schemas.assert_called_once()
+        self.assertEqual([s.name for s in self.schemas.register_schemas.call_args.args[0]], ["order_output"])
+        self.assertEqual(result.schemas_registered, ["order_output"])
+        created = self.metadata.register_task_defs.call_args.args[0][0]
+        self.assertEqual((created.input_schema, created.output_schema),
+                         ({"name": "order_input", "version": 1}, {"name": "order_output", "version": 1}))
+
+    def test_missing_schema_registry_unlinks_schemas(self):
+        self.schemas.get_all_schemas.side_effect = ApiException(status=404)
+
+        register_task_definitions([worker("order", register_schema=True)], self.metadata, self.schemas)
+
+        created = self.metadata.register_task_defs.call_args.args[0][0]
+        self.assertEqual((created.input_schema, created.output_schema), (None, None))
+
+    def test_failures_leave_registration_to_the_workers(self):
+        workers = [worker("a"), worker("b")]
+        self.metadata.get_all_task_defs.return_value = [TaskDef(name="b", enforce_schema=True)]
+        self.metadata.register_task_defs.side_effect = ApiException(status=500, reason="boom")
+        self.metadata.update_task_def.side_effect = ApiException(status=500, reason="boom")
+
+        result = register_task_definitions(workers, self.metadata, self.schemas)
+
+        self.assertEqual(sorted(result.failed), ["a", "b"])
+        self.assertFalse(any(w.task_def_registered for w in workers))
+
+        self.metadata.get_all_task_defs.side_effect = ApiException(status=0)
+        register_task_definitions(workers, self.metadata, self.schemas)
+        self.assertEqual(self.metadata.register_task_defs.call_count, 1)
+
+
+class TestBulkRegistrationDefaults(unittest.TestCase):
+
+    def test_clients_without_bulk_endpoints_register_one_at_a_time(self):
+        registered = []
+
+        class SingleMetadataClient(MetadataClient):
+            register_task_def = registered.append
+
+        class SingleSchemaClient(SchemaClient):
+            register_schema = registered.append
+
+        # Stand in for the other abstract methods, which these calls don't use.
+        for cls in (SingleMetadataClient, SingleSchemaClient):
+            cls.__abstractmethods__ = frozenset()
+        task_defs = [TaskDef(name="a"), TaskDef(name="b")]
+        schema = SchemaDef(name="order_output", type=SchemaType.JSON)
+
+        SingleMetadataClient().register_task_defs(task_defs)
+        SingleSchemaClient().register_schemas([schema])
+
+        self.assertEqual(registered, task_defs + [schema])
+
+
+if __name__ == "__main__":
+    unittest.main()
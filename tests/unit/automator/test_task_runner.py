@@ -8,6 +8,7 @@ from requests.structures import CaseInsensitiveDict
 
 from conductor.client.automator.task_runner import TaskRunner
 from conductor.client.configuration.configuration import Configuration
+from conductor.client.event.task_runner_events import PollCompleted, TaskUpdateCompleted
 from conductor.client.http.api.task_resource_api import TaskResourceApi
 from conductor.client.http.models.task import Task
 from conductor.client.http.models.task_result import TaskResult
@@ -146,6 +147,32 @@ class TestTaskRunner(unittest.TestCase):
             self.assertEqual(len(tasks), 1)
             self.assertEqual(tasks[0], expected_task)
 
+    def test_poll_task_skips_event_construction_without_listeners(self):
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task()]
+        ), patch('conductor.client.automator.task_runner.PollStarted') as poll_started, \
+                patch('conductor.client.automator.task_runner.PollCompleted') as poll_completed:
+            task_runner = self.__get_valid_task_runner()
+            tasks = task_runner._TaskRunner__batch_poll_tasks(1)
+            self.assertEqual(len(tasks), 1)
+            poll_started.assert_not_called()
+            poll_completed.assert_not_called()
+
+    def test_poll_task_publishes_events_to_listeners(self):
+        received = []
+        with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task()]
+        ):
+            task_runner = self.__get_valid_task_runner()
+            task_runner.event_dispatcher.register(PollCompleted, received.append)
+            task_runner._TaskRunner__batch_poll_tasks(1)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].tasks_received, 1)
+
     def test_poll_task_with_faulty_task_api(self):
         with patch.object(
                 TaskResourceApi,
@@ -218,6 +245,17 @@ class TestTaskRunner(unittest.TestCase):
             response = task_runner._TaskRunner__update_task(task_result)
             self.assertEqual(response, mock_next_task)
 
+    def test_update_task_publishes_update_completed(self):
+        received = []
+        with patch.object(TaskResourceApi, 'update_task_v2', return_value=None):
+            task_runner = self.__get_valid_task_runner()
+            task_runner.event_dispatcher.register(TaskUpdateCompleted, received.append)
+            task_runner._TaskRunner__update_task(self.__get_valid_task_result())
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].task_id, self.TASK_ID)
+        self.assertEqual(received[0].workflow_instance_id, self.WORKFLOW_INSTANCE_ID)
+        self.assertGreaterEqual(received[0].duration_ms, 0)
+
     def test_wait_for_polling_interval_with_faulty_worker(self):
         expected_exception = Exception(
             "Failed to get polling interval"
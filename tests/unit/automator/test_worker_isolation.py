@@ -20,12 +20,15 @@ from conductor.client.automator.task_runner import TaskRunner
 from conductor.client.configuration.configuration import Configuration
 from tests.unit.resources.workers import ClassWorker
 from conductor.client.automator.worker_isolation import (
+    ISOLATION_FORKSERVER,
     ISOLATION_PROCESS,
     ISOLATION_THREAD,
     WORKER_ISOLATION_ENV,
     _ThreadAsProcess,
     apply_thread_isolation,
+    forkserver_context,
     isolation_mode,
+    worker_preload_modules,
 )
 
 
@@ -236,3 +239,52 @@ def test_thread_mode_start_stop_smoke(monkeypatch, restore_globals):
         finally:
             _stop_logger(th)
     assert thread_errors == []
+
+
+# ── forkserver mode ──────────────────────────────────────────────────────────
+
+
+def test_forkserver_mode_accepted(monkeypatch):
+    monkeypatch.setenv(WORKER_ISOLATION_ENV, " ForkServer ")
+    assert isolation_mode() == ISOLATION_FORKSERVER
+
+
+def test_worker_preload_modules_covers_sdk_and_worker_modules():
+    modules = worker_preload_modules(
+        [ClassWorker("task"), ClassWorker("other")], import_modules=["json"]
+    )
+    assert modules[0] == "__main__"
+    assert "conductor.client.automator.task_handler" in modules
+    assert "json" in modules
+    assert modules.count(ClassWorker.__module__) == 1
+
+
+@pytest.mark.skipif(
+    "forkserver" not in multiprocessing.get_all_start_methods(),
+    reason="forkserver start method not available",
+)
+def test_task_handler_forkserver_builds_worker_processes_from_context(monkeypatch, restore_globals):
+    monkeypatch.setenv(WORKER_ISOLATION_ENV, "forkserver")
+    th = TaskHandler(
+        configuration=Configuration(),
+        workers=[ClassWorker("task")],
+        scan_for_annotated_workers=False,
+        monitor_processes=False,
+    )
+    try:
+        ctx = multiprocessing.get_context("forkserver")
+        assert len(th.task_runner_processes) == 1
+        assert isinstance(th.task_runner_processes[0], ctx.Process)
+        # Only worker processes move to the fork server.
+        assert task_handler.Process is multiprocessing.Process
+        assert isinstance(th.logger_process, multiprocessing.Process)
+    finally:
+        th.queue.put(None)
+        th.logger_process.join(timeout=5)
+
+
+def test_forkserver_context_falls_back_when_unsupported(monkeypatch, caplog):
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    with caplog.at_level("WARNING", logger=worker_isolation.logger.name):
+        assert forkserver_context(["json"]) is None
+    assert any(ISOLATION_FORKSERVER in r.getMessage() for r in caplog.records)
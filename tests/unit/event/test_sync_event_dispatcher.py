@@ -0,0 +1,185 @@
+"""
+Unit tests for SyncEventDispatcher
+"""
+
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from conductor.client.event.sync_event_dispatcher import (
+    EVENT_DELIVERY_ENV,
+    SyncEventDispatcher,
+    async_delivery_from_env,
+)
+from conductor.client.event.task_runner_events import (
+    TaskRunnerEvent,
+    PollStarted,
+    PollCompleted,
+)
+
+
+def _poll_started(n=1):
+    return PollStarted(task_type="test_task", worker_id="worker_1", poll_count=n)
+
+
+class TestSyncEventDispatcher(unittest.TestCase):
+    """Test inline (default) delivery"""
+
+    def setUp(self):
+        self.dispatcher = SyncEventDispatcher[TaskRunnerEvent]()
+
+    def test_publish_calls_listeners_in_registration_order(self):
+        calls = []
+        self.dispatcher.register(PollStarted, lambda e: calls.append("a"))
+        self.dispatcher.register(PollStarted, lambda e: calls.append("b"))
+        self.dispatcher.publish(_poll_started())
+        self.assertEqual(calls, ["a", "b"])
+
+    def test_has_listeners_tracks_register_and_unregister(self):
+        def listener(event):
+            pass
+
+        self.assertFalse(self.dispatcher.has_listeners(PollStarted))
+        self.dispatcher.register(PollStarted, listener)
+        self.assertTrue(self.dispatcher.has_listeners(PollStarted))
+        self.assertFalse(self.dispatcher.has_listeners(PollCompleted))
+        self.dispatcher.unregister(PollStarted, listener)
+        self.assertFalse(self.dispatcher.has_listeners(PollStarted))
+        self.assertEqual(self.dispatcher.listener_count(PollStarted), 0)
+
+    def test_duplicate_registration_is_ignored(self):
+        def listener(event):
+            pass
+
+        self.dispatcher.register(PollStarted, listener)
+        self.dispatcher.register(PollStarted, listener)
+        self.assertEqual(self.dispatcher.listener_count(PollStarted), 1)
+
+    def test_publish_snapshot_is_not_affected_by_concurrent_register(self):
+        """A listener registering another listener mid-publish must not change the running dispatch."""
+        calls = []
+
+        def late(event):
+            calls.append("late")
+
+        def first(event):
+            calls.append("first")
+            self.dispatcher.register(PollStarted, late)
+
+        self.dispatcher.register(PollStarted, first)
+        self.dispatcher.publish(_poll_started())
+        self.assertEqual(calls, ["first"])
+        self.dispatcher.publish(_poll_started())
+        self.assertEqual(calls, ["first", "first", "late"])
+
+    def test_listener_exception_isolation(self):
+        calls = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        self.dispatcher.register(PollStarted, broken)
+        self.dispatcher.register(PollStarted, lambda e: calls.append(e))
+        self.dispatcher.publish(_poll_started())
+        self.assertEqual(len(calls), 1)
+
+    def test_close_is_noop_in_sync_mode(self):
+        self.dispatcher.close()
+        self.assertTrue(self.dispatcher.flush(timeout=0.1))
+
+
+class TestSyncEventDispatcherAsyncDelivery(unittest.TestCase):
+    """Test background-thread delivery"""
+
+    def test_slow_listener_does_not_block_publisher(self):
+        dispatcher = SyncEventDispatcher[TaskRunnerEvent](async_delivery=True)
+        release = threading.Event()
+        received = []
+
+        def slow(event):
+            release.wait(5)
+            received.append(event.poll_count)
+
+        dispatcher.register(PollStarted, slow)
+        start = time.monotonic()
+        for i in range(5):
+            dispatcher.publish(_poll_started(i))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        release.set()
+        self.assertTrue(dispatcher.flush(timeout=5))
+        self.assertEqual(received, [0, 1, 2, 3, 4])
+        dispatcher.close()
+
+    def test_full_queue_drops_and_counts(self):
+        dispatcher = SyncEventDispatcher[TaskRunnerEvent](async_delivery=True, max_queue_size=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking(event):
+            started.set()
+            release.wait(5)
+
+        dispatcher.register(PollStarted, blocking)
+        dispatcher.publish(_poll_started())  # taken by the delivery thread
+        self.assertTrue(started.wait(5))
+        dispatcher.publish(_poll_started())  # fills the queue
+        dispatcher.publish(_poll_started())  # dropped
+        self.assertEqual(dispatcher.dropped_events, 1)
+        release.set()
+        dispatcher.close()
+
+    def test_close_delivers_pending_events(self):
+        dispatcher = SyncEventDispatcher[TaskRunnerEvent](async_delivery=True)
+        received = []
+        dispatcher.register(PollStarted, lambda e: received.append(e))
+        for i in range(10):
+            dispatcher.publish(_poll_started(i))
+        dispatcher.close()
+        self.assertEqual(len(received), 10)
+
+    def test_close_with_full_queue_returns_within_timeout(self):
+        dispatcher = SyncEventDispatcher[TaskRunnerEvent](async_delivery=True, max_queue_size=1)
+        release = threading.Event()
+        started = threading.Event()
+        received = []
+
+        def blocking(event):
+            started.set()
+            release.wait(5)
+            received.append(event.poll_count)
+
+        dispatcher.register(PollStarted, blocking)
+        dispatcher.publish(_poll_started(0))
+        self.assertTrue(started.wait(5))
+        dispatcher.publish(_poll_started(1))  # fills the queue
+        thread = dispatcher._delivery_thread
+
+        start = time.monotonic()
+        dispatcher.close(timeout=0.2)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(dispatcher.dropped_events, 1)
+
+        release.set()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(received, [0])
+
+    def test_unobserved_publish_does_not_start_thread(self):
+        dispatcher = SyncEventDispatcher[TaskRunnerEvent](async_delivery=True)
+        dispatcher.publish(_poll_started())
+        self.assertIsNone(dispatcher._delivery_thread)
+
+    def test_async_delivery_from_env(self):
+        with patch.dict(os.environ, {EVENT_DELIVERY_ENV: " ASYNC "}):
+            self.assertTrue(async_delivery_from_env())
+        with patch.dict(os.environ, {EVENT_DELIVERY_ENV: "sync"}):
+            self.assertFalse(async_delivery_from_env())
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(async_delivery_from_env())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
+from conductor.client.http.models.bulk_response import BulkResponse
+from conductor.client.http.rest import ApiException
+from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.client.orkes.workflow_bulk_operations import WorkflowBulkOperations
+
+
+def bulk_response(ids, failed=()):
+    return BulkResponse(bulk_successful_results=[i for i in ids if i not in failed],
+                        bulk_error_results={i: "not running" for i in failed if i in ids})
+
+
+class TestWorkflowBulkOperations(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.api = MagicMock(spec=WorkflowBulkResourceApi)
+        self.ids = [f"wf-{i}" for i in range(25)]
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_chunks_run_concurrently_and_merge(self):
+        active, peak, lock = [0], [0], threading.Lock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def terminate(body, **kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            if len(body) == 10:
+                barrier.wait()
+            with lock:
+                active[0] -= 1
+            return bulk_response(body, failed=("wf-3",))
+
+        self.api.terminate.side_effect = terminate
+        progress = []
+        result = WorkflowBulkOperations(self.api, chunk_size=10, max_workers=3).terminate(
+            self.ids, reason="incident", on_progress=progress.append)
+
+        self.assertEqual(self.api.terminate.call_count, 3)
+        self.assertEqual(self.api.terminate.call_args.kwargs, {"reason": "incident"})
+        self.assertGreaterEqual(peak[0], 2)
+        self.assertEqual(sorted(result.bulk_successful_results), sorted(set(self.ids) - {"wf-3"}))
+        self.assertEqual(result.bulk_error_results, {"wf-3": "not running"})
+        self.assertEqual([p.chunks_done for p in progress], [1, 2, 3])
+        self.assertEqual((progress[-1].processed, progress[-1].succeeded, progress[-1].failed), (25, 24, 1))
+
+    def test_chunk_size_is_capped_at_server_limit(self):
+        self.api.retry.side_effect = lambda body, **kwargs: bulk_response(body)
+        result = WorkflowBulkOperations(self.api, chunk_size=5000).retry([f"wf-{i}" for i in range(2500)])
+
+        self.assertEqual([len(call.args[0]) for call in self.api.retry.call_args_list], [1000, 1000, 500])
+        self.assertEqual(len(result.bulk_successful_results), 2500)
+
+    def test_failed_chunk_is_retried_then_reported(self):
+        self.api.pause_workflow.side_effect = [ApiException(status=503, reason="unavailable"),
+                                               bulk_response(self.ids[:10]),
+                                               ApiException(status=400, reason="bad request")]
+        operations = WorkflowBulkOperations(self.api, chunk_size=10, max_workers=1, retry_backoff_seconds=0)
+
+        result = operations.pause(self.ids[:20])
+
+        self.assertEqual(self.api.pause_workflow.call_count, 3)
+        self.assertEqual(result.bulk_successful_results, self.ids[:10])
+        self.assertEqual(result.bulk_error_results, {i: "400: bad request" for i in self.ids[10:20]})
+
+    def test_transport_errors_are_retried_and_do_not_abort_the_run(self):
+        request = httpx.Request("POST", "http://localhost/api/workflow/bulk/resume")
+        self.api.resume_workflow.side_effect = [
+            httpx.ReadTimeout("timed out", request=request),
+            bulk_response(self.ids[:10]),
+            httpx.ConnectError("refused", request=request),
+            httpx.ConnectError("refused", request=request),
+            bulk_response(self.ids[20:]),
+        ]
+        operations = WorkflowBulkOperations(self.api, chunk_size=10, max_workers=1, retries=1,
+                                            retry_backoff_seconds=0)
+
+        result = operations.resume(self.ids)
+
+        self.assertEqual(self.api.resume_workflow.call_count, 5)
+        self.assertEqual(result.bulk_successful_results, self.ids[:10] + self.ids[20:])
+        self.assertEqual(result.bulk_error_results, {i: "ConnectError: refused" for i in self.ids[10:20]})
+
+    def test_checkpoint_resumes_unfinished_chunks(self):
+        path = os.path.join(tempfile.mkdtemp(), "terminate.jsonl")
+        calls = []
+
+        def flaky(body, **kwargs):
+            calls.append(body)
+            if len(calls) == 2:
+                raise ApiException(status=400, reason="bad request")
+            return bulk_response(body)
+
+        self.api.terminate.side_effect = flaky
+        operations = WorkflowBulkOperations(self.api, chunk_size=10, max_workers=1)
+        first = operations.terminate(self.ids, checkpoint=path)
+        self.assertEqual(len(first.bulk_error_results), 10)
+
+        calls.clear()
+        second = operations.terminate(self.ids, checkpoint=path)
+
+        self.assertEqual(calls, [self.ids[10:20]])
+        self.assertEqual(sorted(second.bulk_successful_results), sorted(self.ids))
+        self.assertEqual(second.bulk_error_results, {})
+        with open(path) as f:
+            self.assertEqual(json.loads(f.readline())["operation"], "terminate")
+
+        with self.assertRaises(ValueError):
+            operations.retry(self.ids, checkpoint=path)
+
+    def test_workflow_client_facade(self):
+        client = OrkesWorkflowClient(Configuration("http://localhost:8080/api"))
+        with patch.object(WorkflowBulkResourceApi, "restart",
+                          side_effect=lambda body, **kwargs: bulk_response(body)) as restart:
+            result = client.bulk_restart_workflows(self.ids, use_latest_definitions=True)
+
+        self.assertEqual(restart.call_args.kwargs, {"use_latest_definitions": True})
+        self.assertEqual(len(result.bulk_successful_results), 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from conductor.client.http.models.start_workflow_request import IdempotencyStrategy
+from conductor.client.http.rest import ApiException
+from conductor.client.orkes.workflow_start_pipeline import WorkflowStartPipeline
+
+
+class FakeStarts:
+    """Returns one workflow id per idempotency key, like a server using RETURN_EXISTING."""
+
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.requests = []
+        self.ids = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.requests.append(request)
+            if self.failures:
+                raise self.failures.pop(0)
+            return self.ids.setdefault(request.idempotency_key, f"wf-{len(self.ids)}")
+
+
+class TestWorkflowStartPipeline(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.client = MagicMock()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def pipeline(self, **kwargs) -> WorkflowStartPipeline:
+        kwargs.setdefault("idempotency_key", lambda order: order["id"])
+        pipeline = WorkflowStartPipeline(self.client, "orders", version=2, **kwargs)
+        self.addCleanup(pipeline.close)
+        return pipeline
+
+    def test_starts_with_derived_idempotency_keys_and_skips_duplicates(self):
+        self.client.start_workflow.side_effect = starts = FakeStarts()
+        pipeline = self.pipeline()
+
+        results = [(order, future.result()) for order, future in
+                   pipeline.start_all([{"id": "a"}, {"id": "b"}, {"id": "a"}, {"id": "c"}])]
+
+        self.assertEqual([order["id"] for order, _ in results], ["a", "b", "a", "c"])
+        self.assertEqual(results[0][1], results[2][1])
+        self.assertEqual(len(starts.requests), 3)
+        request = starts.requests[0]
+        self.assertEqual((request.name, request.version), ("orders", 2))
+        self.assertEqual(request.idempotency_strategy, IdempotencyStrategy.RETURN_EXISTING)
+        stats = pipeline.stats
+        self.assertEqual((stats.submitted, stats.started, stats.duplicates_skipped), (4, 3, 1))
+        self.assertGreater(stats.starts_per_second, 0)
+
+    def test_retries_transient_errors_only(self):
+        self.client.start_workflow.side_effect = FakeStarts(failures=[
+            ApiException(status=0, reason="protocol error", transient=True),
+            ApiException(status=503, reason="unavailable"),
+        ])
+        pipeline = self.pipeline(base_delay_seconds=0)
+        self.assertEqual(pipeline.submit({"id": "a"}).result(5), "wf-0")
+        self.assertEqual(pipeline.stats.retries, 2)
+
+        self.client.start_workflow.side_effect = ApiException(status=400, reason="bad input")
+        with self.assertRaises(ApiException):
+            pipeline.submit({"id": "b"}).result(5)
+        stats = pipeline.stats
+        self.assertEqual((stats.retries, stats.failed, stats.in_flight), (2, 1, 0))
+
+    def test_gives_up_after_max_attempts(self):
+        self.client.start_workflow.side_effect = ApiException(status=503, reason="unavailable")
+        pipeline = self.pipeline(max_attempts=3, base_delay_seconds=0)
+
+        with self.assertRaises(ApiException):
+            pipeline.submit({"id": "a"}).result(5)
+        self.assertEqual(self.client.start_workflow.call_count, 3)
+
+    def test_in_flight_window_is_bounded(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def start(request):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return request.idempotency_key
+
+        self.client.start_workflow.side_effect = start
+        pipeline = self.pipeline(max_in_flight=3)
+        futures = [pipeline.submit({"id": str(i)}) for i in range(20)]
+
+        self.assertEqual([f.result(5) for f in futures], [str(i) for i in range(20)])
+        self.assertLessEqual(peak[0], 3)
+
+    def test_dedup_capacity_evicts_oldest_keys(self):
+        self.client.start_workflow.side_effect = starts = FakeStarts()
+        pipeline = self.pipeline(dedup_capacity=2)
+        for key in ["a", "b", "c", "a"]:
+            pipeline.submit({"id": key}).result(5)
+
+        self.assertEqual([r.idempotency_key for r in starts.requests], ["a", "b", "c", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
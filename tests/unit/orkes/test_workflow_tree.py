@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.api.workflow_resource_api import WorkflowResourceApi
+from conductor.client.http.models.task import Task
+from conductor.client.http.models.workflow import Workflow
+from conductor.client.http.rest import ApiException
+from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.client.orkes.workflow_tree import fetch_workflow_tree
+
+# root -> a, b, a (a retried sub-workflow task); a -> c, d; d -> missing
+GRAPH = {"root": ["a", "b", "a"], "a": ["c", "d"], "b": [], "c": [], "d": ["missing"]}
+
+
+class TestFetchWorkflowTree(unittest.TestCase):
+
+    def test_builds_indexed_tree_fetching_each_id_once(self):
+        calls = []
+
+        def fetch(workflow_id):
+            calls.append(workflow_id)
+            return {"id": workflow_id} if workflow_id in GRAPH else None
+
+        tree = fetch_workflow_tree("root", fetch, lambda wf: GRAPH[wf["id"]])
+
+        self.assertEqual(sorted(calls), ["a", "b", "c", "d", "missing", "root"])
+        self.assertEqual(len(tree), 5)
+        self.assertEqual(tree.root.children, ["a", "b"])
+        self.assertEqual(tree["a"].children, ["c", "d"])
+        self.assertEqual(tree["b"].children, [])
+        self.assertEqual((tree["d"].parent_id, tree["d"].depth), ("a", 2))
+        self.assertEqual([node.workflow_id for node in tree], ["root", "a", "c", "d", "b"])
+        self.assertNotIn("missing", tree)
+
+    def test_fetches_siblings_concurrently_within_bound(self):
+        children = {"root": [f"child-{i}" for i in range(8)]}
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def fetch(workflow_id):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return workflow_id
+
+        tree = fetch_workflow_tree("root", fetch, lambda wf: children.get(wf, []), max_workers=4)
+
+        self.assertEqual(len(tree), 9)
+        self.assertEqual(peak[0], 4)
+
+    def test_max_depth_and_errors(self):
+        def fetch(workflow_id):
+            if workflow_id == "b":
+                raise ApiException(status=500, reason="boom")
+            return workflow_id
+
+        tree = fetch_workflow_tree("root", fetch, lambda wf: GRAPH.get(wf, []), max_depth=1)
+
+        self.assertEqual(sorted(tree.nodes), ["a", "root"])
+        self.assertEqual(tree["a"].children, [])
+        self.assertEqual(tree.root.children, ["a"])
+        self.assertEqual(list(tree.errors), ["b"])
+
+
+class TestGetWorkflowTree(unittest.TestCase):
+
+    def test_follows_sub_workflow_tasks(self):
+        workflows = {
+            "root": Workflow(workflow_id="root", tasks=[
+                Task(task_type="SIMPLE", task_id="t1"),
+                Task(task_type="SUB_WORKFLOW", sub_workflow_id="child", task_id="t2"),
+            ]),
+            "child": Workflow(workflow_id="child", tasks=[]),
+        }
+        client = OrkesWorkflowClient(Configuration("http://localhost:8080/api"))
+        with patch.object(WorkflowResourceApi, "get_execution_status",
+                          side_effect=lambda workflow_id, **kwargs: workflows[workflow_id]) as get:
+            tree = client.get_workflow_tree("root", summarize=True)
+
+        self.assertEqual(tree.root.children, ["child"])
+        self.assertIs(tree["child"].workflow, workflows["child"])
+        get.assert_called_with("child", include_tasks=True, summarize=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+Tests for in-process metric aggregation (MetricsSettings.flush_interval) and
+the cached aggregated view served by the metrics provider.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from prometheus_client import write_to_textfile
+
+from conductor.client.configuration.settings.metrics_settings import MetricsSettings
+from conductor.client.telemetry.canonical_metrics_collector import CanonicalMetricsCollector
+from conductor.client.telemetry.legacy_metrics_collector import LegacyMetricsCollector
+from conductor.client.telemetry.metrics_collector_base import (
+    MetricsCollectorBase,
+    _CachedCollector,
+)
+
+
+class TestMetricsSettingsFlushInterval(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.metrics_dir, ignore_errors=True)
+
+    def test_defaults_to_write_through(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("CONDUCTOR_METRICS_FLUSH_INTERVAL", None)
+            self.assertIsNone(MetricsSettings(directory=self.metrics_dir).flush_interval)
+
+    def test_reads_env_var(self):
+        with patch.dict(os.environ, {"CONDUCTOR_METRICS_FLUSH_INTERVAL": "2.5"}):
+            self.assertEqual(MetricsSettings(directory=self.metrics_dir).flush_interval, 2.5)
+
+    def test_invalid_env_var_is_ignored(self):
+        with patch.dict(os.environ, {"CONDUCTOR_METRICS_FLUSH_INTERVAL": "soon"}):
+            self.assertIsNone(MetricsSettings(directory=self.metrics_dir).flush_interval)
+
+    def test_explicit_argument_wins(self):
+        with patch.dict(os.environ, {"CONDUCTOR_METRICS_FLUSH_INTERVAL": "2.5"}):
+            settings = MetricsSettings(directory=self.metrics_dir, flush_interval=0)
+            self.assertEqual(settings.flush_interval, 0)
+
+
+class _AggregationTestBase(unittest.TestCase):
+    collector_class = None
+
+    def setUp(self):
+        self.metrics_dir = tempfile.mkdtemp()
+        # Long interval so the background thread never flushes mid-test.
+        self.settings = MetricsSettings(directory=self.metrics_dir, flush_interval=3600)
+        self.collector = self.collector_class(self.settings)
+
+    def tearDown(self):
+        self.collector._flush_stop.set()
+        shutil.rmtree(self.metrics_dir, ignore_errors=True)
+
+    def _get_metrics_text(self):
+        path = os.path.join(self.metrics_dir, "test_out.prom")
+        write_to_textfile(path, self.collector.registry)
+        with open(path) as f:
+            return f.read()
+
+
+class TestCanonicalAggregation(_AggregationTestBase):
+    collector_class = CanonicalMetricsCollector
+
+    def test_counter_is_buffered_until_flush(self):
+        for _ in range(5):
+            self.collector.increment_task_poll("my_task")
+
+        self.assertNotIn("task_poll_total", self._get_metrics_text())
+
+        self.collector.flush()
+        self.assertIn('task_poll_total{taskType="my_task"} 5.0', self._get_metrics_text())
+
+    def test_histogram_batch_matches_observe(self):
+        values = [0.0005, 0.003, 0.003, 0.2, 7.0, 42.0]
+        for value in values:
+            self.collector.record_task_execute_time("my_task", value)
+        self.collector.flush()
+        aggregated = self._get_metrics_text()
+
+        reference_dir = tempfile.mkdtemp()
+        try:
+            reference = CanonicalMetricsCollector(MetricsSettings(directory=reference_dir))
+            for value in values:
+                reference.record_task_execute_time("my_task", value)
+            path = os.path.join(reference_dir, "ref.prom")
+            write_to_textfile(path, reference.registry)
+            with open(path) as f:
+                expected = f.read()
+        finally:
+            shutil.rmtree(reference_dir, ignore_errors=True)
+
+        def samples(text):
+            return sorted(
+                line for line in text.splitlines()
+                if line.startswith("task_execute_time_seconds") and "_created" not in line
+            )
+
+        self.assertEqual(samples(aggregated), samples(expected))
+
+    def test_gauge_keeps_latest_value(self):
+        self.collector.set_active_workers("my_task", 3)
+        self.collector.set_active_workers("my_task", 1)
+        self.collector.flush()
+        self.assertIn('active_workers{taskType="my_task"} 1.0', self._get_metrics_text())
+
+    def test_flush_without_pending_updates_is_noop(self):
+        self.collector.flush()
+        self.assertNotIn("task_poll_total", self._get_metrics_text())
+
+    def test_close_flushes_and_stops_thread(self):
+        self.collector.increment_task_poll("my_task")
+        thread = self.collector._flush_thread
+        self.assertTrue(thread.is_alive())
+
+        self.collector.close()
+
+        self.assertFalse(thread.is_alive())
+        self.assertIn('task_poll_total{taskType="my_task"} 1.0', self._get_metrics_text())
+
+
+class TestLegacyAggregation(_AggregationTestBase):
+    collector_class = LegacyMetricsCollector
+
+    def test_quantiles_recomputed_on_flush(self):
+        for value in range(1, 101):
+            self.collector.record_task_poll_time("my_task", value / 100.0)
+
+        self.assertNotIn('quantile="0.5"', self._get_metrics_text())
+
+        self.collector.flush()
+        text = self._get_metrics_text()
+        self.assertIn('task_poll_time_seconds{quantile="0.5",status="SUCCESS",taskType="my_task"} 0.505', text)
+        self.assertIn('task_poll_time_seconds_count{status="SUCCESS",taskType="my_task"} 100.0', text)
+
+
+class TestCachedCollector(unittest.TestCase):
+
+    class _CountingCollector:
+        def __init__(self):
+            self.calls = 0
+
+        def collect(self):
+            self.calls += 1
+            return iter([self.calls])
+
+    def test_reuses_result_within_ttl(self):
+        inner = self._CountingCollector()
+        cached = _CachedCollector(inner, ttl=3600)
+
+        self.assertEqual(list(cached.collect()), [1])
+        self.assertEqual(list(cached.collect()), [1])
+        self.assertEqual(inner.calls, 1)
+
+    def test_zero_ttl_always_recollects(self):
+        inner = self._CountingCollector()
+        cached = _CachedCollector(inner, ttl=0)
+
+        list(cached.collect())
+        list(cached.collect())
+        self.assertEqual(inner.calls, 2)
+
+    def test_provider_registry_serves_worker_metrics(self):
+        metrics_dir = tempfile.mkdtemp()
+        try:
+            settings = MetricsSettings(directory=metrics_dir, flush_interval=3600)
+            collector = CanonicalMetricsCollector(settings)
+            collector.increment_task_poll("my_task")
+            collector.close()
+
+            registry = MetricsCollectorBase._build_provider_registry(settings)
+            path = os.path.join(metrics_dir, "provider.prom")
+            write_to_textfile(path, registry)
+            with open(path) as f:
+                text = f.read()
+        finally:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+        # Only meaningful in multiprocess mode, where the provider reads .db files.
+        if "task_poll_total" in text:
+            self.assertIn('task_poll_total{taskType="my_task"} 1.0', text)
+            self.assertNotIn("pid=", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
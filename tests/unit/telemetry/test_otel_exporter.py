@@ -0,0 +1,193 @@
+"""
+Tests for OpenTelemetryExporter (task runner events -> OTel spans and metrics).
+"""
+
+import pickle
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk", reason="opentelemetry-sdk not installed")
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+
+from conductor.client.event.sync_event_dispatcher import SyncEventDispatcher
+from conductor.client.event.sync_listener_register import register_task_runner_listener
+from conductor.client.event.task_runner_events import (
+    PollCompleted,
+    PollFailure,
+    TaskExecutionCompleted,
+    TaskExecutionFailure,
+    TaskExecutionStarted,
+    TaskUpdateCompleted,
+    TaskUpdateFailure,
+    trace_context_from_input,
+)
+from conductor.client.telemetry.otel_exporter import OpenTelemetryExporter
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+class TestTraceContextFromInput(unittest.TestCase):
+
+    def test_extracts_w3c_headers(self):
+        context = trace_context_from_input({"traceparent": TRACEPARENT, "tracestate": "k=v", "x": 1})
+        self.assertEqual(context, {"traceparent": TRACEPARENT, "tracestate": "k=v"})
+
+    def test_returns_none_without_traceparent(self):
+        self.assertIsNone(trace_context_from_input({"tracestate": "k=v"}))
+        self.assertIsNone(trace_context_from_input(None))
+
+    def test_ignores_non_string_values(self):
+        self.assertIsNone(trace_context_from_input({"traceparent": 42}))
+
+
+class TestOpenTelemetryExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.spans = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(self.spans))
+        self.metric_reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[self.metric_reader])
+        self.exporter = OpenTelemetryExporter(
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            poll_sample_ratio=1.0,
+        )
+
+    def _run_task(self, task_id, trace_context=None, fail=False):
+        start = datetime.now(timezone.utc)
+        self.exporter.on_task_execution_started(TaskExecutionStarted(
+            task_type="t", task_id=task_id, worker_id="w", workflow_instance_id="wf-1",
+            timestamp=start, trace_context=trace_context))
+        end = start + timedelta(milliseconds=25)
+        if fail:
+            self.exporter.on_task_execution_failure(TaskExecutionFailure(
+                task_type="t", task_id=task_id, worker_id="w", workflow_instance_id="wf-1",
+                cause=ValueError("boom"), duration_ms=25, timestamp=end))
+        else:
+            self.exporter.on_task_execution_completed(TaskExecutionCompleted(
+                task_type="t", task_id=task_id, worker_id="w", workflow_instance_id="wf-1",
+                duration_ms=25, timestamp=end))
+        self.exporter.on_task_update_completed(TaskUpdateCompleted(
+            task_type="t", task_id=task_id, worker_id="w", workflow_instance_id="wf-1",
+            duration_ms=5, timestamp=end + timedelta(milliseconds=5)))
+
+    def _spans_by_name(self):
+        return {span.name: span for span in self.spans.get_finished_spans()}
+
+    def _metric_names(self):
+        data = self.metric_reader.get_metrics_data()
+        return {
+            metric.name
+            for resource_metrics in data.resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+
+    def test_execute_and_update_spans_are_linked(self):
+        self._run_task("task-1")
+
+        spans = self._spans_by_name()
+        execute = spans["conductor.task.execute"]
+        update = spans["conductor.task.update"]
+        self.assertEqual(update.parent.span_id, execute.context.span_id)
+        self.assertEqual(update.context.trace_id, execute.context.trace_id)
+        self.assertEqual(execute.attributes["conductor.task.id"], "task-1")
+        self.assertEqual(execute.attributes["conductor.workflow.instance_id"], "wf-1")
+        self.assertEqual(execute.kind, SpanKind.CONSUMER)
+        self.assertAlmostEqual((execute.end_time - execute.start_time) / 1e6, 25, places=3)
+
+    def test_execute_span_joins_trace_from_task_input(self):
+        self._run_task("task-1", trace_context={"traceparent": TRACEPARENT})
+
+        execute = self._spans_by_name()["conductor.task.execute"]
+        self.assertEqual(format(execute.context.trace_id, "032x"), TRACE_ID)
+        self.assertEqual(format(execute.parent.span_id, "016x"), "00f067aa0ba902b7")
+        self.assertTrue(execute.parent.is_remote)
+
+    def test_execution_failure_marks_span_error(self):
+        self._run_task("task-1", fail=True)
+
+        execute = self._spans_by_name()["conductor.task.execute"]
+        self.assertEqual(execute.status.status_code, StatusCode.ERROR)
+        self.assertEqual(execute.events[0].name, "exception")
+
+    def test_update_failure_span(self):
+        now = datetime.now(timezone.utc)
+        self.exporter.on_task_execution_completed(TaskExecutionCompleted(
+            task_type="t", task_id="task-1", worker_id="w", workflow_instance_id=None,
+            duration_ms=1, timestamp=now))
+        self.exporter.on_task_update_failure(TaskUpdateFailure(
+            task_type="t", task_id="task-1", worker_id="w", workflow_instance_id=None,
+            cause=ConnectionError("down"), retry_count=4, task_result=None, timestamp=now))
+
+        update = self._spans_by_name()["conductor.task.update"]
+        self.assertEqual(update.status.status_code, StatusCode.ERROR)
+        self.assertEqual(update.attributes["conductor.update.retry_count"], 4)
+
+    def test_sample_ratio_zero_drops_task_spans_but_keeps_metrics(self):
+        self.exporter.sample_ratio = 0.0
+        self._run_task("task-1")
+
+        self.assertEqual(self.spans.get_finished_spans(), ())
+        self.assertIn("conductor.task.execute.duration", self._metric_names())
+        self.assertIn("conductor.task.update.duration", self._metric_names())
+
+    def test_sampled_traceparent_overrides_ratio(self):
+        self.exporter.sample_ratio = 0.0
+        self._run_task("task-1", trace_context={"traceparent": TRACEPARENT})
+
+        self.assertIn("conductor.task.execute", self._spans_by_name())
+
+    def test_empty_polls_are_not_traced_by_default(self):
+        self.exporter.on_poll_completed(PollCompleted(task_type="t", duration_ms=3, tasks_received=0))
+        self.assertEqual(self.spans.get_finished_spans(), ())
+
+        self.exporter.on_poll_completed(PollCompleted(task_type="t", duration_ms=3, tasks_received=2))
+        poll = self._spans_by_name()["conductor.task.poll"]
+        self.assertEqual(poll.attributes["conductor.poll.tasks_received"], 2)
+        self.assertIn("conductor.task.poll.received", self._metric_names())
+
+    def test_poll_failure_counts_error(self):
+        self.exporter.on_poll_failure(PollFailure(task_type="t", duration_ms=3, cause=TimeoutError()))
+
+        self.assertEqual(self._spans_by_name()["conductor.task.poll"].status.status_code, StatusCode.ERROR)
+        self.assertIn("conductor.task.errors", self._metric_names())
+
+    def test_tracked_state_is_bounded(self):
+        self.exporter.max_tracked_tasks = 2
+        for i in range(5):
+            self.exporter.on_task_execution_started(TaskExecutionStarted(
+                task_type="t", task_id=f"task-{i}", worker_id="w",
+                trace_context={"traceparent": TRACEPARENT}))
+
+        self.assertEqual(list(self.exporter._trace_contexts), ["task-3", "task-4"])
+
+    def test_pickle_drops_runtime_state(self):
+        self._run_task("task-1")
+
+        clone = pickle.loads(pickle.dumps(self.exporter))
+
+        self.assertEqual(clone.poll_sample_ratio, 1.0)
+        self.assertFalse(clone._initialized)
+        self.assertIsNone(clone._tracer_provider)
+
+    def test_registers_on_dispatcher(self):
+        dispatcher = SyncEventDispatcher()
+        register_task_runner_listener(self.exporter, dispatcher)
+
+        self.assertTrue(dispatcher.has_listeners(TaskUpdateCompleted))
+        self.assertTrue(dispatcher.has_listeners(TaskExecutionStarted))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import json
+import threading
+import unittest
+import urllib.request
+
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.configuration.settings.authentication_settings import AuthenticationSettings
+from conductor.client.http.api.task_resource_api import TaskResourceApi
+from conductor.client.http.api_client import ApiClient
+from conductor.client.http.models import StartWorkflowRequest, TaskResult
+from conductor.client.http.rest import ApiException
+from conductor.client.orkes.orkes_workflow_client import OrkesWorkflowClient
+from conductor.client.testing.local_server import FaultInjection, LocalConductorServer
+from conductor.client.worker.worker import Worker
+
+WORKFLOW_DEF = {"name": "echo_workflow", "version": 1, "tasks": [
+    {"name": "echo", "taskReferenceName": "echo_ref", "type": "SIMPLE", "inputParameters": {"x": "${workflow.input.x}"}}
+], "outputParameters": {"y": "${echo_ref.output.y}"}}
+
+
+def echo(x: int) -> dict:
+    return {"y": x}
+
+
+class TestLocalConductorServer(unittest.TestCase):
+
+    def start_server(self, **kwargs) -> LocalConductorServer:
+        server = LocalConductorServer(**kwargs).start_in_thread()
+        self.addCleanup(server.stop_in_thread)
+        return server
+
+    def test_poll_and_update_v2_over_http(self):
+        server = self.start_server()
+        server.engine.seed_tasks("echo", 2, {"x": 1})
+        tasks = TaskResourceApi(ApiClient(Configuration(server_api_url=server.url)))
+
+        polled = tasks.batch_poll("echo", workerid="w1", count=1, timeout=100)
+        self.assertEqual(len(polled), 1)
+        self.assertEqual(polled[0].input_data, {"x": 1})
+
+        next_task = tasks.update_task_v2(TaskResult(task_id=polled[0].task_id,
+                                                    workflow_instance_id=polled[0].workflow_instance_id,
+                                                    status="COMPLETED", output_data={"y": 1}, worker_id="w1"))
+        self.assertIsNotNone(next_task.task_id)
+        self.assertNotEqual(next_task.task_id, polled[0].task_id)
+        last = tasks.update_task_v2(TaskResult(task_id=next_task.task_id,
+                                               workflow_instance_id=next_task.workflow_instance_id,
+                                               status="COMPLETED"))
+        self.assertIsNone(last)
+        self.assertEqual(tasks.batch_poll("echo", count=5, timeout=0), [])
+        self.assertEqual(server.engine.stats["workflows_completed"], 2)
+
+    def test_task_runner_and_workflow_client_with_token_refresh(self):
+        server = self.start_server(key_id="key", key_secret="secret",
+                                   faults=FaultInjection(unauthorized_rate=0.3, paths=("/tasks/poll",), seed=7))
+        configuration = Configuration(server_api_url=server.url,
+                                      authentication_settings=AuthenticationSettings(key_id="key", key_secret="secret"))
+        workflow_client = OrkesWorkflowClient(configuration)
+        workflow_id = workflow_client.start_workflow(
+            StartWorkflowRequest(name="echo_workflow", workflow_def=WORKFLOW_DEF, input={"x": 42}))
+
+        runner = TaskRunner(worker=Worker("echo", echo, poll_interval=1), configuration=configuration)
+        thread = threading.Thread(target=runner.run, daemon=True)
+        thread.start()
+        try:
+            self.assertEqual(server.engine.wait_for_workflow(workflow_id, timeout=10), "COMPLETED")
+        finally:
+            runner.stop()
+            thread.join(5)
+
+        workflow = workflow_client.get_workflow(workflow_id, include_tasks=True)
+        self.assertEqual(workflow.output, {"y": 42})
+        self.assertEqual(workflow.tasks[0].status, "COMPLETED")
+
+    def test_requests_without_token_are_rejected(self):
+        server = self.start_server(key_id="key", key_secret="secret")
+        tasks = TaskResourceApi(ApiClient(Configuration(server_api_url=server.url)))
+
+        with self.assertRaises(ApiException) as context:
+            tasks.batch_poll("echo", count=1)
+        self.assertEqual(context.exception.status, 401)
+
+    def test_injected_errors_and_disconnects(self):
+        server = self.start_server(faults=FaultInjection(error_rate=1.0, paths=("/tasks/poll",)))
+        tasks = TaskResourceApi(ApiClient(Configuration(server_api_url=server.url)))
+        with self.assertRaises(ApiException) as context:
+            tasks.batch_poll("echo", count=1)
+        self.assertEqual(context.exception.status, 503)
+
+        server.faults = FaultInjection(disconnect_rate=1.0, paths=("/tasks/poll",))
+        with self.assertRaises(ApiException) as context:
+            tasks.batch_poll("echo", count=1)
+        self.assertEqual(context.exception.status, 0)
+        self.assertGreaterEqual(server.stats["injected_disconnects"], 1)
+        self.assertEqual(server.stats["injected_errors"], 1)
+
+    def test_connections_are_recycled_after_max_requests(self):
+        server = self.start_server(faults=FaultInjection(max_requests_per_connection=2))
+        tasks = TaskResourceApi(ApiClient(Configuration(server_api_url=server.url)))
+
+        for _ in range(6):
+            tasks.batch_poll("echo", count=1)
+
+        self.assertEqual(server.stats["recycled_connections"], 3)
+        self.assertEqual(server.stats["connections"], 3)
+
+    def test_seed_and_stats_endpoints(self):
+        server = self.start_server()
+        request = urllib.request.Request(f"{server.url}/_local/seed/echo?count=3", data=b'{"x": 1}', method="POST",
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            self.assertEqual(json.loads(response.read()), {"seeded": 3})
+
+        server.engine.poll("echo", count=2)
+        with urllib.request.urlopen(f"{server.url}/_local/stats") as response:
+            stats = json.loads(response.read())
+        self.assertEqual(stats["workflows_started"], 3)
+        self.assertEqual(stats["tasks_polled"], 2)
+        self.assertEqual(stats["pickup_ms"]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
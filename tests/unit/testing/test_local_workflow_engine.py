@@ -0,0 +1,288 @@
+"""
+Tests for LocalWorkflowEngine: DSL workflows interpreted in-process and served to real task runners.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from conductor.client.automator.async_task_runner import AsyncTaskRunner
+from conductor.client.automator.task_runner import TaskRunner
+from conductor.client.configuration.configuration import Configuration
+from conductor.client.http.models import TaskDef, TaskResult
+from conductor.client.http.models.task_result_status import TaskResultStatus
+from conductor.client.testing import LocalWorkflowEngine
+from conductor.client.testing.expression_evaluator import ExpressionError, evaluate_expression
+from conductor.client.worker.worker import Worker
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.task.do_while_task import LoopTask
+from conductor.client.workflow.task.fork_task import ForkTask
+from conductor.client.workflow.task.inline import InlineTask
+from conductor.client.workflow.task.set_variable_task import SetVariableTask
+from conductor.client.workflow.task.simple_task import simple_task
+from conductor.client.workflow.task.switch_task import SwitchTask
+from conductor.client.workflow.task.terminate_task import TerminateTask, WorkflowStatus
+from conductor.client.workflow.task.wait_task import WaitTask
+
+
+def complete_all(engine, task_type, output_fn=lambda task: {}, status=TaskResultStatus.COMPLETED):
+    """Poll and complete every queued task of task_type, as a worker would."""
+    completed = 0
+    while True:
+        tasks = engine.poll(task_type, worker_id="test", count=10)
+        if not tasks:
+            return completed
+        for task in tasks:
+            engine.update(TaskResult(task_id=task.task_id, workflow_instance_id=task.workflow_instance_id,
+                                     status=status, output_data=output_fn(task)))
+            completed += 1
+
+
+class TestLocalWorkflowEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = LocalWorkflowEngine()
+
+    def workflow(self, name="wf"):
+        return ConductorWorkflow(executor=self.engine, name=name, version=1)
+
+    def test_simple_tasks_run_in_order_with_references(self):
+        workflow = self.workflow()
+        workflow >> simple_task("add", "first", {"a": "${workflow.input.a}", "b": 1})
+        workflow >> simple_task("add", "second", {"a": "${first.output.sum}", "b": 10})
+        workflow.output_parameters({"total": "${second.output.sum}", "text": "sum=${second.output.sum}"})
+
+        workflow_id = workflow.start_workflow_with_input({"a": 5})
+        self.assertEqual(self.engine.queue_size("add"), 1)
+        complete_all(self.engine, "add", lambda task: {"sum": task.input_data["a"] + task.input_data["b"]})
+
+        run = self.engine.get_workflow(workflow_id)
+        self.assertEqual(run.status, "COMPLETED")
+        self.assertEqual(run.output, {"total": 16, "text": "sum=16"})
+        self.assertEqual([t.reference_task_name for t in run.tasks], ["first", "second"])
+
+    def test_switch_fork_join_and_inline(self):
+        workflow = self.workflow()
+        switch = SwitchTask("route", case_expression="${workflow.input.kind}")
+        switch.switch_case("fast", [InlineTask("double", "(function () { return $.value * 2; })()",
+                                               bindings={"value": "${workflow.input.value}"})])
+        switch.default_case([simple_task("slow", "slow_ref", {})])
+        workflow >> switch
+        workflow >> ForkTask("fork", [[simple_task("a", "a_ref", {})], [simple_task("b", "b_ref", {})]],
+                             join_on=["a_ref", "b_ref"])
+        workflow.output_parameters({"doubled": "${double.output.result}", "b": "${b_ref.output.v}"})
+
+        workflow_id = workflow.start_workflow_with_input({"kind": "fast", "value": 21})
+        self.assertEqual(self.engine.queue_size("slow"), 0)
+        complete_all(self.engine, "a")
+        self.assertEqual(self.engine.get_workflow(workflow_id).status, "RUNNING")
+        complete_all(self.engine, "b", lambda task: {"v": "done"})
+
+        run = self.engine.get_workflow(workflow_id)
+        self.assertEqual(run.status, "COMPLETED")
+        self.assertEqual(run.output, {"doubled": 42, "b": "done"})
+        join = [t for t in run.tasks if t.task_type == "JOIN"][0]
+        self.assertEqual(set(join.output_data), {"a_ref", "b_ref"})
+
+    def test_do_while_loop_suffixes_iterations(self):
+        workflow = self.workflow()
+        workflow >> LoopTask("loop", iterations=3, tasks=[simple_task("step", "step_ref", {})])
+
+        workflow_id = workflow.start_workflow_with_input({})
+        iterations = []
+        for _ in range(3):
+            task = self.engine.poll("step")[0]
+            iterations.append(task.reference_task_name)
+            self.engine.update(TaskResult(task_id=task.task_id, workflow_instance_id=workflow_id,
+                                          status="COMPLETED", output_data={"n": len(iterations)}))
+
+        run = self.engine.get_workflow(workflow_id)
+        self.assertEqual(iterations, ["step_ref__1", "step_ref__2", "step_ref__3"])
+        self.assertEqual(run.status, "COMPLETED")
+        loop = [t for t in run.tasks if t.task_type == "DO_WHILE"][0]
+        self.assertEqual(loop.output_data["iteration"], 3)
+        self.assertEqual(loop.output_data["3"], {"step_ref": {"n": 3}})
+
+    def test_sub_workflow_set_variable_and_terminate(self):
+        child = self.workflow("child")
+        child >> simple_task("work", "work_ref", {"x": "${workflow.input.x}"})
+        child.output_parameters({"y": "${work_ref.output.y}"})
+
+        parent = self.workflow("parent")
+        parent >> SetVariableTask("set_var")
+        parent.add(child)
+        parent >> TerminateTask("stop", WorkflowStatus.COMPLETED, "done early")
+        parent >> simple_task("never", "never_ref", {})
+        parent._tasks[0].input_parameters.update({"seen": True})
+        parent.output_parameters({"unused": True})
+
+        parent_id = parent.start_workflow_with_input({})
+        child_task = self.engine.poll("work")[0]
+        self.assertNotEqual(child_task.workflow_instance_id, parent_id)
+        self.engine.update(TaskResult(task_id=child_task.task_id, workflow_instance_id=child_task.workflow_instance_id,
+                                      status="COMPLETED", output_data={"y": 7}))
+
+        run = self.engine.get_workflow(parent_id)
+        self.assertEqual(run.status, "COMPLETED")
+        self.assertEqual(run.variables, {"seen": True})
+        self.assertEqual(run.reason_for_incompletion, "done early")
+        self.assertEqual(self.engine.queue_size("never"), 0)
+        sub = [t for t in run.tasks if t.task_type == "SUB_WORKFLOW"][0]
+        self.assertEqual(sub.output_data["y"], 7)
+
+    def test_wait_task_signal_and_duration(self):
+        workflow = self.workflow()
+        workflow >> WaitTask("signal")
+        workflow >> WaitTask("pause", wait_for_seconds=3600)
+        self.engine.skip_wait_durations = True
+
+        workflow_id = workflow.start_workflow_with_input({})
+        self.assertEqual(self.engine.get_workflow(workflow_id).status, "RUNNING")
+        self.engine.complete_task(workflow_id, "signal", {"approved": True})
+
+        self.assertEqual(self.engine.wait_for_workflow(workflow_id, timeout=1), "COMPLETED")
+
+    def test_failure_retries_then_fails_workflow(self):
+        self.engine.register_task_def(TaskDef(name="flaky", retry_count=1))
+        workflow = self.workflow()
+        workflow >> simple_task("flaky", "flaky_ref", {})
+
+        workflow_id = workflow.start_workflow_with_input({})
+        self.assertEqual(complete_all(self.engine, "flaky", status=TaskResultStatus.FAILED), 2)
+
+        run = self.engine.get_workflow(workflow_id)
+        self.assertEqual(run.status, "FAILED")
+        self.assertEqual([t.retry_count for t in run.tasks], [0, 1])
+
+    def test_update_v2_returns_next_task_and_domains_are_separate(self):
+        workflow = self.workflow()
+        workflow >> simple_task("t", "t_ref", {})
+        first = workflow.start_workflow_with_input({})
+        workflow.start_workflow_with_input({})
+        workflow.start_workflow_with_input({}, task_to_domain={"t": "blue"})
+
+        client = self.engine.task_client()
+        task = client.batch_poll("t", workerid="w", count=1, timeout=0)[0]
+        next_task = client.update_task_v2(TaskResult(task_id=task.task_id, workflow_instance_id=first,
+                                                     status="COMPLETED"))
+        self.assertIsNotNone(next_task)
+        self.assertEqual(next_task.status, "IN_PROGRESS")
+        self.assertEqual(client.batch_poll("t", count=5), [])
+        self.assertEqual(len(client.batch_poll("t", count=5, domain="blue")), 1)
+
+    def test_in_progress_update_requeues(self):
+        workflow = self.workflow()
+        workflow >> simple_task("t", "t_ref", {})
+        workflow_id = workflow.start_workflow_with_input({})
+
+        task = self.engine.poll("t")[0]
+        self.engine.update(TaskResult(task_id=task.task_id, workflow_instance_id=workflow_id, status="IN_PROGRESS"))
+
+        self.assertEqual(self.engine.poll("t")[0].poll_count, 2)
+
+    def test_unacknowledged_task_is_requeued_after_response_timeout(self):
+        self.engine.register_task_def(TaskDef(name="t", response_timeout_seconds=1))
+        workflow_id = self.engine.seed_tasks("t", 1)[0]
+        lost = self.engine.poll("t")[0]
+
+        with patch("conductor.client.testing.local_workflow_engine.time.monotonic", return_value=time.monotonic() + 2):
+            redelivered = self.engine.poll("t")[0]
+        self.engine.update(TaskResult(task_id=lost.task_id, workflow_instance_id=workflow_id, status="COMPLETED"))
+
+        self.assertEqual(redelivered.task_id, lost.task_id)
+        self.assertEqual(redelivered.poll_count, 2)
+        self.assertEqual(self.engine.stats["tasks_timed_out"], 1)
+        self.assertEqual(self.engine.get_workflow(workflow_id).status, "COMPLETED")
+
+    def test_unsupported_system_task_fails_unless_handler_given(self):
+        workflow_def = {"name": "http", "version": 1, "tasks": [
+            {"name": "call", "taskReferenceName": "call", "type": "HTTP", "inputParameters": {"uri": "x"}}]}
+
+        failed = self.engine.start_workflow(workflow_def)
+        self.assertEqual(self.engine.get_workflow(failed).status, "FAILED")
+
+        self.engine.system_task_handlers["HTTP"] = lambda task_input: {"response": {"uri": task_input["uri"]}}
+        completed = self.engine.start_workflow(workflow_def)
+        self.assertEqual(self.engine.get_workflow(completed).output, {"response": {"uri": "x"}})
+
+    def test_execute_registered_workflow_by_name(self):
+        workflow = self.workflow()
+        workflow >> InlineTask("calc", "$.a + 1", bindings={"a": "${workflow.input.a}"})
+        workflow.use_registered_definition()
+
+        run = workflow.execute(workflow_input={"a": 1}, wait_for_seconds=1)
+
+        self.assertEqual(run.status, "COMPLETED")
+        self.assertEqual(run.output, {"result": 2})
+
+
+class TestLocalWorkflowEngineWithRunners(unittest.TestCase):
+
+    def test_task_runner_executes_workflow_end_to_end(self):
+        engine = LocalWorkflowEngine()
+        workflow = ConductorWorkflow(executor=engine, name="greetings", version=1)
+        workflow >> simple_task("greet", "greet_ref", {"name": "${workflow.input.name}"})
+        workflow.output_parameters({"greeting": "${greet_ref.output.result}"})
+
+        def greet(name: str) -> str:
+            return f"Hello {name}"
+
+        runner = engine.attach(TaskRunner(worker=Worker("greet", greet, poll_interval=1),
+                                          configuration=Configuration()))
+        thread = threading.Thread(target=runner.run, daemon=True)
+        thread.start()
+        try:
+            ids = [workflow.start_workflow_with_input({"name": str(i)}) for i in range(5)]
+            statuses = [engine.wait_for_workflow(workflow_id, timeout=5) for workflow_id in ids]
+        finally:
+            runner.stop()
+            thread.join(5)
+
+        self.assertEqual(statuses, ["COMPLETED"] * 5)
+        self.assertEqual(engine.get_workflow(ids[3]).output, {"greeting": "Hello 3"})
+
+    def test_async_task_runner_executes_workflow_end_to_end(self):
+        engine = LocalWorkflowEngine()
+        workflow = ConductorWorkflow(executor=engine, name="async_greetings", version=1)
+        workflow >> simple_task("async_greet", "greet_ref", {"name": "${workflow.input.name}"})
+
+        async def async_greet(name: str) -> dict:
+            return {"greeting": f"Hi {name}"}
+
+        runner = engine.attach(AsyncTaskRunner(worker=Worker("async_greet", async_greet, poll_interval=1),
+                                               configuration=Configuration()))
+
+        async def scenario():
+            run_task = asyncio.create_task(runner.run())
+            workflow_id = workflow.start_workflow_with_input({"name": "there"})
+            status = await asyncio.to_thread(engine.wait_for_workflow, workflow_id, 5)
+            await runner.stop()
+            await asyncio.wait_for(run_task, 5)
+            return workflow_id, status
+
+        workflow_id, status = asyncio.run(scenario())
+        self.assertEqual(status, "COMPLETED")
+        self.assertEqual(engine.get_workflow(workflow_id).output, {"greeting": "Hi there"})
+
+
+class TestExpressionEvaluator(unittest.TestCase):
+
+    def test_javascript_subset(self):
+        context = {"loop": {"iteration": 2}, "kind": "a", "items": [1, 2, 3]}
+        self.assertTrue(evaluate_expression("graaljs", "if ( $.loop.iteration < 3 ) { true; } else { false; }",
+                                            context))
+        self.assertTrue(evaluate_expression("javascript", "$.kind === 'a' && !($.items.length > 5)", context))
+        self.assertEqual(evaluate_expression("javascript", "$.items.length > 2 ? 'many' : 'few'", context), "many")
+        self.assertIsNone(evaluate_expression("javascript", "$.missing", context))
+
+    def test_unsupported_javascript_raises(self):
+        with self.assertRaises(ExpressionError):
+            evaluate_expression("javascript", "var x = 1; x", {})
+        with self.assertRaises(ExpressionError):
+            evaluate_expression("javascript", "$.__class__", {})
+
+
+if __name__ == "__main__":
+    unittest.main()
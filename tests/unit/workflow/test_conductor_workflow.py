@@ -0,0 +1,94 @@
+import copy
+import unittest
+from unittest.mock import MagicMock
+
+from conductor.client.http.models import StartWorkflowRequest
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.task.simple_task import SimpleTask
+
+
+class TestConductorWorkflowDefinitionCache(unittest.TestCase):
+    def setUp(self):
+        self.executor = MagicMock()
+        self.workflow = ConductorWorkflow(executor=self.executor, name="order_flow", version=3)
+        self.workflow >> SimpleTask("validate", "validate_ref")
+
+    def test_to_workflow_def_is_cached_until_mutation(self):
+        first = self.workflow._shared_workflow_def()
+        self.assertIs(self.workflow._shared_workflow_def(), first)
+
+        self.workflow >> SimpleTask("charge", "charge_ref")
+        second = self.workflow.to_workflow_def()
+        self.assertIsNot(self.workflow._shared_workflow_def(), first)
+        self.assertEqual([t.task_reference_name for t in second.tasks], ["validate_ref", "charge_ref"])
+
+    def test_changes_to_returned_definition_do_not_leak_into_the_cache(self):
+        content_hash = self.workflow.content_hash()
+        returned = self.workflow.to_workflow_def()
+        returned.tasks.append(SimpleTask("charge", "charge_ref").to_workflow_task())
+        returned.description = "changed"
+
+        self.assertEqual(self.workflow.content_hash(), content_hash)
+        self.assertEqual(len(self.workflow.to_workflow_def().tasks), 1)
+        self.workflow.register(overwrite=True)
+        self.assertEqual(len(self.executor.register_workflow.call_args.kwargs["workflow"].tasks), 1)
+
+    def test_builder_and_in_place_mutations_invalidate(self):
+        for mutate in (
+            lambda wf: wf.timeout_seconds(120),
+            lambda wf: wf.output_parameter("result", "${validate_ref.output}"),
+            lambda wf: setattr(wf, "description", "changed"),
+        ):
+            before = self.workflow.content_hash()
+            mutate(self.workflow)
+            self.assertNotEqual(self.workflow.content_hash(), before)
+
+    def test_content_hash_is_stable_across_equal_definitions(self):
+        other = ConductorWorkflow(executor=self.executor, name="order_flow", version=3)
+        other >> SimpleTask("validate", "validate_ref")
+        self.assertEqual(other.content_hash(), self.workflow.content_hash())
+        self.assertEqual(copy.deepcopy(self.workflow).content_hash(), self.workflow.content_hash())
+
+    def test_inline_start_sends_cached_payload(self):
+        self.workflow.start_workflow_with_input({"id": 1})
+        self.workflow.start_workflow_with_input({"id": 2})
+
+        first, second = [c.args[0] for c in self.executor.start_workflow.call_args_list]
+        self.assertIs(first.workflow_def, second.workflow_def)
+        self.assertEqual(first.workflow_def["name"], "order_flow")
+        self.assertEqual(first.workflow_def["tasks"][0]["taskReferenceName"], "validate_ref")
+        self.assertEqual(second.input, {"id": 2})
+
+    def test_execute_keeps_inline_version(self):
+        self.workflow.execute(workflow_input={"id": 1})
+
+        request = self.executor.execute_workflow.call_args.args[0]
+        self.assertEqual(request.name, "order_flow")
+        self.assertEqual(request.version, 1)
+        self.assertIsNotNone(request.workflow_def)
+
+    def test_registered_mode_registers_only_when_hash_changes(self):
+        self.workflow.use_registered_definition()
+
+        self.workflow.start_workflow_with_input({"id": 1})
+        self.workflow.start_workflow(StartWorkflowRequest(input={"id": 2}))
+        self.assertEqual(self.executor.register_workflow.call_count, 1)
+
+        request = self.executor.start_workflow.call_args.args[0]
+        self.assertIsNone(request.workflow_def)
+        self.assertEqual((request.name, request.version), ("order_flow", 3))
+
+        self.workflow >> SimpleTask("charge", "charge_ref")
+        self.workflow.execute(workflow_input={})
+        self.assertEqual(self.executor.register_workflow.call_count, 2)
+        self.assertEqual(len(self.executor.register_workflow.call_args.kwargs["workflow"].tasks), 2)
+        self.assertEqual(self.executor.execute_workflow.call_args.args[0].version, 3)
+
+    def test_explicit_register_is_remembered(self):
+        self.workflow.register(overwrite=True)
+        self.assertFalse(self.workflow.ensure_registered())
+        self.assertEqual(self.executor.register_workflow.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import copy
+import unittest
+
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.task.do_while_task import LoopTask
+from conductor.client.workflow.task.simple_task import SimpleTask
+from conductor.client.workflow.task.switch_task import SwitchTask
+
+
+class TestTaskCopyOnWrite(unittest.TestCase):
+    def test_snapshot_shares_until_mutated(self):
+        task = SimpleTask("charge", "charge_ref")
+        task.input_parameters = {"amount": {"value": 10}}
+
+        snapshot = copy.deepcopy(task)
+        self.assertIs(snapshot._input_parameters, task._input_parameters)
+
+        task.input_parameters["amount"]["value"] = 99
+        task.input_parameter("currency", "USD")
+
+        self.assertEqual(snapshot.input_parameters, {"amount": {"value": 10}})
+        self.assertEqual(task.input_parameters, {"amount": {"value": 99}, "currency": "USD"})
+
+    def test_setter_copies_caller_dict(self):
+        template = {"nested": {"key": "${workflow.input.key}"}, "items": [1, 2]}
+        task = SimpleTask("charge", "charge_ref")
+        task.input_parameters = template
+
+        template["nested"]["key"] = "changed"
+        template["items"].append(3)
+
+        self.assertEqual(task.input_parameters, {"nested": {"key": "${workflow.input.key}"}, "items": [1, 2]})
+
+    def test_workflow_is_isolated_from_later_task_mutation(self):
+        task = SimpleTask("charge", "charge_ref")
+        task.input_parameter("amount", 10)
+        loop = LoopTask("loop_ref", iterations=2, tasks=[task])
+        workflow = ConductorWorkflow(executor=None, name="wf")
+        workflow >> task >> loop
+
+        task.input_parameter("amount", 20)
+        task.input("currency", key="currency", value="EUR")
+
+        workflow_def = workflow.to_workflow_def()
+        self.assertEqual(workflow_def.tasks[0].input_parameters, {"amount": 10})
+        self.assertEqual(workflow_def.tasks[1].loop_over[0].input_parameters, {"amount": 10})
+
+    def test_switch_case_after_snapshot(self):
+        switch = SwitchTask("switch_ref", case_expression="${workflow.input.kind}")
+        switch.switch_case("a", [SimpleTask("a", "a_ref")])
+        snapshot = copy.deepcopy(switch)
+
+        switch.switch_case("b", [SimpleTask("b", "b_ref")])
+
+        self.assertEqual(list(snapshot.to_workflow_task().decision_cases), ["a"])
+        self.assertEqual(list(switch.to_workflow_task().decision_cases), ["a", "b"])
+
+    def test_to_workflow_task_does_not_share_input_dict(self):
+        switch = SwitchTask("switch_ref", case_expression="${workflow.input.kind}")
+        switch.to_workflow_task()
+        self.assertNotIn("switchCaseValue", switch.input_parameters)
+
+    def test_unknown_public_attribute_is_output_reference(self):
+        task = SimpleTask("charge", "charge_ref")
+        self.assertEqual(task.receipt_id, "${charge_ref.output.receipt_id}")
+        with self.assertRaises(AttributeError):
+            task._missing
+
+
+if __name__ == "__main__":
+    unittest.main()
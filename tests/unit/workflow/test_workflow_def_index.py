@@ -0,0 +1,101 @@
+import unittest
+
+from conductor.client.workflow.conductor_workflow import ConductorWorkflow
+from conductor.client.workflow.task.fork_task import ForkTask
+from conductor.client.workflow.task.simple_task import SimpleTask
+from conductor.client.workflow.task.switch_task import SwitchTask
+from conductor.client.workflow.task.terminate_task import TerminateTask, WorkflowStatus
+from conductor.client.workflow.workflow_def_index import WorkflowDefIndex, WorkflowDefValidationError
+
+
+def simple(ref, **inputs):
+    task = {"name": ref, "taskReferenceName": ref, "type": "SIMPLE"}
+    if inputs:
+        task["inputParameters"] = inputs
+    return task
+
+
+def codes(issues):
+    return sorted(issue.code for issue in issues)
+
+
+class TestWorkflowDefIndex(unittest.TestCase):
+
+    def test_indexes_nesting_forks_and_references(self):
+        definition = {"tasks": [
+            simple("a", x="${workflow.input.x}"),
+            {"name": "fork", "taskReferenceName": "fork", "type": "FORK_JOIN",
+             "forkTasks": [[simple("b1", a="${a.output.result}")], [simple("c1"), simple("c2")]]},
+            {"name": "join", "taskReferenceName": "join", "type": "JOIN", "joinOn": ["b1", "c2"]},
+            {"name": "switch", "taskReferenceName": "switch", "type": "SWITCH",
+             "decisionCases": {"big": [simple("big", v="${c2.output}")]}, "defaultCase": [simple("small")]},
+        ], "outputParameters": {"r": "${big.output.r}"}}
+
+        index = WorkflowDefIndex.build(definition)
+
+        self.assertEqual(len(index.tasks), 9)
+        self.assertEqual(index.children["fork"], ["b1", "c1", "c2"])
+        self.assertEqual(index.parent["big"], "switch")
+        self.assertEqual((index.branch_of("c2"), index.branch_of("small")), ("1", "defaultCase"))
+        self.assertEqual((index.fork_join, index.join_fork), ({"fork": "join"}, {"join": "fork"}))
+        self.assertEqual(index.references["b1"], {"a"})
+        self.assertEqual(index.referenced_by["c2"], {"big"})
+        self.assertEqual(index.output_references, {"big"})
+        self.assertEqual(index.validate(), [])
+
+    def test_reports_structural_problems(self):
+        definition = {"tasks": [
+            simple("a", x="${missing.output.x}", y="${CPEWF_TASK_ID}"),
+            {"name": "fork", "taskReferenceName": "fork", "type": "FORK_JOIN", "forkTasks": [[simple("b")]]},
+            simple("after_fork"),
+            {"name": "join", "taskReferenceName": "join", "type": "JOIN", "joinOn": ["a"]},
+            simple("a"),
+            {"name": "stop", "taskReferenceName": "stop", "type": "TERMINATE"},
+            simple("never"),
+            {"name": "inline", "taskReferenceName": "inline", "type": "INLINE",
+             "inputParameters": {"evaluatorType": "graaljs", "expression": "`${$.x}` + `${local}`"}},
+            {"name": "unnamed", "type": "SIMPLE"},
+        ], "outputParameters": {"r": "${gone.output}"}}
+
+        issues = WorkflowDefIndex.build(definition).validate()
+
+        self.assertEqual(codes(issues), ["dangling_reference", "dangling_reference", "duplicate_reference_name",
+                                         "missing_join", "missing_reference_name", "orphan_join",
+                                         "unreachable_task", "unreachable_task", "unreachable_task"])
+        unreachable = [i for i in issues if i.code == "unreachable_task"]
+        self.assertEqual({i.task_ref for i in unreachable}, {"never", "inline", None})
+        self.assertTrue(all(i.severity == "warning" for i in unreachable))
+
+    def test_join_waiting_outside_its_fork(self):
+        definition = {"tasks": [
+            simple("before"),
+            {"name": "fork", "taskReferenceName": "fork", "type": "FORK_JOIN", "forkTasks": [[simple("b")]]},
+            {"name": "join", "taskReferenceName": "join", "type": "JOIN", "joinOn": ["b", "before"]},
+        ]}
+
+        issues = WorkflowDefIndex.build(definition).validate()
+
+        self.assertEqual([(i.code, i.task_ref) for i in issues], [("join_on_outside_fork", "join")])
+        with self.assertRaises(WorkflowDefValidationError) as context:
+            WorkflowDefIndex.build(definition).raise_for_errors()
+        self.assertIn("'before'", str(context.exception))
+
+    def test_conductor_workflow_validate_and_register(self):
+        workflow = ConductorWorkflow(executor=None, name="wf")
+        first = SimpleTask("first", "first")
+        fork = ForkTask("fork", [[SimpleTask("b", "b")], [SimpleTask("c", "c")]])
+        switch = SwitchTask("switch", "${first.output.kind}")
+        switch.switch_case("stop", [TerminateTask("stop", WorkflowStatus.FAILED, "stopped")])
+        switch.default_case([SimpleTask("next", "next").input(key="value", value="${b.output.value}")])
+        workflow >> first >> fork >> switch
+        self.assertEqual(workflow.validate(), [])
+        self.assertIs(workflow.index(), workflow.index())
+
+        workflow >> SimpleTask("last", "last").input(key="value", value="${nope.output}")
+        self.assertEqual(codes(workflow.validate()), ["dangling_reference"])
+        with self.assertRaises(WorkflowDefValidationError):
+            workflow.register(overwrite=True, validate=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
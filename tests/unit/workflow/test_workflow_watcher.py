@@ -0,0 +1,168 @@
+import asyncio
+import re
+import unittest
+from unittest.mock import MagicMock
+
+from conductor.client.http.models import Workflow, WorkflowStatus
+from conductor.client.http.models.scrollable_search_result_workflow_summary import (
+    ScrollableSearchResultWorkflowSummary,
+)
+from conductor.client.http.models.workflow_summary import WorkflowSummary
+from conductor.client.http.rest import ApiException
+from conductor.client.workflow.executor.workflow_watcher import WorkflowWatcher
+
+
+class FakeWorkflowClient:
+    """Workflow state keyed by id; ``indexed`` controls what search can see."""
+
+    def __init__(self):
+        self.statuses = {}
+        self.indexed = True
+        self.search = MagicMock(side_effect=self._search)
+        self.get_workflow = MagicMock(side_effect=self._get_workflow)
+        self.get_workflow_status = MagicMock(side_effect=self._get_workflow_status)
+
+    def _search(self, start=0, size=100, free_text="*", query=None):
+        ids = re.search(r"workflowId IN \(([^)]*)\)", query).group(1).split(",")
+        terminal = re.search(r"status IN \(([^)]*)\)", query).group(1).split(",")
+        found = [i for i in ids if self.indexed and self.statuses.get(i) in terminal]
+        return ScrollableSearchResultWorkflowSummary(
+            results=[WorkflowSummary(workflow_id=i, status=self.statuses[i]) for i in found[:size]])
+
+    def _get_workflow(self, workflow_id, include_tasks=True):
+        if workflow_id not in self.statuses:
+            raise ApiException(status=404, reason="Not Found")
+        return Workflow(workflow_id=workflow_id, status=self.statuses[workflow_id])
+
+    def _get_workflow_status(self, workflow_id, include_output=None, include_variables=None):
+        return WorkflowStatus(workflow_id=workflow_id, status=self.statuses[workflow_id])
+
+
+class TestWorkflowWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.client = FakeWorkflowClient()
+
+    def watcher(self, **kwargs) -> WorkflowWatcher:
+        kwargs.setdefault("min_interval", 0.01)
+        kwargs.setdefault("max_interval", 0.05)
+        watcher = WorkflowWatcher(self.client, **kwargs)
+        self.addCleanup(watcher.stop)
+        return watcher
+
+    def test_batches_lookups_and_fetches_only_finished_workflows(self):
+        ids = [f"wf-{i}" for i in range(250)]
+        self.client.statuses = {i: "RUNNING" for i in ids}
+        watcher = self.watcher(batch_size=100)
+        watcher._ensure_started = lambda: None
+
+        futures = {i: watcher.watch(i) for i in ids}
+        self.assertEqual(watcher.poll_once(), 0)
+        self.assertEqual(self.client.search.call_count, 3)
+        self.assertEqual(self.client.get_workflow.call_count, 0)
+
+        for i in ids[:10]:
+            self.client.statuses[i] = "COMPLETED"
+        self.client.statuses[ids[10]] = "FAILED"
+        self.assertEqual(watcher.poll_once(), 11)
+
+        self.assertEqual(futures[ids[0]].result(0).status, "COMPLETED")
+        self.assertEqual(futures[ids[10]].result(0).status, "FAILED")
+        self.assertFalse(futures[ids[11]].done())
+        self.assertEqual(self.client.get_workflow.call_count, 11)
+        self.assertEqual(watcher.watched_count, 239)
+        self.client.get_workflow_status.assert_not_called()
+
+    def test_background_poller_resolves_waiters(self):
+        self.client.statuses = {"wf-1": "RUNNING", "wf-2": "RUNNING"}
+        watcher = self.watcher()
+        first, second = watcher.watch("wf-1"), watcher.watch("wf-1")
+        other = watcher.watch("wf-2")
+
+        self.client.statuses["wf-1"] = "TERMINATED"
+        self.assertEqual(first.result(5).status, "TERMINATED")
+        self.assertIs(second.result(5), first.result(5))
+        self.assertFalse(other.done())
+
+    def test_wait_times_out_and_stops_watching(self):
+        self.client.statuses = {"wf-1": "RUNNING"}
+        watcher = self.watcher()
+
+        self.assertIsNone(watcher.wait("wf-1", timeout=0.05))
+        watcher.poll_once()
+        self.assertEqual(watcher.watched_count, 0)
+
+    def test_checks_status_directly_when_index_lags(self):
+        self.client.statuses = {"wf-1": "RUNNING"}
+        self.client.indexed = False
+        watcher = self.watcher(direct_check_interval=0)
+        watcher._ensure_started = lambda: None
+        future = watcher.watch("wf-1")
+
+        self.assertEqual(watcher.poll_once(), 0)
+        self.client.statuses["wf-1"] = "COMPLETED"
+        self.assertEqual(watcher.poll_once(), 1)
+        self.assertEqual(future.result(0).status, "COMPLETED")
+        self.assertEqual(self.client.get_workflow_status.call_count, 2)
+
+    def test_falls_back_to_status_checks_when_search_fails(self):
+        self.client.statuses = {"wf-1": "COMPLETED"}
+        self.client.search.side_effect = ApiException(status=500, reason="no index")
+        watcher = self.watcher()
+
+        self.assertEqual(watcher.wait("wf-1", timeout=5).status, "COMPLETED")
+        self.assertEqual(self.client.search.call_count, 1)
+        self.client.get_workflow_status.assert_called_once()
+
+    def test_falls_back_to_status_checks_when_search_finds_nothing(self):
+        self.client.statuses = {"wf-1": "RUNNING", "wf-2": "RUNNING", "wf-3": "RUNNING"}
+        self.client.indexed = False
+        watcher = self.watcher(direct_check_interval=0)
+        watcher._ensure_started = lambda: None
+        futures = [watcher.watch(i) for i in ("wf-1", "wf-2", "wf-3")]
+
+        self.client.statuses.update({"wf-1": "COMPLETED", "wf-2": "COMPLETED"})
+        self.assertEqual(watcher.poll_once(), 2)
+        self.assertEqual(self.client.search.call_count, 1)
+
+        self.client.statuses["wf-3"] = "COMPLETED"
+        self.assertEqual(watcher.poll_once(), 1)
+        self.assertEqual(self.client.search.call_count, 1)
+        self.assertTrue(all(f.done() for f in futures))
+
+    def test_missing_workflow_fails_the_future(self):
+        watcher = self.watcher(direct_check_interval=0)
+        watcher._ensure_started = lambda: None
+        self.client.get_workflow_status.side_effect = ApiException(status=404, reason="Not Found")
+        future = watcher.watch("missing")
+
+        watcher.poll_once()
+        with self.assertRaises(ApiException):
+            future.result(0)
+
+    def test_watch_async(self):
+        self.client.statuses = {"wf-1": "RUNNING"}
+        watcher = self.watcher()
+
+        async def scenario():
+            waiter = watcher.watch_async("wf-1")
+            await asyncio.sleep(0.05)
+            self.client.statuses["wf-1"] = "COMPLETED"
+            return await asyncio.wait_for(waiter, 5)
+
+        self.assertEqual(asyncio.run(scenario()).status, "COMPLETED")
+
+    def test_stop_cancels_pending_futures(self):
+        self.client.statuses = {"wf-1": "RUNNING"}
+        watcher = self.watcher()
+        future = watcher.watch("wf-1")
+
+        watcher.stop()
+
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(RuntimeError):
+            watcher.watch("wf-1")
+
+
+if __name__ == "__main__":
+    unittest.main()